@@ -29,7 +29,7 @@ import sys
 from pathlib import Path
 
 from backend.shared.models.base_model import Base
-from backend.service_recipe.src.models import Ingredient, Recipe
+from backend.service_recipe.src.models import Ingredient, Recipe, OutboxEvent
 
 
 # Добавляем путь к backend в sys.path для импортов моделей
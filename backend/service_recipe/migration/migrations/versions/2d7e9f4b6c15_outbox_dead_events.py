@@ -0,0 +1,46 @@
+"""outbox dead events and sent prune index
+
+Revision ID: 2d7e9f4b6c15
+Revises: 8c4d2e6f1a3b
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '2d7e9f4b6c15'
+down_revision = '8c4d2e6f1a3b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('outbox',
+                  sa.Column('dead_at',
+                            sa.DateTime(timezone=True),
+                            nullable=True,
+                            comment='Время исчерпания попыток публикации'))
+    op.drop_index('ix_outbox_unsent_created_at', table_name='outbox')
+    op.create_index('ix_outbox_unsent_created_at',
+                    'outbox',
+                    ['created_at'],
+                    unique=False,
+                    postgresql_where=sa.text(
+                        'sent_at IS NULL AND dead_at IS NULL'))
+    op.create_index('ix_outbox_sent_at',
+                    'outbox',
+                    ['sent_at'],
+                    unique=False,
+                    postgresql_where=sa.text('sent_at IS NOT NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_sent_at', table_name='outbox')
+    op.drop_index('ix_outbox_unsent_created_at', table_name='outbox')
+    op.create_index('ix_outbox_unsent_created_at',
+                    'outbox',
+                    ['created_at'],
+                    unique=False,
+                    postgresql_where=sa.text('sent_at IS NULL'))
+    op.drop_column('outbox', 'dead_at')
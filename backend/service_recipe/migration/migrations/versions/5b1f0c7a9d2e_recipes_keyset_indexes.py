@@ -0,0 +1,42 @@
+"""recipes keyset indexes
+
+Revision ID: 5b1f0c7a9d2e
+Revises: 139ee91289cb
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5b1f0c7a9d2e'
+down_revision = '139ee91289cb'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Индексы под keyset-пагинацию ORDER BY created_at DESC, id DESC.
+    # CONCURRENTLY не блокирует запись в большую таблицу,
+    # но не может выполняться внутри транзакции миграции.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_recipes_created_at_id',
+                        'recipes',
+                        ['created_at', 'id'],
+                        unique=False,
+                        postgresql_concurrently=True)
+        op.create_index('ix_recipes_user_id_created_at_id',
+                        'recipes',
+                        ['user_id', 'created_at', 'id'],
+                        unique=False,
+                        postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_recipes_user_id_created_at_id',
+                      table_name='recipes',
+                      postgresql_concurrently=True)
+        op.drop_index('ix_recipes_created_at_id',
+                      table_name='recipes',
+                      postgresql_concurrently=True)
@@ -0,0 +1,28 @@
+"""outbox claim lease
+
+Revision ID: 6e3a8b1d4f27
+Revises: 2d7e9f4b6c15
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '6e3a8b1d4f27'
+down_revision = '2d7e9f4b6c15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('outbox',
+                  sa.Column('claimed_until',
+                            sa.DateTime(timezone=True),
+                            nullable=True,
+                            comment='До какого времени событие взято '
+                                    'релеем в публикацию'))
+
+
+def downgrade() -> None:
+    op.drop_column('outbox', 'claimed_until')
@@ -0,0 +1,74 @@
+"""create outbox table
+
+Revision ID: 8c4d2e6f1a3b
+Revises: 5b1f0c7a9d2e
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from backend.shared.models.base.decorator.type_decorator import (
+    UUIDTypeDecorator)
+
+# revision identifiers, used by Alembic.
+revision = '8c4d2e6f1a3b'
+down_revision = '5b1f0c7a9d2e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('outbox',
+                    sa.Column('routing_key',
+                              sa.String(length=100),
+                              nullable=False,
+                              comment='Routing key события'),
+                    sa.Column('payload',
+                              postgresql.JSONB(),
+                              nullable=False,
+                              comment='Тело события'),
+                    sa.Column('attempts',
+                              sa.Integer(),
+                              nullable=False,
+                              server_default='0',
+                              comment='Число неудачных попыток публикации'),
+                    sa.Column('sent_at',
+                              sa.DateTime(timezone=True),
+                              nullable=True,
+                              comment='Время успешной публикации'),
+                    sa.Column('id', UUIDTypeDecorator(),
+                              nullable=False,
+                              comment='Уникальный идентификатор'),
+                    sa.Column('created_at',
+                              sa.DateTime(timezone=True),
+                              server_default=sa.text("timezone('utc', now())"),
+                              nullable=False,
+                              comment='Время создания записи'),
+                    sa.Column('updated_at',
+                              sa.DateTime(timezone=True),
+                              server_default=sa.text("timezone('utc', now())"),
+                              nullable=True,
+                              comment='Время последнего обновления'),
+                    sa.Column('is_active',
+                              sa.Boolean(),
+                              nullable=False,
+                              comment='Флаг активности записи'),
+                    sa.PrimaryKeyConstraint('id')
+                    )
+    op.create_index(op.f('ix_outbox_id'),
+                    'outbox',
+                    ['id'],
+                    unique=False)
+    op.create_index('ix_outbox_unsent_created_at',
+                    'outbox',
+                    ['created_at'],
+                    unique=False,
+                    postgresql_where=sa.text('sent_at IS NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_unsent_created_at', table_name='outbox')
+    op.drop_index(op.f('ix_outbox_id'), table_name='outbox')
+    op.drop_table('outbox')
@@ -6,7 +6,10 @@ from fastapi import APIRouter
 
 # Импортируем роутеры
 from .create_recipe import router as create_recipe_router
+from .get_recipe import router as get_recipe_router
+from .list_recipes import router as list_recipes_router
 from .health import router as health_router
+from .metrics import router as metrics_router
 
 # Создаем главный API router
 api_router = APIRouter(prefix="/api/v1")
@@ -14,4 +17,7 @@ api_router = APIRouter(prefix="/api/v1")
 
 # Подключаем роутеры с префиксами
 api_router.include_router(create_recipe_router, prefix="/recipe")
+api_router.include_router(get_recipe_router, prefix="/recipe")
+api_router.include_router(list_recipes_router, prefix="/recipe")
 api_router.include_router(health_router,  prefix="")
+api_router.include_router(metrics_router, prefix="")
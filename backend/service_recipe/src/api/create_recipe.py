@@ -2,14 +2,9 @@
 API роутеры для работы с рецептами
 """
 
-from datetime import datetime, timezone
 from fastapi import status, APIRouter, Depends
 
-from backend.service_recipe.src.infrastructure import get_message_publisher
-from backend.service_recipe.src.service import (
-    MessagePublisher,
-    RecipeService
-)
+from backend.service_recipe.src.service import RecipeService
 from backend.service_recipe.src.schemas import (
     RecipeCreate,
     RecipeResponse
@@ -43,13 +38,14 @@ router = APIRouter(
 async def create_recipe(
     recipe_data: RecipeCreate,
     current_user: dict = Depends(get_current_user),
-    recipe_service: RecipeService = Depends(get_recipe_service),
-    publisher: MessagePublisher = Depends(get_message_publisher)
+    recipe_service: RecipeService = Depends(get_recipe_service)
 ):
     """
     Создание нового рецепта
     Требует JWT токен в заголовке Authorization: Bearer <token>
     Возвращает созданный рецепт
+
+    Событие recipe.created публикуется асинхронно через outbox
     """
     logger.info(
         "→ Recipe creation started",
@@ -58,7 +54,7 @@ async def create_recipe(
     )
 
     # Создаём рецепт через сервис
-    recipe = recipe_service.create_recipe(
+    recipe = await recipe_service.create_recipe(
         recipe_data=recipe_data,
         user_id=current_user["user_id"]
     )
@@ -69,16 +65,4 @@ async def create_recipe(
         user_id=current_user["user_id"]
     )
 
-    # Публикуем событие в RabbitMQ
-    await publisher.publish_recipe_created({
-        "type": "recipe.created",
-        "recipe_id": str(recipe.id),
-        "payload": {
-            "id": str(recipe.id),
-            "title": recipe_data.name_recipe,
-            "description": recipe_data.description
-        },
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    })
-
     return recipe
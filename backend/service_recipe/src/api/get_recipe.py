@@ -0,0 +1,47 @@
+"""
+API роутеры для чтения рецептов
+"""
+
+from uuid import UUID
+
+from fastapi import status, APIRouter, Depends, HTTPException, Response
+
+from backend.service_recipe.src.service import RecipeService
+from backend.service_recipe.src.schemas import RecipeResponse
+from backend.service_recipe.src.infrastructure import get_recipe_service
+
+
+router = APIRouter(
+    prefix="/recipes",
+    tags=["Recipe_Service"]
+)
+
+
+@router.get(
+    "/{recipe_id}",
+    response_model=RecipeResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Получить рецепт",
+    description="Получение рецепта по ID вместе с ингредиентами",
+    responses={
+        404: {"description": "Рецепт не найден"}
+    }
+)
+async def get_recipe(
+    recipe_id: UUID,
+    recipe_service: RecipeService = Depends(get_recipe_service)
+) -> Response:
+    """
+    Получение рецепта по ID
+
+    Ответ отдаётся готовыми байтами из кэша, без повторной сериализации
+    """
+    body = await recipe_service.get_recipe_json(recipe_id)
+
+    if body is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Рецепт не найден"
+        )
+
+    return Response(content=body, media_type="application/json")
@@ -0,0 +1,55 @@
+"""
+API роутеры для списка рецептов
+"""
+
+from uuid import UUID
+
+from fastapi import status, APIRouter, Depends, HTTPException, Query
+
+from backend.service_recipe.src.service import RecipeService
+from backend.service_recipe.src.service.pagination import InvalidCursorError
+from backend.service_recipe.src.schemas import RecipePage
+from backend.service_recipe.src.infrastructure import get_recipe_service
+
+
+router = APIRouter(
+    prefix="/recipes",
+    tags=["Recipe_Service"]
+)
+
+
+@router.get(
+    "",
+    response_model=RecipePage,
+    status_code=status.HTTP_200_OK,
+    summary="Список рецептов",
+    description="Рецепты от новых к старым с курсорной пагинацией",
+    responses={
+        400: {"description": "Некорректный курсор"}
+    }
+)
+async def list_recipes(
+    limit: int = Query(default=20, ge=1, le=100,
+                       description="Размер страницы"),
+    cursor: str | None = Query(default=None,
+                               description="Курсор следующей страницы"),
+    user_id: UUID | None = Query(default=None,
+                                 description="Фильтр по автору"),
+    recipe_service: RecipeService = Depends(get_recipe_service)
+) -> RecipePage:
+    """
+    Список рецептов
+
+    Для следующей страницы передайте next_cursor из ответа
+    """
+    try:
+        return await recipe_service.list_recipes(
+            limit=limit,
+            cursor=cursor,
+            user_id=user_id
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
@@ -0,0 +1,34 @@
+"""Metrics endpoint"""
+
+from fastapi import APIRouter, Depends
+
+from backend.service_recipe.src.infrastructure import (
+    get_message_publisher,
+    get_recipe_cache,
+    get_user_service_client
+)
+from backend.service_recipe.src.infrastructure.grpc.client import (
+    UserServiceClient)
+from backend.service_recipe.src.service import MessagePublisher
+from backend.shared.cache import LRUTTLCache
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics")
+async def metrics(
+    recipe_cache: LRUTTLCache = Depends(get_recipe_cache),
+    publisher: MessagePublisher = Depends(get_message_publisher),
+    user_service_client: UserServiceClient = Depends(get_user_service_client)
+):
+    """Внутренние счётчики сервиса"""
+    return {
+        "service": "recipe_service",
+        "recipe_cache": recipe_cache.stats(),
+        "publisher": publisher.stats(),
+        "token_cache": user_service_client.token_cache.stats(),
+        "single_flight": user_service_client.single_flight.stats(),
+        "user_loader": user_service_client.user_loader.stats(),
+        "grpc_channels": user_service_client.pool_stats(),
+        "token_stream": user_service_client.token_stream.stats()
+    }
@@ -2,10 +2,14 @@ from .config_api import ApiRConfig
 from .config_cors import CORSConfig
 from .config_grpc import UserServiceConfig
 from .config_rebbit import RebbitConfig
+from .config_cache import CacheConfig
+from .config_outbox import OutboxConfig
 
 __all__ = [
     'ApiRConfig',
     'CORSConfig',
     'UserServiceConfig',
     'RebbitConfig',
+    'CacheConfig',
+    'OutboxConfig',
 ]
@@ -0,0 +1,25 @@
+""" Конфигурация in-process кэша рецептов """
+
+
+from pydantic import Field
+
+from backend.service_recipe.src.config.base import BaseRConfig
+
+
+class CacheConfig(BaseRConfig):
+    """ Конфигурация кэша сериализованных рецептов """
+
+    RECIPE_CACHE_MAX_SIZE: int = Field(
+        default=10_000,
+        gt=0,
+        description="Максимальное число рецептов в кэше"
+    )
+    RECIPE_CACHE_TTL_SECONDS: float = Field(
+        default=300.0,
+        gt=0,
+        description="Время жизни записи кэша в секундах"
+    )
+    RECIPE_CACHE_INVALIDATION_ENABLED: bool = Field(
+        default=True,
+        description="Слушать события recipe.* для инвалидации кэша"
+    )
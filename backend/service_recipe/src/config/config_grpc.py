@@ -1,6 +1,8 @@
 """ Конфигурация для интеграции с user_service """
 
 
+from typing import Literal
+
 from pydantic import Field
 
 from backend.service_recipe.src.config.base import BaseRConfig
@@ -13,6 +15,117 @@ class UserServiceConfig(BaseRConfig):
     GRPC_HOST: str = Field(description='')
     GRPC_PORT: int = Field(description='')
 
+    # Реплики user_service через запятую (host:port,host:port);
+    # пусто — один endpoint GRPC_HOST:GRPC_PORT
+    GRPC_TARGETS: str = Field(
+        default='',
+        description='Endpoint\'ы user_service для клиентской балансировки'
+    )
+    # Unix-сокет user_service на том же хосте/поде;
+    # если задан, используется вместо TCP endpoint'ов
+    GRPC_UDS_PATH: str = Field(
+        default='',
+        description='Путь unix-сокета user_service'
+    )
+    GRPC_CHANNELS_PER_TARGET: int = Field(
+        default=1,
+        description='Число каналов (HTTP/2 соединений) на endpoint'
+    )
+    GRPC_LB_POLICY: Literal["round_robin", "least_outstanding"] = Field(
+        default="round_robin",
+        description='Политика выбора канала'
+    )
+    GRPC_KEEPALIVE_TIME_MS: int = Field(
+        default=30000,
+        description='Интервал keepalive ping'
+    )
+    GRPC_KEEPALIVE_TIMEOUT_MS: int = Field(
+        default=10000,
+        description='Ожидание ответа на keepalive ping'
+    )
+    GRPC_CALL_TIMEOUT_SECONDS: float = Field(
+        default=1.0,
+        description='Дедлайн одного вызова'
+    )
+
     # JWT настройки
     JWT_SECRET_KEY: str = Field(description='')
     JWT_ALGORITHM: str = Field(description='')
+
+    # Режим проверки access токена:
+    # local — подпись и exp проверяются в процессе общим секретом
+    # jwks — в процессе, публичным ключом из JWKS user_service
+    # grpc — ValidateToken в user_service
+    AUTH_MODE: Literal["local", "jwks", "grpc"] = Field(
+        default="local",
+        description='Режим проверки access токена'
+    )
+    JWKS_URL: str = Field(
+        default='http://service_user:8000/.well-known/jwks.json',
+        description='Адрес JWKS user_service'
+    )
+    JWKS_ALGORITHM: str = Field(
+        default='ES256',
+        description='Алгоритм подписи токенов, проверяемых по JWKS'
+    )
+    JWKS_CACHE_TTL_SECONDS: float = Field(
+        default=300.0,
+        description='Время жизни кэша ключей JWKS'
+    )
+    JWKS_MIN_REFRESH_INTERVAL_SECONDS: float = Field(
+        default=10.0,
+        description='Минимальный интервал перечитывания JWKS'
+    )
+    # grpc: проверки мультиплексируются в потоки ValidateTokens
+    # (по одному на канал). Требует GRPC_SERVER_MODE=aio у user_service,
+    # иначе клиент получает UNIMPLEMENTED и остаётся на unary
+    GRPC_TOKEN_STREAM_ENABLED: bool = Field(
+        default=False,
+        description='Проверять токены через поток ValidateTokens'
+    )
+
+    # Кэш результатов ValidateToken (режим grpc); TTL не больше
+    # TOKEN_VERSION_CACHE_TTL_SECONDS (см. get_token_cache_ttl)
+    TOKEN_CACHE_MAX_SIZE: int = Field(
+        default=10000,
+        description='Максимальное число токенов в кэше валидации'
+    )
+    TOKEN_CACHE_TTL_SECONDS: float = Field(
+        default=60.0,
+        description='Максимальное время жизни записи кэша валидации'
+    )
+
+    # Версии токенов пользователей (claim ver, режимы local и jwks):
+    # отзыв сессий виден сервису не позже чем через TTL
+    TOKEN_VERSION_CACHE_MAX_SIZE: int = Field(
+        default=10000,
+        description='Максимальное число пользователей в кэше версий'
+    )
+    TOKEN_VERSION_CACHE_TTL_SECONDS: float = Field(
+        default=5.0,
+        description='Время жизни версии токенов в кэше'
+    )
+
+    # Пакетная загрузка пользователей (GetUsersByIds)
+    USER_BATCH_MAX_SIZE: int = Field(
+        default=100,
+        description='Максимальное число ID в одном GetUsersByIds'
+    )
+
+    def get_grpc_targets(self) -> list[str]:
+        """ Список endpoint'ов user_service """
+        if self.GRPC_UDS_PATH:
+            return [f'unix:{self.GRPC_UDS_PATH}']
+        targets = [
+            target.strip()
+            for target in self.GRPC_TARGETS.split(',')
+            if target.strip()
+        ]
+        return targets or [f'{self.GRPC_HOST}:{self.GRPC_PORT}']
+
+    def get_token_cache_ttl(self) -> float:
+        """ TTL кэша ValidateToken, ограниченный TTL кэша версий """
+        return min(
+            self.TOKEN_CACHE_TTL_SECONDS,
+            self.TOKEN_VERSION_CACHE_TTL_SECONDS
+        )
@@ -0,0 +1,55 @@
+""" Конфигурация релея transactional outbox """
+
+
+from pydantic import Field
+
+from backend.service_recipe.src.config.base import BaseRConfig
+
+
+class OutboxConfig(BaseRConfig):
+    """ Конфигурация публикации событий из outbox """
+
+    OUTBOX_RELAY_ENABLED: bool = Field(
+        default=True,
+        description="Запускать фоновый релей outbox"
+    )
+    OUTBOX_BATCH_SIZE: int = Field(
+        default=100,
+        gt=0,
+        description="Число событий в одной пачке релея"
+    )
+    OUTBOX_POLL_INTERVAL_SECONDS: float = Field(
+        default=1.0,
+        gt=0,
+        description="Пауза между опросами пустого outbox"
+    )
+    OUTBOX_MAX_ATTEMPTS: int = Field(
+        default=10,
+        gt=0,
+        description="Неудачных публикаций до пометки события dead_at"
+    )
+    OUTBOX_SENT_RETENTION_HOURS: float = Field(
+        default=24.0,
+        gt=0,
+        description="Сколько хранить отправленные события"
+    )
+    OUTBOX_PRUNE_BATCH_SIZE: int = Field(
+        default=1000,
+        gt=0,
+        description="Строк в одном DELETE при очистке outbox"
+    )
+    OUTBOX_PRUNE_INTERVAL_SECONDS: float = Field(
+        default=300.0,
+        gt=0,
+        description="Интервал очистки отправленных событий"
+    )
+    OUTBOX_PUBLISH_TIMEOUT_SECONDS: float = Field(
+        default=10.0,
+        gt=0,
+        description="Сколько ждать confirm одного события"
+    )
+    OUTBOX_CLAIM_LEASE_SECONDS: float = Field(
+        default=60.0,
+        gt=0,
+        description="Аренда взятых в публикацию событий (> таймаута)"
+    )
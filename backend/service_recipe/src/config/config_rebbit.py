@@ -12,3 +12,25 @@ class RebbitConfig(BaseRConfig):
     RABBITMQ_PASSWORD: str = Field(description='')
     RABBITMQ_VHOST: str = Field(description='')
     RABBITMQ_URL: str = Field(description='')
+
+    # PUBLISHER
+    PUBLISHER_CHANNEL_POOL_SIZE: int = Field(
+        default=4,
+        gt=0,
+        description='Число каналов publisher'
+    )
+    PUBLISHER_QUEUE_MAX_SIZE: int = Field(
+        default=10_000,
+        gt=0,
+        description='Ёмкость буфера сообщений (backpressure при заполнении)'
+    )
+    PUBLISHER_BATCH_SIZE: int = Field(
+        default=100,
+        gt=0,
+        description='Максимальный размер пачки публикации'
+    )
+    PUBLISHER_FLUSH_INTERVAL_MS: float = Field(
+        default=5.0,
+        ge=0,
+        description='Максимальное ожидание добора пачки, мс'
+    )
@@ -5,7 +5,9 @@ from .dependencies import (
     get_db,
     get_current_user,
     get_message_publisher,
+    get_recipe_cache,
     get_recipe_service,
+    get_token_verifier,
     get_user_service_client
 )
 
@@ -23,7 +25,9 @@ __all__ = [
     "get_db",
     "get_current_user",
     "get_message_publisher",
+    "get_recipe_cache",
     "get_recipe_service",
+    "get_token_verifier",
     "get_user_service_client",
     "UserServiceClient"
 ]
@@ -15,19 +15,32 @@ from dependency_injector import containers, providers
 
 from backend.service_recipe.src.infrastructure.grpc.client import (
     UserServiceClient)
+from backend.service_recipe.src.infrastructure.token_verifier import (
+    GrpcTokenVerifier,
+    JwksTokenVerifier,
+    LocalTokenVerifier,
+    TokenVersionChecker
+)
 from backend.service_recipe.src.config import (
     ApiRConfig,
     CORSConfig,
     UserServiceConfig,
-    RebbitConfig
+    RebbitConfig,
+    CacheConfig,
+    OutboxConfig
 )
 from backend.shared.database import (
     DataBaseConfig,
     ConnectionManager,
-    SessionManager
+    SessionManager,
+    AsyncConnectionManager,
+    AsyncSessionManager
 )
+from backend.shared.cache import LRUTTLCache
 from backend.service_recipe.src.service import (
-    MessagePublisher
+    MessagePublisher,
+    OutboxRelay,
+    RecipeCacheInvalidator
 )
 
 
@@ -50,9 +63,13 @@ class Container(containers.DeclarativeContainer):
     # Factory создает новый экземпляр каждый раз при запросе
     api_config = providers.Factory(ApiRConfig)
     cors_config = providers.Factory(CORSConfig)
-    user_config = providers.Factory(UserServiceConfig)
+    # Singleton: AUTH_MODE читается при каждом запросе (token_verifier),
+    # повторное чтение .env блокировало бы event loop
+    user_config = providers.Singleton(UserServiceConfig)
     db_config = providers.Factory(DataBaseConfig)
     rebbit_config = providers.Factory(RebbitConfig)
+    cache_config = providers.Factory(CacheConfig)
+    outbox_config = providers.Factory(OutboxConfig)
 
     # ==========================================
     # Сессия
@@ -69,12 +86,68 @@ class Container(containers.DeclarativeContainer):
         engine=connection_manager.provided.engine
     )
 
+    # Асинхронный engine для HTTP-слоя (не блокирует event loop)
+    async_connection_manager = providers.Singleton(
+        AsyncConnectionManager,
+        database_config=db_config
+    )
+
+    # Один async_sessionmaker на всё приложение
+    async_session_manager = providers.Singleton(
+        AsyncSessionManager,
+        engine=async_connection_manager.provided.engine
+    )
+
     # ==========================================
     # MESSAGE PUBLISHER (RabbitMQ)
     # ==========================================
     message_publisher = providers.Singleton(
         MessagePublisher,
-        connection_url=rebbit_config.provided.RABBITMQ_URL
+        connection_url=rebbit_config.provided.RABBITMQ_URL,
+        channel_pool_size=rebbit_config.provided.PUBLISHER_CHANNEL_POOL_SIZE,
+        queue_max_size=rebbit_config.provided.PUBLISHER_QUEUE_MAX_SIZE,
+        batch_size=rebbit_config.provided.PUBLISHER_BATCH_SIZE,
+        flush_interval=providers.Callable(
+            lambda ms: ms / 1000,
+            rebbit_config.provided.PUBLISHER_FLUSH_INTERVAL_MS
+        )
+    )
+
+    # ==========================================
+    # OUTBOX РЕЛЕЙ
+    # ==========================================
+    # Публикует события из outbox в фоне (запускается в lifespan)
+    outbox_relay = providers.Singleton(
+        OutboxRelay,
+        session_manager=async_session_manager,
+        publisher=message_publisher,
+        batch_size=outbox_config.provided.OUTBOX_BATCH_SIZE,
+        poll_interval=outbox_config.provided.OUTBOX_POLL_INTERVAL_SECONDS,
+        max_attempts=outbox_config.provided.OUTBOX_MAX_ATTEMPTS,
+        sent_retention_hours=(
+            outbox_config.provided.OUTBOX_SENT_RETENTION_HOURS),
+        prune_batch_size=outbox_config.provided.OUTBOX_PRUNE_BATCH_SIZE,
+        prune_interval=outbox_config.provided.OUTBOX_PRUNE_INTERVAL_SECONDS,
+        publish_timeout=(
+            outbox_config.provided.OUTBOX_PUBLISH_TIMEOUT_SECONDS),
+        claim_lease=outbox_config.provided.OUTBOX_CLAIM_LEASE_SECONDS
+    )
+
+    # ==========================================
+    # КЭШ РЕЦЕПТОВ
+    # ==========================================
+    # Один кэш на процесс: сериализованные RecipeResponse по id
+    recipe_cache = providers.Singleton(
+        LRUTTLCache,
+        max_size=cache_config.provided.RECIPE_CACHE_MAX_SIZE,
+        ttl_seconds=cache_config.provided.RECIPE_CACHE_TTL_SECONDS
+    )
+
+    # Инвалидация по событиям recipe.* от всех реплик
+    recipe_cache_invalidator = providers.Singleton(
+        RecipeCacheInvalidator,
+        connection_url=rebbit_config.provided.RABBITMQ_URL,
+        cache=recipe_cache
     )
 
     # ==========================================
@@ -83,7 +156,56 @@ class Container(containers.DeclarativeContainer):
     user_service_client = providers.Singleton(
         UserServiceClient,
         host=user_config.provided.GRPC_HOST,
-        port=user_config.provided.GRPC_PORT
+        port=user_config.provided.GRPC_PORT,
+        token_cache_size=user_config.provided.TOKEN_CACHE_MAX_SIZE,
+        token_cache_ttl=user_config.provided.get_token_cache_ttl.call(),
+        user_batch_size=user_config.provided.USER_BATCH_MAX_SIZE,
+        targets=user_config.provided.get_grpc_targets.call(),
+        channels_per_target=user_config.provided.GRPC_CHANNELS_PER_TARGET,
+        lb_policy=user_config.provided.GRPC_LB_POLICY,
+        keepalive_time_ms=user_config.provided.GRPC_KEEPALIVE_TIME_MS,
+        keepalive_timeout_ms=user_config.provided.GRPC_KEEPALIVE_TIMEOUT_MS,
+        call_timeout=user_config.provided.GRPC_CALL_TIMEOUT_SECONDS,
+        token_stream_enabled=user_config.provided.GRPC_TOKEN_STREAM_ENABLED
+    )
+
+    # ==========================================
+    # ПРОВЕРКА ТОКЕНОВ
+    # ==========================================
+    # Текущие версии токенов (claim ver) для проверки в процессе
+    token_version_checker = providers.Singleton(
+        TokenVersionChecker,
+        client=user_service_client,
+        cache=providers.Singleton(
+            LRUTTLCache,
+            max_size=user_config.provided.TOKEN_VERSION_CACHE_MAX_SIZE,
+            ttl_seconds=user_config.provided.TOKEN_VERSION_CACHE_TTL_SECONDS
+        )
+    )
+
+    # Выбор реализации по AUTH_MODE (local | jwks | grpc); конфиг
+    # и выбранный верификатор создаются один раз на процесс
+    token_verifier = providers.Selector(
+        providers.Callable(lambda config: config.AUTH_MODE, user_config),
+        local=providers.Singleton(
+            LocalTokenVerifier,
+            secret_key=user_config.provided.JWT_SECRET_KEY,
+            algorithm=user_config.provided.JWT_ALGORITHM,
+            versions=token_version_checker
+        ),
+        jwks=providers.Singleton(
+            JwksTokenVerifier,
+            jwks_url=user_config.provided.JWKS_URL,
+            algorithms=providers.List(user_config.provided.JWKS_ALGORITHM),
+            cache_ttl=user_config.provided.JWKS_CACHE_TTL_SECONDS,
+            min_refresh_interval=(
+                user_config.provided.JWKS_MIN_REFRESH_INTERVAL_SECONDS),
+            versions=token_version_checker
+        ),
+        grpc=providers.Singleton(
+            GrpcTokenVerifier,
+            client=user_service_client
+        )
     )
 
     # ==========================================
@@ -91,16 +213,18 @@ class Container(containers.DeclarativeContainer):
     # ==========================================
     # Все конфигурации в одном объекте
     configs = providers.Factory(
-        lambda api, user, rebbit, db: type('Configs', (), {
+        lambda api, user, rebbit, db, cache: type('Configs', (), {
             'api': api,
             'user': user,
             'db': db,
-            'rebbit': rebbit
+            'rebbit': rebbit,
+            'cache': cache
         })(),
         api=api_config,
         user=user_config,
         db=db_config,
-        rebbit=rebbit_config
+        rebbit=rebbit_config,
+        cache=cache_config
     )
 
 
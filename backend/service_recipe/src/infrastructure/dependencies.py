@@ -8,17 +8,23 @@ Dependencies для recipe_service
 """
 
 
+from typing import AsyncGenerator
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.service_recipe.src.infrastructure import (
     container
 )
+from backend.shared.cache import LRUTTLCache
 from backend.service_recipe.src.infrastructure.grpc.client import (
     UserServiceClient)
 from backend.service_recipe.src.infrastructure.security import oauth2_scheme
-from backend.service_recipe.src.repositories import SQLRecipeRepository
+from backend.service_recipe.src.protocols import TokenVerifierProtocol
+from backend.service_recipe.src.repositories import (
+    AsyncSQLRecipeRepository
+)
 from backend.service_recipe.src.service import (
     MessagePublisher,
     RecipeService
@@ -29,17 +35,14 @@ from backend.service_recipe.src.service import (
 # ПОДКЛЮЧЕНИЕ К БД
 # ==========================================
 
-def get_db():
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Dependency для получения сессии БД
+    Dependency для получения асинхронной сессии БД
     """
-    session_manager = container.session_manager()
-    session = session_manager.SessionLocal()
+    session_manager = container.async_session_manager()
 
-    try:
+    async with session_manager.SessionLocal() as session:
         yield session
-    finally:
-        session.close()
 
 
 # ==========================================
@@ -51,19 +54,27 @@ def get_user_service_client() -> UserServiceClient:
     return container.user_service_client()
 
 
+def get_token_verifier() -> TokenVerifierProtocol:
+    """
+    Проверка токенов из контейнера
+
+    Реализация выбирается по UserServiceConfig.AUTH_MODE
+    """
+    return container.token_verifier()
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(oauth2_scheme),
-    user_client: UserServiceClient = Depends(get_user_service_client)
+    verifier: TokenVerifierProtocol = Depends(get_token_verifier)
 ) -> dict:
     """
     Dependency для получения текущего авторизованного пользователя
 
-    Проверяет JWT токен через gRPC вызов к user_service
+    Проверяет JWT токен локально или через gRPC вызов к user_service
     """
     token = credentials.credentials
 
-    # Валидируем токен через gRPC
-    result = await user_client.validate_token(token)
+    result = await verifier.verify(token)
 
     if not result["valid"]:
 
@@ -91,15 +102,24 @@ def get_message_publisher() -> MessagePublisher:
     return container.message_publisher()
 
 
+# ==========================================
+# КЭШ
+# ==========================================
+
+def get_recipe_cache() -> LRUTTLCache:
+    """ Кэш сериализованных рецептов (один на процесс) """
+    return container.recipe_cache()
+
+
 # ==========================================
 # РЕПОЗИТОРИИ
 # ==========================================
 
 def get_recipe_repository(
-    db: Session = Depends(get_db)
-) -> SQLRecipeRepository:
+    db: AsyncSession = Depends(get_db)
+) -> AsyncSQLRecipeRepository:
     """Dependency для получения репозитория рецептов"""
-    return SQLRecipeRepository(db)
+    return AsyncSQLRecipeRepository(db)
 
 
 # ==========================================
@@ -107,7 +127,12 @@ def get_recipe_repository(
 # ==========================================
 
 def get_recipe_service(
-    recipe_repo: SQLRecipeRepository = Depends(get_recipe_repository)
+    recipe_repo: AsyncSQLRecipeRepository = Depends(
+        get_recipe_repository),
+    recipe_cache: LRUTTLCache = Depends(get_recipe_cache)
 ) -> RecipeService:
     """ Dependency для получения сервиса рецептов """
-    return RecipeService(recipe_repo=recipe_repo)
+    return RecipeService(
+        recipe_repo=recipe_repo,
+        recipe_cache=recipe_cache
+    )
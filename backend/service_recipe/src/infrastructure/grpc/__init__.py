@@ -3,12 +3,35 @@ gRPC client module for Recipe Service
 
 Экспортирует:
 - UserServiceClient: gRPC клиент для взаимодействия с user_service
+- ChannelPool: пул каналов с клиентской балансировкой
+- SingleFlight: объединение одинаковых конкурентных вызовов
+- UserLoader: пакетная загрузка пользователей (GetUsersByIds)
+- TokenValidationStream: проверка токенов через поток ValidateTokens
+- TokenStreamGroup: по потоку ValidateTokens на каждый канал пула
 """
 
+from backend.service_recipe.src.infrastructure.grpc.channel_pool import (
+    ChannelPool
+)
 from backend.service_recipe.src.infrastructure.grpc.client import (
     UserServiceClient
 )
+from backend.service_recipe.src.infrastructure.grpc.single_flight import (
+    SingleFlight
+)
+from backend.service_recipe.src.infrastructure.grpc.token_stream import (
+    TokenStreamGroup,
+    TokenValidationStream
+)
+from backend.service_recipe.src.infrastructure.grpc.user_loader import (
+    UserLoader
+)
 
 __all__ = [
+    "ChannelPool",
+    "SingleFlight",
+    "TokenStreamGroup",
+    "TokenValidationStream",
+    "UserLoader",
     "UserServiceClient"
 ]
@@ -0,0 +1,130 @@
+"""
+Пул gRPC каналов с клиентской балансировкой
+
+Каждый канал — отдельное HTTP/2 соединение. Пул держит несколько
+каналов на каждый endpoint user_service и распределяет вызовы
+между ними (round_robin или least_outstanding).
+"""
+
+import itertools
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Literal, Sequence
+
+import grpc
+
+from backend.shared.proto import user_service_pb2_grpc
+
+
+LBPolicy = Literal["round_robin", "least_outstanding"]
+
+
+@dataclass
+class PooledChannel:
+    """Канал пула и число выполняющихся на нём вызовов"""
+
+    target: str
+    channel: Any
+    stub: Any
+    outstanding: int = field(default=0)
+    calls: int = field(default=0)
+
+
+class ChannelPool:
+    """
+    Набор каналов к одному или нескольким endpoint'ам
+
+    Не потокобезопасен: рассчитан на один event loop.
+    """
+
+    def __init__(
+        self,
+        targets: Sequence[str],
+        channels_per_target: int = 1,
+        lb_policy: LBPolicy = "round_robin",
+        options: Sequence[tuple[str, Any]] = (),
+        channel_factory: Callable[..., Any] = None,
+        stub_factory: Callable[[Any], Any] = (
+            user_service_pb2_grpc.UserServiceStub)
+    ):
+        """
+        Args:
+            targets: Адреса endpoint'ов (host:port)
+            channels_per_target: Число каналов на каждый endpoint
+            lb_policy: Политика выбора канала
+            options: Опции каналов (keepalive и т.п.)
+            channel_factory: Фабрика канала (подменяется в тестах)
+            stub_factory: Фабрика stub по каналу
+        """
+        if not targets:
+            raise ValueError("Нужен хотя бы один endpoint")
+        if channels_per_target <= 0:
+            raise ValueError("channels_per_target должен быть положительным")
+        if lb_policy not in ("round_robin", "least_outstanding"):
+            raise ValueError(f"Неизвестная политика балансировки: {lb_policy}")
+
+        channel_factory = channel_factory or grpc.aio.insecure_channel
+        self.lb_policy = lb_policy
+        self._channels: list[PooledChannel] = []
+        # Каналы разных endpoint'ов чередуются, чтобы round_robin
+        # сразу распределял нагрузку между репликами
+        for _ in range(channels_per_target):
+            for target in targets:
+                channel = channel_factory(target, options=list(options))
+                self._channels.append(PooledChannel(
+                    target=target,
+                    channel=channel,
+                    stub=stub_factory(channel)
+                ))
+        self._rr = itertools.cycle(range(len(self._channels)))
+
+    def _pick(self) -> PooledChannel:
+        """ Выбрать канал по политике балансировки """
+        start = next(self._rr)
+        if self.lb_policy == "round_robin":
+            return self._channels[start]
+
+        # least_outstanding: минимум выполняющихся вызовов,
+        # при равенстве — по кругу, начиная со start
+        size = len(self._channels)
+        return min(
+            (self._channels[(start + i) % size] for i in range(size)),
+            key=lambda pooled: pooled.outstanding
+        )
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Any]:
+        """ Выдать stub выбранного канала на время вызова """
+        pooled = self._pick()
+        pooled.outstanding += 1
+        pooled.calls += 1
+        try:
+            yield pooled.stub
+        finally:
+            pooled.outstanding -= 1
+
+    def stubs(self) -> list[Any]:
+        """ Stub'ы всех каналов (по долгоживущему потоку на канал) """
+        return [pooled.stub for pooled in self._channels]
+
+    async def close(self) -> None:
+        """ Закрыть все каналы """
+        for pooled in self._channels:
+            await pooled.channel.close()
+
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    def stats(self) -> dict:
+        """ Распределение вызовов по каналам для метрик """
+        return {
+            "lb_policy": self.lb_policy,
+            "channels": [
+                {
+                    "target": pooled.target,
+                    "outstanding": pooled.outstanding,
+                    "calls": pooled.calls,
+                }
+                for pooled in self._channels
+            ],
+        }
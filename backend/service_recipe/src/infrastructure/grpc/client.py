@@ -1,12 +1,29 @@
 """ gRPC клиент для recipe_service """
 
+import asyncio
+import hashlib
+import time
+
 import grpc
-from typing import Optional
+from jose import JWTError, jwt
+from typing import Any, Optional, Sequence
 
+from backend.shared.cache import LRUTTLCache
+from backend.service_recipe.src.infrastructure.grpc.channel_pool import (
+    ChannelPool,
+    LBPolicy
+)
+from backend.service_recipe.src.infrastructure.grpc.single_flight import (
+    SingleFlight)
+from backend.service_recipe.src.infrastructure.grpc.token_stream import (
+    TokenStreamError,
+    TokenStreamGroup
+)
+from backend.service_recipe.src.infrastructure.grpc.user_loader import (
+    UserLoader)
 from backend.shared.proto import (
     user_service_pb2
 )
-from backend.shared.proto import user_service_pb2_grpc
 from backend.shared.logging.logger import get_logger
 
 
@@ -21,38 +38,148 @@ class UserServiceClient:
 
     def __init__(self,
                  host: str = "localhost",
-                 port: int = 50051):
+                 port: int = 50051,
+                 token_cache_size: int = 10000,
+                 token_cache_ttl: float = 60.0,
+                 user_batch_size: int = 100,
+                 targets: Optional[Sequence[str]] = None,
+                 channels_per_target: int = 1,
+                 lb_policy: LBPolicy = "round_robin",
+                 keepalive_time_ms: int = 30000,
+                 keepalive_timeout_ms: int = 10000,
+                 call_timeout: float = 1.0,
+                 token_stream_enabled: bool = False):
         self.host = host
         self.port = port
-        logger.info("gRPC client initialized", host=host, port=port)
-        self._channel: Optional[grpc.aio.Channel] = None
-        self._stub: Optional[user_service_pb2_grpc.UserServiceStub] = None
+        # Несколько реплик user_service; по умолчанию одна host:port
+        self.targets = list(targets) if targets else [f'{host}:{port}']
+        self.channels_per_target = channels_per_target
+        self.lb_policy = lb_policy
+        # Дедлайн каждого вызова в секундах
+        self.call_timeout = call_timeout
+        self.channel_options = [
+            ("grpc.keepalive_time_ms", keepalive_time_ms),
+            ("grpc.keepalive_timeout_ms", keepalive_timeout_ms),
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.max_pings_without_data", 0),
+            # Без этого каналы с одинаковыми опциями делят
+            # одно соединение и пул теряет смысл
+            ("grpc.use_local_subchannel_pool", 1),
+        ]
+        logger.info(
+            "gRPC client initialized",
+            targets=self.targets,
+            channels_per_target=channels_per_target,
+            lb_policy=lb_policy
+        )
+        self._pool: Optional[ChannelPool] = None
+
+        # Кэш положительных результатов ValidateToken.
+        # Ключ — sha256 токена: сам токен в памяти не храним
+        self.token_cache = LRUTTLCache(
+            max_size=token_cache_size,
+            ttl_seconds=token_cache_ttl
+        )
+        # Одинаковые конкурентные вызовы выполняются одним RPC
+        self.single_flight = SingleFlight()
+        # Поштучные load_user в одном тике уходят одним GetUsersByIds
+        self.user_loader = UserLoader(
+            self.get_users_by_ids,
+            max_batch_size=user_batch_size
+        )
+        # Проверки токенов мультиплексируются в потоки ValidateTokens,
+        # по одному на канал пула
+        self.token_stream_enabled = token_stream_enabled
+        self.token_stream = TokenStreamGroup(
+            lambda: self._pool.stubs()
+        )
 
     async def connect(self):
-        """Установка соединения"""
-        self._channel = grpc.aio.insecure_channel(f'{self.host}:{self.port}')
-        self._stub = user_service_pb2_grpc.UserServiceStub(self._channel)
+        """Установка соединения: пул каналов ко всем endpoint'ам"""
+        self._pool = ChannelPool(
+            targets=self.targets,
+            channels_per_target=self.channels_per_target,
+            lb_policy=self.lb_policy,
+            options=self.channel_options
+        )
 
     async def close(self):
         """Закрытие соединения"""
-        if self._channel:
-            await self._channel.close()
+        await self.token_stream.close()
+        if self._pool:
+            await self._pool.close()
+            self._pool = None
 
-    async def validate_token(self, token: str) -> dict:
-        """Валидация токена через gRPC"""
-        if not self._stub:
+    async def _call(self, method: str, request: Any) -> Any:
+        """Вызов RPC на канале, выбранном балансировщиком, с дедлайном"""
+        if not self._pool:
             await self.connect()
 
+        async with self._pool.acquire() as stub:
+            return await getattr(stub, method)(
+                request, timeout=self.call_timeout)
+
+    def pool_stats(self) -> dict:
+        """Распределение вызовов по каналам"""
+        if not self._pool:
+            return {"lb_policy": self.lb_policy, "channels": []}
+        return self._pool.stats()
+
+    @staticmethod
+    def _token_digest(token: str) -> bytes:
+        """Ключ кэша для токена"""
+        return hashlib.sha256(token.encode()).digest()
+
+    def _token_cache_ttl(self, token: str) -> float:
+        """
+        TTL записи кэша: не дольше, чем живёт сам токен
+
+        exp читается без проверки подписи — подпись уже проверил
+        user_service, а здесь нужен только срок жизни.
+        """
+        ttl = self.token_cache.ttl_seconds
         try:
-            response = await self._stub.ValidateToken(
-                user_service_pb2.ValidateTokenRequest(token=token)
-            )
-            return {
+            exp = jwt.get_unverified_claims(token).get("exp")
+        except JWTError:
+            return ttl
+        if exp is None:
+            return ttl
+        return min(ttl, float(exp) - time.time())
+
+    async def validate_token(self, token: str) -> dict:
+        """
+        Валидация токена через gRPC
+
+        Положительный результат кэшируется до истечения токена
+        (но не дольше TTL кэша); отказы не кэшируются.
+        Конкурентные проверки одного токена объединяются в один RPC.
+        """
+        key = self._token_digest(token)
+        cached = self.token_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
+        result = await self.single_flight.do(
+            ("ValidateToken", key),
+            lambda: self._validate_token_rpc(token, key)
+        )
+        return dict(result)
+
+    async def _validate_token_rpc(self, token: str, key: bytes) -> dict:
+        """Вызов ValidateToken с записью успешного результата в кэш"""
+        try:
+            response = await self._validate_token_call(token)
+            result = {
                 "valid": response.valid,
                 "user_id": response.user_id,
                 "email": response.email,
                 "error": response.error
             }
+            if result["valid"]:
+                ttl = self._token_cache_ttl(token)
+                if ttl > 0:
+                    self.token_cache.set(key, result, ttl_seconds=ttl)
+            return result
         except grpc.RpcError as e:
             logger.error(
                 "gRPC ValidateToken failed",
@@ -63,25 +190,110 @@ class UserServiceClient:
                 "valid": False,
                 "error": f"gRPC error: {e.code()}"
             }
+        except asyncio.TimeoutError:
+            logger.error("ValidateTokens stream timed out")
+            return {
+                "valid": False,
+                "error": "gRPC error: StatusCode.DEADLINE_EXCEEDED"
+            }
 
-    async def get_user_by_id(self, user_id: str) -> dict:
-        """Получение пользователя по ID"""
-        if not self._stub:
+    async def _validate_token_call(
+        self,
+        token: str
+    ) -> user_service_pb2.ValidateTokenResponse:
+        """
+        ValidateToken через поток или unary вызовом
+
+        При обрыве потока запрос повторяется unary вызовом.
+        """
+        request = user_service_pb2.ValidateTokenRequest(token=token)
+        if not self.token_stream_enabled:
+            return await self._call("ValidateToken", request)
+
+        if not self._pool:
             await self.connect()
+        try:
+            return await self.token_stream.validate(
+                token, timeout=self.call_timeout)
+        except TokenStreamError as e:
+            logger.warning(
+                "ValidateTokens stream failed, falling back to unary",
+                error=str(e)
+            )
+            return await self._call("ValidateToken", request)
 
+    async def get_user_by_id(self, user_id: str) -> dict:
+        """
+        Получение пользователя по ID
+
+        Конкурентные запросы одного пользователя объединяются в один RPC.
+        """
+        result = await self.single_flight.do(
+            ("GetUserById", user_id),
+            lambda: self._get_user_by_id_rpc(user_id)
+        )
+        return dict(result)
+
+    async def _get_user_by_id_rpc(self, user_id: str) -> dict:
+        """Вызов GetUserById"""
         logger.debug("Calling GetUserById gRPC method", user_id=user_id)
 
         try:
-            response = await self._stub.GetUserById(
+            response = await self._call(
+                "GetUserById",
                 user_service_pb2.GetUserByIdRequest(user_id=user_id)
             )
             return {
                 "id": response.id,
                 "email": response.email,
                 "user_name": response.user_name,
-                "exists": response.exists
+                "exists": response.exists,
+                "token_version": response.token_version
             }
         except grpc.RpcError as e:
             logger.error("gRPC GetUserById failed",
                          user_id=user_id, error_code=e.code())
             return {"exists": False, "error": str(e)}
+
+    async def get_users_by_ids(self, user_ids: list[str]) -> dict[str, dict]:
+        """
+        Получение пользователей по списку ID одним RPC
+
+        Returns:
+            Словарь {user_id: пользователь} для каждого запрошенного ID
+        """
+        logger.debug("Calling GetUsersByIds gRPC method", count=len(user_ids))
+
+        try:
+            response = await self._call(
+                "GetUsersByIds",
+                user_service_pb2.GetUsersByIdsRequest(user_ids=user_ids)
+            )
+        except grpc.RpcError as e:
+            logger.error("gRPC GetUsersByIds failed",
+                         count=len(user_ids), error_code=e.code())
+            return {
+                user_id: {"exists": False, "error": str(e)}
+                for user_id in user_ids
+            }
+
+        return {
+            requested: {
+                "id": user.id,
+                "email": user.email,
+                "user_name": user.user_name,
+                "exists": user.exists,
+                "token_version": user.token_version
+            }
+            for requested, user in zip(user_ids, response.users)
+        }
+
+    async def load_user(self, user_id: str) -> dict:
+        """
+        Получение пользователя через пакетный загрузчик
+
+        Используется там, где пользователей запрашивают поштучно
+        (например, авторов страницы рецептов): все вызовы одного
+        тика event loop объединяются в один GetUsersByIds.
+        """
+        return await self.user_loader.load(user_id)
@@ -0,0 +1,71 @@
+"""
+Объединение одинаковых конкурентных вызовов (singleflight)
+
+Пока вызов с ключом выполняется, остальные вызывающие с тем же
+ключом ждут его результат вместо отдельного RPC.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    Реестр выполняющихся вызовов
+
+    Вызов запускается отдельной задачей: отмена одного из ожидающих
+    не отменяет общий вызов для остальных.
+    """
+
+    def __init__(self):
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+
+        # Счётчики
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Выполнить fn или дождаться уже выполняющегося вызова с тем же ключом
+
+        Args:
+            key: Ключ вызова
+            fn: Фабрика корутины, выполняющей вызов
+
+        Returns:
+            Результат вызова (общий для всех ожидающих)
+        """
+        task = self._in_flight.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(
+                lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        """ Снять завершённый вызов с учёта """
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Результат мог остаться без ожидающих (все отменены)
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        """ Счётчики для метрик """
+        total = self.calls + self.coalesced
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "coalesced_ratio": round(self.coalesced / total, 4)
+            if total else 0.0,
+            "in_flight": len(self._in_flight),
+        }
@@ -0,0 +1,249 @@
+"""
+Мультиплексирование проверок токенов поверх потоков ValidateTokens
+
+Конкурентные validate() пишут запросы в общий двунаправленный поток,
+ответы сопоставляются с ожидающими по correlation_id. Так
+HTTP/2 фрейминг и планирование вызова не оплачиваются на каждый токен.
+
+Поток привязан к одному каналу на всё время жизни, поэтому
+TokenStreamGroup открывает по потоку на каждый канал пула и
+распределяет проверки между ними по кругу — так сохраняется
+балансировка между репликами user_service.
+
+Сервер в режиме thread отвечает на ValidateTokens UNIMPLEMENTED;
+такой поток больше не переоткрывается, и клиент остаётся на unary.
+"""
+
+import asyncio
+import itertools
+from typing import Any, Callable, Optional
+
+import grpc
+
+from backend.shared.logging.logger import get_logger
+from backend.shared.proto import user_service_pb2
+
+
+logger = get_logger(__name__).bind(
+    layer="grpc",
+    service="recipe"
+)
+
+
+class TokenStreamError(Exception):
+    """Поток ValidateTokens оборвался до получения ответа"""
+
+
+class TokenValidationStream:
+    """
+    Долгоживущий поток ValidateTokens
+
+    Поток открывается лениво и переоткрывается после обрыва;
+    ожидающие оборванного потока получают TokenStreamError.
+    """
+
+    def __init__(self, stub_provider: Callable[[], Any]):
+        """
+        Args:
+            stub_provider: Возвращает stub, на канале которого
+                открывается поток
+        """
+        self._stub_provider = stub_provider
+        self._call: Optional[Any] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        # grpc.aio допускает только одну незавершённую запись в поток
+        self._write_lock = asyncio.Lock()
+
+        # Сервер не поддерживает потоки (режим thread)
+        self.unsupported = False
+
+        # Счётчики
+        self.requests = 0
+        self.streams_opened = 0
+        self.stream_failures = 0
+
+    def _note_error(self, error: BaseException) -> None:
+        """ Запомнить, что сервер отклоняет ValidateTokens """
+        if (isinstance(error, grpc.RpcError)
+                and error.code() == grpc.StatusCode.UNIMPLEMENTED):
+            if not self.unsupported:
+                logger.warning(
+                    "ValidateTokens is not supported by user_service, "
+                    "using unary calls"
+                )
+            self.unsupported = True
+
+    def _ensure_open(self) -> Any:
+        """ Открыть поток, если он ещё не открыт или оборвался """
+        if self.unsupported:
+            raise TokenStreamError("ValidateTokens is not supported")
+        if self._call is None:
+            self._call = self._stub_provider().ValidateTokens()
+            self._reader = asyncio.ensure_future(self._read(self._call))
+            self.streams_opened += 1
+        return self._call
+
+    async def _read(self, call: Any) -> None:
+        """ Читать ответы и раздавать их ожидающим """
+        error: Optional[BaseException] = None
+        try:
+            while True:
+                response = await call.read()
+                if response is grpc.aio.EOF:
+                    break
+                future = self._pending.pop(response.correlation_id, None)
+                if future is not None and not future.done():
+                    future.set_result(response.result)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = e
+            self.stream_failures += 1
+            self._note_error(e)
+            if not self.unsupported:
+                logger.error("ValidateTokens stream failed", error=str(e))
+        finally:
+            if self._call is call:
+                self._call = None
+                self._reader = None
+            self._fail_pending(error)
+
+    def _fail_pending(self, error: Optional[BaseException]) -> None:
+        """ Завершить ошибкой всех, кто ждёт ответа оборванного потока """
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(
+                    TokenStreamError(str(error or "stream closed")))
+
+    async def validate(
+        self,
+        token: str,
+        timeout: Optional[float] = None
+    ) -> user_service_pb2.ValidateTokenResponse:
+        """
+        Проверить токен через общий поток
+
+        Raises:
+            TokenStreamError: Поток оборвался
+            asyncio.TimeoutError: Ответ не пришёл за timeout
+        """
+        correlation_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[correlation_id] = future
+        self.requests += 1
+
+        try:
+            async with self._write_lock:
+                call = self._ensure_open()
+                await call.write(user_service_pb2.ValidateTokensRequest(
+                    correlation_id=correlation_id,
+                    token=token
+                ))
+            return await asyncio.wait_for(future, timeout)
+        except grpc.RpcError as e:
+            self._note_error(e)
+            raise TokenStreamError(str(e)) from e
+        finally:
+            self._pending.pop(correlation_id, None)
+
+    async def close(self) -> None:
+        """ Закрыть поток """
+        call, reader = self._call, self._reader
+        self._call = None
+        self._reader = None
+        if call is not None:
+            try:
+                await call.done_writing()
+            except Exception:
+                pass
+            call.cancel()
+        if reader is not None:
+            reader.cancel()
+            try:
+                await reader
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._fail_pending(None)
+
+    def stats(self) -> dict:
+        """ Счётчики для метрик """
+        return {
+            "requests": self.requests,
+            "in_flight": len(self._pending),
+            "streams_opened": self.streams_opened,
+            "stream_failures": self.stream_failures,
+            "unsupported": self.unsupported,
+        }
+
+
+class TokenStreamGroup:
+    """
+    По потоку ValidateTokens на каждый канал пула
+
+    Потоки создаются лениво при первой проверке; проверки
+    распределяются между ними по кругу.
+    """
+
+    _COUNTERS = ("requests", "streams_opened", "stream_failures")
+
+    def __init__(self, stubs_provider: Callable[[], list[Any]]):
+        """
+        Args:
+            stubs_provider: Возвращает stub'ы всех каналов пула
+        """
+        self._stubs_provider = stubs_provider
+        self._streams: list[TokenValidationStream] = []
+        self._rr: Optional[itertools.cycle] = None
+        # Счётчики закрытых потоков остаются в метриках
+        self._closed = dict.fromkeys(self._COUNTERS, 0)
+
+    def _pick(self) -> TokenValidationStream:
+        """ Следующий поток по кругу """
+        if not self._streams:
+            self._streams = [
+                TokenValidationStream(lambda stub=stub: stub)
+                for stub in self._stubs_provider()
+            ]
+            self._rr = itertools.cycle(self._streams)
+        return next(self._rr)
+
+    async def validate(
+        self,
+        token: str,
+        timeout: Optional[float] = None
+    ) -> user_service_pb2.ValidateTokenResponse:
+        """
+        Проверить токен через поток очередного канала
+
+        Raises:
+            TokenStreamError: Поток оборвался или не поддерживается
+            asyncio.TimeoutError: Ответ не пришёл за timeout
+        """
+        return await self._pick().validate(token, timeout)
+
+    async def close(self) -> None:
+        """ Закрыть все потоки """
+        streams, self._streams = self._streams, []
+        self._rr = None
+        for stream in streams:
+            await stream.close()
+            stats = stream.stats()
+            for key in self._COUNTERS:
+                self._closed[key] += stats[key]
+
+    def stats(self) -> dict:
+        """ Суммарные счётчики потоков для метрик """
+        per_stream = [stream.stats() for stream in self._streams]
+        totals = {
+            key: self._closed[key] + sum(stats[key] for stats in per_stream)
+            for key in self._COUNTERS
+        }
+        totals["in_flight"] = sum(
+            stats["in_flight"] for stats in per_stream)
+        totals["streams"] = len(per_stream)
+        totals["unsupported"] = sum(
+            stats["unsupported"] for stats in per_stream)
+        return totals
@@ -0,0 +1,106 @@
+"""
+Загрузчик пользователей в стиле dataloader
+
+Запросы load(), сделанные в пределах одного тика event loop,
+собираются в один пакетный вызов GetUsersByIds.
+"""
+
+import asyncio
+from typing import Awaitable, Callable
+
+
+BatchFn = Callable[[list[str]], Awaitable[dict[str, dict]]]
+
+
+class UserLoader:
+    """
+    Пакетная загрузка пользователей по ID
+
+    Повторяющиеся ID в одном пакете запрашиваются один раз.
+    Результаты не кэшируются между тиками.
+    """
+
+    def __init__(self, batch_fn: BatchFn, max_batch_size: int = 100):
+        """
+        Args:
+            batch_fn: Пакетная загрузка: список ID -> {id: пользователь}
+            max_batch_size: Максимальное число ID в одном вызове
+        """
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size должен быть положительным")
+
+        self._batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self._pending: dict[str, list[asyncio.Future]] = {}
+        self._scheduled = False
+
+        # Счётчики
+        self.loads = 0
+        self.batches = 0
+        self.batched_ids = 0
+
+    async def load(self, user_id: str) -> dict:
+        """ Получить пользователя; вызов попадёт в ближайший пакет """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(user_id, []).append(future)
+        self.loads += 1
+
+        if not self._scheduled:
+            self._scheduled = True
+            # Отправка после того, как отработают все готовые корутины
+            loop.call_soon(self._dispatch)
+
+        return await future
+
+    async def load_many(self, user_ids: list[str]) -> list[dict]:
+        """ Получить нескольких пользователей в порядке запроса """
+        return list(await asyncio.gather(
+            *(self.load(user_id) for user_id in user_ids)
+        ))
+
+    def _dispatch(self) -> None:
+        """ Разбить накопленные запросы на пакеты и отправить """
+        pending, self._pending = self._pending, {}
+        self._scheduled = False
+
+        user_ids = list(pending)
+        for start in range(0, len(user_ids), self.max_batch_size):
+            chunk = {
+                user_id: pending[user_id]
+                for user_id in user_ids[start:start + self.max_batch_size]
+            }
+            asyncio.ensure_future(self._run_batch(chunk))
+
+    async def _run_batch(
+        self,
+        chunk: dict[str, list[asyncio.Future]]
+    ) -> None:
+        """ Выполнить один пакетный вызов и раздать результаты """
+        self.batches += 1
+        self.batched_ids += len(chunk)
+
+        try:
+            users = await self._batch_fn(list(chunk))
+        except Exception as e:
+            for futures in chunk.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for user_id, futures in chunk.items():
+            user = users.get(user_id, {"exists": False})
+            for future in futures:
+                if not future.done():
+                    future.set_result(dict(user))
+
+    def stats(self) -> dict:
+        """ Счётчики для метрик """
+        return {
+            "loads": self.loads,
+            "batches": self.batches,
+            "batched_ids": self.batched_ids,
+            "avg_batch_size": round(self.batched_ids / self.batches, 2)
+            if self.batches else 0.0,
+        }
@@ -0,0 +1,259 @@
+""" Проверка access токенов для recipe_service """
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional, Sequence
+
+import httpx
+from jose import ExpiredSignatureError, JWTError, jwt
+
+from backend.service_recipe.src.infrastructure.grpc.client import (
+    UserServiceClient)
+from backend.shared.cache import LRUTTLCache
+from backend.shared.logging.logger import get_logger
+
+
+logger = get_logger(__name__).bind(
+    layer="auth",
+    service="recipe"
+)
+
+
+def _invalid(error: str) -> dict:
+    return {"valid": False, "user_id": "", "email": "", "error": error}
+
+
+def _decode(
+    token: str,
+    key,
+    algorithms: Sequence[str]
+) -> tuple[dict, Optional[dict]]:
+    """
+    Проверка подписи, exp, типа и subject токена
+
+    Returns:
+        Результат проверки и claims (None, если токен невалиден)
+    """
+    try:
+        payload = jwt.decode(token, key, algorithms=list(algorithms))
+    except ExpiredSignatureError:
+        return _invalid("Token expired"), None
+    except JWTError:
+        return _invalid("Invalid token"), None
+
+    if payload.get("type") != "access":
+        return _invalid("Invalid token type"), None
+
+    user_id = payload.get("sub")
+    if not user_id:
+        return _invalid("Invalid token subject"), None
+
+    return {
+        "valid": True,
+        "user_id": user_id,
+        "email": payload.get("email") or "",
+        "error": ""
+    }, payload
+
+
+class TokenVersionUnavailable(Exception):
+    """Текущую версию токенов не удалось получить от user_service"""
+
+
+class TokenVersionChecker:
+    """
+    Проверка claim ver по текущей версии пользователя
+
+    Версия приходит из user_service (GetUsersByIds через пакетный
+    загрузчик клиента) и кэшируется на TTL кэша. Отзыв сессий
+    (logout-all) в user_service становится виден здесь не позже
+    чем через этот TTL.
+    """
+
+    def __init__(self, client: UserServiceClient, cache: LRUTTLCache):
+        """
+        Args:
+            client: gRPC клиент user_service
+            cache: Кэш версий (ключ — user_id из claim sub)
+        """
+        self.client = client
+        self.cache = cache
+
+    async def current(self, user_id: str) -> Optional[int]:
+        """
+        Текущая версия пользователя (None — пользователь не найден)
+
+        Raises:
+            TokenVersionUnavailable: user_service не ответил
+        """
+        cached = self.cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        user = await self.client.load_user(user_id)
+        if user.get("error"):
+            raise TokenVersionUnavailable(user["error"])
+        if not user.get("exists"):
+            return None
+
+        version = user["token_version"]
+        self.cache.set(user_id, version)
+        return version
+
+    async def check(self, result: dict, payload: dict) -> dict:
+        """Результат проверки токена с учётом claim ver"""
+        try:
+            current = await self.current(result["user_id"])
+        except TokenVersionUnavailable as e:
+            logger.warning("Token version check failed", error=str(e))
+            return _invalid("Token version check failed")
+
+        # Токены без ver считаются версией 0, как в user_service
+        if int(payload.get("ver", 0)) != current:
+            return _invalid("Token revoked")
+        return result
+
+
+class LocalTokenVerifier:
+    """
+    Проверяет access токен в процессе, без обращения к user_service
+
+    Проверяются подпись, срок действия (exp) и тип токена, а при
+    заданном versions — ещё и claim ver (отзыв сессий).
+    """
+
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str,
+        versions: Optional[TokenVersionChecker] = None
+    ):
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        self.versions = versions
+
+    async def verify(self, token: str) -> dict:
+        """Декодирование и валидация токена"""
+        result, payload = _decode(token, self.secret_key, [self.algorithm])
+        if payload is None or self.versions is None:
+            return result
+        return await self.versions.check(result, payload)
+
+
+async def _fetch_jwks(url: str) -> dict:
+    """Загрузка JWKS по HTTP"""
+    async with httpx.AsyncClient(timeout=5.0) as client:
+        response = await client.get(url)
+        response.raise_for_status()
+        return response.json()
+
+
+class JwksTokenVerifier:
+    """
+    Проверяет access токен публичным ключом из JWKS user_service
+
+    Секрет подписи сервису не нужен. Ключи кэшируются по kid
+    и перечитываются по TTL или при встрече неизвестного kid
+    (ротация ключей), но не чаще min_refresh_interval.
+    При заданном versions проверяется и claim ver.
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        algorithms: Sequence[str] = ("ES256",),
+        cache_ttl: float = 300.0,
+        min_refresh_interval: float = 10.0,
+        fetch: Callable[[str], Awaitable[dict]] = _fetch_jwks,
+        clock: Callable[[], float] = time.monotonic,
+        versions: Optional[TokenVersionChecker] = None
+    ):
+        self.jwks_url = jwks_url
+        self.algorithms = list(algorithms)
+        self.cache_ttl = cache_ttl
+        self.min_refresh_interval = min_refresh_interval
+        self._fetch = fetch
+        self._clock = clock
+        self.versions = versions
+        self._keys: dict[str, dict] = {}
+        self._fetched_at: Optional[float] = None
+        # Одна загрузка на всех, кто встретил неизвестный kid
+        self._refresh_lock = asyncio.Lock()
+
+        # Счётчики
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    async def verify(self, token: str) -> dict:
+        """Декодирование и валидация токена"""
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+        except JWTError:
+            return _invalid("Invalid token")
+        if not kid:
+            return _invalid("Invalid token")
+
+        key = await self._get_key(kid)
+        if key is None:
+            return _invalid("Unknown signing key")
+
+        result, payload = _decode(token, key, self.algorithms)
+        if payload is None or self.versions is None:
+            return result
+        return await self.versions.check(result, payload)
+
+    async def _get_key(self, kid: str) -> Optional[dict]:
+        """Ключ по kid с обновлением кэша по TTL и при неизвестном kid"""
+        stale = (
+            self._fetched_at is None
+            or self._clock() - self._fetched_at >= self.cache_ttl
+        )
+        if stale or kid not in self._keys:
+            await self._refresh()
+        return self._keys.get(kid)
+
+    async def _refresh(self) -> None:
+        """Перечитать JWKS (не чаще min_refresh_interval)"""
+        async with self._refresh_lock:
+            if (
+                self._fetched_at is not None
+                and self._clock() - self._fetched_at
+                < self.min_refresh_interval
+            ):
+                return
+
+            try:
+                jwks = await self._fetch(self.jwks_url)
+            except Exception as e:
+                # Старые ключи остаются в силе до следующей попытки
+                self.refresh_failures += 1
+                logger.warning("JWKS refresh failed", error=str(e))
+                self._fetched_at = self._clock()
+                return
+
+            self._keys = {
+                key["kid"]: key
+                for key in jwks.get("keys", [])
+                if key.get("kid")
+            }
+            self._fetched_at = self._clock()
+            self.refreshes += 1
+
+
+class GrpcTokenVerifier:
+    """ Проверяет токен вызовом ValidateToken в user_service """
+
+    def __init__(self, client: UserServiceClient):
+        self.client = client
+
+    async def verify(self, token: str) -> dict:
+        """Валидация токена через gRPC"""
+        result = await self.client.validate_token(token)
+
+        if not result["valid"]:
+            error = result.get("error")
+            # В ответе gRPC ошибка — google.rpc.Status
+            message = getattr(error, "message", error)
+            return _invalid(message or "Invalid token")
+
+        return result
@@ -4,6 +4,7 @@ Lifecycle management for Recipe Service
 Управляет только:
 - Alembic миграциями
 - Подключением к базе данных
+- Фоновыми задачами (релей outbox, инвалидация кэша)
 
 Остальные инициализации (gRPC, RabbitMQ) происходят в dependencies
 """
@@ -15,7 +16,7 @@ from alembic import command
 from alembic.config import Config
 
 from backend.shared.logging import get_logger
-from backend.shared.database import ConnectionManager, DataBaseConfig
+from backend.service_recipe.src.infrastructure import container
 
 
 @asynccontextmanager
@@ -32,17 +33,51 @@ async def lifespan(app: FastAPI):
     command.upgrade(alembic_cfg, "head")
     logger.info(">>> Migration Recipe_service успех")
 
-    # Проверяем подключение к базе данных
-    config = DataBaseConfig()
-    connection_manager = ConnectionManager(config)
+    # Проверяем подключение через асинхронный engine приложения
+    connection_manager = container.async_connection_manager()
 
-    if not connection_manager.test_connection():
+    if not await connection_manager.test_connection():
         logger.error("Failed to connect to database")
         raise Exception("Не удалось подключиться к базе данных")
 
     logger.info(">>> Database connection successful")
+
+    # Инвалидация кэша рецептов по событиям (best effort: без брокера
+    # кэш всё равно ограничен TTL и инвалидируется локально при записи)
+    invalidator = None
+    if container.cache_config().RECIPE_CACHE_INVALIDATION_ENABLED:
+        invalidator = container.recipe_cache_invalidator()
+        try:
+            await invalidator.start()
+            logger.info(">>> Recipe cache invalidation subscribed")
+        except Exception as e:
+            logger.warning(
+                "Recipe cache invalidation unavailable",
+                error=str(e)
+            )
+            invalidator = None
+
+    # Релей outbox: публикация событий вне пути запроса
+    relay = None
+    if container.outbox_config().OUTBOX_RELAY_ENABLED:
+        relay = container.outbox_relay()
+        relay.start()
+        logger.info(">>> Outbox relay started")
+
     logger.info(">>> Recipe Service started")
 
     yield
 
+    if relay is not None:
+        await relay.stop()
+        await container.message_publisher().close()
+
+    if invalidator is not None:
+        await invalidator.close()
+
+    # Поток ValidateTokens и каналы к user_service
+    await container.user_service_client().close()
+
+    # Закрываем пул соединений
+    await connection_manager.close()
     logger.info(">>> Recipe Service shutdown complete")
@@ -1,7 +1,9 @@
 from .recipe import Recipe
 from .ingredient import Ingredient
+from .outbox import OutboxEvent
 
 __all__ = [
     'Recipe',
-    'Ingredient'
+    'Ingredient',
+    'OutboxEvent'
 ]
@@ -0,0 +1,74 @@
+"""
+Модель transactional outbox для событий Recipe_Service
+"""
+
+
+from datetime import datetime
+from sqlalchemy import JSON, DateTime, Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from backend.shared.models.base_model import BaseModel
+
+
+class OutboxEvent(BaseModel):
+    """
+    Событие, ожидающее публикации в RabbitMQ
+
+    Пишется в той же транзакции, что и изменение данных;
+    публикуется фоновым OutboxRelay.
+    """
+
+    __tablename__ = "outbox"
+
+    __table_args__ = (
+        # Частичный индекс: релей читает только ожидающие события
+        Index(
+            'ix_outbox_unsent_created_at',
+            'created_at',
+            postgresql_where=text('sent_at IS NULL AND dead_at IS NULL')
+        ),
+        # Для пакетного удаления отправленных событий
+        Index(
+            'ix_outbox_sent_at',
+            'sent_at',
+            postgresql_where=text('sent_at IS NOT NULL')
+        ),
+    )
+
+    routing_key: Mapped[str] = mapped_column(
+        String(100),
+        nullable=False,
+        comment='Routing key события'
+    )
+
+    payload: Mapped[dict] = mapped_column(
+        JSON().with_variant(JSONB(), 'postgresql'),
+        nullable=False,
+        comment='Тело события'
+    )
+
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        nullable=False,
+        comment='Число неудачных попыток публикации'
+    )
+
+    sent_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment='Время успешной публикации'
+    )
+
+    dead_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment='Время исчерпания попыток публикации'
+    )
+
+    claimed_until: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment='До какого времени событие взято релеем в публикацию'
+    )
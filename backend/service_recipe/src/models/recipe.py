@@ -4,7 +4,7 @@
 
 
 from uuid import UUID as UUIDType
-from sqlalchemy import String
+from sqlalchemy import Index, String
 from sqlalchemy.orm import (
     Mapped,
     mapped_column,
@@ -19,6 +19,13 @@ from backend.shared.models.base_model import BaseModel
 class Recipe(BaseModel):
     """Модель рецепта"""
 
+    __table_args__ = (
+        # Keyset-пагинация: ORDER BY created_at DESC, id DESC
+        Index('ix_recipes_created_at_id', 'created_at', 'id'),
+        Index('ix_recipes_user_id_created_at_id',
+              'user_id', 'created_at', 'id'),
+    )
+
     user_id: Mapped[UUIDType] = mapped_column(
         UUIDTypeDecorator(),
         nullable=False,
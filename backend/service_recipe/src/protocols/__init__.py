@@ -1,5 +1,7 @@
 from .recipe_repository import RecipeRepositoryProtocol
+from .token_verifier import TokenVerifierProtocol
 
 __all__ = [
-    "RecipeRepositoryProtocol"
+    "RecipeRepositoryProtocol",
+    "TokenVerifierProtocol"
 ]
@@ -1,4 +1,5 @@
 
+from datetime import datetime
 from typing import Protocol, Optional
 
 from uuid import UUID
@@ -13,14 +14,18 @@ class RecipeRepositoryProtocol(Protocol):
     Любой класс, реализующий эти методы, может быть использован
     как RecipeRepositoryProtocol. Не нужно наследоваться!
 
+    Методы асинхронные: реализация — AsyncSQLRecipeRepository.
+
     """
 
-    def create(
+    async def create(
         self,
         user_id: UUID,
         name_recipe: str,
         description: str,
-        ingredients_data: list[dict]
+        ingredients_data: list[dict],
+        recipe_id: Optional[UUID] = None,
+        outbox_events: Optional[list[dict]] = None
     ) -> Recipe:
         """
         Создание рецепта в БД
@@ -30,13 +35,15 @@ class RecipeRepositoryProtocol(Protocol):
             name_recipe: Название рецепта
             description: Описание
             ingredients_data: Список ингредиентов
+            recipe_id: ID рецепта (по умолчанию генерируется)
+            outbox_events: События outbox, пишутся в той же транзакции
 
         Returns:
             Созданный объект Recipe
         """
         ...
 
-    def get_by_id(self, recipe_id: UUID) -> Optional[Recipe]:
+    async def get_by_id(self, recipe_id: UUID) -> Optional[Recipe]:
         """
         Получение рецепта по id
 
@@ -44,3 +51,19 @@ class RecipeRepositoryProtocol(Protocol):
         :return: Рецепт или None
         """
         ...
+
+    async def list_page(
+        self,
+        limit: int,
+        user_id: Optional[UUID] = None,
+        after: Optional[tuple[datetime, UUID]] = None
+    ) -> list[Recipe]:
+        """
+        Страница рецептов от новых к старым (keyset-пагинация)
+
+        :param limit: Размер страницы
+        :param user_id: Фильтр по автору
+        :param after: (created_at, id) последней записи предыдущей страницы
+        :return: До limit рецептов
+        """
+        ...
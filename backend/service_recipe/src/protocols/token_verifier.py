@@ -0,0 +1,21 @@
+
+from typing import Protocol
+
+
+class TokenVerifierProtocol(Protocol):
+    """
+    Интерфейс проверки access токена
+
+    Реализации: LocalTokenVerifier и JwksTokenVerifier (проверка
+    подписи и claim ver в процессе) и GrpcTokenVerifier (вызов
+    user_service).
+    """
+
+    async def verify(self, token: str) -> dict:
+        """
+        Проверка access токена
+
+        :param token: JWT из заголовка Authorization
+        :return: {"valid": bool, "user_id": str, "email": str, "error": str}
+        """
+        ...
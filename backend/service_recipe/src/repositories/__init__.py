@@ -1,5 +1,9 @@
 from .sql_recipe_repository import SQLRecipeRepository
+from .async_sql_recipe_repository import AsyncSQLRecipeRepository
+from .async_sql_outbox_repository import AsyncSQLOutboxRepository
 
 __all__ = [
-    "SQLRecipeRepository"
+    "SQLRecipeRepository",
+    "AsyncSQLRecipeRepository",
+    "AsyncSQLOutboxRepository"
 ]
@@ -0,0 +1,106 @@
+"""Асинхронный репозиторий transactional outbox"""
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy import case, delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.service_recipe.src.models import OutboxEvent
+
+
+class AsyncSQLOutboxRepository:
+    """Операции релея над таблицей outbox"""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def claim_pending(
+        self,
+        limit: int,
+        lease: timedelta
+    ) -> list[OutboxEvent]:
+        """
+        Забирает пачку неотправленных событий в публикацию
+
+        Строки выбираются FOR UPDATE SKIP LOCKED и получают
+        claimed_until = now + lease: блокировка держится только до
+        COMMIT этой короткой транзакции, а другие релеи (реплики) не
+        возьмут событие, пока аренда не истекла. Если релей упал,
+        не записав результат, событие снова станет доступно после
+        claimed_until.
+
+        Returns:
+            События в порядке создания
+        """
+        now = datetime.now(timezone.utc)
+        batch = (
+            select(OutboxEvent.id)
+            .where(
+                OutboxEvent.sent_at.is_(None),
+                OutboxEvent.dead_at.is_(None),
+                or_(
+                    OutboxEvent.claimed_until.is_(None),
+                    OutboxEvent.claimed_until < now
+                )
+            )
+            .order_by(OutboxEvent.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self._session.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id.in_(batch))
+            .values(claimed_until=now + lease)
+            .returning(OutboxEvent)
+        )
+        return sorted(result.scalars().all(), key=lambda e: e.created_at)
+
+    async def mark_sent(self, event_ids: list[UUID]) -> None:
+        """ Отмечает события опубликованными """
+        if not event_ids:
+            return
+        await self._session.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id.in_(event_ids))
+            .values(sent_at=datetime.now(timezone.utc), claimed_until=None)
+        )
+
+    async def mark_failed(self, event_id: UUID, max_attempts: int) -> bool:
+        """
+        Увеличивает счётчик неудачных попыток
+
+        На max_attempts-й неудаче событие помечается dead_at и больше
+        не выбирается релеем (разбор вручную).
+
+        Returns:
+            True, если событие исчерпало попытки
+        """
+        result = await self._session.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id == event_id)
+            .values(
+                attempts=OutboxEvent.attempts + 1,
+                claimed_until=None,
+                dead_at=case(
+                    (OutboxEvent.attempts + 1 >= max_attempts,
+                     datetime.now(timezone.utc)),
+                    else_=None
+                )
+            )
+            .returning(OutboxEvent.dead_at)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def prune_sent(self, sent_before: datetime, limit: int) -> int:
+        """ Удаляет не более limit событий, отправленных до sent_before """
+        batch = (
+            select(OutboxEvent.id)
+            .where(OutboxEvent.sent_at < sent_before)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self._session.execute(
+            delete(OutboxEvent).where(OutboxEvent.id.in_(batch))
+        )
+        return result.rowcount
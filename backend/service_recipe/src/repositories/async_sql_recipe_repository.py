@@ -0,0 +1,162 @@
+"""Асинхронный репозиторий для работы с рецептами в БД"""
+
+from datetime import datetime
+from uuid import UUID, uuid4
+from sqlalchemy import literal, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from backend.service_recipe.src.models import (
+    Recipe,
+    Ingredient,
+    OutboxEvent
+)
+from backend.service_recipe.src.repositories.recipe_statements import (
+    BULK_INSERT_DIALECTS,
+    build_recipe_insert
+)
+
+
+class AsyncSQLRecipeRepository:
+    """Асинхронный репозиторий для операций с рецептами"""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    def _supports_bulk_insert(self) -> bool:
+        """ Поддерживает ли диалект вставку через CTE с RETURNING """
+        return self._session.get_bind().dialect.name in BULK_INSERT_DIALECTS
+
+    async def create(
+        self,
+        user_id: UUID,
+        name_recipe: str,
+        description: str,
+        ingredients_data: list[dict],
+        recipe_id: UUID | None = None,
+        outbox_events: list[dict] | None = None
+    ) -> Recipe:
+        """
+        Создаёт рецепт в БД
+
+        Args:
+            user_id: ID пользователя-автора
+            name_recipe: Название рецепта
+            description: Описание
+            ingredients_data: Список ингредиентов [{
+                "ingredient": "...",
+                "quantity": "...",
+                "unit": "..."
+                }]
+            recipe_id: ID рецепта (по умолчанию генерируется)
+            outbox_events: События для outbox [{
+                "routing_key": "...",
+                "payload": {...}
+                }] — пишутся в той же транзакции
+
+        Returns:
+            Созданный объект Recipe
+        """
+        if self._supports_bulk_insert():
+            # Один round trip: рецепт, ингредиенты и outbox вставляются
+            # одним выражением, серверные значения — через RETURNING
+            prepared = build_recipe_insert(
+                user_id=user_id,
+                name_recipe=name_recipe,
+                description=description,
+                ingredients_data=ingredients_data,
+                recipe_id=recipe_id,
+                outbox_events=outbox_events
+            )
+            result = await self._session.execute(prepared.statement)
+            row = result.one()
+            await self._session.commit()
+            return prepared.build_recipe(row)
+
+        # Запасной путь для диалектов без CTE-вставок (SQLite в тестах)
+        recipe = Recipe(
+            id=recipe_id or uuid4(),
+            user_id=user_id,
+            name_recipe=name_recipe,
+            description=description,
+            ingredients=[
+                Ingredient(
+                    ingredient=ing_data["ingredient"],
+                    quantity=ing_data["quantity"],
+                    unit=ing_data["unit"]
+                )
+                for ing_data in ingredients_data
+            ]
+        )
+        self._session.add(recipe)
+        self._session.add_all(
+            OutboxEvent(
+                routing_key=event["routing_key"],
+                payload=event["payload"]
+            )
+            for event in outbox_events or []
+        )
+
+        await self._session.commit()
+        # Догружаем серверные значения (created_at/updated_at);
+        # ленивой загрузки в AsyncSession нет
+        await self._session.refresh(
+            recipe,
+            attribute_names=["created_at", "updated_at", "ingredients"]
+        )
+
+        return recipe
+
+    async def get_by_id(self, recipe_id: UUID) -> Recipe | None:
+        """ Получает рецепт по ID вместе с ингредиентами """
+        result = await self._session.execute(
+            select(Recipe)
+            .options(selectinload(Recipe.ingredients))
+            .where(Recipe.id == recipe_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def list_page(
+        self,
+        limit: int,
+        user_id: UUID | None = None,
+        after: tuple[datetime, UUID] | None = None
+    ) -> list[Recipe]:
+        """
+        Страница рецептов от новых к старым (keyset-пагинация)
+
+        Позиция задаётся последней записью предыдущей страницы,
+        поэтому стоимость запроса не зависит от глубины листания.
+        Ингредиенты всей страницы загружаются одним IN-запросом.
+
+        Args:
+            limit: Размер страницы
+            user_id: Фильтр по автору
+            after: (created_at, id) последней записи предыдущей страницы
+
+        Returns:
+            До limit рецептов
+        """
+        stmt = (
+            select(Recipe)
+            .options(selectinload(Recipe.ingredients))
+            .order_by(Recipe.created_at.desc(), Recipe.id.desc())
+            .limit(limit)
+        )
+
+        if user_id is not None:
+            stmt = stmt.where(Recipe.user_id == user_id)
+
+        if after is not None:
+            # Сравнение кортежей использует индекс (created_at, id);
+            # типы параметров задаём явно — tuple_ их не выводит
+            created_at, recipe_id = after
+            stmt = stmt.where(
+                tuple_(Recipe.created_at, Recipe.id) < tuple_(
+                    literal(created_at, Recipe.created_at.type),
+                    literal(recipe_id, Recipe.id.type)
+                )
+            )
+
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
@@ -0,0 +1,169 @@
+"""
+Построители SQL-выражений для репозиториев рецептов
+
+Общие для синхронного и асинхронного репозиториев: выражение строится
+один раз, исполняется любой сессией.
+"""
+
+from dataclasses import dataclass
+from uuid import UUID, uuid4
+
+from sqlalchemy import Select, func, insert, select
+
+from backend.service_recipe.src.models import (
+    Recipe,
+    Ingredient,
+    OutboxEvent
+)
+
+
+# Диалекты, поддерживающие data-modifying CTE с RETURNING
+BULK_INSERT_DIALECTS = frozenset({"postgresql"})
+
+
+@dataclass
+class RecipeInsert:
+    """
+    Подготовленная вставка рецепта с ингредиентами
+
+    Attributes:
+        statement: SELECT поверх CTE-вставок, возвращает
+                   created_at, updated_at рецепта и число ингредиентов
+        recipe_values: Значения строки рецепта
+        ingredient_values: Значения строк ингредиентов
+        outbox_values: Значения строк outbox
+    """
+
+    statement: Select
+    recipe_values: dict
+    ingredient_values: list[dict]
+    outbox_values: list[dict]
+
+    def build_recipe(self, row) -> Recipe:
+        """
+        Собирает объект Recipe из значений вставки и строки RETURNING
+
+        Объект не привязан к сессии: повторный SELECT не нужен.
+        """
+        recipe = Recipe(
+            **self.recipe_values,
+            created_at=row.created_at,
+            updated_at=row.updated_at
+        )
+        recipe.ingredients = [
+            Ingredient(
+                **values,
+                created_at=row.created_at,
+                updated_at=row.updated_at
+            )
+            for values in self.ingredient_values
+        ]
+        return recipe
+
+
+def build_recipe_insert(
+    user_id: UUID,
+    name_recipe: str,
+    description: str,
+    ingredients_data: list[dict],
+    recipe_id: UUID | None = None,
+    outbox_events: list[dict] | None = None
+) -> RecipeInsert:
+    """
+    Строит одно выражение для вставки рецепта и всех его ингредиентов
+
+    WITH r AS (INSERT INTO recipes ... RETURNING created_at, updated_at),
+         i AS (INSERT INTO ingredients VALUES (...), (...) RETURNING id),
+         o AS (INSERT INTO outbox VALUES (...) RETURNING id)
+    SELECT r.created_at, r.updated_at, (SELECT count(*) FROM i) FROM r
+
+    Идентификаторы генерируются на клиенте, поэтому ингредиенты
+    не зависят от результата вставки рецепта. Внешний ключ проверяется
+    в конце выражения, когда обе вставки уже выполнены.
+
+    Args:
+        recipe_id: ID рецепта (по умолчанию генерируется)
+        outbox_events: События [{"routing_key": ..., "payload": ...}],
+                       записываемые атомарно вместе с рецептом
+    """
+    recipe_values = {
+        "id": recipe_id or uuid4(),
+        "user_id": user_id,
+        "name_recipe": name_recipe,
+        "description": description,
+        "is_active": True
+    }
+    ingredient_values = [
+        {
+            "id": uuid4(),
+            "recipe_id": recipe_values["id"],
+            "ingredient": ing_data["ingredient"],
+            "quantity": ing_data["quantity"],
+            "unit": ing_data["unit"],
+            "is_active": True
+        }
+        for ing_data in ingredients_data
+    ]
+
+    outbox_values = [
+        {
+            "id": uuid4(),
+            "routing_key": event["routing_key"],
+            "payload": event["payload"],
+            "attempts": 0,
+            "is_active": True
+        }
+        for event in outbox_events or []
+    ]
+
+    recipe_cte = (
+        insert(Recipe)
+        .values(recipe_values)
+        .returning(Recipe.created_at, Recipe.updated_at)
+        .cte("inserted_recipe")
+    )
+
+    if ingredient_values:
+        ingredients_cte = (
+            insert(Ingredient)
+            .values(ingredient_values)
+            .returning(Ingredient.id)
+            .cte("inserted_ingredients")
+        )
+        # Подзапрос к CTE нужен, чтобы SQLAlchemy отрендерил вставку
+        ingredients_count = (
+            select(func.count())
+            .select_from(ingredients_cte)
+            .scalar_subquery()
+        )
+    else:
+        ingredients_count = select(0).scalar_subquery()
+
+    columns = [
+        recipe_cte.c.created_at,
+        recipe_cte.c.updated_at,
+        ingredients_count.label("ingredients_count")
+    ]
+
+    if outbox_values:
+        outbox_cte = (
+            insert(OutboxEvent)
+            .values(outbox_values)
+            .returning(OutboxEvent.id)
+            .cte("inserted_outbox")
+        )
+        columns.append(
+            select(func.count())
+            .select_from(outbox_cte)
+            .scalar_subquery()
+            .label("outbox_count")
+        )
+
+    statement = select(*columns)
+
+    return RecipeInsert(
+        statement=statement,
+        recipe_values=recipe_values,
+        ingredient_values=ingredient_values,
+        outbox_values=outbox_values
+    )
@@ -1,9 +1,17 @@
 """Репозиторий для работы с рецептами в БД"""
 
-from uuid import UUID
+from uuid import UUID, uuid4
 from sqlalchemy.orm import Session
 
-from backend.service_recipe.src.models import Recipe, Ingredient
+from backend.service_recipe.src.models import (
+    Recipe,
+    Ingredient,
+    OutboxEvent
+)
+from backend.service_recipe.src.repositories.recipe_statements import (
+    BULK_INSERT_DIALECTS,
+    build_recipe_insert
+)
 
 
 class SQLRecipeRepository:
@@ -12,12 +20,18 @@ class SQLRecipeRepository:
     def __init__(self, session: Session):
         self._session = session
 
+    def _supports_bulk_insert(self) -> bool:
+        """ Поддерживает ли диалект вставку через CTE с RETURNING """
+        return self._session.get_bind().dialect.name in BULK_INSERT_DIALECTS
+
     def create(
         self,
         user_id: UUID,
         name_recipe: str,
         description: str,
-        ingredients_data: list[dict]
+        ingredients_data: list[dict],
+        recipe_id: UUID | None = None,
+        outbox_events: list[dict] | None = None
     ) -> Recipe:
         """
         Создаёт рецепт в БД
@@ -31,12 +45,32 @@ class SQLRecipeRepository:
                 "quantity": "...",
                 "unit": "..."
                 }]
+            recipe_id: ID рецепта (по умолчанию генерируется)
+            outbox_events: События для outbox [{
+                "routing_key": "...",
+                "payload": {...}
+                }] — пишутся в той же транзакции
 
         Returns:
             Созданный объект Recipe
         """
+        if self._supports_bulk_insert():
+            # Один round trip вместо flush + N add + commit + refresh
+            prepared = build_recipe_insert(
+                user_id=user_id,
+                name_recipe=name_recipe,
+                description=description,
+                ingredients_data=ingredients_data,
+                recipe_id=recipe_id,
+                outbox_events=outbox_events
+            )
+            row = self._session.execute(prepared.statement).one()
+            self._session.commit()
+            return prepared.build_recipe(row)
+
         # Создаём рецепт
         recipe = Recipe(
+            id=recipe_id or uuid4(),
             user_id=user_id,
             name_recipe=name_recipe,
             description=description
@@ -54,6 +88,13 @@ class SQLRecipeRepository:
             )
             self._session.add(ingredient)
 
+        # События outbox — в той же транзакции, что и рецепт
+        for event in outbox_events or []:
+            self._session.add(OutboxEvent(
+                routing_key=event["routing_key"],
+                payload=event["payload"]
+            ))
+
         # Коммитим всё
         self._session.commit()
         self._session.refresh(recipe)  # Обновляем объект с данными из БД
@@ -5,6 +5,7 @@
     - ingredient_schema: Схемы ингредиентов
     - recipe_request: Схемы входящих запросов
     - recipe_response: Схемы ответов API
+    - recipe_page: Страница списка рецептов
     - recipe_dto: DTO для межсервисного общения
     - base: Базовые схемы с валидаторами
 """
@@ -12,6 +13,7 @@
 from .ingredient_schema import IngredientSchema, IngredientResponse
 from .recipe_request import RecipeCreate
 from .recipe_response import RecipeResponse
+from .recipe_page import RecipePage
 from .base import TitleValidatedModel, DescriptionValidatedModel
 from .recipe_dto import RecipeDTO
 
@@ -21,6 +23,7 @@ __all__ = [
     "IngredientResponse",
     "RecipeCreate",
     "RecipeResponse",
+    "RecipePage",
     "TitleValidatedModel",
     "DescriptionValidatedModel",
     "RecipeDTO"
@@ -0,0 +1,28 @@
+"""
+Схема страницы списка рецептов
+"""
+
+
+from pydantic import BaseModel, Field
+
+from backend.service_recipe.src.schemas.recipe_response import RecipeResponse
+
+
+class RecipePage(BaseModel):
+    """
+    Страница списка рецептов (keyset-пагинация)
+
+    Attributes:
+        items: Рецепты страницы, от новых к старым
+        next_cursor: Непрозрачный курсор следующей страницы
+                     (None — страница последняя)
+    """
+
+    items: list[RecipeResponse] = Field(
+        ...,
+        description="Рецепты страницы"
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description="Курсор следующей страницы"
+    )
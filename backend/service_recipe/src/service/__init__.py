@@ -1,10 +1,14 @@
 from .mappers import RecipeMapper
 from .message_broker import MessagePublisher
 from .recipe_service import RecipeService
+from .cache_invalidator import RecipeCacheInvalidator
+from .outbox_relay import OutboxRelay
 
 
 __all__ = [
     'RecipeMapper',
     'MessagePublisher',
-    'RecipeService'
+    'RecipeService',
+    'RecipeCacheInvalidator',
+    'OutboxRelay'
 ]
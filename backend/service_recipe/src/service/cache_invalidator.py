@@ -0,0 +1,73 @@
+""" Consumer событий RabbitMQ для инвалидации кэша рецептов """
+
+import json
+from typing import Optional
+from uuid import UUID
+
+import aio_pika
+
+from backend.shared.cache import LRUTTLCache
+from backend.shared.logging.logger import get_logger
+
+
+logger = get_logger(__name__).bind(
+    layer="service",
+    service="recipe"
+)
+
+
+class RecipeCacheInvalidator:
+    """
+    Слушает события recipe.* и удаляет изменённые рецепты из кэша
+
+    Каждый экземпляр сервиса получает собственную временную очередь,
+    поэтому запись в одной реплике инвалидирует кэш во всех.
+    """
+
+    EXCHANGE_NAME = "recipe_events"
+    ROUTING_KEY = "recipe.*"
+
+    def __init__(self, connection_url: str, cache: LRUTTLCache):
+        self.connection_url = connection_url
+        self.cache = cache
+        self._connection: Optional[aio_pika.abc.AbstractRobustConnection] = None
+
+    async def start(self) -> None:
+        """ Подключение и подписка на события рецептов """
+        self._connection = await aio_pika.connect_robust(
+            self.connection_url,
+            timeout=10
+        )
+        channel = await self._connection.channel()
+
+        exchange = await channel.declare_exchange(
+            self.EXCHANGE_NAME,
+            aio_pika.ExchangeType.TOPIC,
+            durable=True
+        )
+        # Эксклюзивная очередь живёт, пока жив экземпляр сервиса
+        queue = await channel.declare_queue(exclusive=True, auto_delete=True)
+        await queue.bind(exchange, routing_key=self.ROUTING_KEY)
+        await queue.consume(self._on_message, no_ack=True)
+
+    async def _on_message(
+        self,
+        message: aio_pika.abc.AbstractIncomingMessage
+    ) -> None:
+        """ Инвалидация записи по recipe_id из события """
+        try:
+            recipe_id = UUID(json.loads(message.body)["recipe_id"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning(
+                "Cache invalidation event without recipe_id",
+                routing_key=message.routing_key
+            )
+            return
+
+        self.cache.invalidate(recipe_id)
+
+    async def close(self) -> None:
+        """ Закрытие соединения """
+        if self._connection and not self._connection.is_closed:
+            await self._connection.close()
+            self._connection = None
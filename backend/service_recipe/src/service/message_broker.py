@@ -1,65 +1,232 @@
 """ Publisher для отправки событий в RabbitMQ """
 
 import json
+import time
 import asyncio
 import aio_pika
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+
+@dataclass
+class _PendingMessage:
+    """ Сообщение в буфере и future подтверждения брокером """
+
+    routing_key: str
+    message: aio_pika.Message
+    confirmed: asyncio.Future = field(repr=False)
 
 
 class MessagePublisher:
-    """Publisher для RabbitMQ"""
+    """
+    Publisher для RabbitMQ с буферизацией и publisher confirms
+
+    - exchange объявляется один раз при подключении;
+    - сообщения копятся в ограниченной очереди и отправляются пачками
+      по размеру или по таймеру; при заполнении очереди publish()
+      ждёт (backpressure);
+    - пачка распределяется по пулу каналов, подтверждения (confirms)
+      ожидаются конкурентно;
+    - publish() возвращает управление после подтверждения брокером,
+      поэтому вызывающий код (релей outbox) сохраняет at-least-once.
+    """
 
-    def __init__(self, connection_url: str):
+    EXCHANGE_NAME = "recipe_events"
+
+    def __init__(
+        self,
+        connection_url: str,
+        channel_pool_size: int = 4,
+        queue_max_size: int = 10_000,
+        batch_size: int = 100,
+        flush_interval: float = 0.005,
+        connect: Callable[..., Awaitable] = aio_pika.connect_robust
+    ):
+        """
+        Args:
+            connection_url: URL RabbitMQ
+            channel_pool_size: Число каналов для публикации
+            queue_max_size: Ёмкость буфера сообщений
+            batch_size: Максимальный размер пачки
+            flush_interval: Максимальное ожидание добора пачки, секунды
+            connect: Фабрика соединения (подменяется в тестах/бенчмарках)
+        """
         self.connection_url = connection_url
-        self._connection: Optional[aio_pika.Connection] = None
-        self._channel: Optional[aio_pika.Channel] = None
+        self.channel_pool_size = channel_pool_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._connect = connect
+
+        self._connection: Optional[aio_pika.abc.AbstractRobustConnection] = None
+        self._exchanges: list[aio_pika.abc.AbstractExchange] = []
+        self._queue: asyncio.Queue[_PendingMessage] = asyncio.Queue(
+            maxsize=queue_max_size)
+        self._flusher: Optional[asyncio.Task] = None
         self._lock = asyncio.Lock()
 
+        # Метрики
+        self.published = 0
+        self.confirm_failures = 0
+        self.flushes = 0
+        self.flush_latency_total = 0.0
+        self.flush_latency_max = 0.0
+
     async def connect(self):
-        """Установка соединения с RabbitMQ"""
+        """Установка соединения, пула каналов и объявление exchange"""
         if self._connection and not self._connection.is_closed:
             return
 
-        self._connection = await aio_pika.connect_robust(
+        self._connection = await self._connect(
             self.connection_url,
             timeout=10
         )
-        self._channel = await self._connection.channel()
 
-        # Делаем канал устойчивым к ошибкам
-        await self._channel.set_qos(prefetch_count=10)
+        exchanges = []
+        for _ in range(self.channel_pool_size):
+            channel = await self._connection.channel(publisher_confirms=True)
+            if not exchanges:
+                exchange = await channel.declare_exchange(
+                    self.EXCHANGE_NAME,
+                    aio_pika.ExchangeType.TOPIC,
+                    durable=True
+                )
+            else:
+                # Exchange уже объявлен — только привязка к каналу
+                exchange = await channel.get_exchange(
+                    self.EXCHANGE_NAME,
+                    ensure=False
+                )
+            exchanges.append(exchange)
+        self._exchanges = exchanges
 
     async def _ensure_connected(self):
-        """Гарантирует подключение перед отправкой"""
+        """Гарантирует подключение и запущенный flusher"""
+        if self._flusher is not None and not self._flusher.done():
+            return
         async with self._lock:
-            if not self._channel or self._channel.is_closed:
+            if self._flusher is None or self._flusher.done():
                 await self.connect()
+                self._flusher = asyncio.create_task(self._flush_loop())
 
-    async def publish_recipe_created(self, recipe_data: dict):
-        """Отправка события о создании рецепта"""
+    async def publish(self, routing_key: str, payload: dict):
+        """
+        Отправка события в exchange recipe_events
+
+        Ждёт места в буфере (backpressure) и подтверждения брокером.
+
+        Raises:
+            aio_pika.exceptions.DeliveryError: брокер отклонил сообщение
+        """
         await self._ensure_connected()
 
-        exchange = await self._channel.declare_exchange(
-            "recipe_events",
-            aio_pika.ExchangeType.TOPIC,
-            durable=True
+        pending = _PendingMessage(
+            routing_key=routing_key,
+            message=aio_pika.Message(
+                body=json.dumps(payload).encode(),
+                content_type="application/json",
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT
+            ),
+            confirmed=asyncio.get_running_loop().create_future()
         )
+        await self._queue.put(pending)
+        await pending.confirmed
 
-        message = aio_pika.Message(
-            body=json.dumps(recipe_data).encode(),
-            content_type="application/json",
-            delivery_mode=aio_pika.DeliveryMode.PERSISTENT
-        )
+    async def publish_recipe_created(self, recipe_data: dict):
+        """Отправка события о создании рецепта"""
+        await self.publish("recipe.created", recipe_data)
 
-        await exchange.publish(
-            message,
-            routing_key="recipe.created"
-        )
+    async def _collect_batch(self) -> list[_PendingMessage]:
+        """Первое сообщение ждём без ограничения, остальные — до таймера"""
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(
+                    await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _publish_one(
+        self,
+        exchange: aio_pika.abc.AbstractExchange,
+        pending: _PendingMessage
+    ) -> None:
+        """Публикация с ожиданием confirm; результат — в future"""
+        try:
+            await exchange.publish(
+                pending.message,
+                routing_key=pending.routing_key
+            )
+        except Exception as e:
+            self.confirm_failures += 1
+            if not pending.confirmed.done():
+                pending.confirmed.set_exception(e)
+            return
+
+        self.published += 1
+        if not pending.confirmed.done():
+            pending.confirmed.set_result(None)
+
+    async def flush(self, batch: list[_PendingMessage]) -> None:
+        """Отправка пачки, распределённой по пулу каналов"""
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            self._publish_one(
+                self._exchanges[number % len(self._exchanges)],
+                pending
+            )
+            for number, pending in enumerate(batch)
+        ))
+
+        latency = time.perf_counter() - started
+        self.flushes += 1
+        self.flush_latency_total += latency
+        self.flush_latency_max = max(self.flush_latency_max, latency)
+
+    async def _flush_loop(self) -> None:
+        """Фоновая отправка пачек до отмены задачи"""
+        while True:
+            batch = await self._collect_batch()
+            try:
+                await self.flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def stats(self) -> dict:
+        """Метрики publisher для /metrics"""
+        return {
+            "queue_depth": self._queue.qsize(),
+            "queue_max_size": self._queue.maxsize,
+            "channel_pool_size": len(self._exchanges),
+            "published": self.published,
+            "confirm_failures": self.confirm_failures,
+            "flushes": self.flushes,
+            "flush_latency_avg_ms": round(
+                self.flush_latency_total / self.flushes * 1000, 3
+            ) if self.flushes else 0.0,
+            "flush_latency_max_ms": round(self.flush_latency_max * 1000, 3),
+        }
 
     async def close(self):
-        """Закрытие соединения"""
+        """Отправка остатка буфера и закрытие соединения"""
         async with self._lock:
+            if self._flusher is not None:
+                if not self._flusher.done():
+                    await self._queue.join()
+                self._flusher.cancel()
+                try:
+                    await self._flusher
+                except asyncio.CancelledError:
+                    pass
+                self._flusher = None
+
             if self._connection and not self._connection.is_closed:
                 await self._connection.close()
-                self._connection = None
-                self._channel = None
+            self._connection = None
+            self._exchanges = []
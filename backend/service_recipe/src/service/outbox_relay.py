@@ -0,0 +1,193 @@
+""" Фоновый релей transactional outbox → RabbitMQ """
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+from backend.service_recipe.src.repositories import AsyncSQLOutboxRepository
+from backend.service_recipe.src.service.message_broker import MessagePublisher
+from backend.shared.database import AsyncSessionManager
+from backend.shared.logging.logger import get_logger
+
+
+logger = get_logger(__name__).bind(
+    layer="service",
+    service="recipe"
+)
+
+
+class OutboxRelay:
+    """
+    Публикует события из таблицы outbox пачками
+
+    Пачка проходит три шага: короткая транзакция забирает события
+    (FOR UPDATE SKIP LOCKED + аренда claimed_until), публикация идёт
+    вне транзакции, вторая короткая транзакция записывает результат
+    (sent_at или attempts). Ожидание confirms не держит ни блокировок
+    строк, ни соединения с БД. Каждая публикация ограничена
+    publish_timeout, аренда claim_lease должна быть больше: иначе
+    событие, ещё ожидающее confirm, может забрать другой релей.
+
+    События пачки публикуются конкурентно, порядок доставки
+    не гарантируется. Доставка at-least-once: при падении между
+    публикацией и записью результата события уйдут повторно после
+    истечения аренды, потребители должны быть идемпотентны.
+
+    Событие, не опубликованное max_attempts раз, помечается dead_at
+    и больше не выбирается. Отправленные события старше
+    sent_retention_hours удаляются пакетами раз в prune_interval.
+    """
+
+    def __init__(
+        self,
+        session_manager: AsyncSessionManager,
+        publisher: MessagePublisher,
+        batch_size: int,
+        poll_interval: float,
+        max_attempts: int = 10,
+        sent_retention_hours: float = 24.0,
+        prune_batch_size: int = 1000,
+        prune_interval: float = 300.0,
+        publish_timeout: float = 10.0,
+        claim_lease: float = 60.0
+    ):
+        if claim_lease <= publish_timeout:
+            raise ValueError(
+                "claim_lease должен быть больше publish_timeout")
+
+        self.session_manager = session_manager
+        self.publisher = publisher
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.sent_retention = timedelta(hours=sent_retention_hours)
+        self.prune_batch_size = prune_batch_size
+        self.prune_interval = prune_interval
+        self.publish_timeout = publish_timeout
+        self.claim_lease = timedelta(seconds=claim_lease)
+        self._last_prune: float | None = None
+        self._task: asyncio.Task | None = None
+        self._stopping = asyncio.Event()
+
+    async def relay_batch(self) -> int:
+        """
+        Публикует одну пачку событий
+
+        События пачки отправляются конкурентно: publisher сам собирает
+        их в пачку и ждёт confirms. Подтверждённые отмечаются sent_at,
+        неудачные и не подтверждённые за publish_timeout остаются
+        в outbox до следующей итерации.
+
+        Returns:
+            Число опубликованных событий
+        """
+        async with self.session_manager.get_db_context() as db:
+            events = await AsyncSQLOutboxRepository(db).claim_pending(
+                self.batch_size, self.claim_lease)
+
+        if not events:
+            return 0
+
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(
+                    self.publisher.publish(event.routing_key, event.payload),
+                    timeout=self.publish_timeout
+                )
+                for event in events
+            ),
+            return_exceptions=True
+        )
+
+        sent_ids = []
+        async with self.session_manager.get_db_context() as db:
+            repo = AsyncSQLOutboxRepository(db)
+            for event, result in zip(events, results):
+                if isinstance(result, BaseException):
+                    logger.warning(
+                        "Outbox publish failed",
+                        event_id=str(event.id),
+                        routing_key=event.routing_key,
+                        error=str(result) or type(result).__name__
+                    )
+                    if await repo.mark_failed(event.id, self.max_attempts):
+                        logger.error(
+                            "Outbox event is dead",
+                            event_id=str(event.id),
+                            routing_key=event.routing_key,
+                            attempts=self.max_attempts
+                        )
+                else:
+                    sent_ids.append(event.id)
+
+            await repo.mark_sent(sent_ids)
+
+        return len(sent_ids)
+
+    async def prune_sent(self) -> int:
+        """
+        Удаляет отправленные события старше срока хранения
+
+        Пакетами по prune_batch_size строк, каждый пакет — отдельная
+        короткая транзакция.
+
+        Returns:
+            Число удалённых событий
+        """
+        sent_before = datetime.now(timezone.utc) - self.sent_retention
+        deleted = 0
+        while True:
+            async with self.session_manager.get_db_context() as db:
+                rows = await AsyncSQLOutboxRepository(db).prune_sent(
+                    sent_before, self.prune_batch_size)
+            deleted += rows
+            if rows < self.prune_batch_size or self._stopping.is_set():
+                break
+
+        if deleted:
+            logger.info("Outbox pruned", deleted=deleted)
+        return deleted
+
+    async def _maybe_prune(self) -> None:
+        now = time.monotonic()
+        if (self._last_prune is not None
+                and now - self._last_prune < self.prune_interval):
+            return
+        self._last_prune = now
+        try:
+            await self.prune_sent()
+        except Exception as e:
+            logger.error("Outbox prune failed", error=str(e))
+
+    async def run(self) -> None:
+        """ Цикл релея до вызова stop() """
+        while not self._stopping.is_set():
+            try:
+                sent = await self.relay_batch()
+            except Exception as e:
+                logger.error("Outbox relay iteration failed", error=str(e))
+                sent = 0
+
+            await self._maybe_prune()
+
+            # Полная пачка — вероятно, есть ещё: продолжаем без паузы
+            if sent < self.batch_size:
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(),
+                        timeout=self.poll_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+    def start(self) -> None:
+        """ Запуск релея фоновой задачей """
+        self._stopping.clear()
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """ Остановка релея после текущей пачки """
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
@@ -0,0 +1,52 @@
+""" Непрозрачные курсоры для keyset-пагинации """
+
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+
+
+class InvalidCursorError(ValueError):
+    """ Курсор повреждён или сформирован не этим сервисом """
+
+
+def encode_cursor(created_at: datetime, recipe_id: UUID) -> str:
+    """
+    Кодирует позицию (created_at, id) последней записи страницы
+
+    Returns:
+        base64url-строка без паддинга
+    """
+    raw = json.dumps(
+        [created_at.isoformat(), str(recipe_id)],
+        separators=(",", ":")
+    ).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Декодирует курсор в позицию (created_at, id)
+
+    Raises:
+        InvalidCursorError: Если курсор не удаётся разобрать
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("Некорректный курсор") from e
+
+    # Валидный JSON другой формы (не пара строк) — тоже мусор
+    if (
+        not isinstance(payload, list)
+        or len(payload) != 2
+        or not all(isinstance(item, str) for item in payload)
+    ):
+        raise InvalidCursorError("Некорректный курсор")
+
+    created_at, recipe_id = payload
+    try:
+        return datetime.fromisoformat(created_at), UUID(recipe_id)
+    except ValueError as e:
+        raise InvalidCursorError("Некорректный курсор") from e
@@ -1,11 +1,21 @@
 """ Сервис для работы с рецептами """
 
-from uuid import UUID
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
 
-from backend.service_recipe.src.schemas import RecipeCreate, RecipeResponse
+from backend.shared.cache import LRUTTLCache
+from backend.service_recipe.src.schemas import (
+    RecipeCreate,
+    RecipePage,
+    RecipeResponse
+)
 from backend.service_recipe.src.protocols.recipe_repository import (
     RecipeRepositoryProtocol)
 from backend.service_recipe.src.service.mappers import RecipeMapper
+from backend.service_recipe.src.service.pagination import (
+    decode_cursor,
+    encode_cursor
+)
 
 
 class RecipeService:
@@ -13,11 +23,13 @@ class RecipeService:
 
     def __init__(
         self,
-        recipe_repo: RecipeRepositoryProtocol
+        recipe_repo: RecipeRepositoryProtocol,
+        recipe_cache: LRUTTLCache | None = None
     ):
         self.recipe_repo = recipe_repo
+        self.recipe_cache = recipe_cache
 
-    def create_recipe(
+    async def create_recipe(
         self,
         recipe_data: RecipeCreate,
         user_id: UUID
@@ -25,6 +37,9 @@ class RecipeService:
         """
         Создаёт рецепт
 
+        Событие recipe.created пишется в outbox атомарно с рецептом
+        и публикуется фоновым OutboxRelay.
+
         Args:
             recipe_data: Данные рецепта от клиента
             user_id: ID автора рецепта (из токена)
@@ -42,13 +57,104 @@ class RecipeService:
             for ing in recipe_data.ingredients
         ]
 
+        # ID генерируем заранее: он нужен событию, которое пишется
+        # в outbox в той же транзакции, что и рецепт
+        recipe_id = uuid4()
+        created_event = {
+            "routing_key": "recipe.created",
+            "payload": {
+                "type": "recipe.created",
+                "recipe_id": str(recipe_id),
+                "payload": {
+                    "id": str(recipe_id),
+                    "title": recipe_data.name_recipe,
+                    "description": recipe_data.description
+                },
+                "timestamp": datetime.now(timezone.utc).isoformat()
+            }
+        }
+
         # Репозиторий создаёт рецепт в БД и возвращает модель Recipe
-        recipe = self.recipe_repo.create(
+        recipe = await self.recipe_repo.create(
             user_id=user_id,
             name_recipe=recipe_data.name_recipe,
             description=recipe_data.description,
-            ingredients_data=ingredients_data
+            ingredients_data=ingredients_data,
+            recipe_id=recipe_id,
+            outbox_events=[created_event]
         )
 
+        # Запись рецепта инвалидирует его закэшированное представление
+        if self.recipe_cache is not None:
+            self.recipe_cache.invalidate(recipe.id)
+
         # Маппим модель БД в HTTP ответ для клиента
         return RecipeMapper.to_response(recipe)
+
+    async def get_recipe_json(self, recipe_id: UUID) -> bytes | None:
+        """
+        Возвращает рецепт, сериализованный в JSON
+
+        Горячие рецепты отдаются из кэша без обращения к БД.
+
+        Args:
+            recipe_id: ID рецепта
+
+        Returns:
+            JSON RecipeResponse в байтах или None, если рецепт не найден
+        """
+        if self.recipe_cache is not None:
+            cached = self.recipe_cache.get(recipe_id)
+            if cached is not None:
+                return cached
+
+        recipe = await self.recipe_repo.get_by_id(recipe_id)
+        if recipe is None:
+            return None
+
+        body = RecipeMapper.to_response(recipe).model_dump_json().encode()
+
+        if self.recipe_cache is not None:
+            self.recipe_cache.set(recipe_id, body)
+
+        return body
+
+    async def list_recipes(
+        self,
+        limit: int,
+        cursor: str | None = None,
+        user_id: UUID | None = None
+    ) -> RecipePage:
+        """
+        Список рецептов с keyset-пагинацией
+
+        Args:
+            limit: Размер страницы
+            cursor: Курсор из предыдущей страницы
+            user_id: Фильтр по автору
+
+        Returns:
+            Страница рецептов и курсор следующей
+
+        Raises:
+            InvalidCursorError: Если курсор некорректен
+        """
+        after = decode_cursor(cursor) if cursor else None
+
+        # Запрашиваем на одну запись больше, чтобы узнать о следующей
+        recipes = await self.recipe_repo.list_page(
+            limit=limit + 1,
+            user_id=user_id,
+            after=after
+        )
+
+        next_cursor = None
+        if len(recipes) > limit:
+            recipes = recipes[:limit]
+            last = recipes[-1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+
+        return RecipePage(
+            items=[RecipeMapper.to_response(recipe) for recipe in recipes],
+            next_cursor=next_cursor
+        )
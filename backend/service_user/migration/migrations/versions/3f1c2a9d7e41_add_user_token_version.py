@@ -0,0 +1,37 @@
+"""add user token_version
+
+Revision ID: 3f1c2a9d7e41
+Revises: bccd8ae6df97
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a9d7e41'
+down_revision: Union[str, Sequence[str], None] = 'bccd8ae6df97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'users',
+        sa.Column(
+            'token_version',
+            sa.Integer(),
+            server_default='0',
+            nullable=False,
+            comment='Версия выданных токенов'
+        )
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'token_version')
@@ -0,0 +1,116 @@
+"""partition loginattempts by month
+
+Revision ID: 7a4e0c5b9d12
+Revises: 3f1c2a9d7e41
+Create Date: 2026-10-17 12:00:00.000000
+
+Таблица пересоздаётся секционированной (RANGE по created_at):
+до этой ревизии в неё никто не писал, данные не переносятся.
+Секции на текущий и следующие месяцы создаёт миграция, дальше —
+LoginAttemptPartitions при старте сервиса и раз в сутки.
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.shared.models.base.decorator.type_decorator import (
+    UUIDTypeDecorator)
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a4e0c5b9d12'
+down_revision: Union[str, Sequence[str], None] = '3f1c2a9d7e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Секции, создаваемые миграцией: текущий месяц и два следующих
+MONTHS_AHEAD = 2
+
+
+def _drop_login_attempts() -> None:
+    op.drop_index(op.f('ix_loginattempts_user_id'), table_name='loginattempts')
+    op.drop_index(op.f('ix_loginattempts_id'), table_name='loginattempts')
+    op.drop_index(op.f('ix_loginattempts_email'), table_name='loginattempts')
+    op.drop_table('loginattempts')
+
+
+def _columns() -> list:
+    return [
+        sa.Column('user_id', UUIDTypeDecorator(), nullable=True,
+                  comment='ID пользователя (если пользователь существует)'),
+        sa.Column('email', sa.String(length=100), nullable=False,
+                  comment='Email, с которого была попытка входа'),
+        sa.Column('ip_address', sa.String(length=45), nullable=False,
+                  comment='IP адрес, с которого была попытка'),
+        sa.Column('user_agent', sa.String(length=500), nullable=True,
+                  comment='User Agent браузера'),
+        sa.Column('is_successful', sa.Boolean(), nullable=False,
+                  comment='Успешна ли попытка входа'),
+        sa.Column('failure_reason', sa.String(length=100), nullable=True,
+                  comment='Причина неудачи'),
+        sa.Column('id', UUIDTypeDecorator(), nullable=False,
+                  comment='Уникальный идентификатор'),
+        sa.Column('updated_at', sa.DateTime(timezone=True),
+                  server_default=sa.text("timezone('utc', now())"),
+                  nullable=True, comment='Время последнего обновления'),
+        sa.Column('is_active', sa.Boolean(), nullable=False,
+                  comment='Флаг активности записи'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'],
+                                ondelete='CASCADE'),
+    ]
+
+
+def _create_indexes() -> None:
+    op.create_index(op.f('ix_loginattempts_email'), 'loginattempts',
+                    ['email'], unique=False)
+    op.create_index(op.f('ix_loginattempts_id'), 'loginattempts',
+                    ['id'], unique=False)
+    op.create_index(op.f('ix_loginattempts_user_id'), 'loginattempts',
+                    ['user_id'], unique=False)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _drop_login_attempts()
+
+    op.create_table(
+        'loginattempts',
+        sa.Column('created_at', sa.DateTime(timezone=True),
+                  server_default=sa.text("timezone('utc', now())"),
+                  nullable=False, comment='Время попытки входа'),
+        *_columns(),
+        sa.PrimaryKeyConstraint('created_at', 'id'),
+        postgresql_partition_by='RANGE (created_at)'
+    )
+    _create_indexes()
+
+    now = datetime.now(timezone.utc)
+    year, month = now.year, now.month
+    for _ in range(MONTHS_AHEAD + 1):
+        next_year, next_month = (
+            (year + 1, 1) if month == 12 else (year, month + 1))
+        op.execute(
+            f"CREATE TABLE IF NOT EXISTS loginattempts_y{year}m{month:02d} "
+            f"PARTITION OF loginattempts FOR VALUES "
+            f"FROM ('{year}-{month:02d}-01') "
+            f"TO ('{next_year}-{next_month:02d}-01')"
+        )
+        year, month = next_year, next_month
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Секции удаляются вместе с родительской таблицей
+    _drop_login_attempts()
+
+    op.create_table(
+        'loginattempts',
+        *_columns(),
+        sa.Column('created_at', sa.DateTime(timezone=True),
+                  server_default=sa.text("timezone('utc', now())"),
+                  nullable=False, comment='Время создания записи'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    _create_indexes()
@@ -0,0 +1,79 @@
+"""hash refresh tokens
+
+Revision ID: 9c2d4e6f8a31
+Revises: 7a4e0c5b9d12
+Create Date: 2026-10-17 14:00:00.000000
+
+Вместо значения JWT в refreshtokens хранится его SHA-256 (bytea(32))
+с уникальным индексом. Существующие строки заполняются из token,
+после чего колонка token удаляется.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c2d4e6f8a31'
+down_revision: Union[str, Sequence[str], None] = '7a4e0c5b9d12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'refreshtokens',
+        sa.Column(
+            'token_hash',
+            sa.LargeBinary(length=32),
+            nullable=True,
+            comment='SHA-256 значения токена'
+        )
+    )
+    op.execute(
+        "UPDATE refreshtokens "
+        "SET token_hash = sha256(convert_to(token, 'UTF8'))"
+    )
+    op.alter_column('refreshtokens', 'token_hash', nullable=False)
+    op.create_index(
+        op.f('ix_refreshtokens_token_hash'),
+        'refreshtokens',
+        ['token_hash'],
+        unique=True
+    )
+    op.drop_index(op.f('ix_refreshtokens_token'), table_name='refreshtokens')
+    op.drop_column('refreshtokens', 'token')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Исходные токены не восстановить: строки получают hex дайджеста,
+    # который не совпадёт ни с одним JWT, — сессии придётся открыть заново
+    op.add_column(
+        'refreshtokens',
+        sa.Column(
+            'token',
+            sa.String(length=255),
+            nullable=True,
+            comment='Значение токена'
+        )
+    )
+    op.execute(
+        "UPDATE refreshtokens "
+        "SET token = encode(token_hash, 'hex'), is_revoked = true"
+    )
+    op.alter_column('refreshtokens', 'token', nullable=False)
+    op.create_index(
+        op.f('ix_refreshtokens_token'),
+        'refreshtokens',
+        ['token'],
+        unique=True
+    )
+    op.drop_index(
+        op.f('ix_refreshtokens_token_hash'),
+        table_name='refreshtokens'
+    )
+    op.drop_column('refreshtokens', 'token_hash')
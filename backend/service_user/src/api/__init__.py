@@ -7,6 +7,8 @@ from fastapi import APIRouter
 from .auth_user import router as auth_router
 from .register_user import router as register_router
 from .health import router as health_router
+from .jwks import router as jwks_router
+from .metrics import router as metrics_router
 
 # Создаем главный API router
 api_router = APIRouter(prefix="/api/v1")
@@ -15,6 +17,7 @@ api_router = APIRouter(prefix="/api/v1")
 api_router.include_router(auth_router)
 api_router.include_router(register_router)
 api_router.include_router(health_router)
+api_router.include_router(metrics_router)
 
 
-__all__ = ["api_router"]
+__all__ = ["api_router", "jwks_router"]
@@ -1,7 +1,9 @@
 """ API Routers Auth  """
 
 
-from fastapi import APIRouter, Depends, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Request, status
 
 
 from backend.service_user.src.protocols.token_repository import (
@@ -16,6 +18,7 @@ from backend.service_user.src.schemas.auth.responses import (
 from backend.service_user.src.service.auth_service import AuthService
 from backend.service_user.src.infrastructure.dependencies import (
     get_auth_service,
+    get_client_ip,
     get_token_repository)
 
 
@@ -33,11 +36,14 @@ router = APIRouter(
     response_model=TokenResponse,
     status_code=status.HTTP_200_OK,
     responses={
-        401: {"description": "Неверные учетные данные"}
+        401: {"description": "Неверные учетные данные"},
+        429: {"description": "Слишком много попыток входа"}
     }
 )
 async def login_user(
     login_data: LoginRequest,
+    request: Request,
+    ip_address: Optional[str] = Depends(get_client_ip),
     auth_service: AuthService = Depends(get_auth_service)
 ) -> TokenResponse:
     """
@@ -50,9 +56,11 @@ async def login_user(
     """
 
     # Вызываем метод аутентификации с распакованными данными
-    token_pair = auth_service.authenticate_and_create_tokens(
+    token_pair = await auth_service.authenticate_and_create_tokens(
         email=login_data.email,
-        password=login_data.password
+        password=login_data.password,
+        ip_address=ip_address,
+        user_agent=request.headers.get("user-agent")
     )
 
     return TokenResponse.model_validate(token_pair.to_repository_dict())
@@ -80,7 +88,7 @@ async def refresh_token(
     Возвращает новую пару токенов
     """
 
-    token_pair = auth_service.refresh_access_token(
+    token_pair = await auth_service.refresh_access_token(
         refresh_token=refresh_data.refresh_token
     )
 
@@ -103,5 +111,28 @@ async def logout(
 ):
     """Выход из системы (инвалидация refresh токена)"""
 
-    token_repo.revoke_token(logout_data.refresh_token)
+    await token_repo.revoke_token(logout_data.refresh_token)
     return MessageResponse(message="Вы успешно вышли из системы")
+
+
+@router.post(
+    "/logout-all",
+    summary="Выход со всех устройств",
+    description=(
+        "Отзыв всех refresh токенов пользователя и ранее выданных "
+        "access токенов."
+    ),
+    response_model=MessageResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        401: {"description": "Неверный или истёкший токен"}
+    }
+)
+async def logout_all(
+    logout_data: LogoutRequest,
+    auth_service: AuthService = Depends(get_auth_service)
+):
+    """Выход со всех устройств (глобальный отзыв сессий)"""
+
+    await auth_service.logout_all(logout_data.refresh_token)
+    return MessageResponse(message="Вы вышли со всех устройств")
@@ -0,0 +1,26 @@
+"""JWKS endpoint: публичные ключи проверки JWT"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+
+from backend.service_user.src.core import KeyRing
+from backend.service_user.src.infrastructure.dependencies import (
+    get_key_ring)
+
+router = APIRouter(tags=["JWKS"])
+
+
+@router.get("/.well-known/jwks.json")
+async def jwks(key_ring: Optional[KeyRing] = Depends(get_key_ring)):
+    """
+    Публичные ключи для локальной проверки токенов другими сервисами
+
+    Пустой список, если токены подписываются HMAC-секретом.
+    """
+    body = key_ring.jwks() if key_ring is not None else {"keys": []}
+    return JSONResponse(
+        content=body,
+        headers={"Cache-Control": "public, max-age=300"}
+    )
@@ -0,0 +1,50 @@
+"""Metrics endpoint"""
+
+from fastapi import APIRouter, Depends
+
+from backend.service_user.src.core import LoginRateLimiter
+from backend.service_user.src.infrastructure.dependencies import (
+    get_availability_service,
+    get_expired_token_purger,
+    get_login_attempt_writer,
+    get_login_rate_limiter,
+    get_password_hasher,
+    get_password_rehasher,
+    get_token_version_service
+)
+from backend.service_user.src.infrastructure.login_audit import (
+    LoginAttemptWriter)
+from backend.service_user.src.infrastructure.password_pool import (
+    PasswordHasherPool)
+from backend.service_user.src.infrastructure.token_purge import (
+    ExpiredTokenPurger)
+from backend.service_user.src.service import (
+    AvailabilityService,
+    PasswordRehashService,
+    TokenVersionService
+)
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics")
+async def metrics(
+    password_hasher: PasswordHasherPool = Depends(get_password_hasher),
+    password_rehasher: PasswordRehashService = Depends(get_password_rehasher),
+    token_versions: TokenVersionService = Depends(get_token_version_service),
+    rate_limiter: LoginRateLimiter = Depends(get_login_rate_limiter),
+    login_audit: LoginAttemptWriter = Depends(get_login_attempt_writer),
+    token_purge: ExpiredTokenPurger = Depends(get_expired_token_purger),
+    availability: AvailabilityService = Depends(get_availability_service)
+):
+    """Внутренние счётчики сервиса"""
+    return {
+        "service": "user_service",
+        "password_hasher": password_hasher.stats(),
+        "password_rehash": password_rehasher.stats(),
+        "token_version_cache": token_versions.cache.stats(),
+        "login_rate_limiter": rate_limiter.stats(),
+        "login_audit": login_audit.stats(),
+        "token_purge": token_purge.stats(),
+        "availability": availability.stats()
+    }
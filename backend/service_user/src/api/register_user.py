@@ -1,12 +1,20 @@
 """ API Routers Register """
 
-from fastapi import APIRouter, Depends, status
+from typing import Optional
 
+from fastapi import APIRouter, Depends, Query, status
+
+from backend.service_user.src.exception import ValidationException
 from backend.service_user.src.infrastructure.dependencies import (
+    get_availability_service,
     get_register_service
 )
-from backend.service_user.src.service import RegisterService
+from backend.service_user.src.service import (
+    AvailabilityService,
+    RegisterService
+)
 from backend.service_user.src.schemas.register import (
+    AvailabilityResponse,
     UserCreate,
     UserResponseDTO
 )
@@ -39,7 +47,41 @@ async def register_user(
     Сервис возвращает готовый UserResponseDTO
     """
 
-    return register_service.register_user(register_data)
+    return await register_service.register_user(register_data)
+
+
+@router.get(
+    "/availability",
+    summary="Проверка доступности имени и email",
+    description="Свободны ли user_name и/или email для регистрации",
+    response_model=AvailabilityResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    responses={
+        422: {"description": "Не передан ни user_name, ни email"}
+    }
+)
+async def check_availability(
+    user_name: Optional[str] = Query(default=None, max_length=50),
+    email: Optional[str] = Query(default=None, max_length=100),
+    availability: AvailabilityService = Depends(get_availability_service)
+) -> AvailabilityResponse:
+    """
+    Проверка доступности для формы регистрации
+    Свободные значения определяются фильтром Блума без запроса к БД
+    """
+
+    if user_name is None and email is None:
+        raise ValidationException(
+            "Передайте user_name и/или email",
+            details={"fields": ["user_name", "email"]}
+        )
+
+    result = await availability.check(user_name=user_name, email=email)
+    return AvailabilityResponse(
+        user_name_available=result.get("user_name"),
+        email_available=result.get("email")
+    )
 
 
 # @router.get(
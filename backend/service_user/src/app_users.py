@@ -5,7 +5,7 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from backend.service_user.src.api import api_router
+from backend.service_user.src.api import api_router, jwks_router
 from backend.service_user.src.infrastructure.container import container
 from backend.service_user.src.lifespan import lifespan
 from backend.shared.logging.logger import get_logger
@@ -56,6 +56,8 @@ def create_app() -> FastAPI:
 
     # Подключаем API роутеры
     app.include_router(api_router)
+    # /.well-known — вне версионированного префикса
+    app.include_router(jwks_router)
     logger.info(">>> API роутеры подключены")
 
     return app
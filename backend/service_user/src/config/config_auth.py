@@ -1,6 +1,8 @@
 """ Аутентификация и JWT """
 
 
+from typing import Optional
+
 from pydantic import Field
 from .base import BaseConfig
 
@@ -11,10 +13,164 @@ class AuthConfig(BaseConfig):
     ALGORITHM: str = Field(description="Проверка пароля")
     SECRET_KEY: str = Field(description="Секретный ключ для JWT")
 
+    # Асимметричная подпись (ES256): каталог ключей <kid>.pem
+    # и ключ, которым подписываются новые токены
+    JWT_KEYS_DIR: Optional[str] = Field(
+        default=None,
+        description="Каталог ключей подписи JWT"
+    )
+    JWT_ACTIVE_KID: Optional[str] = Field(
+        default=None,
+        description="kid активного ключа (по умолчанию последний по имени)"
+    )
+
     # JWT конфигурация
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(description="")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(description="40 кликов")
 
+    # Кэш версий токенов (глобальный отзыв сессий). logout-all сбрасывает
+    # запись только в своём процессе: другие воркеры и реплики принимают
+    # отозванные access токены ещё до TTL (брокера у user_service нет)
+    TOKEN_VERSION_CACHE_TTL_SECONDS: float = Field(
+        default=5.0,
+        description="TTL версии токенов в кэше ValidateToken"
+    )
+    TOKEN_VERSION_CACHE_MAX_SIZE: int = Field(
+        default=100_000,
+        description="Максимум пользователей в кэше версий"
+    )
+
+    # Кэш занятых user_name/email: повторная регистрация отклоняется
+    # без Argon2 (пользователи не удаляются, поэтому TTL большой)
+    REGISTRATION_TAKEN_CACHE_MAX_SIZE: int = Field(
+        default=100_000,
+        description="Максимум занятых user_name/email в кэше"
+    )
+    REGISTRATION_TAKEN_CACHE_TTL_SECONDS: float = Field(
+        default=3600.0,
+        description="TTL записи о занятом user_name/email"
+    )
+
+    # Фильтр Блума занятых user_name/email для /register/availability
+    AVAILABILITY_BLOOM_CAPACITY: int = Field(
+        default=1_000_000,
+        description="Ожидаемое число занятых значений (user_name + email)"
+    )
+    AVAILABILITY_BLOOM_ERROR_RATE: float = Field(
+        default=0.01,
+        description="Допустимая доля ложных срабатываний фильтра"
+    )
+    AVAILABILITY_REBUILD_SECONDS: float = Field(
+        default=600.0,
+        description="Интервал перестройки фильтра из БД"
+    )
+
+    # Пул процессов для Argon2
+    PASSWORD_POOL_WORKERS: int = Field(
+        default=2,
+        description="Число процессов для хеширования паролей"
+    )
+    PASSWORD_POOL_MAX_QUEUE: int = Field(
+        default=64,
+        description="Очередь операций с паролями сверх числа процессов"
+    )
+
+    # Лимит попыток входа (скользящее окно, до обращения к БД и Argon2)
+    LOGIN_RATE_LIMIT_ENABLED: bool = Field(
+        default=True,
+        description="Включить лимит попыток входа"
+    )
+    LOGIN_MAX_ATTEMPTS_PER_EMAIL: int = Field(
+        default=5,
+        description="Попыток входа на email в окне"
+    )
+    LOGIN_EMAIL_WINDOW_SECONDS: float = Field(
+        default=300.0,
+        description="Окно лимита по email"
+    )
+    LOGIN_MAX_ATTEMPTS_PER_IP: int = Field(
+        default=50,
+        description="Попыток входа с IP в окне"
+    )
+    LOGIN_IP_WINDOW_SECONDS: float = Field(
+        default=300.0,
+        description="Окно лимита по IP"
+    )
+    LOGIN_RATE_LIMIT_MAX_KEYS: int = Field(
+        default=100_000,
+        description="Максимум отслеживаемых email/IP (ограничение памяти)"
+    )
+    LOGIN_RATE_LIMIT_SHARED: bool = Field(
+        default=False,
+        description="Общий лимит для воркеров хоста (shared memory)"
+    )
+    # Адреса/подсети обратных прокси через запятую: IP клиента для
+    # лимита берётся из X-Forwarded-For только за ними. Пусто —
+    # request.client.host (как его выставил uvicorn --proxy-headers)
+    LOGIN_TRUSTED_PROXIES: str = Field(
+        default="",
+        description="Доверенные прокси для X-Forwarded-For"
+    )
+
+    # Журнал попыток входа (буфер с пакетной записью)
+    LOGIN_AUDIT_ENABLED: bool = Field(
+        default=True,
+        description="Записывать попытки входа в loginattempts"
+    )
+    LOGIN_AUDIT_FLUSH_INTERVAL_MS: int = Field(
+        default=200,
+        description="Максимальная задержка записи попыток"
+    )
+    LOGIN_AUDIT_BATCH_SIZE: int = Field(
+        default=500,
+        description="Строк в одном INSERT"
+    )
+    LOGIN_AUDIT_MAX_BUFFER: int = Field(
+        default=10_000,
+        description="Предел буфера попыток в памяти"
+    )
+    LOGIN_AUDIT_RETENTION_MONTHS: int = Field(
+        default=6,
+        description="Срок хранения попыток (месячные секции)"
+    )
+    LOGIN_AUDIT_PARTITIONS_AHEAD: int = Field(
+        default=2,
+        description="На сколько месяцев вперёд создавать секции"
+    )
+
+    # Очистка просроченных refresh токенов (пакетами)
+    TOKEN_PURGE_ENABLED: bool = Field(
+        default=True,
+        description="Периодически удалять просроченные refresh токены"
+    )
+    TOKEN_PURGE_INTERVAL_SECONDS: float = Field(
+        default=3600.0,
+        description="Интервал между проходами очистки"
+    )
+    TOKEN_PURGE_BATCH_SIZE: int = Field(
+        default=1000,
+        description="Строк в одном DELETE"
+    )
+    TOKEN_PURGE_PAUSE_MS: int = Field(
+        default=50,
+        description="Пауза между пакетами DELETE"
+    )
+
+    # Параметры Argon2 (подбираются командой калибровки под железо).
+    # Хеши с другими параметрами пересчитываются при входе
+    ARGON2_TIME_COST: Optional[int] = Field(
+        default=None,
+        description="Число проходов Argon2 (None — значение passlib)"
+    )
+    ARGON2_MEMORY_COST: Optional[int] = Field(
+        default=None,
+        description="Память Argon2 в KiB (None — значение passlib)"
+    )
+    ARGON2_PARALLELISM: Optional[int] = Field(
+        default=None,
+        description="Параллелизм Argon2 (None — значение passlib)"
+    )
+
     # Пароли
     MIN_PASSWORD_LENGTH: int = Field(
         description="Минимальная длина пароля"
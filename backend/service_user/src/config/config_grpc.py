@@ -1,3 +1,5 @@
+from typing import Literal, Optional
+
 from pydantic import Field
 
 from .base import BaseConfig
@@ -14,3 +16,46 @@ class GrpcConfig(BaseConfig):
         default=50051,
         description="Порт для gRPC сервера"
     )
+    # Unix-сокет для клиентов на том же хосте/поде (в дополнение к TCP)
+    GRPC_UDS_PATH: Optional[str] = Field(
+        default=None,
+        description="Путь unix-сокета gRPC сервера"
+    )
+    # thread — grpc.server на пуле потоков в фоновом потоке
+    # aio — grpc.aio.server на event loop приложения
+    GRPC_SERVER_MODE: Literal["thread", "aio"] = Field(
+        default="thread",
+        description="Режим gRPC сервера"
+    )
+    GRPC_MAX_WORKERS: int = Field(
+        default=10,
+        description="Размер пула потоков (режим thread)"
+    )
+    GRPC_MAX_CONCURRENT_RPCS: Optional[int] = Field(
+        default=None,
+        description="Лимит одновременных RPC (режим aio), None — без лимита"
+    )
+    GRPC_SHUTDOWN_GRACE_SECONDS: float = Field(
+        default=5.0,
+        description="Время на завершение начатых RPC при остановке"
+    )
+    GRPC_MAX_CONCURRENT_STREAMS: int = Field(
+        default=1000,
+        description="Максимум одновременных потоков на одно соединение"
+    )
+    GRPC_KEEPALIVE_MIN_PING_INTERVAL_MS: int = Field(
+        default=10000,
+        description="Минимальный допустимый интервал keepalive ping клиента"
+    )
+
+    def server_options(self) -> list[tuple[str, int]]:
+        """Опции gRPC сервера"""
+        return [
+            ("grpc.max_concurrent_streams", self.GRPC_MAX_CONCURRENT_STREAMS),
+            # Клиенты держат keepalive; без разрешения сервер
+            # отвечает GOAWAY too_many_pings
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.min_ping_interval_without_data_ms",
+             self.GRPC_KEEPALIVE_MIN_PING_INTERVAL_MS),
+            ("grpc.http2.max_ping_strikes", 0),
+        ]
@@ -1,3 +1,6 @@
+from .client_ip import parse_trusted_proxies, resolve_client_ip
+from .key_ring import KeyRing, load_key_ring
+from .rate_limiter import LoginRateLimiter, build_login_rate_limiter
 from .service_jwt import JWTService
 from .service_password import PasswordService
 from .validator_auth import AuthValidator
@@ -5,6 +8,12 @@ from .validator_name import UserUniquenessValidator
 
 __all__ = [
     "JWTService",
+    "KeyRing",
+    "load_key_ring",
+    "parse_trusted_proxies",
+    "resolve_client_ip",
+    "LoginRateLimiter",
+    "build_login_rate_limiter",
     "PasswordService",
     "UserUniquenessValidator",
     "AuthValidator"
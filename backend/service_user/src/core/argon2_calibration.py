@@ -0,0 +1,150 @@
+"""
+Калибровка параметров Argon2 под железо узла
+
+Подбирает memory_cost и time_cost так, чтобы проверка пароля
+занимала не больше целевого времени: память берётся максимальной
+из допустимой (уменьшается вдвое, пока один проход не уложится
+в цель), затем число проходов увеличивается до цели.
+
+Результат — строки .env для USER_SERVICE_ARGON2_*; разным классам
+узлов можно задать разные параметры, старые хеши пересчитываются
+при входе пользователей.
+
+Запуск:
+    python -m backend.service_user.src.core.argon2_calibration --target-ms 250
+"""
+
+import argparse
+import os
+import statistics
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from passlib.hash import argon2
+
+
+# Минимум памяти по рекомендации OWASP (19 MiB)
+MIN_MEMORY_KIB = 19 * 1024
+
+_SAMPLE_PASSWORD = "calibration-Passw0rd!"
+
+
+@dataclass(frozen=True)
+class Argon2Params:
+    """Подобранные параметры и измеренное время проверки"""
+
+    time_cost: int
+    memory_cost: int
+    parallelism: int
+    verify_ms: float
+
+    def to_env(self, prefix: str = "USER_SERVICE_") -> str:
+        """Строки .env с параметрами"""
+        return (
+            f"# Argon2: проверка пароля ~{self.verify_ms:.0f} ms\n"
+            f"{prefix}ARGON2_TIME_COST={self.time_cost}\n"
+            f"{prefix}ARGON2_MEMORY_COST={self.memory_cost}\n"
+            f"{prefix}ARGON2_PARALLELISM={self.parallelism}\n"
+        )
+
+
+def measure_verify(
+    time_cost: int,
+    memory_cost: int,
+    parallelism: int,
+    rounds: int = 3
+) -> float:
+    """Медианное время проверки пароля в миллисекундах"""
+    handler = argon2.using(
+        rounds=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism
+    )
+    hashed = handler.hash(_SAMPLE_PASSWORD)
+
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        handler.verify(_SAMPLE_PASSWORD, hashed)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def calibrate(
+    target_ms: float,
+    max_memory_kib: int,
+    parallelism: int,
+    max_time_cost: int = 10,
+    measure: Callable[[int, int, int], float] = measure_verify
+) -> Argon2Params:
+    """
+    Подбор параметров под целевое время проверки
+
+    Args:
+        target_ms: Целевое время проверки пароля
+        max_memory_kib: Верхняя граница памяти на хеш
+        parallelism: Параллелизм Argon2
+        max_time_cost: Верхняя граница числа проходов
+        measure: Функция замера (подменяется в тестах)
+
+    Returns:
+        Параметры с наибольшей стоимостью, не превышающей цель
+        (или минимальные, если цель недостижима)
+    """
+    if max_memory_kib < MIN_MEMORY_KIB:
+        raise ValueError(
+            f"max_memory_kib не может быть меньше {MIN_MEMORY_KIB}")
+
+    memory_cost = max_memory_kib
+    elapsed = measure(1, memory_cost, parallelism)
+
+    # Память — основная защита от GPU, уменьшаем её в последнюю очередь
+    while elapsed > target_ms and memory_cost // 2 >= MIN_MEMORY_KIB:
+        memory_cost //= 2
+        elapsed = measure(1, memory_cost, parallelism)
+
+    best = Argon2Params(1, memory_cost, parallelism, elapsed)
+    for time_cost in range(2, max_time_cost + 1):
+        elapsed = measure(time_cost, memory_cost, parallelism)
+        if elapsed > target_ms:
+            break
+        best = Argon2Params(time_cost, memory_cost, parallelism, elapsed)
+
+    return best
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Калибровка параметров Argon2")
+    parser.add_argument(
+        "--target-ms", type=float, default=250.0,
+        help="Целевое время проверки пароля")
+    parser.add_argument(
+        "--max-memory-mib", type=int, default=256,
+        help="Максимум памяти на хеш")
+    parser.add_argument(
+        "--parallelism", type=int, default=min(os.cpu_count() or 1, 4),
+        help="Параллелизм Argon2")
+    parser.add_argument(
+        "--max-time-cost", type=int, default=10,
+        help="Максимум проходов")
+    parser.add_argument(
+        "--output", help="Файл для строк .env (по умолчанию stdout)")
+    args = parser.parse_args(argv)
+
+    params = calibrate(
+        target_ms=args.target_ms,
+        max_memory_kib=args.max_memory_mib * 1024,
+        parallelism=args.parallelism,
+        max_time_cost=args.max_time_cost
+    )
+
+    if args.output:
+        Path(args.output).write_text(params.to_env())
+    print(params.to_env(), end="")
+
+
+if __name__ == "__main__":
+    main()
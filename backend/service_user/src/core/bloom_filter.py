@@ -0,0 +1,80 @@
+"""
+Фильтр Блума для проверки занятости значений без запроса к БД
+
+Отрицательный ответ точен ("точно не добавлялось"), положительный —
+вероятностный: доля ложных срабатываний не превышает error_rate,
+пока число элементов не больше capacity. Память — bits / 8 байт
+(около 1.2 MB на миллион элементов при error_rate=0.01).
+"""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Фильтр Блума в bytearray с двойным хешированием
+
+    >>> bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    >>> bloom.add("john_doe")
+    >>> "john_doe" in bloom, "jane_doe" in bloom
+    (True, False)
+    >>> bloom.bits, bloom.hashes
+    (9586, 7)
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        Args:
+            capacity: Ожидаемое число элементов
+            error_rate: Допустимая доля ложных срабатываний
+        """
+        if capacity <= 0:
+            raise ValueError("capacity должен быть положительным")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate должен быть в интервале (0, 1)")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bits = math.ceil(
+            -capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self._array = bytearray((self.bits + 7) // 8)
+        self.items = 0
+
+    def _positions(self, value: str) -> list[int]:
+        # Двойное хеширование (Kirsch–Mitzenmacher): k позиций из двух
+        # 64-битных половин одного дайджеста
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    def add(self, value: str) -> None:
+        """Добавить значение"""
+        for position in self._positions(value):
+            self._array[position >> 3] |= 1 << (position & 7)
+        self.items += 1
+
+    def __contains__(self, value: str) -> bool:
+        return all(
+            self._array[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+    def fill_ratio(self) -> float:
+        """Доля установленных битов"""
+        return int.from_bytes(self._array, "little").bit_count() / self.bits
+
+    def stats(self) -> dict:
+        """Размер и оценка доли ложных срабатываний"""
+        return {
+            "capacity": self.capacity,
+            "error_rate": self.error_rate,
+            "items": self.items,
+            "bits": self.bits,
+            "hashes": self.hashes,
+            "memory_bytes": len(self._array),
+            "estimated_false_positive_rate": round(
+                self.fill_ratio() ** self.hashes, 6)
+        }
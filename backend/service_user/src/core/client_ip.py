@@ -0,0 +1,74 @@
+"""
+IP клиента за обратным прокси
+
+За прокси request.client.host — адрес самого прокси, и лимит по IP
+превращается в одну общую корзину. Адрес клиента берётся из
+X-Forwarded-For: цепочка читается справа налево, адреса доверенных
+прокси пропускаются, первый недоверенный адрес — клиент. Заголовку
+верят, только если соединение пришло от доверенного прокси, иначе
+клиент мог бы подставить любой адрес.
+"""
+
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
+from typing import Optional, Sequence, Union
+
+
+Network = Union[IPv4Network, IPv6Network]
+
+
+def parse_trusted_proxies(value: str) -> list[Network]:
+    """
+    Доверенные прокси из строки "10.0.0.0/8,127.0.0.1"
+
+    >>> parse_trusted_proxies("10.0.0.0/8, 127.0.0.1")
+    [IPv4Network('10.0.0.0/8'), IPv4Network('127.0.0.1/32')]
+    """
+    return [
+        ip_network(item.strip(), strict=False)
+        for item in value.split(",")
+        if item.strip()
+    ]
+
+
+def _is_trusted(address: str, trusted: Sequence[Network]) -> bool:
+    try:
+        parsed = ip_address(address)
+    except ValueError:
+        return False
+    return any(parsed in network for network in trusted)
+
+
+def resolve_client_ip(
+    peer: Optional[str],
+    forwarded_for: Optional[str],
+    trusted: Sequence[Network]
+) -> Optional[str]:
+    """
+    Адрес клиента с учётом доверенных прокси
+
+    Args:
+        peer: Адрес, с которого пришло соединение
+        forwarded_for: Значение X-Forwarded-For
+        trusted: Сети доверенных прокси
+
+    >>> proxies = parse_trusted_proxies("10.0.0.0/8")
+    >>> resolve_client_ip("10.0.0.2", "1.2.3.4, 10.0.0.1", proxies)
+    '1.2.3.4'
+    >>> resolve_client_ip("5.6.7.8", "1.2.3.4", proxies)
+    '5.6.7.8'
+    """
+    if not peer or not forwarded_for or not _is_trusted(peer, trusted):
+        return peer
+
+    client = peer
+    for hop in reversed(forwarded_for.split(",")):
+        hop = hop.strip()
+        try:
+            ip_address(hop)
+        except ValueError:
+            # Мусор в цепочке: дальше доверять ей нельзя
+            break
+        client = hop
+        if not _is_trusted(hop, trusted):
+            break
+    return client
@@ -0,0 +1,152 @@
+"""
+Набор асимметричных ключей подписи JWT (ES256) с ротацией
+
+Ключи хранятся PEM-файлами <kid>.pem в каталоге JWT_KEYS_DIR.
+Подписывает только активный ключ; проверяются и публикуются
+в JWKS все ключи каталога. Ротация с перекрытием:
+1. положить новый ключ в каталог и сделать его активным;
+2. старый ключ удалить не раньше, чем истекут подписанные им токены.
+
+Генерация ключа:
+    python -m backend.service_user.src.core.key_ring --dir keys --kid 2026-10
+"""
+
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from jose import jwk
+
+
+# Алгоритм -> кривая. EdDSA python-jose не поддерживает
+CURVES = {
+    "ES256": ec.SECP256R1,
+    "ES384": ec.SECP384R1,
+    "ES512": ec.SECP521R1,
+}
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    """Ключ подписи и его публичная часть в формате JWK"""
+
+    kid: str
+    algorithm: str
+    private_key: str
+    public_jwk: dict
+
+
+class KeyRing:
+    """Ключи подписи JWT: активный подписывает, все проверяют"""
+
+    def __init__(self, keys: list[SigningKey], active_kid: str):
+        self._keys = {key.kid: key for key in keys}
+        if active_kid not in self._keys:
+            raise ValueError(f"Активный ключ '{active_kid}' не найден")
+        self.active_kid = active_kid
+
+    @classmethod
+    def from_directory(
+        cls,
+        directory: str | Path,
+        algorithm: str,
+        active_kid: Optional[str] = None
+    ) -> "KeyRing":
+        """
+        Загрузить ключи из каталога
+
+        Args:
+            directory: Каталог с файлами <kid>.pem
+            algorithm: Алгоритм подписи (ES256/ES384/ES512)
+            active_kid: Ключ для подписи; по умолчанию последний
+                по имени (kid удобно называть датой выпуска)
+        """
+        if algorithm not in CURVES:
+            raise ValueError(f"Алгоритм {algorithm} не поддерживается")
+
+        paths = sorted(Path(directory).glob("*.pem"))
+        if not paths:
+            raise ValueError(f"В каталоге {directory} нет ключей")
+
+        keys = []
+        for path in paths:
+            private_key = path.read_text()
+            public_jwk = jwk.construct(
+                private_key, algorithm).public_key().to_dict()
+            keys.append(SigningKey(
+                kid=path.stem,
+                algorithm=algorithm,
+                private_key=private_key,
+                public_jwk={**public_jwk, "kid": path.stem, "use": "sig"}
+            ))
+
+        return cls(keys, active_kid or keys[-1].kid)
+
+    @property
+    def active(self) -> SigningKey:
+        """Ключ, которым подписываются новые токены"""
+        return self._keys[self.active_kid]
+
+    def get(self, kid: Optional[str]) -> Optional[SigningKey]:
+        """Ключ по kid"""
+        return self._keys.get(kid)
+
+    def jwks(self) -> dict:
+        """Публичные ключи в формате JWKS"""
+        return {"keys": [key.public_jwk for key in self._keys.values()]}
+
+
+def load_key_ring(
+    algorithm: str,
+    keys_dir: Optional[str],
+    active_kid: Optional[str]
+) -> Optional[KeyRing]:
+    """
+    KeyRing для асимметричного алгоритма; None для HMAC (HS*)
+
+    Raises:
+        ValueError: Асимметричный алгоритм без каталога ключей
+    """
+    if algorithm.startswith("HS"):
+        return None
+    if not keys_dir:
+        raise ValueError(f"Для {algorithm} нужен каталог ключей JWT_KEYS_DIR")
+    return KeyRing.from_directory(keys_dir, algorithm, active_kid or None)
+
+
+def generate_key(
+    directory: str | Path,
+    kid: str,
+    algorithm: str = "ES256"
+) -> Path:
+    """Сгенерировать ключ и сохранить в <directory>/<kid>.pem"""
+    private_key = ec.generate_private_key(CURVES[algorithm]())
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()
+    )
+
+    path = Path(directory) / f"{kid}.pem"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(pem)
+    path.chmod(0o600)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Генерация ключа JWT")
+    parser.add_argument("--dir", required=True, help="Каталог ключей")
+    parser.add_argument("--kid", required=True, help="Идентификатор ключа")
+    parser.add_argument(
+        "--algorithm", default="ES256", choices=sorted(CURVES))
+    args = parser.parse_args()
+
+    print(generate_key(args.dir, args.kid, args.algorithm))
+
+
+if __name__ == "__main__":
+    main()
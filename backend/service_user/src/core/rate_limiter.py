@@ -0,0 +1,374 @@
+"""
+Ограничение частоты попыток входа скользящим окном
+
+Для каждого ключа (email, IP) хранится кольцевой буфер из
+max_attempts последних отметок времени. Попытка разрешена, если
+самая старая отметка буфера вышла из окна; иначе отклоняется
+без записи. Память на ключ — max_attempts * 8 байт.
+
+Хранилища:
+- SlidingWindowLimiter — в памяти процесса, LRU по числу ключей
+- SharedSlidingWindowLimiter — в shared memory, общая для воркеров
+  uvicorn на одном хосте (таблица фиксированного размера)
+"""
+
+import fcntl
+import hashlib
+import math
+import os
+import struct
+import tempfile
+import time
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Protocol
+
+
+class WindowLimiter(Protocol):
+    """Ограничитель по одному виду ключа"""
+
+    def hit(self, key: str) -> float:
+        """Учесть попытку; 0 — разрешена, иначе секунды до разрешения"""
+        ...
+
+    def reset(self, key: str) -> None:
+        """Забыть попытки ключа"""
+        ...
+
+    def stats(self) -> dict:
+        """Метрики"""
+        ...
+
+
+class SlidingWindowLimiter:
+    """
+    Скользящее окно в памяти процесса
+
+    >>> now = [0.0]
+    >>> limiter = SlidingWindowLimiter(2, 60, clock=lambda: now[0])
+    >>> limiter.hit("a"), limiter.hit("a"), limiter.hit("a")
+    (0.0, 0.0, 60.0)
+    >>> now[0] = 61.0
+    >>> limiter.hit("a")
+    0.0
+    """
+
+    def __init__(
+        self,
+        max_attempts: int,
+        window_seconds: float,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_attempts: Попыток в окне
+            window_seconds: Длина окна
+            max_keys: Максимум ключей; сверх него вытесняются давние
+            clock: Источник времени (подменяется в тестах)
+        """
+        if max_attempts <= 0 or max_keys <= 0:
+            raise ValueError(
+                "max_attempts и max_keys должны быть положительными")
+
+        self.max_attempts = max_attempts
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        self._clock = clock
+        # key -> (буфер отметок, индекс самой старой)
+        self._buffers: OrderedDict[str, list] = OrderedDict()
+
+        self.allowed = 0
+        self.rejected = 0
+        self.evictions = 0
+
+    def hit(self, key: str) -> float:
+        now = self._clock()
+        entry = self._buffers.get(key)
+
+        if entry is None:
+            entry = [array("d", [-math.inf] * self.max_attempts), 0]
+            self._buffers[key] = entry
+            if len(self._buffers) > self.max_keys:
+                self._buffers.popitem(last=False)
+                self.evictions += 1
+        else:
+            self._buffers.move_to_end(key)
+
+        buffer, oldest = entry
+        age = now - buffer[oldest]
+        if age < self.window_seconds:
+            self.rejected += 1
+            return self.window_seconds - age
+
+        buffer[oldest] = now
+        entry[1] = (oldest + 1) % self.max_attempts
+        self.allowed += 1
+        return 0.0
+
+    def reset(self, key: str) -> None:
+        self._buffers.pop(key, None)
+
+    def stats(self) -> dict:
+        return {
+            "backend": "memory",
+            "keys": len(self._buffers),
+            "max_keys": self.max_keys,
+            "allowed": self.allowed,
+            "rejected": self.rejected,
+            "evictions": self.evictions
+        }
+
+
+class SharedSlidingWindowLimiter:
+    """
+    Скользящее окно в shared memory, общее для процессов хоста
+
+    Таблица из slots ячеек: ключ попадает в ячейку по хешу, при
+    коллизии ячейка переходит к новому ключу (вытеснение). Доступ
+    к ячейкам сериализуется файловой блокировкой.
+
+    Хеш ключа — blake2b с секретом, который создаётся случайно вместе
+    с сегментом и хранится в его заголовке: подобрать email, попадающий
+    в ячейку чужого ключа, нельзя. В ячейке хранится полный 16-байтный
+    fingerprint, сброс выполняется только при точном совпадении.
+
+    Рядом с секретом в заголовке записана раскладка таблицы (slots,
+    max_attempts). Сегмент переживает воркеров, поэтому после смены
+    настроек на хосте может остаться старый сегмент другой раскладки:
+    подключение к нему завершается ошибкой, а не чтением ячеек
+    по чужим смещениям.
+    """
+
+    # секрет хеша, slots, max_attempts
+    _HEADER = struct.Struct("<16sQI4x")
+    _HEADER_SIZE = _HEADER.size
+
+    def __init__(
+        self,
+        name: str,
+        max_attempts: int,
+        window_seconds: float,
+        slots: int = 65_536,
+        clock: Callable[[], float] = time.time,
+        lock_dir: Optional[str] = None
+    ):
+        """
+        Args:
+            name: Имя сегмента shared memory (одинаковое у воркеров)
+            max_attempts: Попыток в окне
+            window_seconds: Длина окна
+            slots: Число ячеек таблицы
+            clock: Источник времени, общий для процессов
+            lock_dir: Каталог файла блокировки
+        """
+        if max_attempts <= 0 or slots <= 0:
+            raise ValueError(
+                "max_attempts и slots должны быть положительными")
+
+        self.name = name
+        self.max_attempts = max_attempts
+        self.window_seconds = window_seconds
+        self.slots = slots
+        self._clock = clock
+
+        # fingerprint, индекс самой старой отметки, отметки времени
+        self._slot = struct.Struct(f"<16sI4x{max_attempts}d")
+        self._empty = bytes(16)
+        self._lock_path = Path(
+            lock_dir or tempfile.gettempdir()) / f"{name}.lock"
+        self._lock_file = open(self._lock_path, "a+b")
+        # Создание сегмента и секрета под блокировкой: воркеры,
+        # стартующие одновременно, получают один и тот же секрет
+        try:
+            with self._locked():
+                self._shm = self._attach(
+                    name, self._HEADER_SIZE + self._slot.size * slots)
+                self._hash_key = self._init_header()
+        except RuntimeError:
+            self._shm.close()
+            self._lock_file.close()
+            raise
+
+        self.allowed = 0
+        self.rejected = 0
+
+    @staticmethod
+    def _attach(name: str, size: int) -> shared_memory.SharedMemory:
+        """Создать сегмент или подключиться к созданному другим воркером"""
+        try:
+            shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            shm = shared_memory.SharedMemory(name=name)
+        # Сегмент живёт дольше воркера, который его создал
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+    def _init_header(self) -> bytes:
+        """
+        Проверить раскладку сегмента или записать её в новый сегмент
+
+        Returns:
+            Секрет хеша ключей
+
+        Raises:
+            RuntimeError: Сегмент создан с другими slots/max_attempts
+        """
+        expected = self._HEADER_SIZE + self._slot.size * self.slots
+        if self._shm.size < expected:
+            raise RuntimeError(
+                f"Сегмент {self.name}: {self._shm.size} байт, нужно "
+                f"{expected}. Остановите воркеры и удалите сегмент "
+                f"(unlink) или задайте другое имя"
+            )
+
+        hash_key, slots, max_attempts = self._HEADER.unpack_from(
+            self._shm.buf)
+        if hash_key == self._empty:
+            hash_key = os.urandom(16)
+            self._HEADER.pack_into(
+                self._shm.buf, 0, hash_key, self.slots, self.max_attempts)
+        elif (slots, max_attempts) != (self.slots, self.max_attempts):
+            raise RuntimeError(
+                f"Сегмент {self.name} создан с slots={slots}, "
+                f"max_attempts={max_attempts}, ожидается "
+                f"slots={self.slots}, max_attempts={self.max_attempts}. "
+                f"Остановите воркеры и удалите сегмент (unlink) "
+                f"или задайте другое имя"
+            )
+        return hash_key
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def _locate(self, key: str) -> tuple[int, bytes]:
+        """Смещение ячейки и fingerprint ключа"""
+        fingerprint = hashlib.blake2b(
+            key.encode(), digest_size=16, key=self._hash_key).digest()
+        index = int.from_bytes(fingerprint[:8], "little") % self.slots
+        return self._HEADER_SIZE + index * self._slot.size, fingerprint
+
+    def hit(self, key: str) -> float:
+        offset, fingerprint = self._locate(key)
+        now = self._clock()
+
+        with self._locked():
+            stored, oldest, *stamps = self._slot.unpack_from(
+                self._shm.buf, offset)
+            if stored != fingerprint:
+                stored, oldest = fingerprint, 0
+                stamps = [0.0] * self.max_attempts
+
+            age = now - stamps[oldest]
+            if age < self.window_seconds:
+                self.rejected += 1
+                return self.window_seconds - age
+
+            stamps[oldest] = now
+            self._slot.pack_into(
+                self._shm.buf, offset, stored,
+                (oldest + 1) % self.max_attempts, *stamps)
+
+        self.allowed += 1
+        return 0.0
+
+    def reset(self, key: str) -> None:
+        offset, fingerprint = self._locate(key)
+        with self._locked():
+            stored = self._slot.unpack_from(self._shm.buf, offset)[0]
+            if stored == fingerprint:
+                self._slot.pack_into(
+                    self._shm.buf, offset, self._empty, 0,
+                    *([0.0] * self.max_attempts))
+
+    def close(self) -> None:
+        """Отключиться от сегмента (сам сегмент остаётся)"""
+        self._lock_file.close()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Удалить сегмент (после остановки всех воркеров)"""
+        shared_memory.SharedMemory(name=self.name).unlink()
+
+    def stats(self) -> dict:
+        return {
+            "backend": "shared",
+            "slots": self.slots,
+            "allowed": self.allowed,
+            "rejected": self.rejected
+        }
+
+
+class LoginRateLimiter:
+    """Лимиты попыток входа по email и по IP"""
+
+    def __init__(
+        self,
+        by_email: WindowLimiter,
+        by_ip: WindowLimiter
+    ):
+        self.by_email = by_email
+        self.by_ip = by_ip
+
+    @staticmethod
+    def _email_key(email: str) -> str:
+        return email.strip().lower()
+
+    def hit(self, email: str, ip_address: Optional[str]) -> float:
+        """
+        Учесть попытку входа
+
+        Returns:
+            0 — попытка разрешена, иначе секунды до следующей
+        """
+        if ip_address:
+            retry_after = self.by_ip.hit(ip_address)
+            if retry_after:
+                return retry_after
+        return self.by_email.hit(self._email_key(email))
+
+    def reset(self, email: str) -> None:
+        """Сбросить счётчик email после успешного входа"""
+        self.by_email.reset(self._email_key(email))
+
+    def stats(self) -> dict:
+        return {
+            "email": self.by_email.stats(),
+            "ip": self.by_ip.stats()
+        }
+
+
+def build_login_rate_limiter(
+    max_attempts_per_email: int,
+    email_window_seconds: float,
+    max_attempts_per_ip: int,
+    ip_window_seconds: float,
+    max_keys: int,
+    shared: bool = False,
+    shared_name: str = "user_service_login"
+) -> LoginRateLimiter:
+    """LoginRateLimiter с хранилищем в памяти процесса или в shared memory"""
+    if shared:
+        return LoginRateLimiter(
+            by_email=SharedSlidingWindowLimiter(
+                f"{shared_name}_email", max_attempts_per_email,
+                email_window_seconds, slots=max_keys),
+            by_ip=SharedSlidingWindowLimiter(
+                f"{shared_name}_ip", max_attempts_per_ip,
+                ip_window_seconds, slots=max_keys)
+        )
+
+    return LoginRateLimiter(
+        by_email=SlidingWindowLimiter(
+            max_attempts_per_email, email_window_seconds, max_keys),
+        by_ip=SlidingWindowLimiter(
+            max_attempts_per_ip, ip_window_seconds, max_keys)
+    )
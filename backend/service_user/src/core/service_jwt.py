@@ -4,12 +4,22 @@
 
 
 from datetime import datetime, timedelta, timezone
+from uuid import uuid4
 from jose import JWTError, jwt
 from typing import Dict, Optional
 
+from backend.service_user.src.core.key_ring import KeyRing
+
 
 class JWTService:
-    """Сервис для работы с JWT токенами (без доступа к БД)"""
+    """
+    Сервис для работы с JWT токенами (без доступа к БД)
+
+    С HMAC (HS*) подписывает общим секретом. С key_ring подписывает
+    активным асимметричным ключом и ставит kid в заголовок; проверка
+    идёт ключом по kid, поэтому токены старых ключей остаются валидными,
+    пока ключ есть в наборе.
+    """
 
     def __init__(
         self,
@@ -17,7 +27,9 @@ class JWTService:
         algorithm: str,
         access_token_expire_minutes: int,
         refresh_token_expire_days: int,
+        key_ring: Optional[KeyRing] = None,
     ):
+        self.key_ring = key_ring
         self.secret_key = secret_key
         self.algorithm = algorithm
         self.access_token_expire_minutes = access_token_expire_minutes
@@ -43,11 +55,7 @@ class JWTService:
             "type": "access"
         })
 
-        return jwt.encode(
-            to_encode,
-            self.secret_key,
-            algorithm=self.algorithm
-        )
+        return self._encode(to_encode)
 
     def create_refresh_token(
         self,
@@ -68,23 +76,49 @@ class JWTService:
             "exp": expire,
             "type": "refresh"
         })
+        # Без jti два токена одного пользователя в одну секунду совпадают
+        # и нарушают уникальность refreshtokens.token_hash
+        to_encode.setdefault("jti", uuid4().hex)
+
+        return self._encode(to_encode)
 
+    def _encode(self, claims: Dict) -> str:
+        """Подпись токена секретом или активным ключом набора"""
+        if self.key_ring is None:
+            return jwt.encode(
+                claims,
+                self.secret_key,
+                algorithm=self.algorithm
+            )
+
+        active = self.key_ring.active
         return jwt.encode(
-            to_encode,
-            self.secret_key,
-            algorithm=self.algorithm
+            claims,
+            active.private_key,
+            algorithm=active.algorithm,
+            headers={"kid": active.kid}
         )
 
     def decode_token(self, token: str) -> Optional[Dict]:
         """Декодирование токена"""
 
         try:
-            payload = jwt.decode(
+            if self.key_ring is None:
+                return jwt.decode(
+                    token,
+                    self.secret_key,
+                    algorithms=[self.algorithm]
+                )
+
+            kid = jwt.get_unverified_header(token).get("kid")
+            key = self.key_ring.get(kid)
+            if key is None:
+                return None
+            return jwt.decode(
                 token,
-                self.secret_key,
-                algorithms=[self.algorithm]
+                key.public_jwk,
+                algorithms=[key.algorithm]
             )
-            return payload
         except JWTError:
             return None
 
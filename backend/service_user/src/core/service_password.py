@@ -2,19 +2,55 @@
 Служба для работы с паролями
 """
 
+from typing import Optional
+
 from passlib.context import CryptContext
 
 
 class PasswordService:
     """ Класс для работы с паролями """
 
-    def __init__(self):
+    def __init__(
+        self,
+        time_cost: Optional[int] = None,
+        memory_cost: Optional[int] = None,
+        parallelism: Optional[int] = None
+    ):
+        """
+        Args:
+            time_cost: Число проходов Argon2 (None — значение passlib)
+            memory_cost: Память Argon2 в KiB (None — значение passlib)
+            parallelism: Число потоков Argon2 (None — значение passlib)
+        """
+        self.time_cost = time_cost
+        self.memory_cost = memory_cost
+        self.parallelism = parallelism
+
+        # Хеши с другими параметрами помечаются needs_update
+        argon2_settings = {
+            f"argon2__{name}": value
+            for name, value in (
+                ("rounds", time_cost),
+                ("memory_cost", memory_cost),
+                ("parallelism", parallelism),
+            )
+            if value is not None
+        }
 
         self.pwd_context = CryptContext(
             schemes=["argon2"],
-            deprecated="auto"
+            deprecated="auto",
+            **argon2_settings
         )
 
+    def settings(self) -> dict:
+        """Параметры для создания такого же сервиса (в процессах пула)"""
+        return {
+            "time_cost": self.time_cost,
+            "memory_cost": self.memory_cost,
+            "parallelism": self.parallelism
+        }
+
     def verify_password(
         self,
         plain_password: str,
@@ -34,3 +70,11 @@ class PasswordService:
         """ Хэширование пароля """
 
         return self.pwd_context.hash(password)
+
+    def needs_update(
+        self,
+        hashed_password: str
+    ) -> bool:
+        """ Хеш создан с устаревшими параметрами (без вычисления Argon2) """
+
+        return self.pwd_context.needs_update(hashed_password)
@@ -8,33 +8,38 @@ from backend.service_user.src.protocols.user_repository import (
 class UserUniquenessValidator:
     """Валидатор уникальности пользователя"""
 
+    MESSAGES = {
+        "user_name": "Пользователь с таким именем уже существует",
+        "email": "Пользователь с таким email уже существует"
+    }
+
     def __init__(
         self,
         user_repo: UserRepositoryProtocol
     ):
         self.user_repo = user_repo
 
-    def validate(
+    @classmethod
+    def conflict(cls, field: str, value: str) -> ConflictException:
+        """ Исключение о занятом значении поля """
+
+        return ConflictException(
+            message=cls.MESSAGES[field],
+            details={
+                "field": field,
+                "value": value
+            }
+        )
+
+    async def validate(
         self,
         user_name: str,
         email: str
     ) -> None:
         """ Проверка уникальности user_name и email """
 
-        if self.user_repo.get_user_by_user_name(user_name):
-            raise ConflictException(
-                message="Пользователь с таким именем уже существует",
-                details={
-                    "field": "user_name",
-                    "value": user_name
-                }
-            )
-
-        if self.user_repo.get_user_by_email(email):
-            raise ConflictException(
-                message="Пользователь с таким email уже существует",
-                details={
-                    "field": "email",
-                    "value": email
-                }
-            )
+        if await self.user_repo.get_user_by_user_name(user_name):
+            raise self.conflict("user_name", user_name)
+
+        if await self.user_repo.get_user_by_email(email):
+            raise self.conflict("email", email)
@@ -6,6 +6,7 @@ from .base import (
     AppException,
     ConflictException,
     NotFoundException,
+    TooManyRequestsException,
     ValidationException,
 )
 from .auth import (
@@ -24,5 +25,6 @@ __all__ = [
     # Общие
     "ConflictException",
     "NotFoundException",
+    "TooManyRequestsException",
     "ValidationException",
 ]
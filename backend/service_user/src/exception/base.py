@@ -77,3 +77,19 @@ class ValidationException(AppException):
             code="VALIDATION_ERROR",
             details=details
         )
+
+
+class TooManyRequestsException(AppException):
+    """429 - Сервис перегружен, запрос стоит повторить позже"""
+
+    def __init__(
+        self,
+        message: str = "Слишком много запросов",
+        details: Optional[Dict[str, Any]] = None
+    ):
+        super().__init__(
+            message=message,
+            status_code=429,
+            code="TOO_MANY_REQUESTS",
+            details=details
+        )
@@ -22,14 +22,34 @@ from backend.service_user.src.config import (
 from backend.service_user.src.core import (
     JWTService,
     PasswordService,
-    AuthValidator
+    AuthValidator,
+    build_login_rate_limiter,
+    load_key_ring,
+    parse_trusted_proxies
 )
 from backend.shared.database import (
     DataBaseConfig,
     ConnectionManager,
-    SessionManager
+    SessionManager,
+    AsyncConnectionManager,
+    AsyncSessionManager
 )
+from backend.service_user.src.infrastructure.login_audit import (
+    LoginAttemptPartitions,
+    LoginAttemptWriter
+)
+from backend.service_user.src.infrastructure.password_pool import (
+    PasswordHasherPool)
+from backend.service_user.src.infrastructure.token_purge import (
+    ExpiredTokenPurger)
 from backend.service_user.src.service.auth_service import AuthMapper
+from backend.service_user.src.service.availability_service import (
+    AvailabilityService)
+from backend.service_user.src.service.password_rehash_service import (
+    PasswordRehashService)
+from backend.service_user.src.service.token_version_service import (
+    TokenVersionService)
+from backend.shared.cache import LRUTTLCache, ThreadSafeLRUTTLCache
 
 
 class Container(containers.DeclarativeContainer):
@@ -74,13 +94,94 @@ class Container(containers.DeclarativeContainer):
         engine=connection_manager.provided.engine
     )
 
+    # Асинхронный engine для HTTP-слоя (не блокирует event loop)
+    # Синхронный остаётся для Alembic и gRPC сервера
+    async_connection_manager = providers.Singleton(
+        AsyncConnectionManager,
+        database_config=db_config
+    )
+
+    # Один async_sessionmaker на всё приложение
+    async_session_manager = providers.Singleton(
+        AsyncSessionManager,
+        engine=async_connection_manager.provided.engine
+    )
+
     # ==========================================
     # STATELESS CORE СЕРВИСЫ
     # ==========================================
 
     # Сервис для работы с паролями (без состояния)
     password_service = providers.Singleton(
-        PasswordService
+        PasswordService,
+        time_cost=auth_config.provided.ARGON2_TIME_COST,
+        memory_cost=auth_config.provided.ARGON2_MEMORY_COST,
+        parallelism=auth_config.provided.ARGON2_PARALLELISM
+    )
+
+    # Argon2 в пуле процессов, чтобы не блокировать event loop
+    password_hasher = providers.Singleton(
+        PasswordHasherPool,
+        password_service=password_service,
+        max_workers=auth_config.provided.PASSWORD_POOL_WORKERS,
+        max_queue_size=auth_config.provided.PASSWORD_POOL_MAX_QUEUE
+    )
+
+    # Фоновый пересчёт устаревших хешей после входа
+    password_rehasher = providers.Singleton(
+        PasswordRehashService,
+        password_hasher=password_hasher,
+        async_session_manager=async_session_manager
+    )
+
+    # Лимит попыток входа по email и IP
+    login_rate_limiter = providers.Singleton(
+        build_login_rate_limiter,
+        max_attempts_per_email=auth_config.provided.LOGIN_MAX_ATTEMPTS_PER_EMAIL,
+        email_window_seconds=auth_config.provided.LOGIN_EMAIL_WINDOW_SECONDS,
+        max_attempts_per_ip=auth_config.provided.LOGIN_MAX_ATTEMPTS_PER_IP,
+        ip_window_seconds=auth_config.provided.LOGIN_IP_WINDOW_SECONDS,
+        max_keys=auth_config.provided.LOGIN_RATE_LIMIT_MAX_KEYS,
+        shared=auth_config.provided.LOGIN_RATE_LIMIT_SHARED
+    )
+
+    # Доверенные прокси (X-Forwarded-For) разбираются один раз
+    trusted_proxies = providers.Singleton(
+        parse_trusted_proxies,
+        auth_config.provided.LOGIN_TRUSTED_PROXIES
+    )
+
+    # Журнал попыток входа: буфер и пакетная запись
+    login_attempt_writer = providers.Singleton(
+        LoginAttemptWriter,
+        async_session_manager=async_session_manager,
+        flush_interval_ms=auth_config.provided.LOGIN_AUDIT_FLUSH_INTERVAL_MS,
+        batch_size=auth_config.provided.LOGIN_AUDIT_BATCH_SIZE,
+        max_buffer=auth_config.provided.LOGIN_AUDIT_MAX_BUFFER
+    )
+
+    # Месячные секции loginattempts
+    login_attempt_partitions = providers.Singleton(
+        LoginAttemptPartitions,
+        async_session_manager=async_session_manager,
+        retention_months=auth_config.provided.LOGIN_AUDIT_RETENTION_MONTHS,
+        months_ahead=auth_config.provided.LOGIN_AUDIT_PARTITIONS_AHEAD
+    )
+
+    # Пакетная очистка просроченных refresh токенов
+    expired_token_purger = providers.Singleton(
+        ExpiredTokenPurger,
+        async_session_manager=async_session_manager,
+        batch_size=auth_config.provided.TOKEN_PURGE_BATCH_SIZE,
+        pause_ms=auth_config.provided.TOKEN_PURGE_PAUSE_MS
+    )
+
+    # Ключи подписи JWT (None для HS*)
+    key_ring = providers.Singleton(
+        load_key_ring,
+        algorithm=auth_config.provided.ALGORITHM,
+        keys_dir=auth_config.provided.JWT_KEYS_DIR,
+        active_kid=auth_config.provided.JWT_ACTIVE_KID
     )
 
     # Сервис для работы с JWT токенами (без состояния)
@@ -92,6 +193,7 @@ class Container(containers.DeclarativeContainer):
         # Время жизни токенов
         access_token_expire_minutes=auth_config.provided.ACCESS_TOKEN_EXPIRE_MINUTES,
         refresh_token_expire_days=auth_config.provided.REFRESH_TOKEN_EXPIRE_DAYS,
+        key_ring=key_ring,
     )
 
     # Валидатор аутентификации
@@ -100,6 +202,37 @@ class Container(containers.DeclarativeContainer):
     # Маппер для аутентификации
     auth_mapper = providers.Singleton(AuthMapper)
 
+    # Кэш версий токенов: общий для HTTP и gRPC в процессе;
+    # в режиме thread gRPC обращается к нему из пула потоков
+    token_version_cache = providers.Singleton(
+        ThreadSafeLRUTTLCache,
+        max_size=auth_config.provided.TOKEN_VERSION_CACHE_MAX_SIZE,
+        ttl_seconds=auth_config.provided.TOKEN_VERSION_CACHE_TTL_SECONDS
+    )
+
+    # Проверка claim ver при валидации токенов
+    token_version_service = providers.Singleton(
+        TokenVersionService,
+        cache=token_version_cache,
+        async_session_manager=async_session_manager,
+        session_manager_factory=session_manager.provider
+    )
+
+    # Занятые user_name/email для регистрации без лишнего Argon2
+    registration_taken_cache = providers.Singleton(
+        LRUTTLCache,
+        max_size=auth_config.provided.REGISTRATION_TAKEN_CACHE_MAX_SIZE,
+        ttl_seconds=auth_config.provided.REGISTRATION_TAKEN_CACHE_TTL_SECONDS
+    )
+
+    # Фильтр Блума занятых user_name/email
+    availability_service = providers.Singleton(
+        AvailabilityService,
+        async_session_manager=async_session_manager,
+        capacity=auth_config.provided.AVAILABILITY_BLOOM_CAPACITY,
+        error_rate=auth_config.provided.AVAILABILITY_BLOOM_ERROR_RATE
+    )
+
     # ==========================================
     # АГРЕГАТОРЫ
     # ==========================================
@@ -8,17 +8,33 @@ FastAPI Dependencies для User Service
 """
 
 
-from fastapi import Depends
-from sqlalchemy.orm import Session
+from typing import AsyncGenerator, Optional
 
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.service_user.src.core import (
+    KeyRing,
+    LoginRateLimiter,
+    resolve_client_ip
+)
 from backend.service_user.src.infrastructure.container import container
+from backend.service_user.src.infrastructure.login_audit import (
+    LoginAttemptWriter)
+from backend.service_user.src.infrastructure.password_pool import (
+    PasswordHasherPool)
+from backend.service_user.src.infrastructure.token_purge import (
+    ExpiredTokenPurger)
 from backend.service_user.src.repositories import (
-    SQLUserRepository,
-    SQLTokenRepository
+    AsyncSQLUserRepository,
+    AsyncSQLTokenRepository
 )
 from backend.service_user.src.service import (
     AuthService,
-    RegisterService
+    AvailabilityService,
+    PasswordRehashService,
+    RegisterService,
+    TokenVersionService
 )
 
 # ==========================================
@@ -26,17 +42,14 @@ from backend.service_user.src.service import (
 # ==========================================
 
 
-def get_db():
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Dependency для получения сессии БД
+    Dependency для получения асинхронной сессии БД
     """
-    session_manager = container.session_manager()
-    session = session_manager.SessionLocal()
+    session_manager = container.async_session_manager()
 
-    try:
+    async with session_manager.SessionLocal() as session:
         yield session
-    finally:
-        session.close()
 
 
 # ==========================================
@@ -44,17 +57,17 @@ def get_db():
 # ==========================================
 
 def get_user_repository(
-    db: Session = Depends(get_db)
-) -> SQLUserRepository:
+    db: AsyncSession = Depends(get_db)
+) -> AsyncSQLUserRepository:
     """ Dependency для получения репозитория пользователей """
-    return SQLUserRepository(db)
+    return AsyncSQLUserRepository(db)
 
 
 def get_token_repository(
-    db: Session = Depends(get_db)
-) -> SQLTokenRepository:
+    db: AsyncSession = Depends(get_db)
+) -> AsyncSQLTokenRepository:
     """ Dependency для получения репозитория токенов """
-    return SQLTokenRepository(db)
+    return AsyncSQLTokenRepository(db)
 
 
 # ==========================================
@@ -62,35 +75,126 @@ def get_token_repository(
 # ==========================================
 
 def get_auth_service(
-    user_repo: SQLUserRepository = Depends(get_user_repository),
-    token_repo: SQLTokenRepository = Depends(get_token_repository)
+    user_repo: AsyncSQLUserRepository = Depends(get_user_repository),
+    token_repo: AsyncSQLTokenRepository = Depends(get_token_repository)
 ) -> 'AuthService':
     """ Dependency для сервиса аутентификации """
 
+    auth_config = container.auth_config()
+
     return AuthService(
         user_repo=user_repo,
         token_repo=token_repo,
-        password_service=container.password_service(),
+        password_hasher=container.password_hasher(),
         jwt_service=container.jwt_service(),
-        auth_config=container.auth_config(),
+        auth_config=auth_config,
         auth_validator=container.auth_validator(),
-        mapper=container.auth_mapper()
+        mapper=container.auth_mapper(),
+        token_versions=container.token_version_service(),
+        password_rehasher=container.password_rehasher(),
+        rate_limiter=(
+            container.login_rate_limiter()
+            if auth_config.LOGIN_RATE_LIMIT_ENABLED
+            else None
+        ),
+        login_audit=(
+            container.login_attempt_writer()
+            if auth_config.LOGIN_AUDIT_ENABLED
+            else None
+        )
     )
 
 
 def get_register_service(
-    user_repo: SQLUserRepository = Depends(get_user_repository),
+    user_repo: AsyncSQLUserRepository = Depends(get_user_repository),
 ) -> 'RegisterService':
     """ Dependency для сервиса регистрации """
 
     return RegisterService(
         user_repo=user_repo,
-        password_service=container.password_service()
+        password_hasher=container.password_hasher(),
+        taken_cache=container.registration_taken_cache(),
+        availability=container.availability_service()
     )
 
 
+# ==========================================
+# РЕСУРСЫ ПРОЦЕССА
+# ==========================================
+
+def get_login_rate_limiter() -> LoginRateLimiter:
+    """ Dependency для лимита попыток входа """
+
+    return container.login_rate_limiter()
+
+
+def get_login_attempt_writer() -> LoginAttemptWriter:
+    """ Dependency для журнала попыток входа """
+
+    return container.login_attempt_writer()
+
+
+def get_availability_service() -> AvailabilityService:
+    """ Dependency для проверки доступности user_name/email """
+
+    return container.availability_service()
+
+
+def get_expired_token_purger() -> ExpiredTokenPurger:
+    """ Dependency для очистки просроченных refresh токенов """
+
+    return container.expired_token_purger()
+
+
+def get_password_hasher() -> PasswordHasherPool:
+    """ Dependency для пула хеширования паролей """
+
+    return container.password_hasher()
+
+
+def get_password_rehasher() -> PasswordRehashService:
+    """ Dependency для фонового пересчёта хешей паролей """
+
+    return container.password_rehasher()
+
+
+def get_token_version_service() -> TokenVersionService:
+    """ Dependency для проверки версий токенов """
+
+    return container.token_version_service()
+
+
+def get_client_ip(request: Request) -> Optional[str]:
+    """ Dependency для IP клиента (с учётом доверенных прокси) """
+
+    return resolve_client_ip(
+        request.client.host if request.client else None,
+        request.headers.get("x-forwarded-for"),
+        container.trusted_proxies()
+    )
+
+
+# ==========================================
+# КЛЮЧИ ПОДПИСИ
+# ==========================================
+
+def get_key_ring() -> Optional[KeyRing]:
+    """ Dependency для набора ключей подписи JWT """
+
+    return container.key_ring()
+
+
 __all__ = [
+    "get_availability_service",
+    "get_client_ip",
     "get_db",
+    "get_expired_token_purger",
+    "get_key_ring",
+    "get_login_attempt_writer",
+    "get_login_rate_limiter",
+    "get_password_hasher",
+    "get_password_rehasher",
+    "get_token_version_service",
     "get_user_repository",
     "get_token_repository",
     "get_auth_service",
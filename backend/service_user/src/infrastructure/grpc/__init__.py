@@ -9,8 +9,11 @@ gRPC модуль для User Service
 
 from .server import UserServiceServicer
 from .runner import GrpcRunner
+from .aio_server import AioGrpcServer, AsyncUserServiceServicer
 
 __all__ = [
     "UserServiceServicer",
     "GrpcRunner",
+    "AioGrpcServer",
+    "AsyncUserServiceServicer",
 ]
@@ -0,0 +1,230 @@
+"""
+Асинхронный gRPC сервер User Service (grpc.aio)
+
+Вызовы обслуживаются корутинами на event loop, а не пулом
+из 10 потоков: число одновременных RPC ограничено только
+GRPC_MAX_CONCURRENT_RPCS, запросы к БД идут через async engine.
+
+Режимы запуска:
+- на event loop FastAPI (из lifespan, GRPC_SERVER_MODE=aio)
+- отдельным процессом: python -m backend.service_user.src.infrastructure.grpc.aio_server
+"""
+
+import asyncio
+import signal
+from typing import Optional
+from uuid import UUID
+
+import grpc
+from grpc_health.v1 import health, health_pb2, health_pb2_grpc
+
+from backend.service_user.src.infrastructure.container import container
+from backend.service_user.src.infrastructure.grpc.server import (
+    UserServiceServicer)
+from backend.service_user.src.repositories import AsyncSQLUserRepository
+from backend.shared.logging.logger import get_logger
+from backend.shared.proto import user_service_pb2, user_service_pb2_grpc
+
+
+logger = get_logger(__name__).bind(
+    layer="grpc",
+    service="user"
+)
+
+
+class AsyncUserServiceServicer(UserServiceServicer):
+    """Реализация UserService для grpc.aio сервера"""
+
+    async def ValidateToken(self, request, context):
+        """Валидация JWT токена"""
+        response, code = await self._validate_token_async(request.token)
+
+        if code is not None:
+            context.set_code(code)
+            context.set_details(response.error.message)
+
+        return response
+
+    async def ValidateTokens(self, request_iterator, context):
+        """Потоковая валидация JWT токенов"""
+        async for request in request_iterator:
+            response, _ = await self._validate_token_async(request.token)
+            yield user_service_pb2.ValidateTokensResponse(
+                correlation_id=request.correlation_id,
+                result=response
+            )
+
+    async def _validate_token_async(self, token: str):
+        """
+        Проверка токена; версия пользователя читается из кэша,
+        при промахе — через async engine
+        """
+        payload, failure = self._decode_token(token)
+        if failure is not None:
+            return failure
+
+        try:
+            is_current = await self.token_versions.is_current(payload)
+        except Exception as e:
+            logger.error(f"Token version check error: {e}")
+            return self._version_check_failed()
+
+        return self._versioned_response(payload, is_current)
+
+    async def GetUserById(self, request, context):
+        """Получение пользователя по ID"""
+        try:
+            user_id = UUID(request.user_id)
+        except ValueError:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details("Invalid user ID format")
+            return self._missing_response()
+
+        session_manager = container.async_session_manager()
+
+        try:
+            async with session_manager.get_db_context(
+                auto_commit=False
+            ) as session:
+                user = await AsyncSQLUserRepository(
+                    session).get_user_by_id(user_id)
+        except Exception as e:
+            logger.error(f"Error getting user by ID: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("Internal server error")
+            return self._missing_response()
+
+        if not user:
+            return self._missing_response()
+
+        return self._user_response(user)
+
+    async def GetUsersByIds(self, request, context):
+        """Получение пользователей по списку ID одним запросом"""
+        user_ids = self._parse_user_ids(request.user_ids)
+
+        session_manager = container.async_session_manager()
+
+        try:
+            async with session_manager.get_db_context(
+                auto_commit=False
+            ) as session:
+                users = await AsyncSQLUserRepository(
+                    session).get_users_by_ids(self._unique_ids(user_ids))
+        except Exception as e:
+            logger.error(f"Error getting users by IDs: {e}")
+            context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details("Internal server error")
+            return user_service_pb2.GetUsersByIdsResponse()
+
+        return self._users_response(request.user_ids, user_ids, users)
+
+
+class AioGrpcServer:
+    """Управление grpc.aio сервером"""
+
+    def __init__(
+        self,
+        port: int = 50051,
+        options: Optional[list[tuple[str, int]]] = None,
+        max_concurrent_rpcs: Optional[int] = None,
+        grace: float = 5.0,
+        uds_path: Optional[str] = None,
+        servicer: Optional[user_service_pb2_grpc.UserServiceServicer] = None
+    ):
+        """
+        Args:
+            port: Порт сервера
+            options: Опции gRPC сервера
+            max_concurrent_rpcs: Лимит одновременных RPC; сверх него
+                клиент получает RESOURCE_EXHAUSTED (None — без лимита)
+            grace: Время на завершение начатых RPC при остановке
+            uds_path: Дополнительно слушать unix-сокет по этому пути
+            servicer: Реализация сервиса (по умолчанию AsyncUserServiceServicer)
+        """
+        self.port = port
+        self.options = options or []
+        self.max_concurrent_rpcs = max_concurrent_rpcs
+        self.grace = grace
+        self.uds_path = uds_path
+        self._servicer = servicer
+        self._server: Optional[grpc.aio.Server] = None
+        self.bound_port: Optional[int] = None
+
+    async def start(self) -> None:
+        """Запуск сервера на текущем event loop"""
+        self._server = grpc.aio.server(
+            options=self.options,
+            maximum_concurrent_rpcs=self.max_concurrent_rpcs
+        )
+
+        user_service_pb2_grpc.add_UserServiceServicer_to_server(
+            self._servicer or AsyncUserServiceServicer(), self._server
+        )
+
+        health_servicer = health.aio.HealthServicer()
+        await health_servicer.set(
+            "", health_pb2.HealthCheckResponse.SERVING)
+        health_pb2_grpc.add_HealthServicer_to_server(
+            health_servicer, self._server
+        )
+
+        self.bound_port = self._server.add_insecure_port(f'[::]:{self.port}')
+        if self.uds_path:
+            # Клиенты на том же хосте минуют TCP loopback
+            self._server.add_insecure_port(f'unix:{self.uds_path}')
+        await self._server.start()
+        logger.info(
+            "gRPC aio server running",
+            port=self.bound_port,
+            uds_path=self.uds_path,
+            max_concurrent_rpcs=self.max_concurrent_rpcs
+        )
+
+    async def stop(self) -> None:
+        """
+        Graceful drain: новые RPC отклоняются, начатые
+        получают grace секунд на завершение
+        """
+        if self._server is None:
+            return
+        logger.info("Stopping gRPC aio server...", grace=self.grace)
+        await self._server.stop(self.grace)
+        self._server = None
+        logger.info("gRPC aio server stopped")
+
+    async def wait_for_termination(self) -> None:
+        """Ожидать остановки сервера"""
+        if self._server is not None:
+            await self._server.wait_for_termination()
+
+
+def create_aio_server() -> AioGrpcServer:
+    """Сервер с настройками из GrpcConfig"""
+    grpc_config = container.grpc_config()
+    return AioGrpcServer(
+        port=grpc_config.GRPC_PORT,
+        options=grpc_config.server_options(),
+        max_concurrent_rpcs=grpc_config.GRPC_MAX_CONCURRENT_RPCS,
+        grace=grpc_config.GRPC_SHUTDOWN_GRACE_SECONDS,
+        uds_path=grpc_config.GRPC_UDS_PATH
+    )
+
+
+async def serve() -> None:
+    """Запуск отдельным процессом с остановкой по SIGTERM/SIGINT"""
+    server = create_aio_server()
+    await server.start()
+
+    loop = asyncio.get_running_loop()
+    stop_requested = asyncio.Event()
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(signum, stop_requested.set)
+
+    await stop_requested.wait()
+    await server.stop()
+    await container.async_connection_manager().close()
+
+
+if __name__ == "__main__":
+    asyncio.run(serve())
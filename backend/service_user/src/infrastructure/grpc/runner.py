@@ -32,8 +32,17 @@ logger = get_logger(__name__).bind(
 class GrpcRunner:
     """Управление gRPC сервером"""
 
-    def __init__(self, port: int = 50051):
+    def __init__(
+        self,
+        port: int = 50051,
+        options: Optional[list[tuple[str, int]]] = None,
+        max_workers: int = 10,
+        uds_path: Optional[str] = None
+    ):
         self.port = port
+        self.uds_path = uds_path
+        self.options = options or []
+        self.max_workers = max_workers
         self._server: Optional[grpc.Server] = None
         self._running = False
 
@@ -46,7 +55,10 @@ class GrpcRunner:
             raise RuntimeError(f"Port {self.port} is already in use")
 
         # Создаём сервер
-        self._server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=self.max_workers),
+            options=self.options
+        )
 
         # Добавляем сервис пользователя
         user_service_pb2_grpc.add_UserServiceServicer_to_server(
@@ -59,6 +71,10 @@ class GrpcRunner:
         )
 
         self._server.add_insecure_port(f'[::]:{self.port}')
+        if self.uds_path:
+            # Клиенты на том же хосте минуют TCP loopback
+            self._server.add_insecure_port(f'unix:{self.uds_path}')
+            logger.info(f"gRPC server listening on unix:{self.uds_path}")
 
         # Запускаем
         self._server.start()
@@ -4,6 +4,7 @@
 
 
 import grpc
+from typing import Optional
 from uuid import UUID
 
 from grpc_health.v1 import health_pb2
@@ -11,6 +12,7 @@ from google.rpc import status_pb2
 
 
 from backend.service_user.src.infrastructure.container import container
+from backend.service_user.src.repositories import SQLUserRepository
 from backend.shared.logging.logger import get_logger
 from backend.shared.proto import user_service_pb2, user_service_pb2_grpc
 
@@ -26,6 +28,7 @@ class UserServiceServicer(user_service_pb2_grpc.UserServiceServicer):
 
     def __init__(self):
         self.jwt_service = container.jwt_service()
+        self.token_versions = container.token_version_service()
 
     def CheckHealth(self, request, context):
         """Проверка здоровья gRPC сервера"""
@@ -35,49 +38,91 @@ class UserServiceServicer(user_service_pb2_grpc.UserServiceServicer):
 
     def ValidateToken(self, request, context):
         """Валидация JWT токена"""
-        token = request.token
+        response, code = self._validate_token(request.token)
 
+        if code is not None:
+            context.set_code(code)
+            context.set_details(response.error.message)
+
+        return response
+
+    def ValidateTokens(self, request_iterator, context):
+        """
+        Потоковая валидация JWT токенов (только GRPC_SERVER_MODE=aio)
+
+        В режиме thread каждый открытый поток занимал бы поток пула
+        (GRPC_MAX_WORKERS) на всё время жизни, и несколько клиентов
+        исчерпали бы пул для остальных RPC. Поэтому вызов отклоняется
+        с UNIMPLEMENTED, клиенты переходят на unary ValidateToken.
+        """
+        context.abort(
+            grpc.StatusCode.UNIMPLEMENTED,
+            "ValidateTokens requires GRPC_SERVER_MODE=aio"
+        )
+
+    def _validate_token(
+        self,
+        token: str
+    ) -> tuple[user_service_pb2.ValidateTokenResponse,
+               grpc.StatusCode | None]:
+        """
+        Проверка токена без привязки к контексту вызова
+
+        Returns:
+            Ответ и gRPC код ошибки (None, если токен валиден)
+        """
+        payload, failure = self._decode_token(token)
+        if failure is not None:
+            return failure
+
+        try:
+            is_current = self.token_versions.is_current_sync(payload)
+        except Exception as e:
+            logger.error(f"Token version check error: {e}")
+            return self._version_check_failed()
+
+        return self._versioned_response(payload, is_current)
+
+    def _decode_token(
+        self,
+        token: str
+    ) -> tuple[dict | None,
+               tuple[user_service_pb2.ValidateTokenResponse,
+                     grpc.StatusCode] | None]:
+        """
+        Проверка подписи и срока действия токена
+
+        Returns:
+            Claims токена и ответ с ошибкой (None, если токен валиден)
+        """
         if not token:
-            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-            context.set_details("Token is required")
-            return user_service_pb2.ValidateTokenResponse(
-                valid=False,
-                user_id="",
-                email="",
-                error=status_pb2.Status(
-                    code=grpc.StatusCode.INVALID_ARGUMENT.value[0],
-                    message="Token is required"
-                )
-            )
+            return None, self._invalid_response(
+                grpc.StatusCode.INVALID_ARGUMENT, "Token is required")
 
         try:
             payload = self.jwt_service.decode_token(token)
         except Exception as e:
             logger.error(f"JWT decode error: {e}")
-            context.set_code(grpc.StatusCode.UNAUTHENTICATED)
-            context.set_details("Invalid token format")
-            return user_service_pb2.ValidateTokenResponse(
-                valid=False,
-                user_id="",
-                email="",
-                error=status_pb2.Status(
-                    code=grpc.StatusCode.UNAUTHENTICATED.value[0],
-                    message="Invalid token format"
-                )
-            )
+            return None, self._invalid_response(
+                grpc.StatusCode.UNAUTHENTICATED, "Invalid token format")
 
         if not payload:
-            context.set_code(grpc.StatusCode.UNAUTHENTICATED)
-            context.set_details("Invalid or expired token")
-            return user_service_pb2.ValidateTokenResponse(
-                valid=False,
-                user_id="",
-                email="",
-                error=status_pb2.Status(
-                    code=grpc.StatusCode.UNAUTHENTICATED.value[0],
-                    message="Invalid or expired token"
-                )
-            )
+            return None, self._invalid_response(
+                grpc.StatusCode.UNAUTHENTICATED, "Invalid or expired token")
+
+        return payload, None
+
+    @classmethod
+    def _versioned_response(
+        cls,
+        payload: dict,
+        is_current: bool
+    ) -> tuple[user_service_pb2.ValidateTokenResponse,
+               grpc.StatusCode | None]:
+        """Ответ по результату сверки claim ver с версией пользователя"""
+        if not is_current:
+            return cls._invalid_response(
+                grpc.StatusCode.UNAUTHENTICATED, "Token has been revoked")
 
         user_id = payload.get("sub") or payload.get("user_id") or ""
         email = payload.get("email") or ""
@@ -87,55 +132,146 @@ class UserServiceServicer(user_service_pb2_grpc.UserServiceServicer):
             user_id=user_id,
             email=email,
             error=status_pb2.Status()
+        ), None
+
+    @classmethod
+    def _version_check_failed(
+        cls
+    ) -> tuple[user_service_pb2.ValidateTokenResponse, grpc.StatusCode]:
+        """Версию не удалось проверить: токен не принимается"""
+        return cls._invalid_response(
+            grpc.StatusCode.UNAVAILABLE, "Token version check failed")
+
+    @staticmethod
+    def _invalid_response(
+        code: grpc.StatusCode,
+        message: str
+    ) -> tuple[user_service_pb2.ValidateTokenResponse, grpc.StatusCode]:
+        """Ответ для невалидного токена"""
+        return user_service_pb2.ValidateTokenResponse(
+            valid=False,
+            user_id="",
+            email="",
+            error=status_pb2.Status(
+                code=code.value[0],
+                message=message
+            )
+        ), code
+
+    @staticmethod
+    def _user_response(user) -> user_service_pb2.GetUserByIdResponse:
+        """Ответ с данными пользователя"""
+        return user_service_pb2.GetUserByIdResponse(
+            id=str(user.id),
+            email=user.email,
+            user_name=user.user_name,
+            is_active=user.is_active,
+            exists=True,
+            token_version=user.token_version
+        )
+
+    @staticmethod
+    def _missing_response(
+        user_id: str = ""
+    ) -> user_service_pb2.GetUserByIdResponse:
+        """Ответ для отсутствующего пользователя"""
+        return user_service_pb2.GetUserByIdResponse(
+            id=user_id,
+            email="",
+            user_name="",
+            is_active=False,
+            exists=False
         )
 
     def GetUserById(self, request, context):
         """Получение пользователя по ID"""
+        try:
+            user_id = UUID(request.user_id)
+        except ValueError:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details("Invalid user ID format")
+            return self._missing_response()
+
         session_manager = container.session_manager()
-        user_repo_class = container.sql_user_repository()
 
         with session_manager.SessionLocal() as session:
-            user_repo = user_repo_class(session)
             try:
-                try:
-                    user_id = UUID(request.user_id)
-                except ValueError:
-                    context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
-                    context.set_details("Invalid user ID format")
-                    return user_service_pb2.GetUserByIdResponse(
-                        id="",
-                        email="",
-                        user_name="",
-                        is_active=False,
-                        exists=False
-                    )
-
-                user = user_repo.get_user_by_id(user_id)
-
-                if not user:
-                    return user_service_pb2.GetUserByIdResponse(
-                        id="",
-                        email="",
-                        user_name="",
-                        is_active=False,
-                        exists=False
-                    )
-
-                return user_service_pb2.GetUserByIdResponse(
-                    id=str(user.id),
-                    email=user.email,
-                    user_name=user.user_name,
-                    is_active=user.is_active,
-                    exists=True
-                )
+                user = SQLUserRepository(session).get_user_by_id(user_id)
             except Exception as e:
                 logger.error(f"Error getting user by ID: {e}")
                 context.set_code(grpc.StatusCode.INTERNAL)
                 context.set_details("Internal server error")
-                return user_service_pb2.GetUserByIdResponse(
-                    id="",
-                    email="",
-                    user_name="",
-                    is_active=False,
-                    exists=False
+                return self._missing_response()
+
+        if not user:
+            return self._missing_response()
+
+        return self._user_response(user)
+
+    def GetUsersByIds(self, request, context):
+        """
+        Получение пользователей по списку ID
+
+        Все пользователи читаются одним запросом с IN; ответ
+        повторяет порядок запроса, отсутствующие и некорректные ID
+        помечены exists = false.
+        """
+        user_ids = self._parse_user_ids(request.user_ids)
+
+        session_manager = container.session_manager()
+
+        with session_manager.SessionLocal() as session:
+            try:
+                users = SQLUserRepository(session).get_users_by_ids(
+                    self._unique_ids(user_ids)
                 )
+            except Exception as e:
+                logger.error(f"Error getting users by IDs: {e}")
+                context.set_code(grpc.StatusCode.INTERNAL)
+                context.set_details("Internal server error")
+                return user_service_pb2.GetUsersByIdsResponse()
+
+        return self._users_response(request.user_ids, user_ids, users)
+
+    @staticmethod
+    def _parse_user_ids(raw_ids) -> list[Optional[UUID]]:
+        """
+        Разбор ID запроса; некорректный ID — None
+
+        Пакет собирается из запросов разных клиентов (user_loader),
+        поэтому один неверный ID не должен ронять весь RPC.
+        """
+        user_ids = []
+        for raw_id in raw_ids:
+            try:
+                user_ids.append(UUID(raw_id))
+            except ValueError:
+                user_ids.append(None)
+        return user_ids
+
+    @staticmethod
+    def _unique_ids(user_ids: list[Optional[UUID]]) -> list[UUID]:
+        """Корректные ID без повторов для запроса IN"""
+        return [
+            user_id for user_id in dict.fromkeys(user_ids)
+            if user_id is not None
+        ]
+
+    @classmethod
+    def _users_response(
+        cls,
+        raw_ids,
+        user_ids: list[Optional[UUID]],
+        users: list
+    ) -> user_service_pb2.GetUsersByIdsResponse:
+        """Ответ GetUsersByIds в порядке запроса"""
+        found = {user.id: user for user in users}
+
+        return user_service_pb2.GetUsersByIdsResponse(
+            users=[
+                cls._user_response(found[user_id])
+                if user_id in found
+                else cls._missing_response(raw_id)
+                for raw_id, user_id in zip(raw_ids, user_ids)
+            ]
+        )
@@ -0,0 +1,300 @@
+"""
+Журнал попыток входа: буфер с пакетной записью и секции по месяцам
+
+LoginAttemptWriter не пишет попытку отдельным INSERT+COMMIT:
+записи копятся в памяти и сбрасываются одним многострочным
+INSERT раз в flush_interval_ms или при накоплении batch_size строк.
+Журнал best-effort: при переполнении буфера или ошибке БД записи
+отбрасываются и учитываются в stats().
+
+LoginAttemptPartitions заранее создаёт месячные секции таблицы
+loginattempts и удаляет (DETACH + DROP) секции старше срока хранения.
+"""
+
+import asyncio
+import re
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert, text
+
+from backend.service_user.src.models import LoginAttempt
+from backend.shared.logging.logger import get_logger
+
+
+logger = get_logger(__name__).bind(
+    layer="infrastructure",
+    service="user"
+)
+
+_PARTITION_RE = re.compile(r"^loginattempts_y(\d{4})m(\d{2})$")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class LoginAttemptWriter:
+    """Write-behind буфер попыток входа"""
+
+    def __init__(
+        self,
+        async_session_manager: Any,
+        flush_interval_ms: int = 200,
+        batch_size: int = 500,
+        max_buffer: int = 10_000,
+        clock: Callable[[], datetime] = _utcnow
+    ):
+        """
+        Args:
+            async_session_manager: Менеджер асинхронных сессий
+            flush_interval_ms: Максимальная задержка записи
+            batch_size: Строк в одном INSERT; столько же запускает сброс
+            max_buffer: Предел буфера; сверх него старые записи теряются
+            clock: Источник времени попыток (подменяется в тестах)
+        """
+        self.async_session_manager = async_session_manager
+        self.flush_interval = flush_interval_ms / 1000
+        self.batch_size = batch_size
+        self._buffer: deque[dict] = deque(maxlen=max_buffer)
+        self._clock = clock
+
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+        self.recorded = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.flushes = 0
+
+    def record(
+        self,
+        email: str,
+        ip_address: Optional[str],
+        is_successful: bool,
+        user_id: Optional[UUID] = None,
+        user_agent: Optional[str] = None,
+        failure_reason: Optional[str] = None
+    ) -> None:
+        """Поставить попытку в буфер (без ввода-вывода)"""
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+
+        now = self._clock()
+        self._buffer.append({
+            "id": uuid4(),
+            "created_at": now,
+            "updated_at": now,
+            "is_active": True,
+            "user_id": user_id,
+            "email": email[:100],
+            "ip_address": (ip_address or "unknown")[:45],
+            "user_agent": user_agent[:500] if user_agent else None,
+            "is_successful": is_successful,
+            "failure_reason": failure_reason
+        })
+        self.recorded += 1
+
+        if len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    async def start(self) -> None:
+        """Запустить фоновый сброс буфера"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановить фоновый сброс и записать остаток буфера"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Записать буфер пакетами; возвращает число записанных строк"""
+        async with self._flush_lock:
+            written = 0
+            while self._buffer:
+                batch = [
+                    self._buffer.popleft()
+                    for _ in range(min(self.batch_size, len(self._buffer)))
+                ]
+                try:
+                    await self._write(batch)
+                except Exception as e:
+                    self.failed += len(batch)
+                    logger.error(
+                        "Login attempts flush failed",
+                        rows=len(batch),
+                        error=str(e)
+                    )
+                    break
+                written += len(batch)
+
+            self.written += written
+            if written:
+                self.flushes += 1
+            return written
+
+    async def _write(self, rows: list[dict]) -> None:
+        """Один многострочный INSERT в одной транзакции"""
+        async with self.async_session_manager.get_db_context(
+            auto_commit=False
+        ) as session:
+            await session.execute(
+                insert(LoginAttempt.__table__).values(rows))
+            await session.commit()
+
+    def stats(self) -> dict:
+        """Метрики для /metrics"""
+        return {
+            "buffered": len(self._buffer),
+            "recorded": self.recorded,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "flushes": self.flushes
+        }
+
+
+def _add_months(year: int, month: int, delta: int) -> tuple[int, int]:
+    index = year * 12 + (month - 1) + delta
+    return index // 12, index % 12 + 1
+
+
+def partition_name(year: int, month: int) -> str:
+    """
+    Имя месячной секции
+
+    >>> partition_name(2026, 3)
+    'loginattempts_y2026m03'
+    """
+    return f"loginattempts_y{year}m{month:02d}"
+
+
+def partitions_to_create(
+    now: datetime,
+    months_ahead: int
+) -> list[tuple[str, str, str]]:
+    """
+    Секции текущего и следующих месяцев: (имя, FROM, TO)
+
+    >>> partitions_to_create(datetime(2026, 12, 5), 1)[-1]
+    ('loginattempts_y2027m01', '2027-01-01', '2027-02-01')
+    """
+    result = []
+    for delta in range(months_ahead + 1):
+        year, month = _add_months(now.year, now.month, delta)
+        next_year, next_month = _add_months(year, month, 1)
+        result.append((
+            partition_name(year, month),
+            f"{year}-{month:02d}-01",
+            f"{next_year}-{next_month:02d}-01"
+        ))
+    return result
+
+
+def expired_partitions(
+    names: list[str],
+    now: datetime,
+    retention_months: int
+) -> list[str]:
+    """
+    Секции, целиком старше срока хранения
+
+    >>> expired_partitions(
+    ...     ["loginattempts_y2026m01", "loginattempts_y2026m04", "other"],
+    ...     datetime(2026, 7, 15), 3)
+    ['loginattempts_y2026m01']
+    """
+    oldest_kept = _add_months(now.year, now.month, -retention_months)
+    expired = []
+    for name in names:
+        match = _PARTITION_RE.match(name)
+        if match and (int(match[1]), int(match[2])) < oldest_kept:
+            expired.append(name)
+    return sorted(expired)
+
+
+class LoginAttemptPartitions:
+    """Обслуживание месячных секций loginattempts (PostgreSQL)"""
+
+    def __init__(
+        self,
+        async_session_manager: Any,
+        retention_months: int = 6,
+        months_ahead: int = 2,
+        clock: Callable[[], datetime] = _utcnow
+    ):
+        """
+        Args:
+            async_session_manager: Менеджер асинхронных сессий
+            retention_months: Сколько полных месяцев хранить
+            months_ahead: На сколько месяцев вперёд создавать секции
+            clock: Источник времени (подменяется в тестах)
+        """
+        self.async_session_manager = async_session_manager
+        self.retention_months = retention_months
+        self.months_ahead = months_ahead
+        self._clock = clock
+
+    async def maintain(self) -> dict:
+        """Создать недостающие секции и удалить устаревшие"""
+        now = self._clock()
+
+        async with self.async_session_manager.get_db_context(
+            auto_commit=False
+        ) as session:
+            for name, start, end in partitions_to_create(
+                    now, self.months_ahead):
+                await session.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS {name} "
+                    f"PARTITION OF loginattempts "
+                    f"FOR VALUES FROM ('{start}') TO ('{end}')"
+                ))
+
+            result = await session.execute(text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'loginattempts'::regclass"
+            ))
+            dropped = expired_partitions(
+                [row[0] for row in result], now, self.retention_months)
+
+            for name in dropped:
+                await session.execute(text(
+                    f"ALTER TABLE loginattempts DETACH PARTITION {name}"))
+                await session.execute(text(f"DROP TABLE {name}"))
+
+            await session.commit()
+
+        if dropped:
+            logger.info("Login attempt partitions dropped", partitions=dropped)
+        return {"dropped": dropped}
+
+    async def run(self, interval_seconds: float = 86_400) -> None:
+        """Периодическое обслуживание (фоновая задача lifespan)"""
+        while True:
+            try:
+                await self.maintain()
+            except Exception as e:
+                logger.error("Partition maintenance failed", error=str(e))
+            await asyncio.sleep(interval_seconds)
@@ -0,0 +1,196 @@
+"""
+Пул процессов для хеширования и проверки паролей (Argon2)
+
+Argon2 намеренно дорогой: вызов на event loop блокирует его
+на десятки миллисекунд и сериализует все остальные запросы.
+Пул выносит работу в отдельные процессы (без GIL), а ограниченная
+очередь допуска сразу отвечает 429, если пул не успевает.
+"""
+
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from backend.service_user.src.core import PasswordService
+from backend.service_user.src.exception import TooManyRequestsException
+from backend.shared.logging.logger import get_logger
+
+
+logger = get_logger(__name__).bind(
+    layer="infrastructure",
+    service="user"
+)
+
+# Число последних замеров для перцентилей в stats()
+_SAMPLES = 1024
+
+# Экземпляр PasswordService внутри процесса пула
+_worker_service: Optional[PasswordService] = None
+
+
+def _init_worker(settings: Optional[dict] = None) -> None:
+    """Инициализация процесса пула параметрами Argon2 приложения"""
+    global _worker_service
+    _worker_service = PasswordService(**(settings or {}))
+
+
+def _service() -> PasswordService:
+    """PasswordService процесса (создаётся и вне пула, для тестов)"""
+    if _worker_service is None:
+        _init_worker()
+    return _worker_service
+
+
+def _hash_password(password: str) -> tuple[str, float]:
+    """Хеширование в процессе пула; возвращает хеш и время работы"""
+    started = time.perf_counter()
+    hashed = _service().hash_password(password)
+    return hashed, time.perf_counter() - started
+
+
+def _verify_password(
+    plain_password: str,
+    hashed_password: str
+) -> tuple[bool, float]:
+    """Проверка в процессе пула; возвращает результат и время работы"""
+    started = time.perf_counter()
+    is_valid = _service().verify_password(plain_password, hashed_password)
+    return is_valid, time.perf_counter() - started
+
+
+def _summary(samples: deque) -> dict:
+    """Сводка по замерам в миллисекундах"""
+    if not samples:
+        return {"count": 0, "avg_ms": 0.0, "p50_ms": 0.0,
+                "p95_ms": 0.0, "max_ms": 0.0}
+
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "avg_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+        "p95_ms": round(
+            ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+            3),
+        "max_ms": round(ordered[-1] * 1000, 3)
+    }
+
+
+class PasswordHasherPool:
+    """
+    Асинхронный фасад PasswordService поверх пула процессов
+
+    Одновременно допускается не больше max_workers + max_queue_size
+    операций; сверх лимита — TooManyRequestsException (429) без ожидания.
+    """
+
+    def __init__(
+        self,
+        password_service: Optional[PasswordService] = None,
+        max_workers: int = 2,
+        max_queue_size: int = 64,
+        executor_factory: Optional[Callable[[], Executor]] = None
+    ):
+        """
+        Args:
+            password_service: Параметры Argon2 для процессов пула
+                и проверки needs_update
+            max_workers: Число процессов пула
+            max_queue_size: Сколько операций может ждать свободный процесс
+            executor_factory: Фабрика исполнителя (подменяется в тестах)
+        """
+        if max_workers <= 0:
+            raise ValueError("max_workers должен быть положительным")
+        if max_queue_size < 0:
+            raise ValueError("max_queue_size не может быть отрицательным")
+
+        self.password_service = password_service or PasswordService()
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self._executor_factory = executor_factory or (
+            lambda: ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(self.password_service.settings(),)
+            )
+        )
+        # Процессы создаются при первом вызове
+        self._executor: Optional[Executor] = None
+
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self._queue_wait: deque = deque(maxlen=_SAMPLES)
+        self._hash_time: deque = deque(maxlen=_SAMPLES)
+
+    @property
+    def capacity(self) -> int:
+        """Максимум одновременно допущенных операций"""
+        return self.max_workers + self.max_queue_size
+
+    async def hash_password(self, password: str) -> str:
+        """Хеширование пароля в пуле"""
+        return await self._run(_hash_password, password)
+
+    async def verify_password(
+        self,
+        plain_password: str,
+        hashed_password: str
+    ) -> bool:
+        """Проверка пароля в пуле"""
+        return await self._run(
+            _verify_password, plain_password, hashed_password)
+
+    def needs_update(self, hashed_password: str) -> bool:
+        """Хеш создан с устаревшими параметрами (дёшево, в процессе)"""
+        return self.password_service.needs_update(hashed_password)
+
+    async def _run(self, fn: Callable[..., tuple[Any, float]], *args) -> Any:
+        """Допуск в очередь, выполнение в пуле и замеры"""
+        if self._pending >= self.capacity:
+            self.rejected += 1
+            logger.warning(
+                "Password pool is full",
+                pending=self._pending,
+                capacity=self.capacity
+            )
+            raise TooManyRequestsException(
+                "Сервис перегружен, повторите попытку позже")
+
+        if self._executor is None:
+            self._executor = self._executor_factory()
+
+        self._pending += 1
+        submitted = time.perf_counter()
+        try:
+            result, hash_seconds = await asyncio.get_running_loop(
+            ).run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+
+        # Ожидание = время в очереди и на передачу между процессами
+        total = time.perf_counter() - submitted
+        self._queue_wait.append(max(total - hash_seconds, 0.0))
+        self._hash_time.append(hash_seconds)
+        self.completed += 1
+        return result
+
+    def shutdown(self) -> None:
+        """Остановка процессов пула"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> dict:
+        """Метрики пула для /metrics"""
+        return {
+            "max_workers": self.max_workers,
+            "capacity": self.capacity,
+            "pending": self._pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "queue_wait": _summary(self._queue_wait),
+            "hash_time": _summary(self._hash_time)
+        }
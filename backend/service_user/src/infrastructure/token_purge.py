@@ -0,0 +1,119 @@
+"""
+Фоновая очистка просроченных refresh токенов
+
+Вместо одного DELETE по всей таблице (долгая транзакция, блокировки,
+всплеск WAL и раздувание) токены удаляются пакетами по batch_size
+строк в отдельных транзакциях с паузой между пакетами, чтобы
+очистка не вытесняла запросы входа и обновления токенов.
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+from backend.service_user.src.repositories import AsyncSQLTokenRepository
+from backend.shared.logging.logger import get_logger
+
+
+logger = get_logger(__name__).bind(
+    layer="infrastructure",
+    service="user"
+)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class ExpiredTokenPurger:
+    """Пакетное удаление просроченных refresh токенов"""
+
+    def __init__(
+        self,
+        async_session_manager: Any,
+        batch_size: int = 1000,
+        pause_ms: int = 50,
+        max_batches: Optional[int] = None,
+        clock: Callable[[], datetime] = _utcnow
+    ):
+        """
+        Args:
+            async_session_manager: Менеджер асинхронных сессий
+            batch_size: Строк в одном DELETE
+            pause_ms: Пауза между пакетами
+            max_batches: Предел пакетов за проход (None — до конца)
+            clock: Источник времени (подменяется в тестах)
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size должен быть положительным")
+
+        self.async_session_manager = async_session_manager
+        self.batch_size = batch_size
+        self.pause = pause_ms / 1000
+        self.max_batches = max_batches
+        self._clock = clock
+
+        self.runs = 0
+        self.deleted = 0
+        self.batches = 0
+        self.failed = 0
+        self.last_run: Optional[dict] = None
+
+    async def _delete_batch(self, expired_before: datetime) -> int:
+        async with self.async_session_manager.get_db_context(
+            auto_commit=False
+        ) as session:
+            return await AsyncSQLTokenRepository(
+                session).purge_expired_batch(self.batch_size, expired_before)
+
+    async def purge(self) -> dict:
+        """Один проход очистки; возвращает сводку с rows_per_sec"""
+        # Граница фиксируется на проход: токены, истекающие во время
+        # очистки, удалит следующий проход
+        expired_before = self._clock()
+        started = time.perf_counter()
+        deleted = batches = 0
+
+        while self.max_batches is None or batches < self.max_batches:
+            rows = await self._delete_batch(expired_before)
+            batches += 1
+            deleted += rows
+            if rows < self.batch_size:
+                break
+            await asyncio.sleep(self.pause)
+
+        elapsed = time.perf_counter() - started
+        self.runs += 1
+        self.deleted += deleted
+        self.batches += batches
+        self.last_run = {
+            "deleted": deleted,
+            "batches": batches,
+            "seconds": round(elapsed, 3),
+            "rows_per_sec": round(deleted / elapsed, 1) if elapsed else 0.0
+        }
+
+        if deleted:
+            logger.info("Expired refresh tokens purged", **self.last_run)
+        return self.last_run
+
+    async def run(self, interval_seconds: float = 3600) -> None:
+        """Периодическая очистка (фоновая задача lifespan)"""
+        while True:
+            try:
+                await self.purge()
+            except Exception as e:
+                self.failed += 1
+                logger.error("Refresh token purge failed", error=str(e))
+            await asyncio.sleep(interval_seconds)
+
+    def stats(self) -> dict:
+        """Метрики для /metrics"""
+        return {
+            "runs": self.runs,
+            "deleted": self.deleted,
+            "batches": self.batches,
+            "failed": self.failed,
+            "last_run": self.last_run
+        }
@@ -4,10 +4,16 @@
 Отвечает ТОЛЬКО за:
 - Миграции базы данных
 - Подключение к БД
+- gRPC сервер в режиме aio
+- Пул процессов для хеширования паролей
+- Журнал попыток входа и его секции
+- Очистку просроченных refresh токенов
+- Фильтр занятых user_name/email
 - Очистку при завершении
 
 """
 
+import asyncio
 import os
 from contextlib import asynccontextmanager
 
@@ -15,7 +21,9 @@ from fastapi import FastAPI
 from alembic import command
 from alembic.config import Config
 
-from backend.shared.database import ConnectionManager, DataBaseConfig
+from backend.service_user.src.infrastructure.container import container
+from backend.service_user.src.infrastructure.grpc.aio_server import (
+    create_aio_server)
 from backend.shared.logging.logger import get_logger
 
 
@@ -32,9 +40,8 @@ async def lifespan(app: FastAPI):
     alembic_cfg = Config("backend/service_user/migration/alembic.ini")
     command.upgrade(alembic_cfg, "head")
 
-    # Инициализация подключения к БД
-    config = DataBaseConfig()
-    connection_manager = ConnectionManager(config)
+    # Асинхронный engine приложения
+    connection_manager = container.async_connection_manager()
 
     # Пропускаем в тестах
     if os.environ.get("TESTING") == "1" or os.environ.get(
@@ -43,10 +50,36 @@ async def lifespan(app: FastAPI):
         return
 
     # Проверяем подключение к БД
-    if not connection_manager.test_connection():
+    if not await connection_manager.test_connection():
         logger.error("Failed to connect to database")
         raise Exception("Не удалось подключиться к базе данных")
 
+    # gRPC сервер на том же event loop, что и HTTP
+    grpc_config = container.grpc_config()
+    grpc_server = None
+    if grpc_config.ENABLE_GRPC and grpc_config.GRPC_SERVER_MODE == "aio":
+        grpc_server = create_aio_server()
+        await grpc_server.start()
+
+    # Журнал попыток входа и обслуживание его секций
+    login_attempt_writer = container.login_attempt_writer()
+    await login_attempt_writer.start()
+    partitions_task = asyncio.create_task(
+        container.login_attempt_partitions().run())
+
+    # Пакетная очистка просроченных refresh токенов
+    auth_config = container.auth_config()
+    purge_task = None
+    if auth_config.TOKEN_PURGE_ENABLED:
+        purge_task = asyncio.create_task(
+            container.expired_token_purger().run(
+                auth_config.TOKEN_PURGE_INTERVAL_SECONDS))
+
+    # Фильтр Блума для /register/availability: построение и перестройка
+    availability_task = asyncio.create_task(
+        container.availability_service().run(
+            auth_config.AVAILABILITY_REBUILD_SECONDS))
+
     logger.info(
         "User Service started",
         docs_url="http://127.0.0.1:8000/docs",
@@ -56,5 +89,15 @@ async def lifespan(app: FastAPI):
 
     yield
 
-    # Очистка при завершении
+    # Очистка при завершении: сначала дренируем gRPC
+    if grpc_server is not None:
+        await grpc_server.stop()
+    partitions_task.cancel()
+    availability_task.cancel()
+    if purge_task is not None:
+        purge_task.cancel()
+    await login_attempt_writer.stop()
+    await container.password_rehasher().drain()
+    container.password_hasher().shutdown()
+    await connection_manager.close()
     logger.info("User Service shutdown")
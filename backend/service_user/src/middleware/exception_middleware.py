@@ -11,6 +11,7 @@ from backend.service_user.src.exception import (
     InvalidCredentialsException,
     InvalidTokenException,
     TokenExpiredException,
+    TooManyRequestsException,
 )
 
 
@@ -59,6 +60,16 @@ class ExceptionHandlerMiddleware(BaseHTTPMiddleware):
                     "INVALID_TOKEN"
                 ))
 
+        except TooManyRequestsException as exc:
+            headers = {}
+            if "retry_after" in exc.details:
+                headers["Retry-After"] = str(exc.details["retry_after"])
+            return JSONResponse(
+                status_code=429,
+                content=exc.to_dict(),
+                headers=headers
+            )
+
         except AppException as exc:
             logger.error(
                 "App exception",
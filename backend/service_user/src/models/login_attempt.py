@@ -2,15 +2,21 @@
 Модель для отслеживания попыток входа
 Помогает обеспечить безопасность
 и предотвратить brute force атаки
+
+Таблица секционирована по месяцам (RANGE по created_at): старые
+записи удаляются DROP секции, а не DELETE со сканированием.
 """
 
 
 import typing as t
+from datetime import datetime
 
 from sqlalchemy import (
     String,
     Boolean,
-    ForeignKey
+    DateTime,
+    ForeignKey,
+    text
 )
 from sqlalchemy.orm import (
     Mapped,
@@ -25,6 +31,19 @@ from backend.shared.models.base_model import BaseModel
 class LoginAttempt(BaseModel):
     """Модель для отслеживания попыток входа"""
 
+    __table_args__ = {
+        "postgresql_partition_by": "RANGE (created_at)"
+    }
+
+    # Ключ секционирования входит в первичный ключ
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=text("timezone('utc', now())"),
+        primary_key=True,
+        nullable=False,
+        comment='Время попытки входа'
+    )
+
     user_id: Mapped[UUIDType] = mapped_column(
         ForeignKey(
             "users.id",
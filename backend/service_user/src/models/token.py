@@ -2,13 +2,14 @@
 Модель refresh token для auth-service
 """
 
+import hashlib
 from datetime import datetime
 
 from sqlalchemy import (
-    String,
     Boolean,
     DateTime,
-    ForeignKey
+    ForeignKey,
+    LargeBinary
 )
 from sqlalchemy.orm import (
     Mapped,
@@ -33,12 +34,14 @@ class RefreshToken(BaseModel):
         comment='ID пользователя'
     )
 
-    token: Mapped[str] = mapped_column(
-        String(255),
+    # Хранится SHA-256 токена, а не сам JWT: индекс по 32 байтам
+    # вместо строки до 255 символов, утечка таблицы не раскрывает токены
+    token_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32),
         unique=True,
         index=True,
         nullable=False,
-        comment='Значение токена'
+        comment='SHA-256 значения токена'
     )
 
     is_revoked: Mapped[bool] = mapped_column(
@@ -58,3 +61,8 @@ class RefreshToken(BaseModel):
         "User",
         back_populates="refresh_tokens"
     )
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        """SHA-256 токена для хранения и поиска"""
+        return hashlib.sha256(token.encode()).digest()
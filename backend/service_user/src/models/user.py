@@ -101,6 +101,15 @@ class User(BaseModel):
         comment='Количество входов в систему'
     )
 
+    # Версия сессий: увеличивается при выходе со всех устройств,
+    # access токены с устаревшим claim ver перестают приниматься
+    token_version: Mapped[int] = mapped_column(
+        default=0,
+        server_default="0",
+        nullable=False,
+        comment='Версия выданных токенов'
+    )
+
     role_name: Mapped[str] = mapped_column(
         String(50),
         default="user",
@@ -1,7 +1,11 @@
 from .user_repository import UserRepositoryProtocol
 from .token_repository import TokenRepositoryProtocol
+from .password_hasher import PasswordHasherProtocol
+from .login_audit import LoginAuditProtocol
 
 __all__ = [
     "UserRepositoryProtocol",
-    "TokenRepositoryProtocol"
+    "TokenRepositoryProtocol",
+    "PasswordHasherProtocol",
+    "LoginAuditProtocol"
 ]
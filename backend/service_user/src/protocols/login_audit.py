@@ -0,0 +1,31 @@
+from typing import Optional, Protocol
+from uuid import UUID
+
+
+class LoginAuditProtocol(Protocol):
+    """
+    Protocol (интерфейс) для журнала попыток входа
+
+    Запись не должна ждать БД: реализация буферизует попытки.
+    """
+
+    def record(
+        self,
+        email: str,
+        ip_address: Optional[str],
+        is_successful: bool,
+        user_id: Optional[UUID] = None,
+        user_agent: Optional[str] = None,
+        failure_reason: Optional[str] = None
+    ) -> None:
+        """
+        Учесть попытку входа
+
+        :param email: Email из запроса
+        :param ip_address: IP клиента
+        :param is_successful: Успешен ли вход
+        :param user_id: ID пользователя, если он найден
+        :param user_agent: User-Agent клиента
+        :param failure_reason: Причина неудачи
+        """
+        ...
@@ -0,0 +1,41 @@
+from typing import Protocol
+
+
+class PasswordHasherProtocol(Protocol):
+    """
+    Protocol (интерфейс) для асинхронного хеширования паролей
+
+    Реализация выполняет Argon2 вне event loop.
+    """
+
+    async def hash_password(self, password: str) -> str:
+        """
+        Хеширование пароля
+
+        :param password: Пароль в открытом виде
+        :return: Хеш пароля
+        """
+        ...
+
+    async def verify_password(
+        self,
+        plain_password: str,
+        hashed_password: str
+    ) -> bool:
+        """
+        Проверка пароля
+
+        :param plain_password: Пароль в открытом виде
+        :param hashed_password: Хеш пароля
+        :return: True, если пароль совпадает
+        """
+        ...
+
+    def needs_update(self, hashed_password: str) -> bool:
+        """
+        Проверка, создан ли хеш с устаревшими параметрами
+
+        :param hashed_password: Хеш пароля
+        :return: True, если хеш стоит пересчитать
+        """
+        ...
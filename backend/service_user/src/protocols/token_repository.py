@@ -1,8 +1,11 @@
 
 
+from datetime import datetime
 from typing import Protocol, Optional
 from uuid import UUID
 
+from sqlalchemy import Row
+
 from backend.service_user.src.models.token import RefreshToken
 from backend.service_user.src.schemas.auth.auth_dto import RefreshTokenDataDTO
 
@@ -12,28 +15,48 @@ class TokenRepositoryProtocol(Protocol):
     Protocol (интерфейс) для репозитория токенов
     """
 
-    def create_refresh_token(
+    async def create_refresh_token(
         self,
         token_data: RefreshTokenDataDTO
     ) -> RefreshToken:
         """Создание refresh токена"""
         ...
 
-    def get_valid_token(
+    async def get_valid_token(
         self,
         token: str
     ) -> Optional[RefreshToken]:
         """Получение валидного токена"""
         ...
 
-    def revoke_token(self, token: str) -> bool:
+    async def revoke_token(self, token: str) -> bool:
         """Отзыв токена"""
         ...
 
-    def revoke_user_tokens(self, user_id: UUID) -> None:
+    async def rotate_refresh_token(
+        self,
+        old_token: str,
+        token_data: RefreshTokenDataDTO
+    ) -> Optional[Row]:
+        """Атомарная замена refresh токена (отзыв старого + новый)"""
+        ...
+
+    async def revoke_user_tokens(self, user_id: UUID) -> None:
         """Отзыв всех токенов пользователя"""
         ...
 
-    def cleanup_expired_tokens(self) -> int:
+    async def revoke_all_sessions(self, user_id: UUID) -> Optional[int]:
+        """Отзыв токенов и увеличение token_version одной транзакцией"""
+        ...
+
+    async def cleanup_expired_tokens(self) -> int:
         """Очистка просроченных токенов"""
         ...
+
+    async def purge_expired_batch(
+        self,
+        batch_size: int,
+        expired_before: Optional[datetime] = None
+    ) -> int:
+        """Удаление пакета просроченных токенов"""
+        ...
@@ -13,7 +13,7 @@ class UserRepositoryProtocol(Protocol):
     как UserRepositoryProtocol. Не нужно наследоваться!
     """
 
-    def create_user_with_default_role(self, user_data: dict) -> User:
+    async def create_user_with_default_role(self, user_data: dict) -> User:
         """
         Создание пользователя с ролью по умолчанию
 
@@ -22,7 +22,16 @@ class UserRepositoryProtocol(Protocol):
         """
         ...
 
-    def get_user_by_user_name(self, user_name: str) -> Optional[User]:
+    async def create_user_if_absent(self, user_data: dict) -> Optional[User]:
+        """
+        Создание пользователя (INSERT ... ON CONFLICT DO NOTHING)
+
+        :param user_data: Словарь с данными пользователя
+        :return: Созданный пользователь или None, если user_name/email заняты
+        """
+        ...
+
+    async def get_user_by_user_name(self, user_name: str) -> Optional[User]:
         """
         Поиск пользователя по имени
 
@@ -31,7 +40,7 @@ class UserRepositoryProtocol(Protocol):
         """
         ...
 
-    def get_user_by_email(self, email: str) -> Optional[User]:
+    async def get_user_by_email(self, email: str) -> Optional[User]:
         """
         Поиск пользователя по email
 
@@ -40,7 +49,7 @@ class UserRepositoryProtocol(Protocol):
         """
         ...
 
-    def get_user_by_id(self, user_id: UUID) -> Optional[User]:
+    async def get_user_by_id(self, user_id: UUID) -> Optional[User]:
         """
         Поиск пользователя по ID
 
@@ -49,7 +58,10 @@ class UserRepositoryProtocol(Protocol):
         """
         ...
 
-    def get_active_user_by_user_name(self, user_name: str) -> Optional[User]:
+    async def get_active_user_by_user_name(
+        self,
+        user_name: str
+    ) -> Optional[User]:
         """
         Поиск активного пользователя по имени
 
@@ -58,7 +70,7 @@ class UserRepositoryProtocol(Protocol):
         """
         ...
 
-    def get_active_user_by_email(self, email: str) -> Optional[User]:
+    async def get_active_user_by_email(self, email: str) -> Optional[User]:
         """
         Поиск активного пользователя по email
 
@@ -67,7 +79,41 @@ class UserRepositoryProtocol(Protocol):
         """
         ...
 
-    def activate_user(self, user_id: UUID) -> None:
+    async def get_token_version(self, user_id: UUID) -> Optional[int]:
+        """
+        Текущая версия токенов пользователя
+
+        :param user_id: ID пользователя
+        :return: Версия или None, если пользователь не найден
+        """
+        ...
+
+    async def bump_token_version(self, user_id: UUID) -> Optional[int]:
+        """
+        Увеличение версии токенов (выход со всех устройств)
+
+        :param user_id: ID пользователя
+        :return: Новая версия или None, если пользователь не найден
+        """
+        ...
+
+    async def update_password_hash(
+        self,
+        user_id: UUID,
+        old_hash: str,
+        new_hash: str
+    ) -> bool:
+        """
+        Замена хеша пароля (если он всё ещё равен old_hash)
+
+        :param user_id: ID пользователя
+        :param old_hash: Хеш, по которому прошла проверка пароля
+        :param new_hash: Хеш с актуальными параметрами
+        :return: True, если хеш обновлён
+        """
+        ...
+
+    async def activate_user(self, user_id: UUID) -> None:
         """
         Активация пользователя
 
@@ -1,8 +1,12 @@
 from .sql_user_repository import SQLUserRepository
 from .sql_token_repository import SQLTokenRepository
+from .async_sql_user_repository import AsyncSQLUserRepository
+from .async_sql_token_repository import AsyncSQLTokenRepository
 
 __all__ = [
     "SQLUserRepository",
     "SQLRoleRepository",
-    "SQLTokenRepository"
+    "SQLTokenRepository",
+    "AsyncSQLUserRepository",
+    "AsyncSQLTokenRepository"
 ]
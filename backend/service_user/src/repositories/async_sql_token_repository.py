@@ -0,0 +1,199 @@
+"""
+Асинхронный репозиторий для работы с refresh токенами
+"""
+
+from typing import Optional
+from datetime import datetime, timezone
+
+from sqlalchemy import Row, and_, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+
+from backend.service_user.src.models.token import RefreshToken
+from backend.service_user.src.models.user import User
+from backend.service_user.src.schemas.auth.auth_dto import RefreshTokenDataDTO
+
+
+class AsyncSQLTokenRepository:
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_refresh_token(
+        self,
+        token_data: RefreshTokenDataDTO
+    ) -> RefreshToken:
+        """Создание refresh токена"""
+
+        refresh_token = RefreshToken(
+            user_id=token_data.user_id,
+            token_hash=RefreshToken.digest(token_data.token),
+            expires_at=token_data.expires_at
+        )
+        self.db.add(refresh_token)
+        await self.db.commit()
+        return refresh_token
+
+    async def get_valid_token(
+        self,
+        token: str
+    ) -> Optional[RefreshToken]:
+        """Получение валидного токена"""
+
+        result = await self.db.execute(
+            select(RefreshToken).where(
+                and_(
+                    RefreshToken.token_hash == RefreshToken.digest(token),
+                    RefreshToken.is_revoked.is_(False),
+                    RefreshToken.expires_at > datetime.now(timezone.utc)
+                )
+            )
+        )
+        return result.scalars().first()
+
+    async def revoke_token(self, token: str) -> bool:
+        """Отзыв токена"""
+
+        result = await self.db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == RefreshToken.digest(token),
+                RefreshToken.is_revoked.is_(False)
+            )
+            .values(is_revoked=True)
+        )
+        await self.db.commit()
+        return result.rowcount > 0
+
+    async def rotate_refresh_token(
+        self,
+        old_token: str,
+        token_data: RefreshTokenDataDTO
+    ) -> Optional[Row]:
+        """
+        Атомарная замена refresh токена
+
+        В одной транзакции отзывает действующий old_token
+        (UPDATE ... RETURNING user_id), читает claims пользователя и
+        сохраняет новый токен; commit один. Повторно использованный,
+        отозванный или просроченный токен не обновляется — транзакция
+        откатывается.
+
+        Returns:
+            Строка с полями пользователя для claims access токена
+            (id, user_name, email, role_name, token_version) или None
+        """
+        result = await self.db.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == RefreshToken.digest(old_token),
+                RefreshToken.user_id == token_data.user_id,
+                RefreshToken.is_revoked.is_(False),
+                RefreshToken.expires_at > datetime.now(timezone.utc)
+            )
+            .values(is_revoked=True)
+            .returning(RefreshToken.user_id)
+        )
+        if result.first() is None:
+            await self.db.rollback()
+            return None
+
+        result = await self.db.execute(
+            select(
+                User.id,
+                User.user_name,
+                User.email,
+                User.role_name,
+                User.token_version
+            ).where(User.id == token_data.user_id)
+        )
+        user = result.first()
+        if user is None:
+            await self.db.rollback()
+            return None
+
+        await self.db.execute(
+            insert(RefreshToken).values(
+                user_id=token_data.user_id,
+                token_hash=RefreshToken.digest(token_data.token),
+                expires_at=token_data.expires_at
+            )
+        )
+        await self.db.commit()
+        return user
+
+    async def revoke_user_tokens(self, user_id: UUID) -> None:
+        """Отзыв всех токенов пользователя"""
+
+        await self.db.execute(
+            update(RefreshToken)
+            .where(RefreshToken.user_id == user_id)
+            .values(is_revoked=True)
+        )
+        await self.db.commit()
+
+    async def revoke_all_sessions(self, user_id: UUID) -> Optional[int]:
+        """
+        Выход со всех устройств одной транзакцией
+
+        Отзывает refresh токены пользователя и увеличивает его
+        token_version; commit один. Если любая из операций падает,
+        откатываются обе — частичного выхода не бывает.
+
+        Returns:
+            Новая версия токенов или None, если пользователь не найден
+        """
+        try:
+            await self.db.execute(
+                update(RefreshToken)
+                .where(RefreshToken.user_id == user_id)
+                .values(is_revoked=True)
+            )
+            result = await self.db.execute(
+                update(User)
+                .where(User.id == user_id)
+                .values(token_version=User.token_version + 1)
+                .returning(User.token_version)
+            )
+            version = result.scalar_one_or_none()
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        return version
+
+    async def cleanup_expired_tokens(self) -> int:
+        """Очистка просроченных токенов"""
+
+        result = await self.db.execute(
+            delete(RefreshToken).where(
+                RefreshToken.expires_at < datetime.now(timezone.utc)
+            )
+        )
+        await self.db.commit()
+        return result.rowcount
+
+    async def purge_expired_batch(
+        self,
+        batch_size: int,
+        expired_before: Optional[datetime] = None
+    ) -> int:
+        """
+        Удаление не более batch_size просроченных токенов
+
+        Короткая транзакция на пакет: блокировки и WAL ограничены
+        размером пакета; строки, занятые другой транзакцией,
+        пропускаются (SKIP LOCKED) и удаляются следующим проходом.
+        """
+        expired_before = expired_before or datetime.now(timezone.utc)
+        batch = (
+            select(RefreshToken.id)
+            .where(RefreshToken.expires_at < expired_before)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db.execute(
+            delete(RefreshToken).where(RefreshToken.id.in_(batch))
+        )
+        await self.db.commit()
+        return result.rowcount
@@ -0,0 +1,192 @@
+"""
+Асинхронная SQLAlchemy реализация репозитория пользователей
+"""
+
+from uuid import UUID
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.service_user.src.exception.base import ConflictException
+from backend.service_user.src.models.user import User
+from backend.shared.models.enums import ROLES
+
+
+class AsyncSQLUserRepository:
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_user_with_default_role(self, user_data: dict) -> User:
+        """
+        Создание пользователя с ролью по умолчанию.
+
+        Args:
+            user_data: Словарь с данными пользователя (включая role_name)
+
+        Returns:
+            User: Созданная модель пользователя
+
+        Raises:
+            ConflictException: Если роль не указана или недопустима
+        """
+
+        self._check_role(user_data)
+
+        user = User(**user_data)
+
+        self.db.add(user)
+        await self.db.commit()
+        # Догружаем серверные значения (created_at/updated_at)
+        await self.db.refresh(user)
+        return user
+
+    async def create_user_if_absent(self, user_data: dict) -> User | None:
+        """
+        Создание пользователя одним запросом без гонки с проверкой
+
+        INSERT ... ON CONFLICT DO NOTHING RETURNING: уникальность
+        user_name и email обеспечивают индексы, серверные значения
+        (created_at/updated_at) возвращаются тем же запросом.
+
+        Returns:
+            Созданный пользователь или None, если user_name/email заняты
+
+        Raises:
+            ConflictException: Если роль недопустима
+        """
+        self._check_role(user_data)
+
+        dialect = self.db.get_bind().dialect.name
+        insert = (
+            sqlite.insert if dialect == "sqlite" else postgresql.insert)
+
+        result = await self.db.scalars(
+            insert(User)
+            .values(**user_data)
+            .on_conflict_do_nothing()
+            .returning(User)
+        )
+        user = result.first()
+        await self.db.commit()
+        return user
+
+    @staticmethod
+    def _check_role(user_data: dict) -> None:
+        role_name = user_data.get('role_name', 'user')
+
+        if role_name not in ROLES:
+
+            raise ConflictException(
+                f"Роль '{role_name}' не найдена. "
+                f"Допустимые роли: {', '.join(ROLES.keys())}"
+            )
+
+    async def get_user_by_user_name(self, user_name: str):
+        """Поиск пользователя по имени"""
+        result = await self.db.execute(
+            select(User).where(User.user_name == user_name)
+        )
+        return result.scalars().first()
+
+    async def get_user_by_email(self, email: str):
+        """Поиск пользователя по email"""
+        result = await self.db.execute(
+            select(User).where(User.email == email)
+        )
+        return result.scalars().first()
+
+    async def get_user_by_id(self, user_id: UUID):
+        """Поиск пользователя по ID"""
+        result = await self.db.execute(
+            select(User).where(User.id == user_id)
+        )
+        return result.scalars().first()
+
+    async def get_users_by_ids(self, user_ids: list[UUID]) -> list[User]:
+        """Поиск пользователей по списку ID одним запросом (IN)"""
+        if not user_ids:
+            return []
+        result = await self.db.execute(
+            select(User).where(User.id.in_(user_ids))
+        )
+        return list(result.scalars().all())
+
+    async def get_token_version(self, user_id: UUID) -> int | None:
+        """Текущая версия токенов пользователя (None — нет пользователя)"""
+        result = await self.db.execute(
+            select(User.token_version).where(User.id == user_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def bump_token_version(self, user_id: UUID) -> int | None:
+        """
+        Атомарно увеличивает версию токенов пользователя
+
+        Все ранее выданные access токены становятся недействительными.
+
+        Returns:
+            Новая версия или None, если пользователь не найден
+        """
+        result = await self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(token_version=User.token_version + 1)
+            .returning(User.token_version)
+        )
+        version = result.scalar_one_or_none()
+        await self.db.commit()
+        return version
+
+    async def update_password_hash(
+        self,
+        user_id: UUID,
+        old_hash: str,
+        new_hash: str
+    ) -> bool:
+        """
+        Замена хеша пароля, если он не менялся с момента чтения
+
+        Returns:
+            True, если хеш обновлён
+        """
+        result = await self.db.execute(
+            update(User)
+            .where(
+                User.id == user_id,
+                User.hashed_password == old_hash
+            )
+            .values(hashed_password=new_hash)
+        )
+        await self.db.commit()
+        return result.rowcount > 0
+
+    async def get_active_user_by_user_name(self, user_name: str):
+        """Поиск активного пользователя по имени"""
+        result = await self.db.execute(
+            select(User).where(
+                User.user_name == user_name,
+                User.is_active.is_(True)
+            )
+        )
+        return result.scalars().first()
+
+    async def get_active_user_by_email(self, email: str):
+        """Поиск активного пользователя по email"""
+        result = await self.db.execute(
+            select(User).where(
+                User.email == email,
+                User.is_active.is_(True)
+            )
+        )
+        return result.scalars().first()
+
+    async def activate_user(self, user_id: UUID):
+        """Активация пользователя"""
+        await self.db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(is_active=True)
+        )
+        await self.db.commit()
@@ -26,7 +26,7 @@ class SQLTokenRepository:
 
         refresh_token = RefreshToken(
             user_id=token_data.user_id,
-            token=token_data.token,
+            token_hash=RefreshToken.digest(token_data.token),
             expires_at=token_data.expires_at
         )
         self.db.add(refresh_token)
@@ -42,7 +42,7 @@ class SQLTokenRepository:
 
         return self.db.query(RefreshToken).filter(
             and_(
-                RefreshToken.token == token,
+                RefreshToken.token_hash == RefreshToken.digest(token),
                 RefreshToken.is_revoked.is_(False),
                 RefreshToken.expires_at > datetime.now(timezone.utc)
             )
@@ -64,6 +64,18 @@ class SQLUserRepository:
         """Поиск пользователя по ID"""
         return self.db.query(User).filter(User.id == user_id).first()
 
+    def get_users_by_ids(self, user_ids: list[UUID]) -> list[User]:
+        """Поиск пользователей по списку ID одним запросом (IN)"""
+        if not user_ids:
+            return []
+        return self.db.query(User).filter(User.id.in_(user_ids)).all()
+
+    def get_token_version(self, user_id: UUID) -> int | None:
+        """Текущая версия токенов пользователя (None — нет пользователя)"""
+        return self.db.query(User.token_version).filter(
+            User.id == user_id
+        ).scalar()
+
     def get_active_user_by_user_name(self, user_name: str):
         """Поиск активного пользователя по имени"""
         return self.db.query(User).filter(
@@ -23,8 +23,15 @@ class ServiceRunner:
 
         app = create_app()
 
-        if grpc_config and grpc_config.ENABLE_GRPC:
-            self.grpc_runner = GrpcRunner(port=grpc_config.GRPC_PORT)
+        # В режиме aio сервер запускается в lifespan на event loop uvicorn
+        if (grpc_config and grpc_config.ENABLE_GRPC
+                and grpc_config.GRPC_SERVER_MODE == "thread"):
+            self.grpc_runner = GrpcRunner(
+                port=grpc_config.GRPC_PORT,
+                options=grpc_config.server_options(),
+                max_workers=grpc_config.GRPC_MAX_WORKERS,
+                uds_path=grpc_config.GRPC_UDS_PATH
+            )
             self.grpc_runner.run_in_background()
 
         try:
@@ -52,7 +52,7 @@ class NameValidatedModel(BaseModel):
     Базовая схема с валидацией имени пользователя
 
     Используется для поля user_name.
-    Проверяет длину и допустимые символы.
+    Удаляет пробелы по краям, проверяет длину и допустимые символы.
 
     Attributes:
         user_name: Имя пользователя
@@ -67,6 +67,8 @@ class NameValidatedModel(BaseModel):
     def validate_name(cls, v: str) -> str:
         """ Валидация имени """
 
+        # Хранится и ищется (фильтр доступности, логин) без пробелов
+        v = v.strip()
         is_valid, errors = NameValidator.validate(v)
 
         if not is_valid:
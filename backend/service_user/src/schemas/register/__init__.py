@@ -3,15 +3,16 @@
 
 Содержит:
 - register_request: Схема для создания пользователя
-- register_response: DTO для ответа API
+- register_response: DTO для ответа API и проверки доступности
 - register_dto: Внутренний DTO для сервисного слоя
 """
 
 from .register_request import UserCreate
-from .register_response import UserResponseDTO
+from .register_response import AvailabilityResponse, UserResponseDTO
 from .register_dto import UserRegistrationDTO
 
 __all__ = [
+    "AvailabilityResponse",
     "UserCreate",
     "UserResponseDTO",
     "UserRegistrationDTO"
@@ -135,3 +135,33 @@ class UserResponseDTO(BaseModel):
     ) -> Optional[str]:
         """Сериализация datetime в ISO формат"""
         return value.isoformat() if value else None
+
+
+class AvailabilityResponse(BaseModel):
+    """
+    Ответ проверки доступности user_name/email
+
+    Поле присутствует, только если значение передано в запросе.
+
+    Attributes:
+        user_name_available: Свободно ли имя пользователя
+        email_available: Свободен ли email
+    """
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "user_name_available": True,
+                "email_available": False
+            }
+        }
+    )
+
+    user_name_available: Optional[bool] = Field(
+        default=None,
+        description="Имя пользователя свободно"
+    )
+    email_available: Optional[bool] = Field(
+        default=None,
+        description="Email свободен"
+    )
@@ -1,7 +1,13 @@
 from .auth_service import AuthService
+from .availability_service import AvailabilityService
+from .password_rehash_service import PasswordRehashService
 from .register_service import RegisterService
+from .token_version_service import TokenVersionService
 
 __all__ = [
     "AuthService",
-    "RegisterService"
+    "AvailabilityService",
+    "PasswordRehashService",
+    "RegisterService",
+    "TokenVersionService"
 ]
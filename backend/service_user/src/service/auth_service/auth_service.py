@@ -3,25 +3,37 @@
 для выполнения необходимых операций
 """
 
+import math
 from datetime import datetime, timedelta, timezone
 from typing import Optional
-
+from uuid import UUID
 
 from backend.service_user.src.exception import (
-    InvalidCredentialsException)
+    InvalidCredentialsException,
+    InvalidTokenException,
+    TooManyRequestsException)
 from backend.service_user.src.config import AuthConfig
 from backend.service_user.src.core import (
-    PasswordService,
     JWTService,
-    AuthValidator
+    AuthValidator,
+    LoginRateLimiter
 )
 from backend.service_user.src.models.user import User
 from backend.service_user.src.protocols import (
+    LoginAuditProtocol,
+    PasswordHasherProtocol,
     UserRepositoryProtocol,
     TokenRepositoryProtocol
 )
 from backend.service_user.src.service.auth_service.mappers import AuthMapper
-from backend.service_user.src.schemas.auth.auth_dto import TokenPairDTO
+from backend.service_user.src.schemas.auth.auth_dto import (
+    RefreshTokenDataDTO,
+    TokenPairDTO
+)
+from backend.service_user.src.service.password_rehash_service import (
+    PasswordRehashService)
+from backend.service_user.src.service.token_version_service import (
+    TokenVersionService)
 
 
 class AuthService:
@@ -30,103 +42,238 @@ class AuthService:
     def __init__(
         self,
         user_repo: UserRepositoryProtocol,
-        password_service: PasswordService,
+        password_hasher: PasswordHasherProtocol,
         jwt_service: JWTService,
         auth_config: AuthConfig,
         auth_validator: AuthValidator,
         mapper: AuthMapper,
-        token_repo: TokenRepositoryProtocol
+        token_repo: TokenRepositoryProtocol,
+        token_versions: Optional[TokenVersionService] = None,
+        password_rehasher: Optional[PasswordRehashService] = None,
+        rate_limiter: Optional[LoginRateLimiter] = None,
+        login_audit: Optional[LoginAuditProtocol] = None
     ):
         self.user_repo = user_repo
-        self.password_service = password_service
+        self.password_hasher = password_hasher
         self.jwt_service = jwt_service
         self.auth_config = auth_config
         self.auth_validator = auth_validator
         self.mapper = mapper
         self.token_repo = token_repo
+        self.token_versions = token_versions
+        self.password_rehasher = password_rehasher
+        self.rate_limiter = rate_limiter
+        self.login_audit = login_audit
 
-    def authenticate_and_create_tokens(
+    async def authenticate_and_create_tokens(
         self,
         email: str,
-        password: str
+        password: str,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None
     ) -> Optional[TokenPairDTO]:
         """
         Аутентификация и создание токенов
         Возвращает: TokenPairDTO или None при ошибке
         """
+        # Шаг 0: Лимит попыток — до запроса к БД и Argon2
+        self._check_rate_limit(email, ip_address)
+
         # Шаг 1: Аутентификация пользователя
-        user = self.user_repo.get_user_by_email(email)
+        user = await self.user_repo.get_user_by_email(email)
 
         # Шаг 2: Валидация пароля
-        if not self._verify_password(password, user):
+        if not await self._verify_password(password, user):
+            self._audit(email, ip_address, user_agent, user,
+                        failure_reason="invalid_credentials")
             raise InvalidCredentialsException()
 
         # Шаг 3: Валидация пользователя
         if not self.auth_validator.validate_user_for_auth(user):
+            self._audit(email, ip_address, user_agent, user,
+                        failure_reason="inactive_user")
             raise InvalidCredentialsException()
 
-        # Шаг 4: Создание токенов
-        return self.create_tokens(user)
+        self._audit(email, ip_address, user_agent, user)
+        if self.rate_limiter is not None:
+            self.rate_limiter.reset(email)
+
+        # Шаг 4: Хеш с устаревшими параметрами Argon2 пересчитывается
+        # в фоне, ответ его не ждёт
+        if self.password_rehasher is not None:
+            self.password_rehasher.schedule(
+                user.id, password, user.hashed_password)
+
+        # Шаг 5: Создание токенов
+        return await self.create_tokens(user)
+
+    def _audit(
+        self,
+        email: str,
+        ip_address: Optional[str],
+        user_agent: Optional[str],
+        user: Optional[User],
+        failure_reason: Optional[str] = None
+    ) -> None:
+        """Попытка входа в журнал (буфер, без ожидания БД)"""
+        if self.login_audit is None:
+            return
+
+        self.login_audit.record(
+            email=email,
+            ip_address=ip_address,
+            is_successful=failure_reason is None,
+            user_id=user.id if user else None,
+            user_agent=user_agent,
+            failure_reason=failure_reason
+        )
+
+    def _check_rate_limit(
+        self,
+        email: str,
+        ip_address: Optional[str]
+    ) -> None:
+        """Отклонить попытку сверх лимита по email или IP"""
+        if self.rate_limiter is None:
+            return
+
+        retry_after = self.rate_limiter.hit(email, ip_address)
+        if retry_after:
+            raise TooManyRequestsException(
+                "Слишком много попыток входа, повторите позже",
+                details={"retry_after": math.ceil(retry_after)}
+            )
 
-    def _verify_password(
+    async def _verify_password(
         self,
         password: str,
         user: Optional[User]
     ) -> bool:
-        """Проверка пароля"""
+        """Проверка пароля (Argon2 выполняется вне event loop)"""
         if not user:
             return False
-        return self.password_service.verify_password(
+        return await self.password_hasher.verify_password(
             password,
             user.hashed_password
         )
 
-    def create_tokens(self, user: User) -> TokenPairDTO:
-        """Создание пары токенов"""
-        # Access токен
-        access_token = self.jwt_service.create_access_token({
-            "sub": str(user.id),
-            "username": user.user_name,
-            "role": user.role_name,
-            "email": user.email
+    def _access_token(
+        self,
+        user_id: UUID,
+        user_name: str,
+        role_name: str,
+        email: str,
+        token_version: Optional[int]
+    ) -> str:
+        """Access токен с claims пользователя"""
+        return self.jwt_service.create_access_token({
+            "sub": str(user_id),
+            "username": user_name,
+            "role": role_name,
+            "email": email,
+            "ver": token_version or 0
         })
 
-        # Refresh токен
+    def _new_refresh_token(
+        self,
+        user_id: UUID
+    ) -> tuple[str, RefreshTokenDataDTO]:
+        """Refresh токен и данные для его сохранения"""
         refresh_token = self.jwt_service.create_refresh_token({
-            "sub": str(user.id)
+            "sub": str(user_id)
         })
 
-        # Подготовка данных для сохранения refresh токена
         refresh_data = self.mapper.to_refresh_token_data(
-            user_id=user.id,
+            user_id=user_id,
             token=refresh_token,
             expires_at=datetime.now(timezone.utc) + timedelta(
                 days=self.auth_config.REFRESH_TOKEN_EXPIRE_DAYS
             )
         )
+        return refresh_token, refresh_data
 
-        self.token_repo.create_refresh_token(refresh_data)
+    async def create_tokens(self, user: User) -> TokenPairDTO:
+        """Создание пары токенов"""
+        access_token = self._access_token(
+            user.id,
+            user.user_name,
+            user.role_name,
+            user.email,
+            user.token_version
+        )
+        refresh_token, refresh_data = self._new_refresh_token(user.id)
+
+        await self.token_repo.create_refresh_token(refresh_data)
 
         return self.mapper.to_token_pair(
             access_token,
             refresh_token
         )
 
-    def refresh_access_token(
+    async def refresh_access_token(
         self,
         refresh_token: str
     ) -> Optional[TokenPairDTO]:
-        """Обновление токенов"""
+        """
+        Обновление токенов
 
-        valid_token = self.token_repo.get_valid_token(refresh_token)
+        Владелец берётся из подписанного claim sub, поэтому новый
+        refresh токен подписывается до обращения к БД; отзыв старого
+        токена, чтение claims пользователя и сохранение нового —
+        одна транзакция (UPDATE ... RETURNING + INSERT + COMMIT).
+        """
+        payload = self.jwt_service.decode_token(refresh_token)
+        if not payload or payload.get("type") != "refresh":
+            return None
 
-        if not valid_token:
+        try:
+            user_id = UUID(payload["sub"])
+        except (KeyError, TypeError, ValueError):
             return None
 
-        user = self.user_repo.get_user_by_id(valid_token.user_id)
+        new_refresh_token, refresh_data = self._new_refresh_token(user_id)
+        user = await self.token_repo.rotate_refresh_token(
+            refresh_token,
+            refresh_data
+        )
 
-        if not user:
+        if user is None:
             return None
 
-        self.token_repo.revoke_token(refresh_token)
-        return self.create_tokens(user)
+        access_token = self._access_token(
+            user.id,
+            user.user_name,
+            user.role_name,
+            user.email,
+            user.token_version
+        )
+        return self.mapper.to_token_pair(
+            access_token,
+            new_refresh_token
+        )
+
+    async def revoke_all_sessions(self, user_id: UUID) -> None:
+        """
+        Выход со всех устройств
+
+        Отзывает refresh токены и увеличивает версию токенов одной
+        транзакцией: выданные ранее access токены перестают проходить
+        ValidateToken.
+
+        Кэш версий сбрасывается только в этом процессе; другие воркеры
+        и реплики увидят новую версию не позже чем через
+        TOKEN_VERSION_CACHE_TTL_SECONDS.
+        """
+        await self.token_repo.revoke_all_sessions(user_id)
+
+        if self.token_versions is not None:
+            self.token_versions.invalidate(user_id)
+
+    async def logout_all(self, refresh_token: str) -> None:
+        """Выход со всех устройств по действующему refresh токену"""
+        valid_token = await self.token_repo.get_valid_token(refresh_token)
+
+        if not valid_token:
+            raise InvalidTokenException()
+
+        await self.revoke_all_sessions(valid_token.user_id)
@@ -0,0 +1,169 @@
+"""
+Проверка доступности user_name/email для форм регистрации
+
+Занятые значения хранятся в фильтре Блума процесса так же, как
+в БД: user_name — с учётом регистра, email — в нижнем регистре.
+Промах по фильтру — "точно свободно" без запроса к БД; попадание
+проверяется поиском по уникальному индексу.
+
+Фильтр строится при старте и периодически перестраивается,
+регистрации в этом процессе добавляются сразу. Регистрации в других
+воркерах попадут в фильтр при следующей перестройке: ответ носит
+справочный характер, уникальность при регистрации обеспечивают
+индексы БД.
+"""
+
+import asyncio
+from typing import Any, Optional
+
+from sqlalchemy import select
+
+from backend.service_user.src.core.bloom_filter import BloomFilter
+from backend.service_user.src.models.user import User
+from backend.service_user.src.repositories import AsyncSQLUserRepository
+from backend.shared.logging.logger import get_logger
+
+
+logger = get_logger(__name__).bind(
+    layer="service",
+    service="user"
+)
+
+
+class AvailabilityService:
+    """Доступность user_name/email: фильтр Блума + поиск по индексу"""
+
+    def __init__(
+        self,
+        async_session_manager: Any,
+        capacity: int = 1_000_000,
+        error_rate: float = 0.01,
+        load_batch_size: int = 10_000
+    ):
+        """
+        Args:
+            async_session_manager: Менеджер асинхронных сессий
+            capacity: Ожидаемое число занятых значений (user_name + email)
+            error_rate: Допустимая доля ложных срабатываний фильтра
+            load_batch_size: Строк users на одну выборку при построении
+        """
+        self.async_session_manager = async_session_manager
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.load_batch_size = load_batch_size
+
+        self.bloom = BloomFilter(capacity, error_rate)
+        # Пока фильтр не построен, каждая проверка идёт в БД
+        self.ready = False
+        self._building: Optional[BloomFilter] = None
+
+        self.probes = 0
+        self.definitely_free = 0
+        self.db_lookups = 0
+        self.false_positives = 0
+        self.rebuilds = 0
+
+    @staticmethod
+    def _normalize(field: str, value: str) -> str:
+        """Значение в том виде, в каком оно хранится в users"""
+        value = value.strip()
+        # Схемы регистрации обрезают пробелы у обоих полей; email
+        # хранится в нижнем регистре (EmailValidatedModel),
+        # user_name — с учётом регистра
+        return value.lower() if field == "email" else value
+
+    @classmethod
+    def _key(cls, field: str, value: str) -> str:
+        return f"{field}:{cls._normalize(field, value)}"
+
+    def add(self, user_name: str, email: str) -> None:
+        """Учесть зарегистрированного пользователя"""
+        for bloom in (self.bloom, self._building):
+            if bloom is not None:
+                bloom.add(self._key("user_name", user_name))
+                bloom.add(self._key("email", email))
+
+    async def load(self) -> int:
+        """Построить фильтр по таблице users; возвращает число строк"""
+        self._building = BloomFilter(self.capacity, self.error_rate)
+        rows = 0
+        try:
+            async with self.async_session_manager.get_db_context(
+                auto_commit=False
+            ) as session:
+                result = await session.stream(
+                    select(User.user_name, User.email).execution_options(
+                        yield_per=self.load_batch_size)
+                )
+                async for user_name, email in result:
+                    self._building.add(self._key("user_name", user_name))
+                    self._building.add(self._key("email", email))
+                    rows += 1
+
+            self.bloom = self._building
+        finally:
+            self._building = None
+
+        self.ready = True
+        self.rebuilds += 1
+        if rows * 2 > self.capacity:
+            logger.warning(
+                "Availability filter over capacity",
+                values=rows * 2,
+                capacity=self.capacity
+            )
+        return rows
+
+    async def run(self, interval_seconds: float = 600) -> None:
+        """Построение и периодическая перестройка (задача lifespan)"""
+        while True:
+            try:
+                await self.load()
+            except Exception as e:
+                logger.error("Availability filter load failed", error=str(e))
+            await asyncio.sleep(interval_seconds)
+
+    async def check(
+        self,
+        user_name: Optional[str] = None,
+        email: Optional[str] = None
+    ) -> dict[str, bool]:
+        """Доступность переданных значений: {поле: свободно ли}"""
+        result = {}
+        for field, value in (("user_name", user_name), ("email", email)):
+            if value is not None:
+                result[field] = not await self._is_taken(field, value)
+        return result
+
+    async def _is_taken(self, field: str, value: str) -> bool:
+        self.probes += 1
+        if self.ready and self._key(field, value) not in self.bloom:
+            self.definitely_free += 1
+            return False
+
+        self.db_lookups += 1
+        value = self._normalize(field, value)
+        async with self.async_session_manager.get_db_context(
+            auto_commit=False
+        ) as session:
+            repo = AsyncSQLUserRepository(session)
+            if field == "user_name":
+                user = await repo.get_user_by_user_name(value)
+            else:
+                user = await repo.get_user_by_email(value)
+
+        if user is None and self.ready:
+            self.false_positives += 1
+        return user is not None
+
+    def stats(self) -> dict:
+        """Метрики для /metrics"""
+        return {
+            "ready": self.ready,
+            "probes": self.probes,
+            "definitely_free": self.definitely_free,
+            "db_lookups": self.db_lookups,
+            "false_positives": self.false_positives,
+            "rebuilds": self.rebuilds,
+            "bloom": self.bloom.stats()
+        }
@@ -0,0 +1,127 @@
+"""
+Фоновый пересчёт хешей паролей с устаревшими параметрами Argon2
+
+После успешного входа пароль известен в открытом виде, и хеш
+можно пересчитать с текущими параметрами без сброса паролей.
+Пересчёт и запись идут фоновой задачей со своей сессией БД и
+не увеличивают время ответа /login.
+"""
+
+import asyncio
+from typing import Any, Optional
+from uuid import UUID
+
+from backend.service_user.src.exception import TooManyRequestsException
+from backend.service_user.src.protocols import PasswordHasherProtocol
+from backend.service_user.src.repositories import AsyncSQLUserRepository
+from backend.shared.logging.logger import get_logger
+
+
+logger = get_logger(__name__).bind(
+    layer="service",
+    service="user"
+)
+
+
+class PasswordRehashService:
+    """Планировщик пересчёта хешей после входа"""
+
+    def __init__(
+        self,
+        password_hasher: PasswordHasherProtocol,
+        async_session_manager: Any
+    ):
+        """
+        Args:
+            password_hasher: Хешер с текущими параметрами Argon2
+            async_session_manager: Менеджер асинхронных сессий
+        """
+        self.password_hasher = password_hasher
+        self.async_session_manager = async_session_manager
+
+        # Ссылки на задачи, чтобы их не собрал GC
+        self._tasks: set[asyncio.Task] = set()
+        # Пользователи, для которых пересчёт уже идёт
+        self._in_progress: set[UUID] = set()
+
+        self.scheduled = 0
+        self.upgraded = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def schedule(
+        self,
+        user_id: UUID,
+        password: str,
+        old_hash: str
+    ) -> Optional[asyncio.Task]:
+        """
+        Запланировать пересчёт хеша, если он устарел
+
+        Returns:
+            Фоновая задача или None, если пересчёт не нужен
+        """
+        if user_id in self._in_progress:
+            return None
+        if not self.password_hasher.needs_update(old_hash):
+            return None
+
+        self.scheduled += 1
+        self._in_progress.add(user_id)
+        task = asyncio.create_task(
+            self._rehash(user_id, password, old_hash))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _rehash(
+        self,
+        user_id: UUID,
+        password: str,
+        old_hash: str
+    ) -> None:
+        """Пересчёт хеша и условная запись"""
+        try:
+            new_hash = await self.password_hasher.hash_password(password)
+
+            async with self.async_session_manager.get_db_context(
+                auto_commit=False
+            ) as session:
+                updated = await AsyncSQLUserRepository(
+                    session).update_password_hash(user_id, old_hash, new_hash)
+        except TooManyRequestsException:
+            # Пул занят входами; пересчитаем при следующем входе
+            self.skipped += 1
+            return
+        except Exception as e:
+            self.failed += 1
+            logger.error(
+                "Password rehash failed",
+                user_id=str(user_id),
+                error=str(e)
+            )
+            return
+        finally:
+            self._in_progress.discard(user_id)
+
+        if updated:
+            self.upgraded += 1
+            logger.info("Password hash upgraded", user_id=str(user_id))
+        else:
+            # Пароль сменили, пока считался новый хеш
+            self.skipped += 1
+
+    async def drain(self) -> None:
+        """Дождаться запущенных пересчётов (при остановке сервиса)"""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stats(self) -> dict:
+        """Метрики для /metrics"""
+        return {
+            "scheduled": self.scheduled,
+            "upgraded": self.upgraded,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "in_progress": len(self._in_progress)
+        }
@@ -5,22 +5,19 @@ from backend.service_user.src.schemas.register import (
     UserCreate,
     UserResponseDTO
 )
-from backend.service_user.src.core.service_password import PasswordService
 from backend.service_user.src.models.user import User
 
 
 class UserRegistrationMapper:
     """Маппер для конвертации схем"""
 
-    def __init__(self, password_service: PasswordService):
-        self.password_service = password_service
-
-    def api_to_dto(self, user_create: UserCreate) -> UserRegistrationDTO:
+    @staticmethod
+    def api_to_dto(
+        user_create: UserCreate,
+        hashed_password: str
+    ) -> UserRegistrationDTO:
         """Конвертация API схемы во внутренний DTO"""
 
-        hashed_password = self.password_service.hash_password(
-            user_create.password)
-
         return UserRegistrationDTO(
             user_name=user_create.user_name,
             email=user_create.email,
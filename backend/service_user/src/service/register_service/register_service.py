@@ -1,18 +1,23 @@
 """ Сервис регистрации пользователя """
 
 
-from backend.service_user.src.protocols.user_repository import (
-    UserRepositoryProtocol)
+from typing import Optional
+
+from backend.service_user.src.exception import ConflictException
+from backend.service_user.src.protocols import (
+    PasswordHasherProtocol,
+    UserRepositoryProtocol
+)
 from backend.service_user.src.schemas import (
     UserCreate,
     UserResponseDTO
 )
 from backend.service_user.src.service.register_service.mappers import (
     UserRegistrationMapper)
-from backend.service_user.src.core import (
-    UserUniquenessValidator,
-    PasswordService
-)
+from backend.service_user.src.core import UserUniquenessValidator
+from backend.service_user.src.service.availability_service import (
+    AvailabilityService)
+from backend.shared.cache import LRUTTLCache
 
 
 class RegisterService:
@@ -21,34 +26,79 @@ class RegisterService:
     def __init__(
         self,
         user_repo: UserRepositoryProtocol,
-        password_service: PasswordService
+        password_hasher: PasswordHasherProtocol,
+        taken_cache: Optional[LRUTTLCache] = None,
+        availability: Optional[AvailabilityService] = None
     ):
+        """
+        Args:
+            user_repo: Репозиторий пользователей
+            password_hasher: Хеширование паролей
+            taken_cache: Кэш занятых user_name/email процесса; попадание
+                отклоняет регистрацию без вычисления Argon2
+            availability: Фильтр занятых значений для проверки
+                доступности; пополняется при регистрации
+        """
         self.user_repo = user_repo
-        self.password_service = password_service
+        self.password_hasher = password_hasher
+        self.taken_cache = taken_cache
+        self.availability = availability
 
         # Компоненты сервиса
         self.validator = UserUniquenessValidator(user_repo)
-        self.mapper = UserRegistrationMapper(password_service)
+        self.mapper = UserRegistrationMapper()
 
-    def register_user(self, user_data: UserCreate) -> UserResponseDTO:
+    async def register_user(self, user_data: UserCreate) -> UserResponseDTO:
         """
         Регистрация пользователя
         Returns:
             UserResponseDTO: Данные созданного пользователя
         """
 
-        # 1. Валидация
-        self.validator.validate(
-            user_data.user_name,
-            user_data.email
-        )
+        # 1. Заведомо занятые значения — без Argon2 и без запросов
+        self._check_taken_cache(user_data.user_name, user_data.email)
 
-        # 2. Маппинг (хеширование пароля)
-        user_dto = self.mapper.api_to_dto(user_data)
+        # 2. Хеширование пароля вне event loop и маппинг
+        hashed_password = await self.password_hasher.hash_password(
+            user_data.password)
+        user_dto = self.mapper.api_to_dto(user_data, hashed_password)
 
-        # 3. Создание
-        user = self.user_repo.create_user_with_default_role(
+        # 3. Создание; уникальность проверяют индексы (ON CONFLICT)
+        user = await self.user_repo.create_user_if_absent(
             user_dto.to_repository_dict())
 
+        if user is None:
+            await self._raise_conflict(user_data.user_name, user_data.email)
+
+        self._remember_taken("user_name", user.user_name)
+        self._remember_taken("email", user.email)
+        if self.availability is not None:
+            self.availability.add(user.user_name, user.email)
+
         # 4. Возврат DTO
         return self.mapper.model_to_response_dto(user)
+
+    def _check_taken_cache(self, user_name: str, email: str) -> None:
+        if self.taken_cache is None:
+            return
+        for field, value in (("user_name", user_name), ("email", email)):
+            if self.taken_cache.get((field, value)):
+                raise self.validator.conflict(field, value)
+
+    def _remember_taken(self, field: str, value: str) -> None:
+        if self.taken_cache is not None:
+            self.taken_cache.set((field, value), True)
+
+    async def _raise_conflict(self, user_name: str, email: str) -> None:
+        """Определить занятое поле (только при конфликте вставки)"""
+        try:
+            await self.validator.validate(user_name, email)
+        except ConflictException as e:
+            self._remember_taken(e.details["field"], e.details["value"])
+            raise
+
+        # Конфликтующая запись исчезла между INSERT и проверкой
+        raise ConflictException(
+            message="Пользователь с таким именем или email уже существует",
+            details={"user_name": user_name, "email": email}
+        )
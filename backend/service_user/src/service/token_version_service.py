@@ -0,0 +1,108 @@
+"""
+Версии токенов пользователей для глобального отзыва сессий
+
+Access токен несёт claim ver — версию на момент выдачи.
+Выход со всех устройств увеличивает User.token_version, и все
+ранее выданные токены перестают проходить ValidateToken.
+
+Версии кэшируются в памяти с коротким TTL, поэтому проверка
+обычно обходится без запроса к БД. Отзыв инвалидирует запись
+сразу; в других процессах устаревшая версия живёт не дольше TTL.
+"""
+
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+from backend.service_user.src.repositories import (
+    AsyncSQLUserRepository,
+    SQLUserRepository
+)
+from backend.shared.cache import LRUTTLCache
+
+
+class TokenVersionService:
+    """Проверка claim ver по текущей версии пользователя"""
+
+    def __init__(
+        self,
+        cache: LRUTTLCache,
+        async_session_manager: Any,
+        session_manager_factory: Callable[[], Any]
+    ):
+        """
+        Args:
+            cache: Кэш версий (ключ — строковый user_id)
+            async_session_manager: Менеджер асинхронных сессий
+            session_manager_factory: Фабрика синхронного менеджера
+                сессий (для gRPC сервера на потоках)
+        """
+        self.cache = cache
+        self.async_session_manager = async_session_manager
+        self.session_manager_factory = session_manager_factory
+
+    @staticmethod
+    def claim_version(payload: dict) -> int:
+        """Версия из токена; токены без ver считаются версией 0"""
+        return int(payload.get("ver", 0))
+
+    async def current(self, user_id: str) -> Optional[int]:
+        """Текущая версия пользователя (None — пользователь не найден)"""
+        cached = self.cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        uid = self._parse_user_id(user_id)
+        if uid is None:
+            return None
+
+        async with self.async_session_manager.get_db_context(
+            auto_commit=False
+        ) as session:
+            version = await AsyncSQLUserRepository(
+                session).get_token_version(uid)
+
+        return self._remember(user_id, version)
+
+    def current_sync(self, user_id: str) -> Optional[int]:
+        """Синхронный вариант current для gRPC сервера на потоках"""
+        cached = self.cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        uid = self._parse_user_id(user_id)
+        if uid is None:
+            return None
+
+        session_manager = self.session_manager_factory()
+        with session_manager.SessionLocal() as session:
+            version = SQLUserRepository(session).get_token_version(uid)
+
+        return self._remember(user_id, version)
+
+    async def is_current(self, payload: dict) -> bool:
+        """Выдан ли токен с актуальной версией"""
+        user_id = payload.get("sub") or ""
+        return self.claim_version(payload) == await self.current(user_id)
+
+    def is_current_sync(self, payload: dict) -> bool:
+        """Синхронный вариант is_current"""
+        user_id = payload.get("sub") or ""
+        return self.claim_version(payload) == self.current_sync(user_id)
+
+    def invalidate(self, user_id: str | UUID) -> None:
+        """Сбросить закэшированную версию после её изменения"""
+        self.cache.invalidate(str(user_id))
+
+    def _remember(self, user_id: str, version: Optional[int]) -> Optional[int]:
+        """Кэширует найденную версию"""
+        if version is not None:
+            self.cache.set(user_id, version)
+        return version
+
+    @staticmethod
+    def _parse_user_id(user_id: str) -> Optional[UUID]:
+        """UUID из claim sub или None"""
+        try:
+            return UUID(user_id)
+        except ValueError:
+            return None
@@ -0,0 +1,6 @@
+from .lru_ttl_cache import LRUTTLCache, ThreadSafeLRUTTLCache
+
+__all__ = [
+    'LRUTTLCache',
+    'ThreadSafeLRUTTLCache',
+]
@@ -0,0 +1,156 @@
+"""
+In-process LRU+TTL кэш для сериализованных ответов
+
+Хранит готовые значения (например, байты JSON), чтобы горячие записи
+отдавались без обращения к БД и без повторной сериализации.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+class LRUTTLCache:
+    """
+    Ограниченный по размеру кэш с вытеснением LRU и временем жизни записей
+
+    Не потокобезопасен: рассчитан на один event loop, операции
+    не содержат await и выполняются атомарно относительно корутин.
+    Для доступа из нескольких потоков — ThreadSafeLRUTTLCache.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            max_size: Максимальное число записей
+            ttl_seconds: Время жизни записи в секундах
+            clock: Источник монотонного времени (подменяется в тестах)
+        """
+        if max_size <= 0:
+            raise ValueError("max_size должен быть положительным")
+
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+        # Счётчики
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """ Получить значение; просроченная запись считается промахом """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._data[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl_seconds: float | None = None
+    ) -> None:
+        """
+        Положить значение, вытесняя самые давние записи
+
+        Args:
+            key: Ключ записи
+            value: Значение
+            ttl_seconds: Время жизни этой записи; по умолчанию общий TTL
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._data[key] = (self._clock() + ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """ Удалить запись; True если она была в кэше """
+        if self._data.pop(key, None) is None:
+            return False
+        self.invalidations += 1
+        return True
+
+    def clear(self) -> None:
+        """ Очистить кэш (счётчики сохраняются) """
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        """ Счётчики кэша для метрик """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+
+class ThreadSafeLRUTTLCache(LRUTTLCache):
+    """
+    LRUTTLCache под блокировкой
+
+    Для кэша, общего для event loop и потоков (например, gRPC
+    сервера на пуле потоков): get с удалением просроченной записи
+    и set с вытеснением меняют OrderedDict в несколько шагов.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            return super().get(key)
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl_seconds: float | None = None
+    ) -> None:
+        with self._lock:
+            super().set(key, value, ttl_seconds)
+
+    def invalidate(self, key: Hashable) -> bool:
+        with self._lock:
+            return super().invalidate(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            super().clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return super().stats()
@@ -1,10 +1,14 @@
 from .connection_manager import ConnectionManager
 from .session_manager import SessionManager
+from .async_connection_manager import AsyncConnectionManager
+from .async_session_manager import AsyncSessionManager
 from .config import DataBaseConfig
 
 __all__ = [
     'ConnectionManager',
     'SessionManager',
+    'AsyncConnectionManager',
+    'AsyncSessionManager',
     'DataBaseConfig',
     'get_connection_manager',  # функция-хелпер
     'get_session_manager',     # функция-хелпер
@@ -0,0 +1,81 @@
+"""
+Асинхронный менеджер соединений с базой данных
+Отвечает только за создание и управление AsyncEngine
+"""
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+
+class AsyncConnectionManager:
+    """
+    Управляет асинхронными соединениями с БД
+    SRP: только соединения, не управляет сессиями
+
+    Используется HTTP-слоем: запросы к БД не блокируют event loop.
+    Синхронный ConnectionManager остаётся для Alembic и тестов.
+    """
+
+    def __init__(self, database_config):
+        """
+        Инициализация менеджера соединений
+
+        Args:
+            database_config: Конфигурация БД
+        """
+        self.config = database_config
+        self._engine = self._create_engine()
+
+    def _create_engine(self) -> AsyncEngine:
+        """
+        Создает AsyncEngine с настройками под окружение
+
+        Returns:
+            SQLAlchemy AsyncEngine
+        """
+        if self.config.TESTING:
+            return create_async_engine(
+                self.config.get_async_database_url(),
+                poolclass=StaticPool,
+                echo=False
+            )
+
+        return create_async_engine(
+            self.config.get_async_database_url(),
+            echo=False,
+            pool_pre_ping=True,
+            pool_size=self.config.POOL_SIZE,
+            max_overflow=self.config.MAX_OVERFLOW
+        )
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """
+        Получить AsyncEngine
+
+        Returns:
+            SQLAlchemy AsyncEngine
+        """
+        return self._engine
+
+    async def test_connection(self) -> bool:
+        """
+        Проверка подключения к БД
+
+        Returns:
+            True если подключение успешно, иначе False
+        """
+        try:
+            async with self._engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            return True
+        except Exception:
+            return False
+
+    async def close(self) -> None:
+        """
+        Закрыть AsyncEngine (для graceful shutdown)
+        """
+        if self._engine:
+            await self._engine.dispose()
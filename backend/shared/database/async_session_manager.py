@@ -0,0 +1,87 @@
+"""
+Асинхронный менеджер сессий — провайдер AsyncSession
+НЕ управляет схемой данных (это делают миграции)
+"""
+
+from typing import AsyncGenerator
+from contextlib import asynccontextmanager
+
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker
+)
+
+
+class AsyncSessionManager:
+    """
+    Управляет асинхронными сессиями БД
+    SRP: только сессии, не управляет соединениями
+    DIP: зависит от абстракции AsyncEngine, не от конкретной реализации
+    """
+
+    def __init__(self, engine: AsyncEngine):
+        """
+        Инициализация менеджера сессий
+
+        Args:
+            engine: SQLAlchemy AsyncEngine
+                    (получается из AsyncConnectionManager)
+        """
+        self._engine = engine
+        # expire_on_commit=False: после commit атрибуты не сбрасываются,
+        # иначе обращение к ним вызовет неявный (запрещённый) lazy-load
+        self._SessionLocal = async_sessionmaker(
+            bind=engine,
+            autoflush=False,
+            expire_on_commit=False
+        )
+
+    @property
+    def SessionLocal(self) -> async_sessionmaker:
+        """
+        Получить factory для создания сессий
+
+        Returns:
+            SQLAlchemy async_sessionmaker
+        """
+        return self._SessionLocal
+
+    async def get_db(self) -> AsyncGenerator[AsyncSession, None]:
+        """
+        FastAPI dependency — асинхронная сессия с авто-закрытием
+
+        Yields:
+            SQLAlchemy AsyncSession
+        """
+        async with self._SessionLocal() as db:
+            yield db
+
+    @asynccontextmanager
+    async def get_db_context(
+        self,
+        auto_commit: bool = True
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Асинхронный контекстный менеджер для работы с сессией
+
+        Args:
+            auto_commit: True — коммит при успехе, rollback при ошибке
+                        False — явный контроль коммита
+
+        Yields:
+            SQLAlchemy AsyncSession
+
+        Example:
+            async with session_manager.get_db_context() as db:
+                result = await db.execute(select(User))
+                # auto_commit=True — коммит при выходе из контекста
+        """
+        async with self._SessionLocal() as db:
+            try:
+                yield db
+                if auto_commit:
+                    await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
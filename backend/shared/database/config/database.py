@@ -16,6 +16,10 @@ class DataBaseConfig(DBBaseConfig):
     POSTGRES_DB: str = Field(description="Название БД")
     POSTGRES_PASSWORD: str = Field(description="Пароль БД")
     DB_DRIVER: str = Field(description="Драйвер БД")
+    ASYNC_DB_DRIVER: str = Field(
+        default="postgresql+asyncpg",
+        description="Асинхронный драйвер БД"
+    )
     # ОКРУЖЕНИЕ И РЕЖИМ ОТЛАДКИ
     TESTING: bool = Field(description="Тестирование")
     DEBUG: bool = Field(description="Режим отладки")
@@ -35,3 +39,17 @@ class DataBaseConfig(DBBaseConfig):
             f"{self.DB_DRIVER}://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@"
             f"{self.DB_HOST}:{self.DB_PORT}/{self.POSTGRES_DB}"
         )
+
+    def get_async_database_url(self) -> str:
+        """
+        Получить URL базы данных для асинхронного драйвера
+        """
+
+        if self.TESTING:
+            return "sqlite+aiosqlite:///:memory:"
+
+        return (
+            f"{self.ASYNC_DB_DRIVER}://{self.POSTGRES_USER}:"
+            f"{self.POSTGRES_PASSWORD}@"
+            f"{self.DB_HOST}:{self.DB_PORT}/{self.POSTGRES_DB}"
+        )
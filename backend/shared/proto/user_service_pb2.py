@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from google.rpc import status_pb2 as google_dot_rpc_dot_status__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\'backend/shared/proto/user_service.proto\x12\x04user\x1a\x17google/rpc/status.proto\"%\n\x14ValidateTokenRequest\x12\r\n\x05token\x18\x01 \x01(\t\"i\n\x15ValidateTokenResponse\x12\r\n\x05valid\x18\x01 \x01(\x08\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12!\n\x05\x65rror\x18\x04 \x01(\x0b\x32\x12.google.rpc.Status\"%\n\x12GetUserByIdRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"f\n\x13GetUserByIdResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x11\n\tuser_name\x18\x03 \x01(\t\x12\x11\n\tis_active\x18\x04 \x01(\x08\x12\x0e\n\x06\x65xists\x18\x05 \x01(\x08\x32\x9b\x01\n\x0bUserService\x12H\n\rValidateToken\x12\x1a.user.ValidateTokenRequest\x1a\x1b.user.ValidateTokenResponse\x12\x42\n\x0bGetUserById\x12\x18.user.GetUserByIdRequest\x1a\x19.user.GetUserByIdResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\'backend/shared/proto/user_service.proto\x12\x04user\x1a\x17google/rpc/status.proto\"%\n\x14ValidateTokenRequest\x12\r\n\x05token\x18\x01 \x01(\t\"i\n\x15ValidateTokenResponse\x12\r\n\x05valid\x18\x01 \x01(\x08\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\x12!\n\x05\x65rror\x18\x04 \x01(\x0b\x32\x12.google.rpc.Status\"%\n\x12GetUserByIdRequest\x12\x0f\n\x07user_id\x18\x01 \x01(\t\"}\n\x13GetUserByIdResponse\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x11\n\tuser_name\x18\x03 \x01(\t\x12\x11\n\tis_active\x18\x04 \x01(\x08\x12\x0e\n\x06\x65xists\x18\x05 \x01(\x08\x12\x15\n\rtoken_version\x18\x06 \x01(\x03\"(\n\x14GetUsersByIdsRequest\x12\x10\n\x08user_ids\x18\x01 \x03(\t\"A\n\x15GetUsersByIdsResponse\x12(\n\x05users\x18\x01 \x03(\x0b\x32\x19.user.GetUserByIdResponse\">\n\x15ValidateTokensRequest\x12\x16\n\x0e\x63orrelation_id\x18\x01 \x01(\x04\x12\r\n\x05token\x18\x02 \x01(\t\"]\n\x16ValidateTokensResponse\x12\x16\n\x0e\x63orrelation_id\x18\x01 \x01(\x04\x12+\n\x06result\x18\x02 \x01(\x0b\x32\x1b.user.ValidateTokenResponse2\xb6\x02\n\x0bUserService\x12H\n\rValidateToken\x12\x1a.user.ValidateTokenRequest\x1a\x1b.user.ValidateTokenResponse\x12\x42\n\x0bGetUserById\x12\x18.user.GetUserByIdRequest\x1a\x19.user.GetUserByIdResponse\x12H\n\rGetUsersByIds\x12\x1a.user.GetUsersByIdsRequest\x1a\x1b.user.GetUsersByIdsResponse\x12O\n\x0eValidateTokens\x12\x1b.user.ValidateTokensRequest\x1a\x1c.user.ValidateTokensResponse(\x01\x30\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -39,7 +39,15 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_GETUSERBYIDREQUEST']._serialized_start=220
   _globals['_GETUSERBYIDREQUEST']._serialized_end=257
   _globals['_GETUSERBYIDRESPONSE']._serialized_start=259
-  _globals['_GETUSERBYIDRESPONSE']._serialized_end=361
-  _globals['_USERSERVICE']._serialized_start=364
-  _globals['_USERSERVICE']._serialized_end=519
+  _globals['_GETUSERBYIDRESPONSE']._serialized_end=384
+  _globals['_GETUSERSBYIDSREQUEST']._serialized_start=386
+  _globals['_GETUSERSBYIDSREQUEST']._serialized_end=426
+  _globals['_GETUSERSBYIDSRESPONSE']._serialized_start=428
+  _globals['_GETUSERSBYIDSRESPONSE']._serialized_end=493
+  _globals['_VALIDATETOKENSREQUEST']._serialized_start=495
+  _globals['_VALIDATETOKENSREQUEST']._serialized_end=557
+  _globals['_VALIDATETOKENSRESPONSE']._serialized_start=559
+  _globals['_VALIDATETOKENSRESPONSE']._serialized_end=652
+  _globals['_USERSERVICE']._serialized_start=655
+  _globals['_USERSERVICE']._serialized_end=965
 # @@protoc_insertion_point(module_scope)
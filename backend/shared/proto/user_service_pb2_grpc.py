@@ -44,6 +44,16 @@ class UserServiceStub(object):
                 request_serializer=backend_dot_shared_dot_proto_dot_user__service__pb2.GetUserByIdRequest.SerializeToString,
                 response_deserializer=backend_dot_shared_dot_proto_dot_user__service__pb2.GetUserByIdResponse.FromString,
                 _registered_method=True)
+        self.GetUsersByIds = channel.unary_unary(
+                '/user.UserService/GetUsersByIds',
+                request_serializer=backend_dot_shared_dot_proto_dot_user__service__pb2.GetUsersByIdsRequest.SerializeToString,
+                response_deserializer=backend_dot_shared_dot_proto_dot_user__service__pb2.GetUsersByIdsResponse.FromString,
+                _registered_method=True)
+        self.ValidateTokens = channel.stream_stream(
+                '/user.UserService/ValidateTokens',
+                request_serializer=backend_dot_shared_dot_proto_dot_user__service__pb2.ValidateTokensRequest.SerializeToString,
+                response_deserializer=backend_dot_shared_dot_proto_dot_user__service__pb2.ValidateTokensResponse.FromString,
+                _registered_method=True)
 
 
 class UserServiceServicer(object):
@@ -61,6 +71,19 @@ class UserServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetUsersByIds(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ValidateTokens(self, request_iterator, context):
+        """Долгоживущий поток валидации: ответы сопоставляются по correlation_id
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_UserServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -74,6 +97,16 @@ def add_UserServiceServicer_to_server(servicer, server):
                     request_deserializer=backend_dot_shared_dot_proto_dot_user__service__pb2.GetUserByIdRequest.FromString,
                     response_serializer=backend_dot_shared_dot_proto_dot_user__service__pb2.GetUserByIdResponse.SerializeToString,
             ),
+            'GetUsersByIds': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetUsersByIds,
+                    request_deserializer=backend_dot_shared_dot_proto_dot_user__service__pb2.GetUsersByIdsRequest.FromString,
+                    response_serializer=backend_dot_shared_dot_proto_dot_user__service__pb2.GetUsersByIdsResponse.SerializeToString,
+            ),
+            'ValidateTokens': grpc.stream_stream_rpc_method_handler(
+                    servicer.ValidateTokens,
+                    request_deserializer=backend_dot_shared_dot_proto_dot_user__service__pb2.ValidateTokensRequest.FromString,
+                    response_serializer=backend_dot_shared_dot_proto_dot_user__service__pb2.ValidateTokensResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'user.UserService', rpc_method_handlers)
@@ -138,3 +171,57 @@ class UserService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetUsersByIds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/user.UserService/GetUsersByIds',
+            backend_dot_shared_dot_proto_dot_user__service__pb2.GetUsersByIdsRequest.SerializeToString,
+            backend_dot_shared_dot_proto_dot_user__service__pb2.GetUsersByIdsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ValidateTokens(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/user.UserService/ValidateTokens',
+            backend_dot_shared_dot_proto_dot_user__service__pb2.ValidateTokensRequest.SerializeToString,
+            backend_dot_shared_dot_proto_dot_user__service__pb2.ValidateTokensResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
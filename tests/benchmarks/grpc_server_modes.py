@@ -0,0 +1,151 @@
+"""
+Бенчмарк gRPC сервера User Service: пул потоков против grpc.aio
+
+Поднимает оба варианта сервера на свободных портах и нагружает
+ValidateToken настоящими access-токенами. --io-ms имитирует
+ожидание ввода-вывода в обработчике (например, запрос к БД): в режиме
+thread оно занимает поток пула, в режиме aio — только корутину.
+
+Запуск:
+    python -m tests.benchmarks.grpc_server_modes --requests 20000 \\
+        --concurrency 200 --io-ms 2
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+from concurrent import futures
+
+import grpc
+
+from backend.service_user.src.infrastructure.container import container
+from backend.service_user.src.infrastructure.grpc.aio_server import (
+    AioGrpcServer,
+    AsyncUserServiceServicer
+)
+from backend.service_user.src.infrastructure.grpc.server import (
+    UserServiceServicer)
+from backend.shared.proto import user_service_pb2, user_service_pb2_grpc
+from tests.benchmarks.stats import LatencyStats, print_summary
+
+
+def thread_servicer(io_seconds: float) -> UserServiceServicer:
+    class Servicer(UserServiceServicer):
+        def ValidateToken(self, request, context):
+            if io_seconds:
+                time.sleep(io_seconds)
+            return super().ValidateToken(request, context)
+    return Servicer()
+
+
+def aio_servicer(io_seconds: float) -> AsyncUserServiceServicer:
+    class Servicer(AsyncUserServiceServicer):
+        async def ValidateToken(self, request, context):
+            if io_seconds:
+                await asyncio.sleep(io_seconds)
+            return await super().ValidateToken(request, context)
+    return Servicer()
+
+
+def start_thread_server(args: argparse.Namespace) -> tuple:
+    """Прежний режим: grpc.server на ThreadPoolExecutor"""
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=args.workers))
+    user_service_pb2_grpc.add_UserServiceServicer_to_server(
+        thread_servicer(args.io_ms / 1000), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    return port, lambda: server.stop(0)
+
+
+def start_aio_server(args: argparse.Namespace) -> tuple:
+    """grpc.aio сервер на собственном event loop в отдельном потоке"""
+    loop = asyncio.new_event_loop()
+    server = AioGrpcServer(
+        port=0,
+        servicer=aio_servicer(args.io_ms / 1000),
+        grace=0
+    )
+    started = threading.Event()
+
+    def run() -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(server.start())
+        started.set()
+        loop.run_forever()
+
+    threading.Thread(target=run, daemon=True).start()
+    started.wait()
+
+    def stop() -> None:
+        asyncio.run_coroutine_threadsafe(server.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
+    return server.bound_port, stop
+
+
+async def load(port: int, token: str, args: argparse.Namespace):
+    """--concurrency клиентов делят --requests вызовов ValidateToken"""
+    stats = LatencyStats()
+    counter = iter(range(args.requests))
+    request = user_service_pb2.ValidateTokenRequest(token=token)
+
+    async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+        stub = user_service_pb2_grpc.UserServiceStub(channel)
+        await stub.ValidateToken(request)
+
+        async def worker() -> None:
+            for _ in counter:
+                started = time.perf_counter()
+                try:
+                    response = await stub.ValidateToken(request)
+                except grpc.aio.AioRpcError:
+                    stats.add_error()
+                    continue
+                if response.valid:
+                    stats.add(time.perf_counter() - started)
+                else:
+                    stats.add_error()
+
+        stats.started_at = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        stats.finish()
+
+    return stats
+
+
+def main() -> None:
+    args = parse_args()
+    user_id = "00000000-0000-0000-0000-000000000001"
+    token = container.jwt_service().create_access_token(
+        {"sub": user_id, "email": "bench@example.com", "ver": 0}
+    )
+    # Версия токенов берётся из кэша: пользователя в БД нет
+    container.token_version_cache().set(user_id, 0, ttl_seconds=3600)
+
+    for title, start in (
+        (f"thread ({args.workers} workers)", start_thread_server),
+        ("aio", start_aio_server),
+    ):
+        port, stop = start(args)
+        try:
+            stats = asyncio.run(load(port, token, args))
+        finally:
+            stop()
+        print_summary(
+            f"{title}, io {args.io_ms} ms, "
+            f"concurrency {args.concurrency}", stats)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--io-ms", type=float, default=2.0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Бенчмарк транспорта gRPC: TCP loopback против unix-сокета
+
+Поднимает grpc.aio сервер User Service, слушающий одновременно
+TCP-порт и unix-сокет, и замеряет ValidateToken через каждый
+транспорт: последовательно (чистая задержка) и с --concurrency
+конкурентными вызовами.
+
+Запуск:
+    python -m tests.benchmarks.grpc_uds_vs_tcp --requests 10000
+"""
+
+import argparse
+import asyncio
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import grpc
+
+from backend.service_user.src.infrastructure.container import container
+from backend.service_user.src.infrastructure.grpc.aio_server import (
+    AioGrpcServer)
+from backend.shared.proto import user_service_pb2, user_service_pb2_grpc
+from tests.benchmarks.stats import LatencyStats, print_summary
+
+
+def start_server(uds_path: str) -> tuple:
+    """Сервер на собственном event loop в отдельном потоке"""
+    loop = asyncio.new_event_loop()
+    server = AioGrpcServer(port=0, grace=0, uds_path=uds_path)
+    started = threading.Event()
+
+    def run() -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(server.start())
+        started.set()
+        loop.run_forever()
+
+    threading.Thread(target=run, daemon=True).start()
+    started.wait()
+
+    def stop() -> None:
+        asyncio.run_coroutine_threadsafe(server.stop(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
+    return server.bound_port, stop
+
+
+async def load(target: str, token: str, requests: int, concurrency: int):
+    """concurrency клиентов делят requests вызовов ValidateToken"""
+    stats = LatencyStats()
+    counter = iter(range(requests))
+    request = user_service_pb2.ValidateTokenRequest(token=token)
+
+    async with grpc.aio.insecure_channel(target) as channel:
+        stub = user_service_pb2_grpc.UserServiceStub(channel)
+        # Прогрев: установка соединения не входит в замер
+        for _ in range(100):
+            await stub.ValidateToken(request)
+
+        async def worker() -> None:
+            for _ in counter:
+                started = time.perf_counter()
+                try:
+                    await stub.ValidateToken(request)
+                except grpc.aio.AioRpcError:
+                    stats.add_error()
+                    continue
+                stats.add(time.perf_counter() - started)
+
+        stats.started_at = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        stats.finish()
+
+    return stats
+
+
+def main() -> None:
+    args = parse_args()
+    user_id = "00000000-0000-0000-0000-000000000001"
+    token = container.jwt_service().create_access_token(
+        {"sub": user_id, "email": "bench@example.com", "ver": 0}
+    )
+    # Версия токенов берётся из кэша: пользователя в БД нет
+    container.token_version_cache().set(user_id, 0, ttl_seconds=3600)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        uds_path = str(Path(tmp) / "user_service.sock")
+        port, stop = start_server(uds_path)
+        try:
+            for concurrency in (1, args.concurrency):
+                for title, target in (
+                    ("tcp", f"127.0.0.1:{port}"),
+                    ("uds", f"unix:{uds_path}"),
+                ):
+                    stats = asyncio.run(
+                        load(target, token, args.requests, concurrency))
+                    print_summary(
+                        f"{title}, concurrency {concurrency}", stats)
+        finally:
+            stop()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Нагрузочный бенчмарк: N одновременных пользователей против HTTP API
+
+Проверяет цель из README — 1 000+ одновременных пользователей при
+p95 < 100 ms. Каждый виртуальный пользователь последовательно шлёт
+запросы; все пользователи работают конкурентно в одном event loop.
+
+Запуск (сервисы подняты через docker compose):
+    python -m tests.benchmarks.load_concurrent_users \\
+        --scenario login --url http://127.0.0.1:8000 \\
+        --email user@example.com --password Secret123!
+
+    python -m tests.benchmarks.load_concurrent_users \\
+        --scenario create_recipe --url http://127.0.0.1:8001 \\
+        --token <access_token>
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from tests.benchmarks.stats import LatencyStats, print_summary
+
+
+def build_request(args: argparse.Namespace, user_no: int) -> dict:
+    """Параметры запроса для выбранного сценария"""
+    if args.scenario == "login":
+        return {
+            "method": "POST",
+            "url": "/api/v1/auth/login",
+            "json": {"email": args.email, "password": args.password},
+        }
+    return {
+        "method": "POST",
+        "url": "/api/v1/recipe/recipes/",
+        "headers": {"Authorization": f"Bearer {args.token}"},
+        "json": {
+            "name_recipe": f"Нагрузочный рецепт {user_no}",
+            "description": "Рецепт, созданный нагрузочным тестом",
+            "ingredients": [
+                {"ingredient": "Вода", "quantity": "1", "unit": "л"}
+            ],
+        },
+    }
+
+
+async def virtual_user(
+    client: httpx.AsyncClient,
+    args: argparse.Namespace,
+    user_no: int,
+    stats: LatencyStats
+) -> None:
+    """Один виртуальный пользователь: серия последовательных запросов"""
+    for _ in range(args.requests):
+        started = time.perf_counter()
+        try:
+            response = await client.request(**build_request(args, user_no))
+        except httpx.HTTPError:
+            stats.add_error()
+            continue
+        if response.status_code < 400:
+            stats.add(time.perf_counter() - started)
+        else:
+            stats.add_error()
+
+
+async def run(args: argparse.Namespace) -> LatencyStats:
+    """Запустить всех пользователей конкурентно"""
+    limits = httpx.Limits(
+        max_connections=args.users,
+        max_keepalive_connections=args.users
+    )
+    stats = LatencyStats()
+    async with httpx.AsyncClient(
+        base_url=args.url,
+        limits=limits,
+        timeout=args.timeout
+    ) as client:
+        await asyncio.gather(*(
+            virtual_user(client, args, user_no, stats)
+            for user_no in range(args.users)
+        ))
+    stats.finish()
+    return stats
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--scenario", choices=["login", "create_recipe"], default="login")
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--email", default="user@example.com")
+    parser.add_argument("--password", default="Secret123!")
+    parser.add_argument("--token", default="")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    result = asyncio.run(run(arguments))
+    print_summary(
+        f"{arguments.scenario}: {arguments.users} users × "
+        f"{arguments.requests} requests",
+        result
+    )
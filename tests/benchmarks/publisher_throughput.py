@@ -0,0 +1,134 @@
+"""
+Бенчмарк MessagePublisher: сообщений в секунду на заглушке брокера
+
+Заглушка имитирует сетевую задержку RabbitMQ: каждое объявление
+exchange и каждый publisher confirm стоят --rtt-ms. Сравниваются
+прежняя схема (declare_exchange + publish по одному на канале под
+блокировкой) и буферизованный publisher с пулом каналов.
+
+Запуск:
+    python -m tests.benchmarks.publisher_throughput --messages 20000
+"""
+
+import argparse
+import asyncio
+import time
+
+from backend.service_recipe.src.service import MessagePublisher
+
+
+class StandInExchange:
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+
+    async def publish(self, message, routing_key):
+        # Confirm приходит через RTT; confirms разных сообщений
+        # на канале конвейеризуются
+        await asyncio.sleep(self.rtt)
+
+
+class StandInChannel:
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+
+    async def declare_exchange(self, name, *args, **kwargs):
+        await asyncio.sleep(self.rtt)
+        return StandInExchange(self.rtt)
+
+    async def get_exchange(self, name, ensure=True):
+        return StandInExchange(self.rtt)
+
+
+class StandInConnection:
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+        self.is_closed = False
+
+    async def channel(self, publisher_confirms=True):
+        await asyncio.sleep(self.rtt)
+        return StandInChannel(self.rtt)
+
+    async def close(self):
+        self.is_closed = True
+
+
+def stand_in_connect(rtt: float):
+    async def connect(url, timeout=None):
+        return StandInConnection(rtt)
+    return connect
+
+
+async def legacy_publish_all(args: argparse.Namespace) -> float:
+    """Прежняя схема: один канал, declare на каждое сообщение, по одному"""
+    rtt = args.rtt_ms / 1000
+    channel = await StandInConnection(rtt).channel()
+    lock = asyncio.Lock()
+
+    async def publish_one(n: int) -> None:
+        async with lock:
+            exchange = await channel.declare_exchange("recipe_events")
+            await exchange.publish(None, routing_key="recipe.created")
+
+    started = time.perf_counter()
+    await run_producers(args, publish_one)
+    return time.perf_counter() - started
+
+
+async def buffered_publish_all(args: argparse.Namespace) -> tuple:
+    """Буферизованный publisher с пулом каналов"""
+    publisher = MessagePublisher(
+        "amqp://stand-in",
+        channel_pool_size=args.channels,
+        batch_size=args.batch_size,
+        flush_interval=args.flush_ms / 1000,
+        connect=stand_in_connect(args.rtt_ms / 1000)
+    )
+    await publisher.connect()
+
+    async def publish_one(n: int) -> None:
+        await publisher.publish("recipe.created", {"n": n})
+
+    started = time.perf_counter()
+    await run_producers(args, publish_one)
+    elapsed = time.perf_counter() - started
+    stats = publisher.stats()
+    await publisher.close()
+    return elapsed, stats
+
+
+async def run_producers(args: argparse.Namespace, publish_one) -> None:
+    """--producers конкурентных отправителей делят --messages сообщений"""
+    counter = iter(range(args.messages))
+
+    async def producer() -> None:
+        for n in counter:
+            await publish_one(n)
+
+    await asyncio.gather(*(producer() for _ in range(args.producers)))
+
+
+async def run(args: argparse.Namespace) -> None:
+    legacy = await legacy_publish_all(args)
+    buffered, stats = await buffered_publish_all(args)
+
+    print(f"\n=== {args.messages} messages, rtt {args.rtt_ms} ms, "
+          f"{args.producers} producers ===")
+    print(f"{'legacy':>10}: {args.messages / legacy:>10.0f} msg/s")
+    print(f"{'buffered':>10}: {args.messages / buffered:>10.0f} msg/s")
+    for key, value in stats.items():
+        print(f"{key:>22}: {value}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=5000)
+    parser.add_argument("--producers", type=int, default=100)
+    parser.add_argument("--rtt-ms", type=float, default=1.0)
+    parser.add_argument("--channels", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--flush-ms", type=float, default=5.0)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
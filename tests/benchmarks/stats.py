@@ -0,0 +1,59 @@
+"""
+Общие хелперы для бенчмарков: сбор задержек и сводка перцентилей
+"""
+
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass
+class LatencyStats:
+    """Накопитель задержек (в секундах) и ошибок"""
+
+    samples: list[float] = field(default_factory=list)
+    errors: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+    finished_at: float | None = None
+
+    def add(self, seconds: float) -> None:
+        """Добавить успешный замер"""
+        self.samples.append(seconds)
+
+    def add_error(self) -> None:
+        """Учесть неуспешный запрос"""
+        self.errors += 1
+
+    def finish(self) -> None:
+        """Зафиксировать окончание прогона"""
+        self.finished_at = time.perf_counter()
+
+    def percentile(self, p: float) -> float:
+        """Перцентиль p (0..100) методом ближайшего ранга, в секундах"""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = max(0, min(len(ordered) - 1,
+                          round(p / 100 * len(ordered) + 0.5) - 1))
+        return ordered[rank]
+
+    def summary(self) -> dict:
+        """Сводка прогона: rps, p50/p95/p99 в миллисекундах, ошибки"""
+        finished = self.finished_at or time.perf_counter()
+        elapsed = max(finished - self.started_at, 1e-9)
+        total = len(self.samples) + self.errors
+        return {
+            "requests": total,
+            "errors": self.errors,
+            "elapsed_s": round(elapsed, 3),
+            "rps": round(total / elapsed, 1),
+            "p50_ms": round(self.percentile(50) * 1000, 2),
+            "p95_ms": round(self.percentile(95) * 1000, 2),
+            "p99_ms": round(self.percentile(99) * 1000, 2),
+        }
+
+
+def print_summary(title: str, stats: LatencyStats) -> None:
+    """Вывести сводку прогона в консоль"""
+    print(f"\n=== {title} ===")
+    for key, value in stats.summary().items():
+        print(f"{key:>10}: {value}")
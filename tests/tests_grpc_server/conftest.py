@@ -0,0 +1,29 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from backend.service_recipe.src.infrastructure.grpc.channel_pool import (
+    ChannelPool)
+from backend.service_recipe.src.infrastructure.grpc.client import (
+    UserServiceClient)
+
+
+@pytest.fixture
+def stub():
+    """Stub user_service, общий для всех каналов пула"""
+    return MagicMock()
+
+
+@pytest.fixture
+def make_client(stub):
+    """Фабрика клиента, подключённого к stub без реальных каналов"""
+    def _make(**kwargs) -> UserServiceClient:
+        client = UserServiceClient(host="localhost", port=50051, **kwargs)
+        client._pool = ChannelPool(
+            targets=client.targets,
+            channels_per_target=client.channels_per_target,
+            lb_policy=client.lb_policy,
+            channel_factory=lambda target, options: AsyncMock(),
+            stub_factory=lambda channel: stub
+        )
+        return client
+    return _make
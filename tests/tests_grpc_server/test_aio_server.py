@@ -0,0 +1,208 @@
+import asyncio
+
+import grpc
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import UUID
+
+from backend.service_user.src.infrastructure.grpc.aio_server import (
+    AioGrpcServer,
+    AsyncUserServiceServicer
+)
+from backend.shared.proto import user_service_pb2, user_service_pb2_grpc
+
+
+SERVER_MODULE = 'backend.service_user.src.infrastructure.grpc.aio_server'
+BASE_MODULE = 'backend.service_user.src.infrastructure.grpc.server'
+
+
+@pytest.fixture
+def servicer():
+    with patch(f'{BASE_MODULE}.container') as mock_container:
+        mock_jwt = MagicMock()
+        mock_jwt.decode_token = MagicMock(return_value={
+            "sub": "123",
+            "email": "test@example.com"
+        })
+        mock_container.jwt_service.return_value = mock_jwt
+        mock_container.token_version_service.return_value.is_current = (
+            AsyncMock(return_value=True))
+        yield AsyncUserServiceServicer()
+
+
+@pytest.fixture
+async def server(servicer):
+    server = AioGrpcServer(port=0, servicer=servicer, grace=1.0)
+    await server.start()
+    yield server
+    await server.stop()
+
+
+class TestAioGrpcServer:
+    """Тесты grpc.aio сервера User Service"""
+
+    @pytest.mark.asyncio
+    async def test_validate_token_over_aio_server(self, server):
+        """ValidateToken обслуживается aio сервером"""
+        async with grpc.aio.insecure_channel(
+            f"localhost:{server.bound_port}"
+        ) as channel:
+            stub = user_service_pb2_grpc.UserServiceStub(channel)
+            responses = await asyncio.gather(*(
+                stub.ValidateToken(
+                    user_service_pb2.ValidateTokenRequest(token="jwt"))
+                for _ in range(50)
+            ))
+
+        assert all(r.valid and r.user_id == "123" for r in responses)
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_in_flight_rpc(self, servicer):
+        """Остановка даёт начатому RPC завершиться"""
+        release = asyncio.Event()
+
+        async def slow_validate(request, context):
+            await release.wait()
+            return user_service_pb2.ValidateTokenResponse(valid=True)
+
+        servicer.ValidateToken = slow_validate
+        server = AioGrpcServer(port=0, servicer=servicer, grace=2.0)
+        await server.start()
+
+        async with grpc.aio.insecure_channel(
+            f"localhost:{server.bound_port}"
+        ) as channel:
+            stub = user_service_pb2_grpc.UserServiceStub(channel)
+            call = asyncio.ensure_future(stub.ValidateToken(
+                user_service_pb2.ValidateTokenRequest(token="jwt")))
+            await asyncio.sleep(0.1)
+
+            stopping = asyncio.create_task(server.stop())
+            await asyncio.sleep(0.05)
+            release.set()
+
+            assert (await call).valid is True
+            await stopping
+
+
+class TestAsyncUserServiceServicer:
+    """Тесты асинхронного servicer"""
+
+    @pytest.mark.asyncio
+    async def test_get_users_by_ids_uses_async_repository(self, servicer):
+        """GetUsersByIds читает пользователей через async репозиторий"""
+        user_id = "550e8400-e29b-41d4-a716-446655440000"
+        mock_user = MagicMock(
+            id=UUID(user_id),
+            email="test@example.com",
+            user_name="Test User",
+            is_active=True
+        )
+        mock_repo = MagicMock()
+        mock_repo.get_users_by_ids = AsyncMock(return_value=[mock_user])
+
+        session_manager = MagicMock()
+        session_manager.get_db_context.return_value.__aenter__ = AsyncMock()
+        session_manager.get_db_context.return_value.__aexit__ = AsyncMock(
+            return_value=False)
+
+        with patch(f'{SERVER_MODULE}.container') as mock_container, patch(
+            f'{SERVER_MODULE}.AsyncSQLUserRepository',
+            return_value=mock_repo
+        ):
+            mock_container.async_session_manager.return_value = (
+                session_manager)
+
+            response = await servicer.GetUsersByIds(
+                user_service_pb2.GetUsersByIdsRequest(user_ids=[user_id]),
+                MagicMock()
+            )
+
+        assert response.users[0].exists is True
+        assert response.users[0].email == "test@example.com"
+
+    @pytest.mark.asyncio
+    async def test_get_users_by_ids_mixed_valid_and_invalid(self, servicer):
+        """Неверный ID получает exists = false, остальные обслуживаются"""
+        user_id = "550e8400-e29b-41d4-a716-446655440000"
+        mock_user = MagicMock(
+            id=UUID(user_id),
+            email="test@example.com",
+            user_name="Test User",
+            is_active=True
+        )
+        mock_repo = MagicMock()
+        mock_repo.get_users_by_ids = AsyncMock(return_value=[mock_user])
+
+        session_manager = MagicMock()
+        session_manager.get_db_context.return_value.__aenter__ = AsyncMock()
+        session_manager.get_db_context.return_value.__aexit__ = AsyncMock(
+            return_value=False)
+        context = MagicMock()
+
+        with patch(f'{SERVER_MODULE}.container') as mock_container, patch(
+            f'{SERVER_MODULE}.AsyncSQLUserRepository',
+            return_value=mock_repo
+        ):
+            mock_container.async_session_manager.return_value = (
+                session_manager)
+
+            response = await servicer.GetUsersByIds(
+                user_service_pb2.GetUsersByIdsRequest(
+                    user_ids=[user_id, "not-a-uuid"]),
+                context
+            )
+
+        mock_repo.get_users_by_ids.assert_awaited_once_with([UUID(user_id)])
+        assert [user.exists for user in response.users] == [True, False]
+        assert response.users[1].id == "not-a-uuid"
+        context.set_code.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_user_by_id_invalid_format(self, servicer):
+        """Некорректный ID — INVALID_ARGUMENT без обращения к БД"""
+        context = MagicMock()
+
+        response = await servicer.GetUserById(
+            user_service_pb2.GetUserByIdRequest(user_id="999"), context)
+
+        assert response.exists is False
+        context.set_code.assert_called_once_with(
+            grpc.StatusCode.INVALID_ARGUMENT)
+
+
+class TestUnixSocketTransport:
+    """gRPC поверх unix-сокета"""
+
+    @pytest.mark.asyncio
+    async def test_client_connects_over_unix_socket(self, servicer, tmp_path):
+        """Клиент с unix: endpoint'ом обращается к серверу через сокет"""
+        from backend.service_recipe.src.infrastructure.grpc.client import (
+            UserServiceClient)
+
+        socket_path = tmp_path / "user_service.sock"
+        server = AioGrpcServer(
+            port=0, servicer=servicer, grace=0, uds_path=str(socket_path))
+        await server.start()
+
+        client = UserServiceClient(targets=[f"unix:{socket_path}"])
+        try:
+            result = await client.validate_token("jwt")
+        finally:
+            await client.close()
+            await server.stop()
+
+        assert result["valid"] is True
+        assert result["user_id"] == "123"
+
+    def test_uds_path_overrides_tcp_targets(self):
+        """GRPC_UDS_PATH в конфигурации заменяет TCP endpoint'ы"""
+        from backend.service_recipe.src.config import UserServiceConfig
+
+        config = UserServiceConfig(
+            GRPC_UDS_PATH="/run/grpc/user_service.sock",
+            GRPC_TARGETS="a:1,b:2"
+        )
+
+        assert config.get_grpc_targets() == [
+            "unix:/run/grpc/user_service.sock"]
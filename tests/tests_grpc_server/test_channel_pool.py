@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from backend.service_recipe.src.infrastructure.grpc.channel_pool import (
+    ChannelPool)
+
+
+def _pool(targets, **kwargs):
+    return ChannelPool(
+        targets=targets,
+        channel_factory=lambda target, options: AsyncMock(),
+        stub_factory=lambda channel: MagicMock(),
+        **kwargs
+    )
+
+
+class TestChannelPool:
+    """Тесты пула gRPC каналов"""
+
+    @pytest.mark.asyncio
+    async def test_round_robin_spreads_calls_across_targets(self):
+        """round_robin распределяет вызовы по всем каналам поровну"""
+        pool = _pool(["a:1", "b:1"], channels_per_target=2)
+
+        for _ in range(8):
+            async with pool.acquire():
+                pass
+
+        channels = pool.stats()["channels"]
+        assert len(channels) == 4
+        assert [c["calls"] for c in channels] == [2, 2, 2, 2]
+        assert {c["target"] for c in channels} == {"a:1", "b:1"}
+
+    @pytest.mark.asyncio
+    async def test_least_outstanding_avoids_busy_channel(self):
+        """least_outstanding выбирает канал без выполняющихся вызовов"""
+        pool = _pool(["a:1", "b:1"], lb_policy="least_outstanding")
+        release = asyncio.Event()
+        busy_stubs = []
+
+        async def hold():
+            async with pool.acquire() as stub:
+                busy_stubs.append(stub)
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+
+        for _ in range(3):
+            async with pool.acquire() as stub:
+                assert stub is not busy_stubs[0]
+
+        release.set()
+        await holder
+        assert all(
+            c["outstanding"] == 0 for c in pool.stats()["channels"])
+
+    @pytest.mark.asyncio
+    async def test_options_passed_to_every_channel(self):
+        """Опции каналов передаются фабрике"""
+        factory = MagicMock(return_value=AsyncMock())
+        options = [("grpc.keepalive_time_ms", 1000)]
+
+        ChannelPool(
+            targets=["a:1"],
+            channels_per_target=3,
+            options=options,
+            channel_factory=factory,
+            stub_factory=lambda channel: MagicMock()
+        )
+
+        assert factory.call_count == 3
+        factory.assert_called_with("a:1", options=options)
+
+    @pytest.mark.asyncio
+    async def test_close_closes_all_channels(self):
+        """close закрывает все каналы пула"""
+        channels = []
+
+        def factory(target, options):
+            channel = AsyncMock()
+            channels.append(channel)
+            return channel
+
+        pool = ChannelPool(
+            targets=["a:1", "b:1"],
+            channel_factory=factory,
+            stub_factory=lambda channel: MagicMock()
+        )
+        await pool.close()
+
+        for channel in channels:
+            channel.close.assert_awaited_once()
+
+    def test_empty_targets_rejected(self):
+        """Пустой список endpoint'ов недопустим"""
+        with pytest.raises(ValueError):
+            _pool([])
+
+
+class TestClientDeadline:
+    """Дедлайн вызовов UserServiceClient"""
+
+    @pytest.mark.asyncio
+    async def test_call_timeout_passed_to_rpc(self, make_client, stub):
+        """Каждый вызов получает timeout из настроек клиента"""
+        client = make_client(call_timeout=0.25)
+        response = MagicMock(valid=False, user_id="", email="", error="")
+        stub.ValidateToken = AsyncMock(return_value=response)
+
+        await client.validate_token("token")
+
+        assert stub.ValidateToken.await_args.kwargs["timeout"] == 0.25
+
+    def test_targets_default_to_host_port(self):
+        """Без списка реплик используется host:port"""
+        from backend.service_recipe.src.infrastructure.grpc.client import (
+            UserServiceClient)
+
+        assert UserServiceClient(host="h", port=1).targets == ["h:1"]
+        assert UserServiceClient(
+            targets=["a:1", "b:2"]).targets == ["a:1", "b:2"]
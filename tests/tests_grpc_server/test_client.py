@@ -18,9 +18,9 @@ class TestUserServiceClient:
         with patch('grpc.aio.insecure_channel') as mock_channel:
             await client.connect()
 
-            mock_channel.assert_called_once_with("localhost:50051")
-            assert client._channel is not None
-            assert client._stub is not None
+            mock_channel.assert_called_once_with(
+                "localhost:50051", options=client.channel_options)
+            assert client._pool is not None
 
     @pytest.mark.asyncio
     async def test_close_closes_channel(self, client):
@@ -28,7 +28,8 @@ class TestUserServiceClient:
         with patch(
             'backend.service_recipe.src.infrastructure.grpc.client.grpc.aio.insecure_channel'
         ) as mock_channel:
-            mock_channel_instance = AsyncMock()
+            mock_channel_instance = MagicMock()
+            mock_channel_instance.close = AsyncMock()
             mock_channel.return_value = mock_channel_instance
 
             await client.connect()
@@ -38,16 +39,20 @@ class TestUserServiceClient:
             mock_channel_instance.close.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_validate_token_returns_correct_format(self, client):
+    async def test_validate_token_returns_correct_format(
+        self, make_client, stub
+    ):
         """validate_token возвращает правильный формат"""
-        with patch.object(client, '_stub') as mock_stub:
+        client = make_client()
+        with patch.object(stub, 'ValidateToken') as mock_stub_method:
             mock_response = MagicMock()
             mock_response.valid = True
             mock_response.user_id = "123"
             mock_response.email = "test@example.com"
             mock_response.error = ""
 
-            mock_stub.ValidateToken = AsyncMock(return_value=mock_response)
+            mock_stub_method.side_effect = AsyncMock(
+                return_value=mock_response)
 
             result = await client.validate_token("test_token")
 
@@ -59,14 +64,15 @@ class TestUserServiceClient:
             }
 
     @pytest.mark.asyncio
-    async def test_validate_token_handles_grpc_error(self, client):
+    async def test_validate_token_handles_grpc_error(
+        self, make_client, stub
+    ):
         """validate_token обрабатывает gRPC ошибки"""
         import grpc
         from grpc import StatusCode
 
-        mock_stub = MagicMock()
-        client._stub = mock_stub
-        client._channel = AsyncMock()
+        client = make_client()
+        mock_stub = stub
 
         # AioRpcError требует больше параметров
         mock_error = grpc.aio.AioRpcError(
@@ -82,3 +88,76 @@ class TestUserServiceClient:
 
         assert result["valid"] is False
         assert "gRPC error" in result["error"]
+
+
+class TestTokenValidationCache:
+    """Тесты кэша результатов ValidateToken"""
+
+    @pytest.fixture
+    def client(self, make_client):
+        return make_client()
+
+    @staticmethod
+    def _response(valid: bool):
+        response = MagicMock()
+        response.valid = valid
+        response.user_id = "123" if valid else ""
+        response.email = "test@example.com" if valid else ""
+        response.error = "" if valid else "Invalid token"
+        return response
+
+    @staticmethod
+    def _token(exp_delta: float) -> str:
+        import time
+        from jose import jwt
+
+        return jwt.encode(
+            {"sub": "123", "exp": int(time.time() + exp_delta)},
+            "secret",
+            algorithm="HS256"
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeated_valid_token_served_from_cache(self, client, stub):
+        """Повторная проверка того же токена не делает RPC"""
+        stub.ValidateToken = AsyncMock(
+            return_value=self._response(True))
+        token = self._token(300)
+
+        first = await client.validate_token(token)
+        second = await client.validate_token(token)
+
+        assert first == second
+        assert stub.ValidateToken.await_count == 1
+        stats = client.token_cache.stats()
+        assert stats["hits"] == 1
+        assert stats["size"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_result_not_cached(self, client, stub):
+        """Отказ не кэшируется"""
+        stub.ValidateToken = AsyncMock(
+            return_value=self._response(False))
+        token = self._token(300)
+
+        await client.validate_token(token)
+        await client.validate_token(token)
+
+        assert stub.ValidateToken.await_count == 2
+        assert len(client.token_cache) == 0
+
+    def test_ttl_capped_by_token_exp(self, client):
+        """Запись живёт не дольше токена"""
+        assert client._token_cache_ttl(self._token(5)) <= 5
+        assert client._token_cache_ttl(self._token(3600)) == (
+            client.token_cache.ttl_seconds)
+
+    @pytest.mark.asyncio
+    async def test_expired_token_not_cached(self, client, stub):
+        """Истёкший по exp токен в кэш не попадает"""
+        stub.ValidateToken = AsyncMock(
+            return_value=self._response(True))
+
+        await client.validate_token(self._token(-10))
+
+        assert len(client.token_cache) == 0
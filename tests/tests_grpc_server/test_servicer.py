@@ -1,8 +1,10 @@
 from dotenv import load_dotenv
+import grpc
 import os
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
+from uuid import UUID
 
 from backend.shared.proto import user_service_pb2
 from backend.service_user.src.infrastructure.grpc.server import (
@@ -65,6 +67,31 @@ class TestUserServiceServicer:
             assert response.user_id == ""
             assert response.email == ""
 
+    def test_validate_token_revoked_version(self, context):
+        """Токен с устаревшей версией отклоняется"""
+        with patch(
+            'backend.service_user.src.infrastructure.grpc.server.container'
+        ) as mock_container:
+            mock_jwt = MagicMock()
+            mock_jwt.decode_token = MagicMock(return_value={
+                "sub": "123",
+                "email": "test@example.com",
+                "ver": 0
+            })
+            mock_container.jwt_service.return_value = mock_jwt
+            mock_container.token_version_service.return_value = MagicMock(
+                is_current_sync=MagicMock(return_value=False))
+
+            servicer = UserServiceServicer()
+            request = user_service_pb2.ValidateTokenRequest(token="old_jwt")
+
+            response = servicer.ValidateToken(request, context)
+
+            assert response.valid is False
+            assert response.error.message == "Token has been revoked"
+            context.set_code.assert_called_once_with(
+                grpc.StatusCode.UNAUTHENTICATED)
+
     def test_get_user_by_id_exists(self, context):
         """Получение существующего пользователя"""
         # Используем валидный UUID формат
@@ -88,11 +115,12 @@ class TestUserServiceServicer:
 
         with patch(
             'backend.service_user.src.infrastructure.grpc.server.container'
-        ) as mock_container:
+        ) as mock_container, patch(
+            'backend.service_user.src.infrastructure.grpc.server.'
+            'SQLUserRepository',
+            return_value=mock_repo_instance
+        ):
             mock_container.session_manager.return_value = mock_session_manager
-            # Добавлен мок sql_user_repository
-            mock_container.sql_user_repository.return_value = MagicMock(
-                return_value=mock_repo_instance)
 
             servicer = UserServiceServicer()
             request = user_service_pb2.GetUserByIdRequest(
@@ -130,3 +158,95 @@ class TestUserServiceServicer:
             assert response.email == ""
             assert response.user_name == ""
             assert response.is_active is False
+
+    def test_get_users_by_ids_single_query_in_request_order(self, context):
+        """Пакетное получение: один запрос, порядок запроса сохраняется"""
+        found_id = "550e8400-e29b-41d4-a716-446655440000"
+        missing_id = "550e8400-e29b-41d4-a716-446655440001"
+
+        mock_user = MagicMock()
+        mock_user.id = UUID(found_id)
+        mock_user.email = "test@example.com"
+        mock_user.user_name = "Test User"
+        mock_user.is_active = True
+
+        mock_repo_instance = MagicMock()
+        mock_repo_instance.get_users_by_ids = MagicMock(
+            return_value=[mock_user])
+
+        with patch(
+            'backend.service_user.src.infrastructure.grpc.server.container'
+        ), patch(
+            'backend.service_user.src.infrastructure.grpc.server.'
+            'SQLUserRepository',
+            return_value=mock_repo_instance
+        ):
+            servicer = UserServiceServicer()
+            request = user_service_pb2.GetUsersByIdsRequest(
+                user_ids=[missing_id, found_id, found_id])
+
+            response = servicer.GetUsersByIds(request, context)
+
+        mock_repo_instance.get_users_by_ids.assert_called_once_with(
+            [UUID(missing_id), UUID(found_id)])
+        assert [user.exists for user in response.users] == [
+            False, True, True]
+        assert response.users[0].id == missing_id
+        assert response.users[1].email == "test@example.com"
+
+    def test_get_users_by_ids_invalid_id(self, context):
+        """Некорректный ID — exists = false без ошибки RPC"""
+        mock_repo_instance = MagicMock()
+        mock_repo_instance.get_users_by_ids = MagicMock(return_value=[])
+
+        with patch(
+            'backend.service_user.src.infrastructure.grpc.server.container'
+        ), patch(
+            'backend.service_user.src.infrastructure.grpc.server.'
+            'SQLUserRepository',
+            return_value=mock_repo_instance
+        ):
+            servicer = UserServiceServicer()
+            request = user_service_pb2.GetUsersByIdsRequest(
+                user_ids=["not-a-uuid"])
+
+            response = servicer.GetUsersByIds(request, context)
+
+        assert len(response.users) == 1
+        assert response.users[0].exists is False
+        assert response.users[0].id == "not-a-uuid"
+        context.set_code.assert_not_called()
+
+    def test_get_users_by_ids_mixed_valid_and_invalid(self, context):
+        """Неверный ID в пакете не мешает ответить по остальным"""
+        found_id = "550e8400-e29b-41d4-a716-446655440000"
+
+        mock_user = MagicMock()
+        mock_user.id = UUID(found_id)
+        mock_user.email = "test@example.com"
+        mock_user.user_name = "Test User"
+        mock_user.is_active = True
+
+        mock_repo_instance = MagicMock()
+        mock_repo_instance.get_users_by_ids = MagicMock(
+            return_value=[mock_user])
+
+        with patch(
+            'backend.service_user.src.infrastructure.grpc.server.container'
+        ), patch(
+            'backend.service_user.src.infrastructure.grpc.server.'
+            'SQLUserRepository',
+            return_value=mock_repo_instance
+        ):
+            servicer = UserServiceServicer()
+            request = user_service_pb2.GetUsersByIdsRequest(
+                user_ids=["999", found_id])
+
+            response = servicer.GetUsersByIds(request, context)
+
+        mock_repo_instance.get_users_by_ids.assert_called_once_with(
+            [UUID(found_id)])
+        assert [user.exists for user in response.users] == [False, True]
+        assert response.users[0].id == "999"
+        assert response.users[1].email == "test@example.com"
+        context.set_code.assert_not_called()
@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from backend.service_recipe.src.infrastructure.grpc.client import (
+    UserServiceClient)
+from backend.service_recipe.src.infrastructure.grpc.single_flight import (
+    SingleFlight)
+
+
+class TestSingleFlight:
+    """Тесты объединения конкурентных вызовов"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Конкурентные вызовы с одним ключом выполняются один раз"""
+        flight = SingleFlight()
+        release = asyncio.Event()
+        executions = 0
+
+        async def call():
+            nonlocal executions
+            executions += 1
+            await release.wait()
+            return "result"
+
+        waiters = [
+            asyncio.create_task(flight.do("key", call)) for _ in range(10)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ["result"] * 10
+        assert executions == 1
+        assert flight.stats()["coalesced"] == 9
+        assert flight.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_not_coalesced(self):
+        """Разные ключи выполняются независимо"""
+        flight = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0)
+            return 1
+
+        await asyncio.gather(flight.do("a", call), flight.do("b", call))
+
+        assert flight.stats()["calls"] == 2
+        assert flight.stats()["coalesced"] == 0
+
+    @pytest.mark.asyncio
+    async def test_error_propagates_to_all_waiters(self):
+        """Ошибка вызова получают все ожидающие"""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def call():
+            await release.wait()
+            raise RuntimeError("boom")
+
+        waiters = [
+            asyncio.create_task(flight.do("key", call)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_call(self):
+        """Отмена одного ожидающего не отменяет вызов для остальных"""
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def call():
+            await release.wait()
+            return "ok"
+
+        first = asyncio.create_task(flight.do("key", call))
+        second = asyncio.create_task(flight.do("key", call))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "ok"
+
+
+class TestClientCoalescing:
+    """Объединение вызовов в UserServiceClient"""
+
+    @pytest.mark.asyncio
+    async def test_parallel_get_user_by_id_single_rpc(self, make_client, stub):
+        """Параллельные GetUserById одного пользователя — один RPC"""
+        client = make_client()
+
+        response = MagicMock()
+        response.id = "123"
+        response.email = "test@example.com"
+        response.user_name = "test"
+        response.exists = True
+
+        async def slow_rpc(request, timeout=None):
+            await asyncio.sleep(0.01)
+            return response
+
+        stub.GetUserById = AsyncMock(side_effect=slow_rpc)
+
+        results = await asyncio.gather(
+            *(client.get_user_by_id("123") for _ in range(5)))
+
+        assert all(r["exists"] for r in results)
+        assert stub.GetUserById.await_count == 1
+        assert client.single_flight.stats()["coalesced"] == 4
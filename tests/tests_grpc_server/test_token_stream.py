@@ -0,0 +1,209 @@
+import asyncio
+from concurrent import futures
+
+import grpc
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.service_recipe.src.infrastructure.grpc.client import (
+    UserServiceClient)
+from backend.service_recipe.src.infrastructure.grpc.token_stream import (
+    TokenStreamError,
+    TokenStreamGroup,
+    TokenValidationStream
+)
+from backend.service_user.src.infrastructure.grpc.aio_server import (
+    AioGrpcServer,
+    AsyncUserServiceServicer
+)
+from backend.service_user.src.infrastructure.grpc.server import (
+    UserServiceServicer)
+from backend.shared.proto import user_service_pb2, user_service_pb2_grpc
+
+
+BASE_MODULE = 'backend.service_user.src.infrastructure.grpc.server'
+
+
+@pytest.fixture
+def servicer():
+    with patch(f'{BASE_MODULE}.container') as mock_container:
+        mock_jwt = MagicMock()
+        mock_jwt.decode_token = MagicMock(
+            side_effect=lambda token: {"sub": token} if token != "bad"
+            else None
+        )
+        mock_container.jwt_service.return_value = mock_jwt
+        mock_container.token_version_service.return_value.is_current = (
+            AsyncMock(return_value=True))
+        yield AsyncUserServiceServicer()
+
+
+@pytest.fixture
+async def server(servicer):
+    server = AioGrpcServer(port=0, servicer=servicer, grace=0)
+    await server.start()
+    yield server
+    await server.stop()
+
+
+class TestValidateTokensServicer:
+    """Потоковая валидация на стороне user_service"""
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_does_not_end_stream(self, servicer):
+        """Невалидный токен возвращается ответом, поток продолжается"""
+        requests = [
+            user_service_pb2.ValidateTokensRequest(
+                correlation_id=1, token="bad"),
+            user_service_pb2.ValidateTokensRequest(
+                correlation_id=2, token="u2"),
+        ]
+
+        async def request_iterator():
+            for request in requests:
+                yield request
+
+        context = MagicMock()
+        responses = [
+            response async for response in servicer.ValidateTokens(
+                request_iterator(), context)
+        ]
+
+        assert [r.correlation_id for r in responses] == [1, 2]
+        assert responses[0].result.valid is False
+        assert responses[1].result.user_id == "u2"
+        context.set_code.assert_not_called()
+
+
+@pytest.fixture
+def thread_server():
+    """user_service в режиме thread"""
+    with patch(f'{BASE_MODULE}.container'):
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+        user_service_pb2_grpc.add_UserServiceServicer_to_server(
+            UserServiceServicer(), server)
+        port = server.add_insecure_port("127.0.0.1:0")
+        server.start()
+        yield port
+        server.stop(0)
+
+
+class TestThreadModeRejectsStream:
+    """В режиме thread поток не занимает поток пула"""
+
+    @pytest.mark.asyncio
+    async def test_unimplemented_and_not_reopened(self, thread_server):
+        """UNIMPLEMENTED — поток помечается неподдерживаемым"""
+        async with grpc.aio.insecure_channel(
+            f"127.0.0.1:{thread_server}"
+        ) as channel:
+            stub = user_service_pb2_grpc.UserServiceStub(channel)
+            stream = TokenValidationStream(lambda: stub)
+
+            with pytest.raises(TokenStreamError):
+                await stream.validate("token", timeout=5)
+            with pytest.raises(TokenStreamError):
+                await stream.validate("token", timeout=5)
+            await stream.close()
+
+        assert stream.unsupported is True
+        assert stream.stats()["streams_opened"] == 1
+
+
+class TestTokenValidationStream:
+    """Мультиплексирование проверок поверх одного потока"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_validations_share_one_stream(self, server):
+        """Конкурентные проверки идут по одному потоку и не путаются"""
+        async with grpc.aio.insecure_channel(
+            f"localhost:{server.bound_port}"
+        ) as channel:
+            stub = user_service_pb2_grpc.UserServiceStub(channel)
+            stream = TokenValidationStream(lambda: stub)
+
+            results = await asyncio.gather(*(
+                stream.validate(f"user-{i}", timeout=5) for i in range(100)
+            ))
+            await stream.close()
+
+        assert [r.user_id for r in results] == [
+            f"user-{i}" for i in range(100)]
+        assert stream.stats()["streams_opened"] == 1
+
+    @pytest.mark.asyncio
+    async def test_broken_stream_fails_pending(self):
+        """Обрыв потока завершает ожидающих TokenStreamError"""
+        class BrokenCall:
+            async def write(self, request):
+                pass
+
+            async def read(self):
+                await asyncio.sleep(0)
+                raise RuntimeError("connection reset")
+
+        stub = MagicMock()
+        stub.ValidateTokens = MagicMock(return_value=BrokenCall())
+        stream = TokenValidationStream(lambda: stub)
+
+        with pytest.raises(TokenStreamError):
+            await stream.validate("token", timeout=1)
+        assert stream.stats()["stream_failures"] == 1
+
+
+class TestTokenStreamGroup:
+    """По потоку на каждый канал пула"""
+
+    @pytest.mark.asyncio
+    async def test_streams_spread_over_channels(self):
+        """Проверки распределяются по потокам всех каналов"""
+        group = TokenStreamGroup(lambda: ["stub-a", "stub-b"])
+        with patch.object(
+            TokenValidationStream, "validate",
+            autospec=True, return_value="ok"
+        ) as validate:
+            for _ in range(4):
+                await group.validate("token", timeout=1)
+
+        used = [call.args[0] for call in validate.call_args_list]
+        assert len(set(map(id, used))) == 2
+        assert used[0] is used[2] and used[1] is used[3]
+        assert group.stats()["streams"] == 2
+
+
+class TestClientTokenStream:
+    """UserServiceClient в режиме потока"""
+
+    @pytest.mark.asyncio
+    async def test_validate_token_over_stream(self, server):
+        """validate_token использует поток ValidateTokens"""
+        client = UserServiceClient(
+            targets=[f"localhost:{server.bound_port}"],
+            token_stream_enabled=True
+        )
+        try:
+            result = await client.validate_token("user-1")
+        finally:
+            await client.close()
+
+        assert result["valid"] is True
+        assert result["user_id"] == "user-1"
+        assert client.token_stream.stats()["requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_unary_when_stream_breaks(
+        self, make_client, stub
+    ):
+        """При обрыве потока проверка повторяется unary вызовом"""
+        from unittest.mock import AsyncMock
+
+        client = make_client(token_stream_enabled=True)
+        client.token_stream.validate = AsyncMock(
+            side_effect=TokenStreamError("reset"))
+        stub.ValidateToken = AsyncMock(return_value=MagicMock(
+            valid=True, user_id="1", email="", error=""))
+
+        result = await client.validate_token("token")
+
+        assert result["valid"] is True
+        stub.ValidateToken.assert_awaited_once()
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from backend.service_recipe.src.infrastructure.grpc.client import (
+    UserServiceClient)
+from backend.service_recipe.src.infrastructure.grpc.user_loader import (
+    UserLoader)
+
+
+def _users(user_ids):
+    return {
+        user_id: {"id": user_id, "exists": True} for user_id in user_ids
+    }
+
+
+class TestUserLoader:
+    """Тесты пакетного загрузчика пользователей"""
+
+    @pytest.mark.asyncio
+    async def test_loads_in_one_tick_become_one_batch(self):
+        """Вызовы load одного тика объединяются в один пакет"""
+        batch_fn = AsyncMock(side_effect=_users)
+        loader = UserLoader(batch_fn)
+
+        results = await asyncio.gather(
+            loader.load("a"), loader.load("b"), loader.load("a"))
+
+        batch_fn.assert_awaited_once_with(["a", "b"])
+        assert [r["id"] for r in results] == ["a", "b", "a"]
+        assert loader.stats()["batches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batches_split_by_max_size(self):
+        """Пакеты не превышают max_batch_size"""
+        batch_fn = AsyncMock(side_effect=_users)
+        loader = UserLoader(batch_fn, max_batch_size=2)
+
+        await loader.load_many(["a", "b", "c"])
+
+        assert batch_fn.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_user_marked_not_exists(self):
+        """Отсутствующий в ответе ID — exists = False"""
+        loader = UserLoader(AsyncMock(return_value={}))
+
+        assert (await loader.load("a"))["exists"] is False
+
+    @pytest.mark.asyncio
+    async def test_batch_error_propagates(self):
+        """Ошибка пакета получают все ожидающие"""
+        loader = UserLoader(AsyncMock(side_effect=RuntimeError("boom")))
+
+        with pytest.raises(RuntimeError):
+            await loader.load_many(["a", "b"])
+
+
+class TestClientGetUsersByIds:
+    """Пакетный RPC в UserServiceClient"""
+
+    @pytest.mark.asyncio
+    async def test_load_user_uses_single_rpc(self, make_client, stub):
+        """Поштучные load_user одного тика — один GetUsersByIds"""
+        client = make_client()
+
+        async def rpc(request, timeout=None):
+            response = MagicMock()
+            response.users = [
+                MagicMock(id=user_id, email="", user_name="", exists=True)
+                for user_id in request.user_ids
+            ]
+            return response
+
+        stub.GetUsersByIds = AsyncMock(side_effect=rpc)
+
+        results = await asyncio.gather(
+            *(client.load_user(str(i)) for i in range(10)))
+
+        assert stub.GetUsersByIds.await_count == 1
+        assert [r["id"] for r in results] == [str(i) for i in range(10)]
@@ -1,4 +1,6 @@
 import os
+from datetime import datetime, timezone
+
 import pytest
 
 os.environ["TESTING"] = "1"
@@ -32,6 +34,40 @@ def short_description() -> str:
 
 @pytest.fixture
 def mock_recipe_repo():
-    """Мок репозитория"""
-    from unittest.mock import Mock
-    return Mock()
+    """Мок асинхронного репозитория"""
+    from unittest.mock import AsyncMock
+    return AsyncMock()
+
+
+@pytest.fixture
+async def sqlite_engine():
+    """
+    Async SQLite engine со схемой recipe_service
+
+    Регистрирует timezone() и now(), чтобы server_default/onupdate
+    моделей (рассчитанные на PostgreSQL) работали в SQLite.
+    """
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from backend.service_recipe.src.models import (  # noqa: F401
+        Recipe, Ingredient, OutboxEvent
+    )
+    from backend.shared.models.base_model import Base
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def register_pg_functions(dbapi_connection, connection_record):
+        dbapi_connection.create_function(
+            "now", 0,
+            lambda: datetime.now(timezone.utc).strftime(
+                "%Y-%m-%d %H:%M:%S.%f")
+        )
+        dbapi_connection.create_function("timezone", 2, lambda tz, ts: ts)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+    await engine.dispose()
@@ -0,0 +1,148 @@
+"""
+Тесты LRU+TTL кэша и чтения рецепта через кэш
+"""
+
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from backend.shared.cache import LRUTTLCache
+from backend.service_recipe.src.schemas import RecipeCreate
+from backend.service_recipe.src.service.recipe_service import RecipeService
+
+
+class FakeClock:
+    """Управляемые часы для проверки TTL"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUTTLCache:
+    """Тесты LRUTTLCache"""
+
+    def test_get_after_set_is_hit(self):
+        """Сохранённое значение возвращается и считается попаданием"""
+        cache = LRUTTLCache(max_size=2, ttl_seconds=60)
+        cache.set("a", b"1")
+
+        assert cache.get("a") == b"1"
+        assert cache.get("b") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_evicts_least_recently_used(self):
+        """При переполнении вытесняется самая давняя по обращению запись"""
+        cache = LRUTTLCache(max_size=2, ttl_seconds=60)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        cache.get("a")
+        cache.set("c", b"3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+        assert cache.stats()["evictions"] == 1
+
+    def test_expired_entry_is_miss(self):
+        """Просроченная запись удаляется и считается промахом"""
+        clock = FakeClock()
+        cache = LRUTTLCache(max_size=2, ttl_seconds=10, clock=clock)
+        cache.set("a", b"1")
+        clock.now = 10.0
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+        assert cache.stats()["expirations"] == 1
+
+    def test_per_entry_ttl_overrides_default(self):
+        """TTL, переданный в set, действует только для этой записи"""
+        clock = FakeClock()
+        cache = LRUTTLCache(max_size=2, ttl_seconds=10, clock=clock)
+        cache.set("a", b"1", ttl_seconds=2)
+        cache.set("b", b"2")
+        clock.now = 5.0
+
+        assert cache.get("a") is None
+        assert cache.get("b") == b"2"
+
+    def test_invalidate_removes_entry(self):
+        """Инвалидация удаляет запись"""
+        cache = LRUTTLCache(max_size=2, ttl_seconds=60)
+        cache.set("a", b"1")
+
+        assert cache.invalidate("a") is True
+        assert cache.invalidate("a") is False
+        assert cache.get("a") is None
+
+    def test_non_positive_size_rejected(self):
+        """Размер кэша должен быть положительным"""
+        with pytest.raises(ValueError):
+            LRUTTLCache(max_size=0, ttl_seconds=60)
+
+
+class TestRecipeServiceCache:
+    """Тесты чтения рецепта через кэш"""
+
+    @pytest.fixture
+    def recipe_model(self):
+        recipe = Mock()
+        recipe.id = uuid4()
+        recipe.user_id = uuid4()
+        recipe.name_recipe = "Борщ"
+        recipe.description = "Вкусный украинский борщ"
+        recipe.ingredients = []
+        recipe.created_at = datetime.now()
+        recipe.updated_at = None
+        return recipe
+
+    async def test_second_read_served_from_cache(
+            self, mock_recipe_repo, recipe_model):
+        """Повторное чтение не обращается к репозиторию"""
+        mock_recipe_repo.get_by_id.return_value = recipe_model
+        service = RecipeService(
+            recipe_repo=mock_recipe_repo,
+            recipe_cache=LRUTTLCache(max_size=10, ttl_seconds=60)
+        )
+
+        first = await service.get_recipe_json(recipe_model.id)
+        second = await service.get_recipe_json(recipe_model.id)
+
+        assert first == second
+        assert json.loads(first)["name_recipe"] == "Борщ"
+        mock_recipe_repo.get_by_id.assert_awaited_once()
+
+    async def test_missing_recipe_returns_none(self, mock_recipe_repo):
+        """Отсутствующий рецепт не кэшируется"""
+        mock_recipe_repo.get_by_id.return_value = None
+        cache = LRUTTLCache(max_size=10, ttl_seconds=60)
+        service = RecipeService(recipe_repo=mock_recipe_repo,
+                                recipe_cache=cache)
+
+        assert await service.get_recipe_json(uuid4()) is None
+        assert len(cache) == 0
+
+    async def test_write_invalidates_cached_recipe(
+            self, mock_recipe_repo, recipe_model):
+        """Запись рецепта удаляет его из кэша"""
+        cache = LRUTTLCache(max_size=10, ttl_seconds=60)
+        cache.set(recipe_model.id, b"stale")
+        mock_recipe_repo.create = AsyncMock(return_value=recipe_model)
+        service = RecipeService(recipe_repo=mock_recipe_repo,
+                                recipe_cache=cache)
+
+        await service.create_recipe(
+            recipe_data=RecipeCreate(
+                name_recipe="Борщ",
+                description="Вкусный украинский борщ",
+                ingredients=[]
+            ),
+            user_id=recipe_model.user_id
+        )
+
+        assert cache.get(recipe_model.id) is None
@@ -16,10 +16,10 @@ class TestCreateRecipeEndpoint:
     """Тесты эндпоинта создания рецепта"""
 
     @pytest.fixture
-    def mock_user_service_client(self):
-        """Мок gRPC клиента для валидации токена"""
+    def mock_token_verifier(self):
+        """Мок проверки токена"""
         mock = AsyncMock()
-        mock.validate_token.return_value = {
+        mock.verify.return_value = {
             "valid": True,
             "user_id": str(uuid4()),
             "email": "test@example.com"
@@ -41,28 +41,29 @@ class TestCreateRecipeEndpoint:
         # Мок рецепта
         mock_recipe = Mock()
         mock_recipe.id = recipe_id
+        mock_recipe.user_id = uuid4()
         mock_recipe.name_recipe = "Борщ"
         mock_recipe.description = "Вкусный украинский борщ"
         mock_recipe.ingredients = [ingredient]
         mock_recipe.created_at = datetime.now()
         mock_recipe.updated_at = None
 
-        mock = Mock()
+        mock = AsyncMock()
         mock.create_recipe.return_value = mock_recipe
         return mock
 
     @pytest.fixture
-    def app(self, mock_user_service_client, mock_recipe_service):
+    def app(self, mock_token_verifier, mock_recipe_service):
         app = create_app()
 
         # Переопределяем зависимости правильно
         from backend.service_recipe.src.infrastructure.dependencies import (
-            get_user_service_client,
+            get_token_verifier,
             get_recipe_service,
             get_message_publisher
         )
 
-        app.dependency_overrides[get_user_service_client] = lambda: mock_user_service_client
+        app.dependency_overrides[get_token_verifier] = lambda: mock_token_verifier
         app.dependency_overrides[get_recipe_service] = lambda: mock_recipe_service
         mock_publisher = AsyncMock()
         app.dependency_overrides[get_message_publisher] = lambda: mock_publisher
@@ -137,10 +138,10 @@ class TestCreateRecipeEndpoint:
 
         assert response.status_code == 422
 
-    def test_create_recipe_with_invalid_token_returns_401(self, client, mock_user_service_client):
+    def test_create_recipe_with_invalid_token_returns_401(self, client, mock_token_verifier):
         """Невалидный токен — 401"""
         # Настраиваем мок на возврат invalid
-        mock_user_service_client.validate_token.return_value = {
+        mock_token_verifier.verify.return_value = {
             "valid": False,
             "error": "Token expired"
         }
@@ -183,3 +184,110 @@ class TestCreateRecipeEndpoint:
         )
 
         assert response.status_code == 201
+
+
+class TestGetRecipeEndpoint:
+    """Тесты эндпоинта чтения рецепта"""
+
+    @pytest.fixture
+    def mock_recipe_service(self):
+        mock = AsyncMock()
+        mock.get_recipe_json.return_value = b'{"id": "cached"}'
+        return mock
+
+    @pytest.fixture
+    def client(self, mock_recipe_service):
+        app = create_app()
+
+        from backend.service_recipe.src.infrastructure.dependencies import (
+            get_recipe_service
+        )
+
+        app.dependency_overrides[get_recipe_service] = lambda: mock_recipe_service
+        return TestClient(app)
+
+    def test_get_recipe_returns_cached_bytes(self, client):
+        """Ответ отдаётся байтами из сервиса как есть"""
+        response = client.get(f"/api/v1/recipe/recipes/{uuid4()}")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"id": "cached"}
+
+    def test_get_missing_recipe_returns_404(self, client, mock_recipe_service):
+        """Отсутствующий рецепт — 404"""
+        mock_recipe_service.get_recipe_json.return_value = None
+
+        response = client.get(f"/api/v1/recipe/recipes/{uuid4()}")
+
+        assert response.status_code == 404
+
+    def test_get_recipe_with_invalid_id_returns_422(self, client):
+        """Невалидный UUID — 422"""
+        response = client.get("/api/v1/recipe/recipes/not-a-uuid")
+
+        assert response.status_code == 422
+
+    def test_metrics_expose_cache_counters(self, client):
+        """Метрики содержат счётчики кэша"""
+        response = client.get("/api/v1/metrics")
+
+        assert response.status_code == 200
+        assert {"hits", "misses", "evictions"} <= set(
+            response.json()["recipe_cache"])
+        assert {"hit_ratio", "size"} <= set(response.json()["token_cache"])
+
+
+class TestListRecipesEndpoint:
+    """Тесты эндпоинта списка рецептов"""
+
+    @pytest.fixture
+    def mock_recipe_service(self):
+        from backend.service_recipe.src.schemas import RecipePage
+
+        mock = AsyncMock()
+        mock.list_recipes.return_value = RecipePage(items=[], next_cursor=None)
+        return mock
+
+    @pytest.fixture
+    def client(self, mock_recipe_service):
+        app = create_app()
+
+        from backend.service_recipe.src.infrastructure.dependencies import (
+            get_recipe_service
+        )
+
+        app.dependency_overrides[get_recipe_service] = lambda: mock_recipe_service
+        return TestClient(app)
+
+    def test_list_recipes_passes_filters(self, client, mock_recipe_service):
+        """Параметры запроса передаются в сервис"""
+        user_id = uuid4()
+
+        response = client.get(
+            "/api/v1/recipe/recipes",
+            params={"limit": 5, "cursor": "abc", "user_id": str(user_id)}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"items": [], "next_cursor": None}
+        mock_recipe_service.list_recipes.assert_awaited_once_with(
+            limit=5, cursor="abc", user_id=user_id)
+
+    def test_invalid_cursor_returns_400(self, client, mock_recipe_service):
+        """Некорректный курсор — 400"""
+        from backend.service_recipe.src.service.pagination import (
+            InvalidCursorError
+        )
+        mock_recipe_service.list_recipes.side_effect = InvalidCursorError(
+            "Некорректный курсор")
+
+        response = client.get("/api/v1/recipe/recipes", params={"cursor": "x"})
+
+        assert response.status_code == 400
+
+    def test_limit_out_of_range_returns_422(self, client):
+        """limit вне диапазона — 422"""
+        response = client.get("/api/v1/recipe/recipes", params={"limit": 0})
+
+        assert response.status_code == 422
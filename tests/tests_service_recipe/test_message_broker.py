@@ -0,0 +1,130 @@
+"""
+Тесты MessagePublisher на заглушке брокера
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from backend.service_recipe.src.service import MessagePublisher
+
+
+class FakeExchange:
+    def __init__(self, broker):
+        self.broker = broker
+
+    async def publish(self, message, routing_key):
+        await asyncio.sleep(0)
+        if self.broker.nack_keys and routing_key in self.broker.nack_keys:
+            raise RuntimeError("nack")
+        self.broker.published.append((routing_key, json.loads(message.body)))
+
+
+class FakeChannel:
+    def __init__(self, broker):
+        self.broker = broker
+
+    async def declare_exchange(self, name, *args, **kwargs):
+        self.broker.declared += 1
+        return FakeExchange(self.broker)
+
+    async def get_exchange(self, name, ensure=True):
+        return FakeExchange(self.broker)
+
+
+class FakeConnection:
+    def __init__(self, broker):
+        self.broker = broker
+        self.is_closed = False
+
+    async def channel(self, publisher_confirms=True):
+        self.broker.channels += 1
+        return FakeChannel(self.broker)
+
+    async def close(self):
+        self.is_closed = True
+
+
+class FakeBroker:
+    """Заглушка RabbitMQ: считает объявления, каналы и сообщения"""
+
+    def __init__(self):
+        self.declared = 0
+        self.channels = 0
+        self.published = []
+        self.nack_keys = set()
+
+    async def connect(self, url, timeout=None):
+        return FakeConnection(self)
+
+
+@pytest.fixture
+def broker():
+    return FakeBroker()
+
+
+def make_publisher(broker, **kwargs) -> MessagePublisher:
+    return MessagePublisher("amqp://test", connect=broker.connect, **kwargs)
+
+
+class TestMessagePublisher:
+    """Тесты MessagePublisher"""
+
+    async def test_exchange_declared_once_for_pool(self, broker):
+        """Exchange объявляется один раз, каналов — по размеру пула"""
+        publisher = make_publisher(broker, channel_pool_size=3)
+
+        for n in range(5):
+            await publisher.publish("recipe.created", {"n": n})
+        await publisher.close()
+
+        assert broker.declared == 1
+        assert broker.channels == 3
+        assert len(broker.published) == 5
+
+    async def test_concurrent_publishes_batched(self, broker):
+        """Конкурентные сообщения уходят пачками"""
+        publisher = make_publisher(broker, batch_size=50,
+                                   flush_interval=0.05)
+
+        await asyncio.gather(*(
+            publisher.publish("recipe.created", {"n": n})
+            for n in range(100)
+        ))
+        stats = publisher.stats()
+        await publisher.close()
+
+        assert stats["published"] == 100
+        assert stats["flushes"] == 2
+
+    async def test_failed_confirm_raises_and_counted(self, broker):
+        """Отказ брокера пробрасывается вызывающему и попадает в метрики"""
+        broker.nack_keys = {"recipe.bad"}
+        publisher = make_publisher(broker)
+
+        with pytest.raises(RuntimeError):
+            await publisher.publish("recipe.bad", {})
+        await publisher.publish("recipe.created", {})
+
+        assert publisher.stats()["confirm_failures"] == 1
+        assert publisher.stats()["published"] == 1
+        await publisher.close()
+
+    async def test_full_queue_applies_backpressure(self, broker):
+        """При заполненном буфере publish ждёт"""
+        publisher = make_publisher(broker, queue_max_size=1)
+        # Flusher не запущен: буфер не разбирается
+        publisher._flusher = asyncio.create_task(asyncio.sleep(3600))
+
+        first = asyncio.create_task(publisher.publish("recipe.created", {}))
+        second = asyncio.create_task(publisher.publish("recipe.created", {}))
+        await asyncio.sleep(0.01)
+
+        assert publisher.stats()["queue_depth"] == 1
+        assert not first.done() and not second.done()
+
+        for task in (first, second, publisher._flusher):
+            task.cancel()
+        await asyncio.gather(first, second, publisher._flusher,
+                             return_exceptions=True)
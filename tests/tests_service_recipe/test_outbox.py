@@ -0,0 +1,210 @@
+"""
+Тесты transactional outbox и релея
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from uuid import uuid4
+
+from backend.service_recipe.src.models import OutboxEvent
+from backend.service_recipe.src.repositories import AsyncSQLOutboxRepository
+from backend.service_recipe.src.repositories.recipe_statements import (
+    build_recipe_insert
+)
+from backend.service_recipe.src.service import OutboxRelay
+from backend.shared.database import AsyncSessionManager
+
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+async def session_manager(sqlite_engine):
+    manager = AsyncSessionManager(sqlite_engine)
+    async with manager.get_db_context() as db:
+        for n in range(3):
+            db.add(OutboxEvent(
+                routing_key="recipe.created",
+                payload={"recipe_id": str(n)},
+                created_at=BASE_TIME + timedelta(seconds=n)
+            ))
+
+    return manager
+
+
+async def load_events(manager: AsyncSessionManager) -> list[OutboxEvent]:
+    async with manager.get_db_context(auto_commit=False) as db:
+        result = await db.execute(
+            select(OutboxEvent).order_by(OutboxEvent.created_at))
+        return list(result.scalars().all())
+
+
+class TestOutboxInsert:
+    """Событие пишется тем же выражением, что и рецепт"""
+
+    def test_outbox_rendered_in_recipe_statement(self):
+        recipe_id = uuid4()
+        prepared = build_recipe_insert(
+            uuid4(), "Борщ", "Описание", [],
+            recipe_id=recipe_id,
+            outbox_events=[{
+                "routing_key": "recipe.created",
+                "payload": {"recipe_id": str(recipe_id)}
+            }]
+        )
+
+        sql = str(prepared.statement.compile(dialect=postgresql.dialect()))
+
+        assert "INSERT INTO outbox" in sql
+        assert prepared.recipe_values["id"] == recipe_id
+
+
+class TestOutboxRelay:
+    """Тесты OutboxRelay"""
+
+    async def test_batch_published_and_marked_sent(self, session_manager):
+        """Пачка публикуется и отмечается отправленной"""
+        publisher = AsyncMock()
+        relay = OutboxRelay(session_manager, publisher,
+                            batch_size=10, poll_interval=0.01)
+
+        assert await relay.relay_batch() == 3
+        assert sorted(c.args[1]["recipe_id"]
+                      for c in publisher.publish.await_args_list) == [
+            "0", "1", "2"]
+        assert all(e.sent_at is not None
+                   for e in await load_events(session_manager))
+        assert await relay.relay_batch() == 0
+
+    async def test_failed_events_stay_pending(self, session_manager):
+        """Неподтверждённые события остаются в outbox и считают попытки"""
+        publisher = AsyncMock()
+        publisher.publish.side_effect = [
+            None, ConnectionError("nack"), None]
+        relay = OutboxRelay(session_manager, publisher,
+                            batch_size=10, poll_interval=0.01)
+
+        assert await relay.relay_batch() == 2
+
+        events = await load_events(session_manager)
+        assert events[0].sent_at is not None
+        assert events[1].sent_at is None and events[1].attempts == 1
+        assert events[2].sent_at is not None
+
+    async def test_start_and_stop(self, session_manager):
+        """Фоновая задача разбирает outbox и корректно останавливается"""
+        publisher = AsyncMock()
+        relay = OutboxRelay(session_manager, publisher,
+                            batch_size=2, poll_interval=0.01)
+
+        relay.start()
+        for _ in range(100):
+            if publisher.publish.await_count == 3:
+                break
+            await asyncio.sleep(0.01)
+        await relay.stop()
+
+        assert publisher.publish.await_count == 3
+        assert relay._task is None
+
+    async def test_poison_event_is_marked_dead(self, session_manager):
+        """После max_attempts неудач событие больше не выбирается"""
+        publisher = AsyncMock()
+        publisher.publish.side_effect = lambda key, payload: (
+            _raise(TypeError("not serializable"))
+            if payload["recipe_id"] == "1" else None)
+        relay = OutboxRelay(session_manager, publisher,
+                            batch_size=10, poll_interval=0.01,
+                            max_attempts=2)
+
+        await relay.relay_batch()
+        await relay.relay_batch()
+        publisher.publish.reset_mock()
+        await relay.relay_batch()
+
+        publisher.publish.assert_not_awaited()
+        poison = (await load_events(session_manager))[1]
+        assert poison.attempts == 2
+        assert poison.dead_at is not None and poison.sent_at is None
+
+    async def test_publish_runs_outside_claim_transaction(
+        self, session_manager
+    ):
+        """Во время публикации события уже взяты и не блокируют БД"""
+        claimed_by_other = []
+
+        async def publish(key, payload):
+            async with session_manager.get_db_context() as db:
+                claimed_by_other.extend(
+                    await AsyncSQLOutboxRepository(db).claim_pending(
+                        10, timedelta(seconds=60)))
+
+        publisher = AsyncMock()
+        publisher.publish.side_effect = publish
+        relay = OutboxRelay(session_manager, publisher,
+                            batch_size=10, poll_interval=0.01)
+
+        assert await relay.relay_batch() == 3
+        assert claimed_by_other == []
+        assert all(e.claimed_until is None
+                   for e in await load_events(session_manager))
+
+    async def test_unconfirmed_publish_times_out(self, session_manager):
+        """Зависший confirm ограничен publish_timeout и считается неудачей"""
+        async def hang(key, payload):
+            await asyncio.sleep(60)
+
+        publisher = AsyncMock()
+        publisher.publish.side_effect = hang
+        relay = OutboxRelay(session_manager, publisher,
+                            batch_size=10, poll_interval=0.01,
+                            publish_timeout=0.05, claim_lease=1.0)
+
+        assert await relay.relay_batch() == 0
+
+        events = await load_events(session_manager)
+        assert all(e.attempts == 1 and e.sent_at is None
+                   and e.claimed_until is None for e in events)
+
+    async def test_expired_claim_is_taken_again(self, session_manager):
+        """Событие упавшего релея снова доступно после истечения аренды"""
+        async with session_manager.get_db_context() as db:
+            repo = AsyncSQLOutboxRepository(db)
+            assert len(await repo.claim_pending(
+                1, timedelta(seconds=-1))) == 1
+            assert len(await repo.claim_pending(
+                10, timedelta(seconds=60))) == 3
+            assert await repo.claim_pending(10, timedelta(seconds=60)) == []
+
+    def test_lease_must_exceed_publish_timeout(self, session_manager):
+        with pytest.raises(ValueError):
+            OutboxRelay(session_manager, AsyncMock(),
+                        batch_size=10, poll_interval=0.01,
+                        publish_timeout=10, claim_lease=10)
+
+    async def test_prune_deletes_old_sent_events(self, session_manager):
+        """Удаляются только отправленные события старше срока хранения"""
+        now = datetime.now(timezone.utc)
+        async with session_manager.get_db_context() as db:
+            events = (await db.execute(
+                select(OutboxEvent).order_by(OutboxEvent.created_at)
+            )).scalars().all()
+            events[0].sent_at = now - timedelta(hours=48)
+            events[1].sent_at = now - timedelta(hours=1)
+
+        relay = OutboxRelay(session_manager, AsyncMock(),
+                            batch_size=10, poll_interval=0.01,
+                            sent_retention_hours=24, prune_batch_size=1)
+
+        assert await relay.prune_sent() == 1
+        assert [e.payload["recipe_id"]
+                for e in await load_events(session_manager)] == ["1", "2"]
+
+
+def _raise(error: Exception):
+    raise error
@@ -0,0 +1,136 @@
+"""
+Тесты SQL-выражений репозитория рецептов
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from backend.service_recipe.src.models import Recipe, Ingredient
+from backend.service_recipe.src.repositories import AsyncSQLRecipeRepository
+from backend.service_recipe.src.repositories.recipe_statements import (
+    build_recipe_insert
+)
+from backend.service_recipe.src.service.mappers import RecipeMapper
+
+
+INGREDIENTS = [
+    {"ingredient": "Свекла", "quantity": "300", "unit": "г"},
+    {"ingredient": "Капуста", "quantity": "200", "unit": "г"},
+]
+
+
+class TestBuildRecipeInsert:
+    """Тесты построителя вставки рецепта"""
+
+    def test_single_statement_inserts_recipe_and_ingredients(self):
+        """Рецепт и ингредиенты вставляются одним выражением"""
+        prepared = build_recipe_insert(uuid4(), "Борщ", "Описание", INGREDIENTS)
+
+        sql = str(prepared.statement.compile(dialect=postgresql.dialect()))
+
+        assert sql.count("INSERT INTO recipes") == 1
+        assert sql.count("INSERT INTO ingredients") == 1
+        assert "RETURNING recipes.created_at, recipes.updated_at" in sql
+
+    def test_empty_ingredients_skip_ingredient_insert(self):
+        """Без ингредиентов вставка в ingredients не рендерится"""
+        prepared = build_recipe_insert(uuid4(), "Чай", "Просто чай", [])
+
+        sql = str(prepared.statement.compile(dialect=postgresql.dialect()))
+
+        assert "INSERT INTO ingredients" not in sql
+        assert prepared.ingredient_values == []
+
+    def test_ingredients_reference_generated_recipe_id(self):
+        """Ингредиенты ссылаются на сгенерированный на клиенте id"""
+        prepared = build_recipe_insert(uuid4(), "Борщ", "Описание", INGREDIENTS)
+
+        recipe_id = prepared.recipe_values["id"]
+        assert all(
+            values["recipe_id"] == recipe_id
+            for values in prepared.ingredient_values
+        )
+
+    def test_build_recipe_from_returning_row(self):
+        """Ответ собирается из RETURNING без повторного SELECT"""
+        user_id = uuid4()
+        prepared = build_recipe_insert(user_id, "Борщ", "Описание", INGREDIENTS)
+        now = datetime.now(timezone.utc)
+        row = SimpleNamespace(created_at=now, updated_at=now)
+
+        response = RecipeMapper.to_response(prepared.build_recipe(row))
+
+        assert response.id == prepared.recipe_values["id"]
+        assert response.user_id == user_id
+        assert response.created_at == now
+        assert [i.ingredient for i in response.ingredients] == [
+            "Свекла", "Капуста"
+        ]
+
+
+class TestListPage:
+    """Тесты keyset-пагинации на SQLite (aiosqlite)"""
+
+    BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    @pytest.fixture
+    async def session_factory(self, sqlite_engine):
+        factory = async_sessionmaker(sqlite_engine, expire_on_commit=False)
+        user_id = uuid4()
+        async with factory() as session:
+            for n in range(5):
+                # Временные метки явно: порядок страниц детерминирован
+                created_at = self.BASE_TIME + timedelta(minutes=n)
+                session.add(Recipe(
+                    user_id=user_id if n % 2 == 0 else uuid4(),
+                    name_recipe=f"Рецепт {n}",
+                    description="Описание рецепта",
+                    created_at=created_at,
+                    updated_at=created_at,
+                    ingredients=[Ingredient(
+                        ingredient="Вода",
+                        quantity="1",
+                        unit="л",
+                        created_at=created_at,
+                        updated_at=created_at
+                    )]
+                ))
+            await session.commit()
+
+        factory.user_id = user_id
+        return factory
+
+    async def test_pages_follow_keyset_without_overlap(self, session_factory):
+        """Страницы идут от новых к старым без повторов"""
+        async with session_factory() as session:
+            repo = AsyncSQLRecipeRepository(session)
+
+            first = await repo.list_page(limit=2)
+            last = first[-1]
+            second = await repo.list_page(
+                limit=2, after=(last.created_at, last.id))
+
+        assert [r.name_recipe for r in first] == ["Рецепт 4", "Рецепт 3"]
+        assert [r.name_recipe for r in second] == ["Рецепт 2", "Рецепт 1"]
+
+    async def test_ingredients_loaded_with_page(self, session_factory):
+        """Ингредиенты доступны без ленивой загрузки"""
+        async with session_factory() as session:
+            page = await AsyncSQLRecipeRepository(session).list_page(limit=5)
+
+        assert all(len(recipe.ingredients) == 1 for recipe in page)
+
+    async def test_filter_by_user_id(self, session_factory):
+        """Фильтр по автору"""
+        async with session_factory() as session:
+            page = await AsyncSQLRecipeRepository(session).list_page(
+                limit=10, user_id=session_factory.user_id)
+
+        assert [r.name_recipe for r in page] == [
+            "Рецепт 4", "Рецепт 2", "Рецепт 0"
+        ]
@@ -2,6 +2,8 @@
 Тесты сервисного слоя RecipeService
 """
 
+import base64
+import json
 from datetime import datetime
 from unittest.mock import Mock
 from uuid import uuid4
@@ -9,6 +11,11 @@ from uuid import uuid4
 import pytest
 
 from backend.service_recipe.src.schemas import RecipeCreate, IngredientSchema
+from backend.service_recipe.src.service.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor
+)
 from backend.service_recipe.src.service.recipe_service import RecipeService
 
 
@@ -61,7 +68,7 @@ class TestRecipeService:
             ]
         )
 
-    def test_create_recipe_returns_response(
+    async def test_create_recipe_returns_response(
             self, mock_recipe_repo,
             mock_recipe_model, recipe_create_data):
         """Создание рецепта должно возвращать RecipeResponse"""
@@ -71,7 +78,7 @@ class TestRecipeService:
         mock_recipe_repo.create.return_value = mock_recipe_model
 
         service = RecipeService(recipe_repo=mock_recipe_repo)
-        result = service.create_recipe(
+        result = await service.create_recipe(
             recipe_data=recipe_create_data,
             user_id=user_id
         )
@@ -82,7 +89,7 @@ class TestRecipeService:
         assert result.description == "Вкусный украинский борщ"
         assert len(result.ingredients) == 1
 
-    def test_create_recipe_calls_repo_with_correct_data(
+    async def test_create_recipe_calls_repo_with_correct_data(
             self, mock_recipe_repo, mock_recipe_model,
             recipe_create_data):
         """Сервис должен передавать правильные данные в репозиторий"""
@@ -91,17 +98,33 @@ class TestRecipeService:
         mock_recipe_repo.create.return_value = mock_recipe_model
 
         service = RecipeService(recipe_repo=mock_recipe_repo)
-        service.create_recipe(recipe_data=recipe_create_data, user_id=user_id)
+        await service.create_recipe(
+            recipe_data=recipe_create_data, user_id=user_id)
 
         # Проверяем, что репозиторий был вызван с правильными аргументами
-        mock_recipe_repo.create.assert_called_once()
+        mock_recipe_repo.create.assert_awaited_once()
 
         call_kwargs = mock_recipe_repo.create.call_args.kwargs
         assert call_kwargs['user_id'] == user_id
         assert call_kwargs['name_recipe'] == "Борщ"
         assert call_kwargs['description'] == "Вкусный украинский борщ"
 
-    def test_create_recipe_maps_ingredients_correctly(
+    async def test_create_recipe_writes_created_event_to_outbox(
+            self, mock_recipe_repo, mock_recipe_model,
+            recipe_create_data):
+        """Событие recipe.created передаётся в репозиторий вместе с рецептом"""
+        mock_recipe_repo.create.return_value = mock_recipe_model
+
+        service = RecipeService(recipe_repo=mock_recipe_repo)
+        await service.create_recipe(
+            recipe_data=recipe_create_data, user_id=uuid4())
+
+        call_kwargs = mock_recipe_repo.create.call_args.kwargs
+        [event] = call_kwargs['outbox_events']
+        assert event['routing_key'] == "recipe.created"
+        assert event['payload']['recipe_id'] == str(call_kwargs['recipe_id'])
+
+    async def test_create_recipe_maps_ingredients_correctly(
             self, mock_recipe_repo, mock_recipe_model,
             recipe_create_data):
         """Ингредиенты должны маппиться правильно в формат для БД"""
@@ -110,7 +133,8 @@ class TestRecipeService:
         mock_recipe_repo.create.return_value = mock_recipe_model
 
         service = RecipeService(recipe_repo=mock_recipe_repo)
-        service.create_recipe(recipe_data=recipe_create_data, user_id=user_id)
+        await service.create_recipe(
+            recipe_data=recipe_create_data, user_id=user_id)
 
         # Проверяем структуру ингредиентов
         call_kwargs = mock_recipe_repo.create.call_args.kwargs
@@ -128,13 +152,14 @@ class TestRecipeService:
             "unit": "г"
         }
 
-    def test_create_recipe_with_empty_ingredients(self, mock_recipe_repo):
+    async def test_create_recipe_with_empty_ingredients(self, mock_recipe_repo):
         """Создание рецепта без ингредиентов должно работать"""
         user_id = uuid4()
 
         # Мок рецепта без ингредиентов
         mock_recipe = Mock()
         mock_recipe.id = uuid4()
+        mock_recipe.user_id = user_id
         mock_recipe.name_recipe = "Чай"
         mock_recipe.description = "Просто чай"
         mock_recipe.ingredients = []
@@ -150,13 +175,13 @@ class TestRecipeService:
         )
 
         service = RecipeService(recipe_repo=mock_recipe_repo)
-        result = service.create_recipe(
+        result = await service.create_recipe(
             recipe_data=recipe_data, user_id=user_id)
 
         assert result.name_recipe == "Чай"
         assert len(result.ingredients) == 0
 
-    def test_create_recipe_returns_correct_response_fields(
+    async def test_create_recipe_returns_correct_response_fields(
             self, mock_recipe_repo,
             mock_recipe_model, recipe_create_data):
         """Response должен содержать все необходимые поля"""
@@ -165,7 +190,7 @@ class TestRecipeService:
         mock_recipe_repo.create.return_value = mock_recipe_model
 
         service = RecipeService(recipe_repo=mock_recipe_repo)
-        result = service.create_recipe(
+        result = await service.create_recipe(
             recipe_data=recipe_create_data, user_id=user_id)
 
         # Проверяем все поля ответа
@@ -175,3 +200,69 @@ class TestRecipeService:
         assert hasattr(result, 'ingredients')
         assert hasattr(result, 'created_at')
         assert hasattr(result, 'updated_at')
+
+
+class TestRecipeListing:
+    """Тесты списка рецептов с курсорами"""
+
+    @staticmethod
+    def make_recipe(minute: int):
+        recipe = Mock()
+        recipe.id = uuid4()
+        recipe.user_id = uuid4()
+        recipe.name_recipe = f"Рецепт {minute}"
+        recipe.description = "Описание рецепта"
+        recipe.ingredients = []
+        recipe.created_at = datetime(2026, 1, 1, 12, minute)
+        recipe.updated_at = None
+        return recipe
+
+    def test_cursor_roundtrip(self):
+        """Курсор декодируется в исходную позицию"""
+        created_at = datetime(2026, 1, 1, 12, 0)
+        recipe_id = uuid4()
+
+        assert decode_cursor(encode_cursor(created_at, recipe_id)) == (
+            created_at, recipe_id)
+
+    def test_invalid_cursor_raises(self):
+        """Мусорный курсор — InvalidCursorError"""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("not-a-cursor")
+
+    @pytest.mark.parametrize("payload", [
+        ["2020-01-01", 123],
+        ["2020-01-01"],
+        {"created_at": "2020-01-01"},
+        "2020-01-01",
+        None,
+    ])
+    def test_cursor_of_wrong_shape_raises(self, payload):
+        """Валидный JSON не той формы — InvalidCursorError, а не 500"""
+        cursor = base64.urlsafe_b64encode(
+            json.dumps(payload).encode()).rstrip(b"=").decode()
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+    async def test_next_cursor_points_to_last_item(self, mock_recipe_repo):
+        """При наличии следующей страницы курсор указывает на последний"""
+        recipes = [self.make_recipe(m) for m in (3, 2, 1)]
+        mock_recipe_repo.list_page.return_value = recipes
+
+        service = RecipeService(recipe_repo=mock_recipe_repo)
+        page = await service.list_recipes(limit=2)
+
+        assert len(page.items) == 2
+        assert decode_cursor(page.next_cursor) == (
+            recipes[1].created_at, recipes[1].id)
+        assert mock_recipe_repo.list_page.call_args.kwargs["limit"] == 3
+
+    async def test_last_page_has_no_cursor(self, mock_recipe_repo):
+        """Последняя страница без курсора"""
+        mock_recipe_repo.list_page.return_value = [self.make_recipe(1)]
+
+        service = RecipeService(recipe_repo=mock_recipe_repo)
+        page = await service.list_recipes(limit=2)
+
+        assert page.next_cursor is None
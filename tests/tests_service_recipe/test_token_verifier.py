@@ -0,0 +1,321 @@
+"""
+Тесты проверки access токенов в recipe_service
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+from google.rpc import status_pb2
+from jose import jwt
+
+from backend.service_recipe.src.infrastructure.token_verifier import (
+    GrpcTokenVerifier,
+    JwksTokenVerifier,
+    LocalTokenVerifier,
+    TokenVersionChecker
+)
+from backend.service_user.src.core import JWTService, KeyRing
+from backend.service_user.src.core.key_ring import generate_key
+from backend.shared.cache import LRUTTLCache
+
+
+SECRET = "test-secret"
+ALGORITHM = "HS256"
+
+
+def make_token(token_type="access", expires_in=timedelta(minutes=5),
+               secret=SECRET, **claims):
+    payload = {
+        "sub": str(uuid4()),
+        "email": "user@example.com",
+        "type": token_type,
+        "exp": datetime.now(timezone.utc) + expires_in,
+        **claims
+    }
+    return jwt.encode(payload, secret, algorithm=ALGORITHM)
+
+
+class TestLocalTokenVerifier:
+    """Тесты LocalTokenVerifier"""
+
+    @pytest.fixture
+    def verifier(self):
+        return LocalTokenVerifier(secret_key=SECRET, algorithm=ALGORITHM)
+
+    async def test_valid_access_token(self, verifier):
+        """Валидный access токен принимается"""
+        result = await verifier.verify(make_token())
+
+        assert result["valid"] is True
+        assert result["email"] == "user@example.com"
+
+    async def test_expired_token_rejected(self, verifier):
+        """Истёкший токен отклоняется"""
+        result = await verifier.verify(
+            make_token(expires_in=timedelta(minutes=-1)))
+
+        assert result == {"valid": False, "user_id": "", "email": "",
+                          "error": "Token expired"}
+
+    async def test_wrong_signature_rejected(self, verifier):
+        """Токен с чужой подписью отклоняется"""
+        result = await verifier.verify(make_token(secret="other"))
+
+        assert result["valid"] is False
+
+    async def test_refresh_token_rejected(self, verifier):
+        """Refresh токен не годится для доступа"""
+        result = await verifier.verify(make_token(token_type="refresh"))
+
+        assert result["valid"] is False
+        assert result["error"] == "Invalid token type"
+
+
+def user_client(token_version=0, **user):
+    """Клиент user_service, отдающий пользователя с версией токенов"""
+    client = AsyncMock()
+    client.load_user.return_value = {
+        "exists": True, "token_version": token_version, **user}
+    return client
+
+
+class TestTokenVersionCheck:
+    """Проверка claim ver в процессе"""
+
+    @pytest.fixture
+    def cache(self):
+        return LRUTTLCache(max_size=100, ttl_seconds=5)
+
+    def verifier(self, client, cache):
+        return LocalTokenVerifier(
+            secret_key=SECRET,
+            algorithm=ALGORITHM,
+            versions=TokenVersionChecker(client, cache)
+        )
+
+    async def test_current_version_accepted(self, cache):
+        """Токен с актуальной версией принимается"""
+        verifier = self.verifier(user_client(token_version=2), cache)
+
+        result = await verifier.verify(make_token(ver=2))
+
+        assert result["valid"] is True
+
+    async def test_revoked_version_rejected(self, cache):
+        """После logout-all старый ver отклоняется"""
+        verifier = self.verifier(user_client(token_version=3), cache)
+
+        result = await verifier.verify(make_token(ver=2))
+
+        assert result["error"] == "Token revoked"
+
+    async def test_token_without_ver_is_version_zero(self, cache):
+        """Токен без ver считается версией 0"""
+        verifier = self.verifier(user_client(token_version=0), cache)
+
+        assert (await verifier.verify(make_token()))["valid"] is True
+
+    async def test_missing_user_rejected(self, cache):
+        """Удалённый пользователь — токен не принимается"""
+        client = AsyncMock()
+        client.load_user.return_value = {"exists": False}
+        verifier = self.verifier(client, cache)
+
+        assert (await verifier.verify(make_token()))["valid"] is False
+
+    async def test_version_cached_within_ttl(self, cache):
+        """В пределах TTL версия не запрашивается повторно"""
+        client = user_client(token_version=1)
+        verifier = self.verifier(client, cache)
+        token = make_token(ver=1)
+
+        await verifier.verify(token)
+        await verifier.verify(token)
+
+        client.load_user.assert_awaited_once()
+
+    async def test_user_service_error_rejected(self, cache):
+        """Недоступность user_service не пропускает токен"""
+        client = AsyncMock()
+        client.load_user.return_value = {
+            "exists": False, "error": "UNAVAILABLE"}
+        verifier = self.verifier(client, cache)
+
+        result = await verifier.verify(make_token())
+
+        assert result["error"] == "Token version check failed"
+        assert len(cache) == 0
+
+    async def test_invalid_token_skips_version_lookup(self, cache):
+        """Невалидный токен отклоняется без запроса версии"""
+        client = user_client()
+        verifier = self.verifier(client, cache)
+
+        await verifier.verify(make_token(secret="other"))
+
+        client.load_user.assert_not_awaited()
+
+
+class TestGrpcTokenVerifier:
+    """Тесты GrpcTokenVerifier"""
+
+    async def test_status_error_converted_to_message(self):
+        """Ошибка google.rpc.Status превращается в строку"""
+        client = AsyncMock()
+        client.validate_token.return_value = {
+            "valid": False,
+            "user_id": "",
+            "email": "",
+            "error": status_pb2.Status(code=16, message="Invalid token")
+        }
+
+        result = await GrpcTokenVerifier(client).verify("token")
+
+        assert result["valid"] is False
+        assert result["error"] == "Invalid token"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestJwksTokenVerifier:
+    """Тесты JwksTokenVerifier"""
+
+    @pytest.fixture
+    def keys_dir(self, tmp_path):
+        generate_key(tmp_path, "k1")
+        return tmp_path
+
+    @staticmethod
+    def issue(keys_dir, token_type="access"):
+        service = JWTService(
+            secret_key="unused",
+            algorithm="ES256",
+            access_token_expire_minutes=5,
+            refresh_token_expire_days=1,
+            key_ring=KeyRing.from_directory(keys_dir, "ES256")
+        )
+        if token_type == "refresh":
+            return service.create_refresh_token({"sub": "user-1"})
+        return service.create_access_token({"sub": "user-1"})
+
+    @staticmethod
+    def jwks_fetch(keys_dir):
+        return AsyncMock(side_effect=lambda url: KeyRing.from_directory(
+            keys_dir, "ES256").jwks())
+
+    async def test_valid_token_verified_with_public_key(self, keys_dir):
+        """Токен проверяется публичным ключом из JWKS"""
+        fetch = self.jwks_fetch(keys_dir)
+        verifier = JwksTokenVerifier("http://jwks", fetch=fetch)
+
+        result = await verifier.verify(self.issue(keys_dir))
+        await verifier.verify(self.issue(keys_dir))
+
+        assert result["valid"] is True
+        assert result["user_id"] == "user-1"
+        fetch.assert_awaited_once()
+
+    async def test_unknown_kid_triggers_refresh(self, keys_dir):
+        """Неизвестный kid (ротация) перечитывает JWKS"""
+        clock = FakeClock()
+        fetch = self.jwks_fetch(keys_dir)
+        verifier = JwksTokenVerifier(
+            "http://jwks", fetch=fetch, min_refresh_interval=10, clock=clock)
+        await verifier.verify(self.issue(keys_dir))
+
+        generate_key(keys_dir, "k2")
+        clock.now = 11.0
+        result = await verifier.verify(self.issue(keys_dir))
+
+        assert result["valid"] is True
+        assert fetch.await_count == 2
+
+    async def test_refresh_rate_limited(self, keys_dir):
+        """Поток токенов с чужим kid не вызывает шквал загрузок JWKS"""
+        fetch = self.jwks_fetch(keys_dir)
+        verifier = JwksTokenVerifier(
+            "http://jwks", fetch=fetch, min_refresh_interval=10,
+            clock=FakeClock())
+        forged = jwt.encode(
+            {"sub": "x", "type": "access"}, "s", algorithm="HS256",
+            headers={"kid": "unknown"})
+
+        results = [await verifier.verify(forged) for _ in range(5)]
+
+        assert all(r["error"] == "Unknown signing key" for r in results)
+        fetch.assert_awaited_once()
+
+    async def test_refresh_token_rejected(self, keys_dir):
+        """Refresh токен не принимается как access"""
+        verifier = JwksTokenVerifier(
+            "http://jwks", fetch=self.jwks_fetch(keys_dir))
+
+        result = await verifier.verify(self.issue(keys_dir, "refresh"))
+
+        assert result["error"] == "Invalid token type"
+
+    async def test_fetch_failure_keeps_cached_keys(self, keys_dir):
+        """Ошибка загрузки JWKS не сбрасывает уже известные ключи"""
+        clock = FakeClock()
+        fetch = self.jwks_fetch(keys_dir)
+        verifier = JwksTokenVerifier(
+            "http://jwks", fetch=fetch, cache_ttl=60, clock=clock)
+        token = self.issue(keys_dir)
+        await verifier.verify(token)
+
+        fetch.side_effect = RuntimeError("unavailable")
+        clock.now = 61.0
+
+        assert (await verifier.verify(token))["valid"] is True
+        assert verifier.refresh_failures == 1
+
+    async def test_revoked_version_rejected(self, keys_dir):
+        """claim ver проверяется и в режиме jwks"""
+        verifier = JwksTokenVerifier(
+            "http://jwks",
+            fetch=self.jwks_fetch(keys_dir),
+            versions=TokenVersionChecker(
+                user_client(token_version=1),
+                LRUTTLCache(max_size=10, ttl_seconds=5)
+            )
+        )
+
+        result = await verifier.verify(self.issue(keys_dir))
+
+        assert result["error"] == "Token revoked"
+
+
+class TestContainerTokenVerifier:
+    """Выбор верификатора в контейнере"""
+
+    def test_config_and_verifier_built_once(self):
+        """.env читается один раз, верификатор переиспользуется"""
+        from backend.service_recipe.src.infrastructure.container import (
+            Container)
+
+        container = Container()
+
+        assert container.user_config() is container.user_config()
+        assert container.token_verifier() is container.token_verifier()
+
+    def test_token_cache_ttl_capped_by_version_ttl(self):
+        """Кэш ValidateToken не переживает TTL кэша версий"""
+        from backend.service_recipe.src.infrastructure.container import (
+            Container)
+
+        container = Container()
+        config = container.user_config()
+
+        assert container.user_service_client().token_cache.ttl_seconds == (
+            min(config.TOKEN_CACHE_TTL_SECONDS,
+                config.TOKEN_VERSION_CACHE_TTL_SECONDS))
+        assert container.token_version_checker().cache.ttl_seconds == (
+            config.TOKEN_VERSION_CACHE_TTL_SECONDS)
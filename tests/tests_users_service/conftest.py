@@ -1,6 +1,8 @@
 """Конфигурация pytest для user_service"""
 
 import os
+from datetime import datetime, timezone
+
 import pytest
 
 # Устанавливаем режим тестирования
@@ -48,3 +50,48 @@ def valid_name() -> str:
 def short_name() -> str:
     """Короткое имя пользователя"""
     return "ab"
+
+
+@pytest.fixture
+async def sqlite_engine():
+    """
+    Async SQLite engine со схемой user_service
+
+    Регистрирует timezone() и now(), чтобы server_default/onupdate
+    моделей (рассчитанные на PostgreSQL) работали в SQLite.
+    """
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from backend.service_user.src.models import (  # noqa: F401
+        User, RefreshToken, LoginAttempt
+    )
+    from backend.shared.models.base_model import Base
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def register_pg_functions(dbapi_connection, connection_record):
+        dbapi_connection.create_function(
+            "now", 0,
+            lambda: datetime.now(timezone.utc).strftime(
+                "%Y-%m-%d %H:%M:%S.%f")
+        )
+        dbapi_connection.create_function("timezone", 2, lambda tz, ts: ts)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db_session(sqlite_engine):
+    """Асинхронная сессия поверх sqlite_engine"""
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    async with async_sessionmaker(
+        sqlite_engine, expire_on_commit=False
+    )() as session:
+        yield session
@@ -0,0 +1,168 @@
+"""
+Тесты проверки доступности user_name/email через фильтр Блума
+"""
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from backend.service_user.src.app_users import create_app
+from backend.service_user.src.core.bloom_filter import BloomFilter
+from backend.service_user.src.repositories import AsyncSQLUserRepository
+from backend.service_user.src.service import AvailabilityService
+from backend.shared.database import AsyncSessionManager
+
+
+class CountingSessionManager(AsyncSessionManager):
+    """Считает обращения к БД"""
+
+    def __init__(self, engine):
+        super().__init__(engine)
+        self.contexts = 0
+
+    def get_db_context(self, auto_commit=True):
+        self.contexts += 1
+        return super().get_db_context(auto_commit=auto_commit)
+
+
+@pytest.fixture
+async def manager(sqlite_engine, db_session):
+    await AsyncSQLUserRepository(db_session).create_user_if_absent({
+        "user_name": "john_doe",
+        "email": "john@example.com",
+        "hashed_password": "hash"
+    })
+    return CountingSessionManager(sqlite_engine)
+
+
+@pytest.fixture
+def availability(manager):
+    return AvailabilityService(manager, capacity=1000, error_rate=0.01)
+
+
+class TestBloomFilter:
+    """Размер и доля ложных срабатываний"""
+
+    def test_false_positive_rate_within_bound(self):
+        bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+        for i in range(10_000):
+            bloom.add(f"user{i}")
+
+        assert all(f"user{i}" in bloom for i in range(10_000))
+        false_positives = sum(f"other{i}" in bloom for i in range(10_000))
+        assert false_positives / 10_000 < 0.02
+        assert bloom.stats()["estimated_false_positive_rate"] < 0.02
+
+    @pytest.mark.parametrize("capacity, error_rate", [(0, 0.01), (10, 1.0)])
+    def test_invalid_parameters(self, capacity, error_rate):
+        with pytest.raises(ValueError):
+            BloomFilter(capacity, error_rate)
+
+
+class TestAvailabilityService:
+    """Промах по фильтру отвечается без БД"""
+
+    async def test_before_load_every_probe_hits_db(
+        self, availability, manager
+    ):
+        assert await availability.check(user_name="free_name") == {
+            "user_name": True}
+        assert manager.contexts == 1
+
+    async def test_free_value_skips_db_after_load(
+        self, availability, manager
+    ):
+        assert await availability.load() == 1
+        manager.contexts = 0
+
+        result = await availability.check(
+            user_name="free_name", email="free@example.com")
+
+        assert result == {"user_name": True, "email": True}
+        assert manager.contexts == 0
+        assert availability.stats()["definitely_free"] == 2
+
+    async def test_taken_value_is_confirmed_by_index(
+        self, availability, manager
+    ):
+        await availability.load()
+        manager.contexts = 0
+
+        result = await availability.check(
+            user_name="john_doe", email=" John@Example.com ")
+
+        assert result == {"user_name": False, "email": False}
+        assert manager.contexts == 2
+
+    async def test_false_positive_is_counted(self, availability):
+        await availability.load()
+        availability.add("ghost", "ghost@example.com")
+
+        assert await availability.check(user_name="ghost") == {
+            "user_name": True}
+        assert availability.stats()["false_positives"] == 1
+
+    async def test_registration_is_added(self, availability):
+        await availability.load()
+        availability.add("jane_doe", "jane@example.com")
+
+        assert availability._key("user_name", " jane_doe ") in (
+            availability.bloom)
+        assert availability._key("email", "Jane@Example.com") in (
+            availability.bloom)
+
+    async def test_user_name_case_variant_skips_db(
+        self, availability, manager
+    ):
+        # user_name уникален с учётом регистра: John_Doe свободен
+        await availability.load()
+        manager.contexts = 0
+
+        assert await availability.check(user_name="John_Doe") == {
+            "user_name": True}
+        assert manager.contexts == 0
+        assert availability.stats()["false_positives"] == 0
+
+
+class TestAvailabilityEndpoint:
+    """GET /api/v1/register/availability"""
+
+    @pytest.fixture
+    async def client(self, availability):
+        from backend.service_user.src.infrastructure.dependencies import (
+            get_availability_service)
+
+        await availability.load()
+        app = create_app()
+        app.dependency_overrides[get_availability_service] = (
+            lambda: availability)
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test"
+        ) as client:
+            yield client
+
+    async def test_availability(self, client):
+        response = await client.get(
+            "/api/v1/register/availability",
+            params={"user_name": "john_doe", "email": "new@example.com"}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "user_name_available": False,
+            "email_available": True
+        }
+
+    async def test_single_field(self, client):
+        response = await client.get(
+            "/api/v1/register/availability",
+            params={"email": "new@example.com"}
+        )
+
+        assert response.json() == {"email_available": True}
+
+    async def test_requires_a_field(self, client):
+        response = await client.get("/api/v1/register/availability")
+
+        assert response.status_code == 422
@@ -0,0 +1,139 @@
+"""
+Тесты асимметричной подписи JWT, ротации ключей и JWKS endpoint
+"""
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from jose import jwt
+
+from backend.service_user.src.app_users import create_app
+from backend.service_user.src.core import JWTService, KeyRing, load_key_ring
+from backend.service_user.src.core.key_ring import generate_key
+
+
+def make_jwt_service(key_ring: KeyRing) -> JWTService:
+    return JWTService(
+        secret_key="unused",
+        algorithm="ES256",
+        access_token_expire_minutes=5,
+        refresh_token_expire_days=1,
+        key_ring=key_ring
+    )
+
+
+@pytest.fixture
+def keys_dir(tmp_path):
+    generate_key(tmp_path, "2026-01")
+    return tmp_path
+
+
+class TestKeyRing:
+    """Тесты набора ключей"""
+
+    def test_active_key_defaults_to_last_kid(self, keys_dir):
+        """Активный ключ по умолчанию — последний по имени"""
+        generate_key(keys_dir, "2026-02")
+
+        key_ring = KeyRing.from_directory(keys_dir, "ES256")
+
+        assert key_ring.active_kid == "2026-02"
+        assert {key["kid"] for key in key_ring.jwks()["keys"]} == {
+            "2026-01", "2026-02"}
+
+    def test_jwks_contains_only_public_part(self, keys_dir):
+        """В JWKS нет приватной части ключа"""
+        key = KeyRing.from_directory(keys_dir, "ES256").jwks()["keys"][0]
+
+        assert key["kty"] == "EC"
+        assert key["use"] == "sig"
+        assert "d" not in key
+
+    def test_hmac_algorithm_has_no_key_ring(self):
+        """Для HS256 набор ключей не нужен"""
+        assert load_key_ring("HS256", None, None) is None
+
+    def test_asymmetric_algorithm_requires_keys_dir(self):
+        """Для ES256 без каталога ключей — ошибка конфигурации"""
+        with pytest.raises(ValueError):
+            load_key_ring("ES256", None, None)
+
+
+class TestAsymmetricJWTService:
+    """Тесты подписи ES256"""
+
+    def test_token_signed_with_active_kid(self, keys_dir):
+        """Токен подписан активным ключом, kid в заголовке"""
+        service = make_jwt_service(KeyRing.from_directory(keys_dir, "ES256"))
+
+        token = service.create_access_token({"sub": "1"})
+
+        header = jwt.get_unverified_header(token)
+        assert header["alg"] == "ES256"
+        assert header["kid"] == "2026-01"
+        assert service.decode_token(token)["sub"] == "1"
+
+    def test_old_key_tokens_valid_during_rotation(self, keys_dir):
+        """После ротации токены старого ключа проверяются"""
+        old_service = make_jwt_service(
+            KeyRing.from_directory(keys_dir, "ES256"))
+        old_token = old_service.create_access_token({"sub": "1"})
+
+        generate_key(keys_dir, "2026-02")
+        new_service = make_jwt_service(
+            KeyRing.from_directory(keys_dir, "ES256"))
+
+        assert new_service.key_ring.active_kid == "2026-02"
+        assert new_service.decode_token(old_token)["sub"] == "1"
+
+    def test_retired_key_tokens_rejected(self, keys_dir, tmp_path_factory):
+        """Токен ключа, удалённого из набора, не проходит проверку"""
+        token = make_jwt_service(
+            KeyRing.from_directory(keys_dir, "ES256")
+        ).create_access_token({"sub": "1"})
+
+        other_dir = tmp_path_factory.mktemp("other")
+        generate_key(other_dir, "2026-02")
+        service = make_jwt_service(KeyRing.from_directory(other_dir, "ES256"))
+
+        assert service.decode_token(token) is None
+
+
+class TestJwksEndpoint:
+    """Тесты /.well-known/jwks.json"""
+
+    @pytest.mark.asyncio
+    async def test_jwks_served(self, keys_dir):
+        """Endpoint отдаёт публичные ключи"""
+        from backend.service_user.src.infrastructure.dependencies import (
+            get_key_ring)
+
+        app = create_app()
+        key_ring = KeyRing.from_directory(keys_dir, "ES256")
+        app.dependency_overrides[get_key_ring] = lambda: key_ring
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test"
+        ) as client:
+            response = await client.get("/.well-known/jwks.json")
+
+        assert response.status_code == 200
+        assert response.json() == key_ring.jwks()
+        assert "max-age" in response.headers["cache-control"]
+
+    @pytest.mark.asyncio
+    async def test_jwks_empty_for_hmac(self):
+        """С HMAC-подписью список ключей пуст"""
+        from backend.service_user.src.infrastructure.dependencies import (
+            get_key_ring)
+
+        app = create_app()
+        app.dependency_overrides[get_key_ring] = lambda: None
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test"
+        ) as client:
+            response = await client.get("/.well-known/jwks.json")
+
+        assert response.json() == {"keys": []}
@@ -0,0 +1,169 @@
+"""
+Тесты буферизованного журнала попыток входа и секций loginattempts
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import func, select
+
+from backend.service_user.src.exception import InvalidCredentialsException
+from backend.service_user.src.infrastructure.login_audit import (
+    LoginAttemptWriter,
+    expired_partitions,
+    partitions_to_create
+)
+from backend.service_user.src.models import LoginAttempt
+from backend.service_user.src.service import AuthService
+from backend.shared.database import AsyncSessionManager
+
+
+async def count_attempts(engine) -> int:
+    async with AsyncSessionManager(engine).SessionLocal() as session:
+        return await session.scalar(
+            select(func.count()).select_from(LoginAttempt))
+
+
+class CountingSessionManager(AsyncSessionManager):
+    """Считает транзакции записи"""
+
+    def __init__(self, engine):
+        super().__init__(engine)
+        self.contexts = 0
+
+    def get_db_context(self, auto_commit=True):
+        self.contexts += 1
+        return super().get_db_context(auto_commit=auto_commit)
+
+
+class TestLoginAttemptWriter:
+    """Пакетная запись попыток"""
+
+    async def test_rows_are_written_in_batches(self, sqlite_engine):
+        manager = CountingSessionManager(sqlite_engine)
+        writer = LoginAttemptWriter(manager, batch_size=10)
+
+        for i in range(25):
+            writer.record(f"user{i}@example.com", "10.0.0.1", i % 2 == 0)
+
+        assert await writer.flush() == 25
+        assert await count_attempts(sqlite_engine) == 25
+        # 25 строк — три INSERT (10 + 10 + 5)
+        assert manager.contexts == 3
+        assert writer.stats()["buffered"] == 0
+
+    async def test_batch_size_triggers_flush(self, sqlite_engine):
+        writer = LoginAttemptWriter(
+            AsyncSessionManager(sqlite_engine),
+            flush_interval_ms=60_000,
+            batch_size=5
+        )
+        await writer.start()
+        try:
+            for _ in range(5):
+                writer.record("john@example.com", "10.0.0.1", False,
+                              failure_reason="invalid_credentials")
+            for _ in range(50):
+                if writer.stats()["written"] == 5:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await writer.stop()
+
+        assert writer.stats()["written"] == 5
+
+    async def test_interval_and_stop_flush(self, sqlite_engine):
+        writer = LoginAttemptWriter(
+            AsyncSessionManager(sqlite_engine),
+            flush_interval_ms=10,
+            batch_size=1000
+        )
+        await writer.start()
+        writer.record("john@example.com", "10.0.0.1", True)
+        await asyncio.sleep(0.1)
+        assert writer.stats()["written"] == 1
+
+        writer.record("john@example.com", "10.0.0.1", True)
+        await writer.stop()
+
+        assert await count_attempts(sqlite_engine) == 2
+
+    async def test_buffer_is_bounded(self):
+        writer = LoginAttemptWriter(MagicMock(), max_buffer=3)
+
+        for _ in range(5):
+            writer.record("john@example.com", None, False)
+
+        assert writer.stats()["buffered"] == 3
+        assert writer.stats()["dropped"] == 2
+
+    async def test_failed_flush_is_counted(self):
+        manager = MagicMock()
+        manager.get_db_context.side_effect = RuntimeError("db down")
+        writer = LoginAttemptWriter(manager)
+
+        writer.record("john@example.com", "10.0.0.1", False)
+
+        assert await writer.flush() == 0
+        assert writer.stats()["failed"] == 1
+
+
+class TestPartitions:
+    """Расчёт месячных секций"""
+
+    def test_partitions_ahead_cross_year(self):
+        names = [name for name, _, _ in partitions_to_create(
+            datetime(2026, 11, 20, tzinfo=timezone.utc), 2)]
+
+        assert names == [
+            "loginattempts_y2026m11",
+            "loginattempts_y2026m12",
+            "loginattempts_y2027m01",
+        ]
+
+    def test_retention_keeps_whole_months(self):
+        names = [
+            "loginattempts_y2025m12",
+            "loginattempts_y2026m01",
+            "loginattempts_y2026m02",
+            "loginattempts_y2026m08",
+        ]
+
+        assert expired_partitions(
+            names, datetime(2026, 8, 1, tzinfo=timezone.utc), 6
+        ) == ["loginattempts_y2025m12", "loginattempts_y2026m01"]
+
+
+class TestLoginAudit:
+    """AuthService пишет попытки в журнал"""
+
+    async def test_failed_login_is_recorded(self):
+        audit = MagicMock()
+        user = MagicMock(hashed_password="hash")
+        auth_service = AuthService(
+            user_repo=MagicMock(get_user_by_email=AsyncMock(
+                return_value=user)),
+            password_hasher=MagicMock(
+                verify_password=AsyncMock(return_value=False)),
+            jwt_service=MagicMock(),
+            auth_config=MagicMock(),
+            auth_validator=MagicMock(),
+            mapper=MagicMock(),
+            token_repo=MagicMock(),
+            login_audit=audit
+        )
+
+        with pytest.raises(InvalidCredentialsException):
+            await auth_service.authenticate_and_create_tokens(
+                "john@example.com", "WrongPass456!", "10.0.0.1", "curl")
+
+        audit.record.assert_called_once_with(
+            email="john@example.com",
+            ip_address="10.0.0.1",
+            is_successful=False,
+            user_id=user.id,
+            user_agent="curl",
+            failure_reason="invalid_credentials"
+        )
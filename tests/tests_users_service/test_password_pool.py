@@ -0,0 +1,157 @@
+"""
+Тесты пула процессов для Argon2 и очереди допуска
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+
+from backend.service_user.src.exception import (
+    InvalidCredentialsException,
+    TooManyRequestsException
+)
+from backend.service_user.src.infrastructure.password_pool import (
+    PasswordHasherPool)
+from backend.service_user.src.service import AuthService
+
+
+POOL_MODULE = 'backend.service_user.src.infrastructure.password_pool'
+
+
+def thread_pool(max_workers: int) -> PasswordHasherPool:
+    return PasswordHasherPool(
+        max_workers=max_workers,
+        max_queue_size=0,
+        executor_factory=lambda: ThreadPoolExecutor(max_workers=max_workers)
+    )
+
+
+class TestPasswordHasherPool:
+    """Выполнение Argon2 вне event loop"""
+
+    async def test_hash_and_verify_in_process_pool(self):
+        pool = PasswordHasherPool(max_workers=1, max_queue_size=4)
+        try:
+            hashed = await pool.hash_password("SecurePass123!")
+
+            assert hashed.startswith("$argon2")
+            assert await pool.verify_password("SecurePass123!", hashed)
+            assert not await pool.verify_password("WrongPass456!", hashed)
+        finally:
+            pool.shutdown()
+
+        stats = pool.stats()
+        assert stats["completed"] == 3
+        assert stats["pending"] == 0
+        assert stats["hash_time"]["count"] == 3
+        assert stats["hash_time"]["avg_ms"] > 0
+
+    async def test_rejects_when_queue_is_full(self):
+        release = threading.Event()
+
+        def blocking_hash(password):
+            release.wait(5)
+            return "hash", 0.0
+
+        pool = thread_pool(max_workers=1)
+        with patch(f'{POOL_MODULE}._hash_password', blocking_hash):
+            first = asyncio.ensure_future(pool.hash_password("a"))
+            await asyncio.sleep(0)
+
+            with pytest.raises(TooManyRequestsException) as exc_info:
+                await pool.hash_password("b")
+
+            release.set()
+            assert await first == "hash"
+
+        pool.shutdown()
+        assert exc_info.value.status_code == 429
+        assert pool.stats()["rejected"] == 1
+        assert pool.stats()["completed"] == 1
+
+    async def test_queue_wait_excludes_hash_time(self):
+        pool = thread_pool(max_workers=1)
+        with patch(
+            f'{POOL_MODULE}._hash_password',
+            lambda password: ("hash", 0.25)
+        ):
+            await pool.hash_password("a")
+        pool.shutdown()
+
+        stats = pool.stats()
+        assert stats["hash_time"]["max_ms"] == 250.0
+        assert stats["queue_wait"]["max_ms"] < 250.0
+
+    def test_invalid_sizes(self):
+        with pytest.raises(ValueError):
+            PasswordHasherPool(max_workers=0)
+        with pytest.raises(ValueError):
+            PasswordHasherPool(max_queue_size=-1)
+
+
+class TestLoginUsesHasher:
+    """AuthService проверяет пароль через асинхронный хешер"""
+
+    async def test_wrong_password_is_rejected(self):
+        hasher = MagicMock(verify_password=AsyncMock(return_value=False))
+        auth_service = AuthService(
+            user_repo=MagicMock(get_user_by_email=AsyncMock(
+                return_value=MagicMock(hashed_password="hash"))),
+            password_hasher=hasher,
+            jwt_service=MagicMock(),
+            auth_config=MagicMock(),
+            auth_validator=MagicMock(),
+            mapper=MagicMock(),
+            token_repo=MagicMock()
+        )
+
+        with pytest.raises(InvalidCredentialsException):
+            await auth_service.authenticate_and_create_tokens(
+                "test@example.com", "WrongPass456!")
+
+        hasher.verify_password.assert_awaited_once_with(
+            "WrongPass456!", "hash")
+
+
+class TestMetricsEndpoint:
+    """/api/v1/metrics отдаёт метрики пула"""
+
+    async def test_metrics(self):
+        from backend.service_user.src.app_users import create_app
+        from backend.service_user.src.infrastructure.dependencies import (
+            get_availability_service,
+            get_expired_token_purger,
+            get_login_attempt_writer,
+            get_password_hasher,
+            get_password_rehasher,
+            get_token_version_service
+        )
+
+        app = create_app()
+        app.dependency_overrides[get_password_hasher] = (
+            lambda: thread_pool(max_workers=1))
+        app.dependency_overrides[get_login_attempt_writer] = (
+            lambda: MagicMock(stats=lambda: {"written": 0}))
+        app.dependency_overrides[get_availability_service] = (
+            lambda: MagicMock(stats=lambda: {"probes": 0}))
+        app.dependency_overrides[get_expired_token_purger] = (
+            lambda: MagicMock(stats=lambda: {"deleted": 0}))
+        app.dependency_overrides[get_password_rehasher] = (
+            lambda: MagicMock(stats=lambda: {"upgraded": 0}))
+        app.dependency_overrides[get_token_version_service] = (
+            lambda: MagicMock(cache=MagicMock(stats=lambda: {"size": 0})))
+
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test"
+        ) as client:
+            response = await client.get("/api/v1/metrics")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["password_hasher"]["rejected"] == 0
+        assert "p95_ms" in body["password_hasher"]["queue_wait"]
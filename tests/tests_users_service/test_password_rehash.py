@@ -0,0 +1,189 @@
+"""
+Тесты калибровки Argon2 и пересчёта устаревших хешей при входе
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.service_user.src.core import PasswordService
+from backend.service_user.src.core.argon2_calibration import (
+    MIN_MEMORY_KIB,
+    calibrate
+)
+from backend.service_user.src.exception import TooManyRequestsException
+from backend.service_user.src.repositories import AsyncSQLUserRepository
+from backend.service_user.src.service import (
+    AuthService,
+    PasswordRehashService
+)
+from backend.shared.database import AsyncSessionManager
+
+
+# Дешёвые параметры, чтобы тесты не тратили время на Argon2
+OLD = PasswordService(time_cost=1, memory_cost=8192, parallelism=1)
+NEW = PasswordService(time_cost=2, memory_cost=8192, parallelism=1)
+
+
+class FakeHasher:
+    """Хешер с параметрами NEW без пула процессов"""
+
+    def __init__(self, error: Exception | None = None):
+        self.error = error
+
+    def needs_update(self, hashed_password: str) -> bool:
+        return NEW.needs_update(hashed_password)
+
+    async def hash_password(self, password: str) -> str:
+        if self.error is not None:
+            raise self.error
+        return NEW.hash_password(password)
+
+
+class TestNeedsUpdate:
+    """Сравнение параметров хеша с текущими"""
+
+    def test_hash_with_other_params_needs_update(self):
+        hashed = OLD.hash_password("SecurePass123!")
+
+        assert NEW.needs_update(hashed)
+        assert not OLD.needs_update(hashed)
+        # Старый хеш по-прежнему проверяется
+        assert NEW.verify_password("SecurePass123!", hashed)
+
+    def test_settings_round_trip(self):
+        assert PasswordService(**NEW.settings()).settings() == NEW.settings()
+
+
+class TestCalibrate:
+    """Подбор параметров по замерам"""
+
+    @staticmethod
+    def fake_measure(time_cost, memory_cost, parallelism):
+        # 10 ms на проход на каждые 64 MiB
+        return time_cost * memory_cost / (64 * 1024) * 10
+
+    def test_increases_time_cost_up_to_target(self):
+        params = calibrate(
+            target_ms=45, max_memory_kib=64 * 1024, parallelism=2,
+            measure=self.fake_measure)
+
+        assert params.memory_cost == 64 * 1024
+        assert params.time_cost == 4
+        assert params.verify_ms <= 45
+
+    def test_halves_memory_when_single_pass_is_too_slow(self):
+        params = calibrate(
+            target_ms=12, max_memory_kib=256 * 1024, parallelism=2,
+            measure=self.fake_measure)
+
+        assert params.memory_cost == 64 * 1024
+        assert params.time_cost == 1
+
+    def test_memory_floor(self):
+        params = calibrate(
+            target_ms=0.1, max_memory_kib=64 * 1024, parallelism=1,
+            measure=self.fake_measure)
+
+        assert params.memory_cost >= MIN_MEMORY_KIB
+        assert params.time_cost == 1
+
+        with pytest.raises(ValueError):
+            calibrate(target_ms=10, max_memory_kib=1024, parallelism=1)
+
+    def test_env_output(self):
+        params = calibrate(
+            target_ms=45, max_memory_kib=64 * 1024, parallelism=2,
+            measure=self.fake_measure)
+
+        env = params.to_env()
+        assert "USER_SERVICE_ARGON2_TIME_COST=4" in env
+        assert "USER_SERVICE_ARGON2_MEMORY_COST=65536" in env
+        assert "USER_SERVICE_ARGON2_PARALLELISM=2" in env
+
+
+class TestPasswordRehashService:
+    """Фоновый пересчёт хеша после входа"""
+
+    @pytest.fixture
+    async def user(self, db_session):
+        return await AsyncSQLUserRepository(
+            db_session).create_user_with_default_role({
+                "user_name": "john_doe",
+                "email": "john@example.com",
+                "hashed_password": OLD.hash_password("SecurePass123!")
+            })
+
+    async def test_stale_hash_is_upgraded(self, sqlite_engine, user):
+        rehasher = PasswordRehashService(
+            FakeHasher(), AsyncSessionManager(sqlite_engine))
+
+        task = rehasher.schedule(
+            user.id, "SecurePass123!", user.hashed_password)
+        await task
+
+        async with AsyncSessionManager(
+                sqlite_engine).SessionLocal() as session:
+            stored = await AsyncSQLUserRepository(
+                session).get_user_by_id(user.id)
+
+        assert not NEW.needs_update(stored.hashed_password)
+        assert NEW.verify_password("SecurePass123!", stored.hashed_password)
+        assert rehasher.stats()["upgraded"] == 1
+
+    async def test_current_hash_is_not_scheduled(self, sqlite_engine):
+        rehasher = PasswordRehashService(
+            FakeHasher(), AsyncSessionManager(sqlite_engine))
+
+        task = rehasher.schedule(
+            MagicMock(), "SecurePass123!",
+            NEW.hash_password("SecurePass123!"))
+
+        assert task is None
+        assert rehasher.stats()["scheduled"] == 0
+
+    async def test_changed_password_is_not_overwritten(
+        self, sqlite_engine, user
+    ):
+        rehasher = PasswordRehashService(
+            FakeHasher(), AsyncSessionManager(sqlite_engine))
+
+        # Хеш, по которому прошёл вход, уже заменён
+        await rehasher.schedule(
+            user.id, "SecurePass123!", OLD.hash_password("OldPass456!"))
+
+        assert rehasher.stats()["upgraded"] == 0
+        assert rehasher.stats()["skipped"] == 1
+
+    async def test_busy_pool_skips_rehash(self, sqlite_engine, user):
+        rehasher = PasswordRehashService(
+            FakeHasher(TooManyRequestsException()),
+            AsyncSessionManager(sqlite_engine))
+
+        await rehasher.schedule(
+            user.id, "SecurePass123!", user.hashed_password)
+
+        assert rehasher.stats()["skipped"] == 1
+        assert rehasher.stats()["in_progress"] == 0
+
+    async def test_login_schedules_rehash(self):
+        user = MagicMock(hashed_password="hash", token_version=0)
+        rehasher = MagicMock()
+        auth_service = AuthService(
+            user_repo=MagicMock(get_user_by_email=AsyncMock(
+                return_value=user)),
+            password_hasher=MagicMock(
+                verify_password=AsyncMock(return_value=True)),
+            jwt_service=MagicMock(),
+            auth_config=MagicMock(REFRESH_TOKEN_EXPIRE_DAYS=1),
+            auth_validator=MagicMock(),
+            mapper=MagicMock(),
+            token_repo=MagicMock(create_refresh_token=AsyncMock()),
+            password_rehasher=rehasher
+        )
+
+        await auth_service.authenticate_and_create_tokens(
+            "john@example.com", "SecurePass123!")
+
+        rehasher.schedule.assert_called_once_with(
+            user.id, "SecurePass123!", "hash")
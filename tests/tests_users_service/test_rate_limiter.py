@@ -0,0 +1,221 @@
+"""
+Тесты лимита попыток входа (скользящее окно)
+"""
+
+import uuid
+from multiprocessing import shared_memory
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.service_user.src.core.client_ip import (
+    parse_trusted_proxies,
+    resolve_client_ip
+)
+from backend.service_user.src.core.rate_limiter import (
+    LoginRateLimiter,
+    SharedSlidingWindowLimiter,
+    SlidingWindowLimiter
+)
+from backend.service_user.src.exception import TooManyRequestsException
+from backend.service_user.src.service import AuthService
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+class TestSlidingWindowLimiter:
+    """Кольцевой буфер в памяти процесса"""
+
+    def test_window_slides(self, clock):
+        limiter = SlidingWindowLimiter(3, 60, clock=clock)
+
+        for _ in range(3):
+            assert limiter.hit("a") == 0.0
+            clock.now += 10
+
+        # Самая старая попытка была 30 секунд назад
+        assert limiter.hit("a") == pytest.approx(30.0)
+
+        clock.now += 30
+        assert limiter.hit("a") == 0.0
+        assert limiter.stats()["rejected"] == 1
+
+    def test_keys_are_independent_and_reset(self, clock):
+        limiter = SlidingWindowLimiter(1, 60, clock=clock)
+
+        assert limiter.hit("a") == 0.0
+        assert limiter.hit("b") == 0.0
+        assert limiter.hit("a") > 0
+
+        limiter.reset("a")
+        assert limiter.hit("a") == 0.0
+
+    def test_memory_is_bounded(self, clock):
+        limiter = SlidingWindowLimiter(1, 60, max_keys=2, clock=clock)
+
+        for key in ("a", "b", "c"):
+            limiter.hit(key)
+
+        assert limiter.stats()["keys"] == 2
+        assert limiter.stats()["evictions"] == 1
+        # Вытеснен самый давний ключ
+        assert limiter.hit("a") == 0.0
+
+
+class TestSharedSlidingWindowLimiter:
+    """Общий для процессов лимит в shared memory"""
+
+    @pytest.fixture
+    def name(self, tmp_path):
+        name = f"test_login_{uuid.uuid4().hex[:8]}"
+        yield name
+        shared_memory.SharedMemory(name=name).unlink()
+
+    def test_instances_share_attempts(self, name, clock, tmp_path):
+        first = SharedSlidingWindowLimiter(
+            name, 2, 60, slots=16, clock=clock, lock_dir=str(tmp_path))
+        second = SharedSlidingWindowLimiter(
+            name, 2, 60, slots=16, clock=clock, lock_dir=str(tmp_path))
+
+        assert first.hit("a") == 0.0
+        assert second.hit("a") == 0.0
+        assert first.hit("a") == pytest.approx(60.0)
+
+        second.reset("a")
+        assert first.hit("a") == 0.0
+
+        first.close()
+        second.close()
+
+    def test_reset_requires_exact_key(self, name, clock, tmp_path):
+        # Одна ячейка: все ключи попадают в ячейку жертвы
+        limiter = SharedSlidingWindowLimiter(
+            name, 1, 60, slots=1, clock=clock, lock_dir=str(tmp_path))
+
+        limiter.hit("victim@example.com")
+        limiter.reset("attacker@example.com")
+
+        assert limiter.hit("victim@example.com") == pytest.approx(60.0)
+        limiter.close()
+
+    def test_hash_key_shared_by_workers(self, name, tmp_path):
+        first = SharedSlidingWindowLimiter(
+            name, 1, 60, slots=16, lock_dir=str(tmp_path))
+        second = SharedSlidingWindowLimiter(
+            name, 1, 60, slots=16, lock_dir=str(tmp_path))
+
+        assert first._hash_key == second._hash_key != bytes(16)
+        first.close()
+        second.close()
+
+    @pytest.mark.parametrize("slots, max_attempts", [(32, 1), (8, 1)])
+    def test_segment_of_other_layout_is_rejected(
+        self, name, tmp_path, slots, max_attempts
+    ):
+        first = SharedSlidingWindowLimiter(
+            name, 1, 60, slots=16, lock_dir=str(tmp_path))
+
+        with pytest.raises(RuntimeError, match=name):
+            SharedSlidingWindowLimiter(
+                name, max_attempts, 60, slots=slots, lock_dir=str(tmp_path))
+
+        first.close()
+
+    def test_segment_of_same_size_other_layout_is_rejected(
+        self, name, tmp_path
+    ):
+        # 2 * (24 + 8 * 3) == 3 * (24 + 8 * 1): размер совпадает
+        first = SharedSlidingWindowLimiter(
+            name, 3, 60, slots=2, lock_dir=str(tmp_path))
+
+        with pytest.raises(RuntimeError, match="slots=2"):
+            SharedSlidingWindowLimiter(
+                name, 1, 60, slots=3, lock_dir=str(tmp_path))
+
+        first.close()
+
+
+class TestLoginRateLimit:
+    """Проверка лимита в AuthService"""
+
+    @pytest.fixture
+    def auth_service(self, clock):
+        limiter = LoginRateLimiter(
+            by_email=SlidingWindowLimiter(2, 60, clock=clock),
+            by_ip=SlidingWindowLimiter(3, 60, clock=clock)
+        )
+        return AuthService(
+            user_repo=MagicMock(get_user_by_email=AsyncMock(
+                return_value=None)),
+            password_hasher=MagicMock(verify_password=AsyncMock()),
+            jwt_service=MagicMock(),
+            auth_config=MagicMock(),
+            auth_validator=MagicMock(),
+            mapper=MagicMock(),
+            token_repo=MagicMock(),
+            rate_limiter=limiter
+        )
+
+    async def attempt(self, auth_service, email, ip="10.0.0.1"):
+        try:
+            await auth_service.authenticate_and_create_tokens(
+                email, "WrongPass456!", ip)
+        except TooManyRequestsException as exc:
+            return exc
+        except Exception:
+            return None
+
+    async def test_rejects_before_db_and_hash(self, auth_service):
+        for _ in range(2):
+            assert await self.attempt(
+                auth_service, "john@example.com") is None
+
+        exc = await self.attempt(auth_service, "John@Example.com ")
+
+        assert exc.status_code == 429
+        assert exc.details["retry_after"] == 60
+        assert auth_service.user_repo.get_user_by_email.await_count == 2
+
+    async def test_ip_limit_covers_many_emails(self, auth_service):
+        for i in range(3):
+            assert await self.attempt(
+                auth_service, f"user{i}@example.com") is None
+
+        assert await self.attempt(auth_service, "other@example.com")
+        assert await self.attempt(
+            auth_service, "other@example.com", ip="10.0.0.2") is None
+
+
+class TestClientIp:
+    """IP клиента для лимита за обратным прокси"""
+
+    PROXIES = parse_trusted_proxies("10.0.0.0/8, 192.168.1.1")
+
+    @pytest.mark.parametrize("peer, forwarded_for, expected", [
+        # Без прокси заголовок игнорируется
+        ("5.6.7.8", "1.2.3.4", "5.6.7.8"),
+        ("10.0.0.2", None, "10.0.0.2"),
+        # Цепочка прокси: первый недоверенный адрес справа
+        ("10.0.0.2", "1.2.3.4, 192.168.1.1", "1.2.3.4"),
+        # Подделанное клиентом начало цепочки не учитывается
+        ("10.0.0.2", "9.9.9.9, 1.2.3.4", "1.2.3.4"),
+        ("10.0.0.2", "garbage, 1.2.3.4", "1.2.3.4"),
+        ("10.0.0.2", "1.2.3.4, garbage", "10.0.0.2"),
+    ])
+    def test_resolve(self, peer, forwarded_for, expected):
+        assert resolve_client_ip(
+            peer, forwarded_for, self.PROXIES) == expected
+
+    def test_no_trusted_proxies(self):
+        assert resolve_client_ip("10.0.0.2", "1.2.3.4", []) == "10.0.0.2"
@@ -0,0 +1,122 @@
+"""
+Тесты атомарной ротации refresh токенов
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import select
+
+from backend.service_user.src.core import JWTService
+from backend.service_user.src.models import RefreshToken
+from backend.service_user.src.repositories import (
+    AsyncSQLTokenRepository,
+    AsyncSQLUserRepository
+)
+from backend.service_user.src.service import AuthService
+from backend.service_user.src.service.auth_service.mappers import AuthMapper
+
+
+@pytest.fixture
+def jwt_service():
+    return JWTService(
+        secret_key="test-secret",
+        algorithm="HS256",
+        access_token_expire_minutes=15,
+        refresh_token_expire_days=1
+    )
+
+
+@pytest.fixture
+async def user(db_session):
+    return await AsyncSQLUserRepository(db_session).create_user_with_default_role({
+        "user_name": "john_doe",
+        "email": "john@example.com",
+        "hashed_password": "hash"
+    })
+
+
+@pytest.fixture
+def auth_service(db_session, jwt_service):
+    return AuthService(
+        user_repo=AsyncSQLUserRepository(db_session),
+        password_hasher=MagicMock(),
+        jwt_service=jwt_service,
+        auth_config=MagicMock(REFRESH_TOKEN_EXPIRE_DAYS=1),
+        auth_validator=MagicMock(),
+        mapper=AuthMapper(),
+        token_repo=AsyncSQLTokenRepository(db_session)
+    )
+
+
+async def stored(db_session, token: str) -> RefreshToken:
+    result = await db_session.execute(
+        select(RefreshToken).where(
+            RefreshToken.token_hash == RefreshToken.digest(token)))
+    return result.scalars().one()
+
+
+class TestRefreshRotation:
+    """refresh_access_token через rotate_refresh_token"""
+
+    async def test_rotation_revokes_old_and_stores_new(
+        self, auth_service, user, db_session, jwt_service
+    ):
+        first = await auth_service.create_tokens(user)
+
+        second = await auth_service.refresh_access_token(first.refresh_token)
+
+        assert second is not None
+        assert second.refresh_token != first.refresh_token
+        assert (await stored(db_session, first.refresh_token)).is_revoked
+        assert not (await stored(db_session, second.refresh_token)).is_revoked
+
+        claims = jwt_service.decode_token(second.access_token)
+        assert claims["sub"] == str(user.id)
+        assert claims["username"] == "john_doe"
+        assert claims["email"] == "john@example.com"
+        assert claims["ver"] == 0
+
+    async def test_reused_token_is_rejected(self, auth_service, user):
+        first = await auth_service.create_tokens(user)
+        await auth_service.refresh_access_token(first.refresh_token)
+
+        assert await auth_service.refresh_access_token(
+            first.refresh_token) is None
+
+    async def test_expired_token_is_rejected(
+        self, auth_service, user, db_session
+    ):
+        first = await auth_service.create_tokens(user)
+        token = await stored(db_session, first.refresh_token)
+        token.expires_at = datetime.now(timezone.utc) - timedelta(minutes=1)
+        await db_session.commit()
+
+        assert await auth_service.refresh_access_token(
+            first.refresh_token) is None
+
+    async def test_failed_rotation_stores_nothing(
+        self, auth_service, user, db_session
+    ):
+        first = await auth_service.create_tokens(user)
+        await auth_service.refresh_access_token(first.refresh_token)
+        await auth_service.refresh_access_token(first.refresh_token)
+
+        result = await db_session.execute(select(RefreshToken))
+        assert len(result.scalars().all()) == 2
+
+    async def test_raw_token_is_not_stored(
+        self, auth_service, user, db_session
+    ):
+        pair = await auth_service.create_tokens(user)
+
+        token = await stored(db_session, pair.refresh_token)
+        assert len(token.token_hash) == 32
+        assert pair.refresh_token.encode() not in token.token_hash
+
+    async def test_access_token_is_not_accepted(self, auth_service, user):
+        pair = await auth_service.create_tokens(user)
+
+        assert await auth_service.refresh_access_token(
+            pair.access_token) is None
@@ -0,0 +1,174 @@
+"""
+Тесты регистрации через INSERT ... ON CONFLICT DO NOTHING
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.service_user.src.core import PasswordService
+from backend.service_user.src.exception import ConflictException
+from backend.service_user.src.repositories import AsyncSQLUserRepository
+from backend.service_user.src.schemas import UserCreate
+from backend.service_user.src.service import RegisterService
+from backend.shared.cache import LRUTTLCache
+
+
+HASH = PasswordService().hash_password("SecurePass123!")
+
+
+def user_create(
+    user_name: str = "john_doe",
+    email: str = "john@example.com"
+) -> UserCreate:
+    return UserCreate(
+        user_name=user_name,
+        email=email,
+        password="SecurePass123!",
+        full_name="John Doe"
+    )
+
+
+@pytest.fixture
+def hasher():
+    return MagicMock(hash_password=AsyncMock(return_value=HASH))
+
+
+@pytest.fixture
+def cache():
+    return LRUTTLCache(max_size=100, ttl_seconds=60)
+
+
+@pytest.fixture
+def register_service(db_session, hasher, cache):
+    return RegisterService(
+        user_repo=AsyncSQLUserRepository(db_session),
+        password_hasher=hasher,
+        taken_cache=cache
+    )
+
+
+class TestCreateUserIfAbsent:
+    """Вставка с опорой на уникальные индексы"""
+
+    async def test_insert_returns_user_with_server_defaults(
+        self, db_session
+    ):
+        repo = AsyncSQLUserRepository(db_session)
+        user = await repo.create_user_if_absent({
+            "user_name": "john_doe",
+            "email": "john@example.com",
+            "hashed_password": "hash"
+        })
+
+        assert user.id is not None
+        assert user.created_at is not None
+        assert user.role_name == "user"
+
+    async def test_conflict_returns_none(self, db_session):
+        repo = AsyncSQLUserRepository(db_session)
+        data = {
+            "user_name": "john_doe",
+            "email": "john@example.com",
+            "hashed_password": "hash"
+        }
+        await repo.create_user_if_absent(data)
+
+        assert await repo.create_user_if_absent(
+            {**data, "email": "other@example.com"}) is None
+
+
+class TestRegisterService:
+    """Регистрация без предварительных SELECT"""
+
+    async def test_register_user(self, register_service, hasher):
+        response = await register_service.register_user(user_create())
+
+        assert response.user_name == "john_doe"
+        hasher.hash_password.assert_awaited_once()
+
+    @pytest.mark.parametrize("field, data", [
+        ("user_name", {"email": "other@example.com"}),
+        ("email", {"user_name": "jane_doe"})
+    ])
+    async def test_conflict_details(
+        self, db_session, hasher, field, data
+    ):
+        # Без кэша конфликт обнаруживается на INSERT
+        service = RegisterService(
+            user_repo=AsyncSQLUserRepository(db_session),
+            password_hasher=hasher
+        )
+        await service.register_user(user_create())
+
+        with pytest.raises(ConflictException) as exc_info:
+            await service.register_user(user_create(**data))
+
+        assert exc_info.value.details["field"] == field
+        assert hasher.hash_password.await_count == 2
+
+    async def test_known_taken_value_skips_hashing(
+        self, register_service, hasher
+    ):
+        await register_service.register_user(user_create())
+
+        with pytest.raises(ConflictException) as exc_info:
+            await register_service.register_user(
+                user_create(email="other@example.com"))
+
+        assert exc_info.value.details == {
+            "field": "user_name",
+            "value": "john_doe"
+        }
+        hasher.hash_password.assert_awaited_once()
+
+    async def test_insert_conflict_is_remembered(
+        self, db_session, hasher, cache
+    ):
+        # Пользователь создан другим воркером: кэш о нём не знает
+        await AsyncSQLUserRepository(db_session).create_user_if_absent({
+            "user_name": "john_doe",
+            "email": "john@example.com",
+            "hashed_password": "hash"
+        })
+        service = RegisterService(
+            user_repo=AsyncSQLUserRepository(db_session),
+            password_hasher=hasher,
+            taken_cache=cache
+        )
+
+        for _ in range(2):
+            with pytest.raises(ConflictException):
+                await service.register_user(
+                    user_create(email="other@example.com"))
+
+        hasher.hash_password.assert_awaited_once()
+
+    async def test_registration_updates_availability(
+        self, db_session, hasher
+    ):
+        availability = MagicMock()
+        service = RegisterService(
+            user_repo=AsyncSQLUserRepository(db_session),
+            password_hasher=hasher,
+            availability=availability
+        )
+
+        await service.register_user(user_create())
+
+        availability.add.assert_called_once_with(
+            "john_doe", "john@example.com")
+
+    async def test_user_name_is_stored_stripped(self, db_session, hasher):
+        availability = MagicMock()
+        service = RegisterService(
+            user_repo=AsyncSQLUserRepository(db_session),
+            password_hasher=hasher,
+            availability=availability
+        )
+
+        user = await service.register_user(user_create(user_name=" bob_1 "))
+
+        assert user.user_name == "bob_1"
+        availability.add.assert_called_once_with(
+            "bob_1", "john@example.com")
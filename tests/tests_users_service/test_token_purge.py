@@ -0,0 +1,102 @@
+"""
+Тесты пакетной очистки просроченных refresh токенов
+"""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from backend.service_user.src.infrastructure.token_purge import (
+    ExpiredTokenPurger)
+from backend.service_user.src.models import RefreshToken
+from backend.service_user.src.repositories import (
+    AsyncSQLTokenRepository,
+    AsyncSQLUserRepository
+)
+from backend.service_user.src.schemas.auth.auth_dto import RefreshTokenDataDTO
+from backend.shared.database import AsyncSessionManager
+
+
+NOW = datetime.now(timezone.utc)
+
+
+class CountingSessionManager(AsyncSessionManager):
+    """Считает транзакции"""
+
+    def __init__(self, engine):
+        super().__init__(engine)
+        self.contexts = 0
+
+    def get_db_context(self, auto_commit=True):
+        self.contexts += 1
+        return super().get_db_context(auto_commit=auto_commit)
+
+
+@pytest.fixture
+async def tokens(db_session):
+    """7 просроченных и 3 действующих токена"""
+    user = await AsyncSQLUserRepository(
+        db_session).create_user_with_default_role({
+            "user_name": "john_doe",
+            "email": "john@example.com",
+            "hashed_password": "hash"
+        })
+    repo = AsyncSQLTokenRepository(db_session)
+    for offset in [-1] * 7 + [1] * 3:
+        await repo.create_refresh_token(RefreshTokenDataDTO(
+            user_id=user.id,
+            token=uuid4().hex,
+            expires_at=NOW + timedelta(days=offset)
+        ))
+
+
+async def remaining(engine) -> int:
+    async with AsyncSessionManager(engine).SessionLocal() as session:
+        return await session.scalar(
+            select(func.count()).select_from(RefreshToken))
+
+
+class TestExpiredTokenPurger:
+    """Удаление пакетами с паузами"""
+
+    async def test_purge_deletes_expired_in_batches(
+        self, sqlite_engine, tokens
+    ):
+        manager = CountingSessionManager(sqlite_engine)
+        purger = ExpiredTokenPurger(manager, batch_size=3, pause_ms=0)
+
+        result = await purger.purge()
+
+        assert result["deleted"] == 7
+        # 3 + 3 + 1: неполный пакет завершает проход
+        assert result["batches"] == 3
+        assert manager.contexts == 3
+        assert await remaining(sqlite_engine) == 3
+        assert purger.stats()["deleted"] == 7
+
+    async def test_max_batches_limits_pass(self, sqlite_engine, tokens):
+        purger = ExpiredTokenPurger(
+            AsyncSessionManager(sqlite_engine),
+            batch_size=2,
+            pause_ms=0,
+            max_batches=2
+        )
+
+        result = await purger.purge()
+
+        assert result["deleted"] == 4
+        assert await remaining(sqlite_engine) == 6
+
+    async def test_nothing_to_purge(self, sqlite_engine):
+        purger = ExpiredTokenPurger(AsyncSessionManager(sqlite_engine))
+
+        result = await purger.purge()
+
+        assert result["deleted"] == 0
+        assert result["batches"] == 1
+
+    def test_batch_size_must_be_positive(self):
+        with pytest.raises(ValueError):
+            ExpiredTokenPurger(None, batch_size=0)
@@ -0,0 +1,274 @@
+"""
+Тесты глобального отзыва сессий через token_version
+"""
+
+import sys
+import threading
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from backend.service_user.src.exception import InvalidTokenException
+from backend.service_user.src.models import RefreshToken
+from backend.service_user.src.repositories import (
+    AsyncSQLTokenRepository,
+    AsyncSQLUserRepository
+)
+from backend.service_user.src.service import AuthService, TokenVersionService
+from backend.shared.cache import LRUTTLCache, ThreadSafeLRUTTLCache
+
+
+SERVICE_MODULE = 'backend.service_user.src.service.token_version_service'
+
+
+def make_async_session_manager():
+    """Менеджер сессий, отдающий заглушку вместо сессии"""
+    manager = MagicMock()
+
+    @asynccontextmanager
+    async def get_db_context(auto_commit=True):
+        yield MagicMock()
+
+    manager.get_db_context = get_db_context
+    return manager
+
+
+@pytest.fixture
+def cache():
+    return LRUTTLCache(max_size=100, ttl_seconds=60)
+
+
+@pytest.fixture
+def versions(cache):
+    return TokenVersionService(
+        cache=cache,
+        async_session_manager=make_async_session_manager(),
+        session_manager_factory=MagicMock()
+    )
+
+
+class TestUserRepositoryTokenVersion:
+    """Хранение версии токенов в users"""
+
+    async def test_bump_increments_version(self, db_session):
+        repo = AsyncSQLUserRepository(db_session)
+        user = await repo.create_user_with_default_role({
+            "user_name": "john_doe",
+            "email": "john@example.com",
+            "hashed_password": "hash"
+        })
+
+        assert await repo.get_token_version(user.id) == 0
+        assert await repo.bump_token_version(user.id) == 1
+        assert await repo.bump_token_version(user.id) == 2
+        assert await repo.get_token_version(user.id) == 2
+
+    async def test_bump_missing_user_returns_none(self, db_session):
+        repo = AsyncSQLUserRepository(db_session)
+
+        assert await repo.bump_token_version(uuid4()) is None
+        assert await repo.get_token_version(uuid4()) is None
+
+
+class TestRevokeAllSessionsRepository:
+    """Отзыв токенов и увеличение версии одной транзакцией"""
+
+    @pytest.fixture
+    async def user_id(self, db_session):
+        user = await AsyncSQLUserRepository(
+            db_session).create_user_with_default_role({
+                "user_name": "john_doe",
+                "email": "john@example.com",
+                "hashed_password": "hash"
+            })
+        db_session.add(RefreshToken(
+            user_id=user.id,
+            token_hash=RefreshToken.digest("refresh"),
+            expires_at=datetime.now(timezone.utc) + timedelta(days=1)
+        ))
+        user_id = user.id
+        await db_session.commit()
+        return user_id
+
+    async def test_revokes_and_bumps(self, db_session, user_id):
+        repo = AsyncSQLTokenRepository(db_session)
+
+        assert await repo.revoke_all_sessions(user_id) == 1
+        assert await repo.get_valid_token("refresh") is None
+
+    async def test_failed_bump_keeps_refresh_tokens(
+        self, db_session, user_id
+    ):
+        repo = AsyncSQLTokenRepository(db_session)
+        execute = db_session.execute
+        calls = []
+
+        async def failing_execute(statement, *args, **kwargs):
+            calls.append(statement)
+            if len(calls) == 2:
+                raise RuntimeError("connection lost")
+            return await execute(statement, *args, **kwargs)
+
+        with patch.object(db_session, "execute", failing_execute):
+            with pytest.raises(RuntimeError):
+                await repo.revoke_all_sessions(user_id)
+
+        assert await repo.get_valid_token("refresh") is not None
+        assert await AsyncSQLUserRepository(
+            db_session).get_token_version(user_id) == 0
+
+
+class TestTokenVersionService:
+    """Сверка claim ver с версией пользователя"""
+
+    async def test_cached_version_skips_db(self, versions, cache):
+        user_id = str(uuid4())
+        cache.set(user_id, 3)
+
+        with patch(f'{SERVICE_MODULE}.AsyncSQLUserRepository') as repo_cls:
+            assert await versions.is_current({"sub": user_id, "ver": 3})
+            assert not await versions.is_current({"sub": user_id, "ver": 2})
+
+        repo_cls.assert_not_called()
+
+    async def test_miss_reads_db_and_caches(self, versions, cache):
+        user_id = str(uuid4())
+        repo = MagicMock(get_token_version=AsyncMock(return_value=1))
+
+        with patch(
+            f'{SERVICE_MODULE}.AsyncSQLUserRepository', return_value=repo
+        ):
+            assert await versions.is_current({"sub": user_id, "ver": 1})
+            assert await versions.is_current({"sub": user_id, "ver": 1})
+
+        repo.get_token_version.assert_awaited_once()
+        assert cache.get(user_id) == 1
+
+    async def test_token_without_ver_is_version_zero(self, versions, cache):
+        user_id = str(uuid4())
+        cache.set(user_id, 0)
+
+        assert await versions.is_current({"sub": user_id})
+
+        cache.set(user_id, 1)
+        assert not await versions.is_current({"sub": user_id})
+
+    async def test_unknown_user_is_not_current(self, versions):
+        repo = MagicMock(get_token_version=AsyncMock(return_value=None))
+
+        with patch(
+            f'{SERVICE_MODULE}.AsyncSQLUserRepository', return_value=repo
+        ):
+            assert not await versions.is_current(
+                {"sub": str(uuid4()), "ver": 0})
+            assert not await versions.is_current({"sub": "not-a-uuid"})
+
+    def test_sync_lookup(self, versions):
+        user_id = str(uuid4())
+        repo = MagicMock(get_token_version=MagicMock(return_value=2))
+
+        with patch(f'{SERVICE_MODULE}.SQLUserRepository', return_value=repo):
+            assert versions.is_current_sync({"sub": user_id, "ver": 2})
+            assert not versions.is_current_sync({"sub": user_id, "ver": 1})
+
+        repo.get_token_version.assert_called_once()
+
+    def test_invalidate_drops_cached_version(self, versions, cache):
+        user_id = uuid4()
+        cache.set(str(user_id), 0)
+
+        versions.invalidate(user_id)
+
+        assert cache.get(str(user_id)) is None
+
+
+class TestConcurrentVersionCache:
+    """Кэш версий общий для event loop и пула потоков gRPC"""
+
+    def test_concurrent_access_from_threads(self):
+        # Мелкий кэш с нулевым TTL: каждое чтение удаляет просроченную
+        # запись, каждая запись вытесняет — гонки на OrderedDict
+        cache = ThreadSafeLRUTTLCache(max_size=4, ttl_seconds=0)
+        user_ids = [str(uuid4()) for _ in range(8)]
+        errors = []
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+        def worker():
+            try:
+                for i in range(20_000):
+                    user_id = user_ids[i % len(user_ids)]
+                    cache.set(user_id, 1)
+                    cache.get(user_id)
+                    cache.invalidate(user_ids[(i + 3) % len(user_ids)])
+            except Exception as e:
+                errors.append(e)
+
+        try:
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        assert errors == []
+        assert len(cache) <= cache.max_size
+
+    def test_container_cache_is_thread_safe(self):
+        from backend.service_user.src.infrastructure.container import (
+            container)
+
+        assert isinstance(
+            container.token_version_cache(), ThreadSafeLRUTTLCache)
+
+
+class TestRevokeAllSessions:
+    """Выход со всех устройств в AuthService"""
+
+    @pytest.fixture
+    def auth_service(self, versions):
+        return AuthService(
+            user_repo=MagicMock(bump_token_version=AsyncMock(return_value=1)),
+            password_hasher=MagicMock(),
+            jwt_service=MagicMock(),
+            auth_config=MagicMock(REFRESH_TOKEN_EXPIRE_DAYS=1),
+            auth_validator=MagicMock(),
+            mapper=MagicMock(),
+            token_repo=MagicMock(
+                revoke_all_sessions=AsyncMock(return_value=1),
+                get_valid_token=AsyncMock(return_value=None)
+            ),
+            token_versions=versions
+        )
+
+    async def test_revoke_all_bumps_version_and_invalidates(
+        self, auth_service, cache
+    ):
+        user_id = uuid4()
+        cache.set(str(user_id), 0)
+
+        await auth_service.revoke_all_sessions(user_id)
+
+        auth_service.token_repo.revoke_all_sessions.assert_awaited_once_with(
+            user_id)
+        assert cache.get(str(user_id)) is None
+
+    async def test_logout_all_with_invalid_refresh_token(self, auth_service):
+        with pytest.raises(InvalidTokenException):
+            await auth_service.logout_all("unknown")
+
+        auth_service.token_repo.revoke_all_sessions.assert_not_awaited()
+
+    async def test_access_token_carries_version(self, auth_service):
+        user = MagicMock(token_version=4)
+        auth_service.token_repo.create_refresh_token = AsyncMock()
+
+        await auth_service.create_tokens(user)
+
+        claims = auth_service.jwt_service.create_access_token.call_args[0][0]
+        assert claims["ver"] == 4